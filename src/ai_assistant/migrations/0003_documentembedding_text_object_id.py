@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 00:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ai_assistant', '0002_aioperation_documentembedding'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='documentembedding',
+            name='object_id',
+            field=models.CharField(help_text='ID of the embedded object (text, so UUID primary keys fit)', max_length=64),
+        ),
+    ]
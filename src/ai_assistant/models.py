@@ -450,7 +450,10 @@ class DocumentEmbedding(models.Model):
         on_delete=models.CASCADE,
         help_text="Type of object that was embedded"
     )
-    object_id = models.PositiveIntegerField(help_text="ID of the embedded object")
+    object_id = models.CharField(
+        max_length=64,
+        help_text="ID of the embedded object (text, so UUID primary keys fit)"
+    )
     content_object = GenericForeignKey('content_type', 'object_id')
 
     # Embedding metadata
@@ -18,7 +18,7 @@ from .prompt_templates import PromptTemplates
 try:
     from .embedding_service import EmbeddingService
     from .similarity_search import SimilaritySearchService, get_similarity_search_service
-    from .vector_store import VectorStore
+    from .vector_store import VectorStore, get_vector_store
 
     __all__ = [
         'GeminiService',
@@ -27,6 +27,7 @@ try:
         'PromptTemplates',
         'EmbeddingService',
         'VectorStore',
+        'get_vector_store',
         'SimilaritySearchService',
         'get_similarity_search_service',
     ]
@@ -14,14 +14,121 @@ Why Sentence Transformers:
 
 import hashlib
 import logging
-from typing import List, Optional, Union
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Union
 
 import numpy as np
+from django.core.cache import cache
 from sentence_transformers import SentenceTransformer
 
 logger = logging.getLogger(__name__)
 
 
+class EmbeddingCache:
+    """
+    Two-level cache for single-text embeddings.
+
+    - Level 1: bounded in-process LRU (no serialization, no network)
+    - Level 2: shared Django cache holding raw float32 bytes, so workers
+      reuse each other's query embeddings
+
+    Keys combine the model name, the normalization flag and a hash of the
+    normalized text (Unicode NFKC, whitespace collapsed).
+    """
+
+    MAX_ENTRIES = 2048
+    SHARED_TTL = 86400  # 24 hours
+    PREFIX = "embedding"
+
+    def __init__(self, max_entries: int = MAX_ENTRIES, shared_ttl: int = SHARED_TTL):
+        self.max_entries = max_entries
+        self.shared_ttl = shared_ttl
+        self._entries: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    @staticmethod
+    def normalize_text(text: str) -> str:
+        """Normalize text so trivially different queries share an entry."""
+        return " ".join(unicodedata.normalize("NFKC", text).split())
+
+    def make_key(self, text: str, model_name: str, normalize: bool) -> str:
+        digest = hashlib.md5(self.normalize_text(text).encode("utf-8")).hexdigest()
+        return f"{self.PREFIX}:{model_name}:{int(normalize)}:{digest}"
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """Return a copy of the cached vector, or None."""
+        with self._lock:
+            vector = self._entries.get(key)
+            if vector is not None:
+                self._entries.move_to_end(key)
+                self.stats["hits"] += 1
+                return vector.copy()
+
+        try:
+            raw = cache.get(key)
+        except Exception as e:
+            logger.warning(f"Shared embedding cache unavailable: {e}")
+            raw = None
+
+        if raw is None:
+            with self._lock:
+                self.stats["misses"] += 1
+            return None
+
+        vector = np.frombuffer(raw, dtype=np.float32)
+        self._remember(key, vector)
+        with self._lock:
+            self.stats["shared_hits"] += 1
+        return vector.copy()
+
+    def set(self, key: str, vector: np.ndarray):
+        """Store ``vector`` in both cache levels."""
+        vector = np.ascontiguousarray(vector, dtype=np.float32)
+        self._remember(key, vector)
+        try:
+            cache.set(key, vector.tobytes(), self.shared_ttl)
+        except Exception as e:
+            logger.warning(f"Shared embedding cache unavailable: {e}")
+
+    def _remember(self, key: str, vector: np.ndarray):
+        vector = vector.copy()
+        vector.flags.writeable = False
+        with self._lock:
+            self._entries[key] = vector
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop the in-process entries (shared entries expire via TTL)."""
+        with self._lock:
+            self._entries.clear()
+
+    def reset_stats(self):
+        self.stats = {"hits": 0, "shared_hits": 0, "misses": 0}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for this process."""
+        with self._lock:
+            hits = self.stats["hits"]
+            shared_hits = self.stats["shared_hits"]
+            misses = self.stats["misses"]
+            size = len(self._entries)
+        total = hits + shared_hits + misses
+        return {
+            "hits": hits,
+            "shared_hits": shared_hits,
+            "misses": misses,
+            "total_requests": total,
+            "hit_rate": round((hits + shared_hits) / total * 100, 2) if total else 0,
+            "size": size,
+            "max_entries": self.max_entries,
+        }
+
+
 class EmbeddingService:
     """
     Generate embeddings using Sentence Transformers.
@@ -37,6 +144,9 @@ class EmbeddingService:
     _model = None
     _model_name = 'sentence-transformers/all-MiniLM-L6-v2'
 
+    # Process-wide cache of single-text embeddings
+    embedding_cache = EmbeddingCache()
+
     def __init__(self, model_name: Optional[str] = None):
         """
         Initialize the embedding service.
@@ -68,13 +178,19 @@ class EmbeddingService:
         """Get the embedding dimension of the current model."""
         return self.model.get_sentence_embedding_dimension()
 
-    def generate_embedding(self, text: str, normalize: bool = True) -> np.ndarray:
+    def generate_embedding(
+        self, text: str, normalize: bool = True, use_cache: bool = True
+    ) -> np.ndarray:
         """
         Generate embedding vector for a single text.
 
+        Results are cached (see ``EmbeddingCache``), so repeated queries skip
+        the model forward pass.
+
         Args:
             text: Input text to encode
             normalize: Whether to L2 normalize the embedding (recommended for cosine similarity)
+            use_cache: Whether to read/write the embedding cache
 
         Returns:
             numpy array of shape (dimension,)
@@ -89,17 +205,27 @@ class EmbeddingService:
             logger.warning("Empty text provided for embedding generation")
             return np.zeros(self.get_dimension())
 
+        cache_key = None
+        if use_cache:
+            cache_key = self.embedding_cache.make_key(text, self.model_name, normalize)
+            cached = self.embedding_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         try:
             embedding = self.model.encode(
                 text,
                 normalize_embeddings=normalize,
                 show_progress_bar=False
             )
-            return embedding
         except Exception as e:
             logger.error(f"Error generating embedding: {e}")
             raise
 
+        if cache_key is not None:
+            self.embedding_cache.set(cache_key, embedding)
+        return embedding
+
     def batch_generate(
         self,
         texts: List[str],
@@ -204,6 +330,18 @@ class EmbeddingService:
         current_hash = self.compute_content_hash(current_text)
         return current_hash != stored_hash
 
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get embedding service statistics.
+
+        Returns:
+            Dict with the model name and embedding cache counters
+        """
+        return {
+            'model_name': self.model_name,
+            'cache': self.embedding_cache.get_stats(),
+        }
+
 
 # Global singleton instance
 _service_instance = None
@@ -13,10 +13,11 @@ Provides unified interface for:
 import logging
 from typing import Dict, List, Optional
 
+import numpy as np
 from django.contrib.contenttypes.models import ContentType
 
 from .embedding_service import get_embedding_service
-from .vector_store import VectorStore
+from .vector_store import VectorStore, get_vector_store
 
 logger = logging.getLogger(__name__)
 
@@ -47,11 +48,11 @@ class SimilaritySearchService:
         Returns:
             VectorStore instance
         """
-        if store_name not in self._stores:
-            try:
-                self._stores[store_name] = VectorStore.load(store_name)
-                logger.info(f"Loaded vector store '{store_name}'")
-            except FileNotFoundError:
+        try:
+            # Shared memory-mapped handle; reloaded when the index is rebuilt
+            self._stores[store_name] = get_vector_store(store_name)
+        except FileNotFoundError:
+            if store_name not in self._stores:
                 logger.warning(
                     f"Vector store '{store_name}' not found. Creating empty store."
                 )
@@ -61,7 +62,11 @@ class SimilaritySearchService:
         return self._stores[store_name]
 
     def search_communities(
-        self, query: str, limit: int = 10, threshold: float = 0.5
+        self,
+        query: str,
+        limit: int = 10,
+        threshold: float = 0.5,
+        query_vector: Optional[np.ndarray] = None,
     ) -> List[Dict]:
         """
         Search for similar communities.
@@ -70,6 +75,7 @@ class SimilaritySearchService:
             query: Search query (e.g., "Muslim community in Zamboanga with fishing livelihood")
             limit: Maximum number of results
             threshold: Minimum similarity score (0-1)
+            query_vector: Precomputed query embedding (skips encoding)
 
         Returns:
             List of dicts with community info and similarity scores
@@ -90,7 +96,8 @@ class SimilaritySearchService:
             return []
 
         # Generate query embedding
-        query_vector = self.embedding_service.generate_embedding(query)
+        if query_vector is None:
+            query_vector = self.embedding_service.generate_embedding(query)
 
         # Search
         raw_results = store.search_by_threshold(
@@ -113,7 +120,11 @@ class SimilaritySearchService:
         return results
 
     def search_assessments(
-        self, query: str, limit: int = 10, threshold: float = 0.5
+        self,
+        query: str,
+        limit: int = 10,
+        threshold: float = 0.5,
+        query_vector: Optional[np.ndarray] = None,
     ) -> List[Dict]:
         """
         Search for similar MANA assessments.
@@ -122,6 +133,7 @@ class SimilaritySearchService:
             query: Search query (e.g., "education needs assessment")
             limit: Maximum number of results
             threshold: Minimum similarity score
+            query_vector: Precomputed query embedding (skips encoding)
 
         Returns:
             List of dicts with assessment info and similarity scores
@@ -132,7 +144,8 @@ class SimilaritySearchService:
             logger.warning("Assessments index is empty")
             return []
 
-        query_vector = self.embedding_service.generate_embedding(query)
+        if query_vector is None:
+            query_vector = self.embedding_service.generate_embedding(query)
 
         raw_results = store.search_by_threshold(
             query_vector, threshold=threshold, max_results=limit
@@ -153,7 +166,11 @@ class SimilaritySearchService:
         return results
 
     def search_policies(
-        self, query: str, limit: int = 10, threshold: float = 0.5
+        self,
+        query: str,
+        limit: int = 10,
+        threshold: float = 0.5,
+        query_vector: Optional[np.ndarray] = None,
     ) -> List[Dict]:
         """
         Search for similar policy recommendations.
@@ -162,6 +179,7 @@ class SimilaritySearchService:
             query: Search query (e.g., "livelihood program for fisher folk")
             limit: Maximum number of results
             threshold: Minimum similarity score
+            query_vector: Precomputed query embedding (skips encoding)
 
         Returns:
             List of dicts with policy info and similarity scores
@@ -172,7 +190,8 @@ class SimilaritySearchService:
             logger.warning("Policies index is empty")
             return []
 
-        query_vector = self.embedding_service.generate_embedding(query)
+        if query_vector is None:
+            query_vector = self.embedding_service.generate_embedding(query)
 
         raw_results = store.search_by_threshold(
             query_vector, threshold=threshold, max_results=limit
@@ -218,10 +237,12 @@ class SimilaritySearchService:
             >>> print(f"Assessments: {len(results['assessments'])}")
             >>> print(f"Policies: {len(results['policies'])}")
         """
+        # Encode the query once for all modules
+        query_vector = self.embedding_service.generate_embedding(query)
         return {
-            "communities": self.search_communities(query, limit, threshold),
-            "assessments": self.search_assessments(query, limit, threshold),
-            "policies": self.search_policies(query, limit, threshold),
+            "communities": self.search_communities(query, limit, threshold, query_vector),
+            "assessments": self.search_assessments(query, limit, threshold, query_vector),
+            "policies": self.search_policies(query, limit, threshold, query_vector),
         }
 
     def find_similar_communities(
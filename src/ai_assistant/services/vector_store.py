@@ -9,14 +9,28 @@ Why FAISS:
 - Memory efficient
 - Production-ready (used by Facebook, Google)
 - Perfect for OBCMS scale (<100K documents)
+
+Storage layout:
+- ``<name>.index``: FAISS index wrapped in ``IndexIDMap2`` so every vector
+  keeps a stable 64-bit id across deletes and upserts.
+- ``<name>.metadata``: SQLite sidecar mapping vector ids to their metadata.
+  Indexes written by older releases (pickled metadata list) are still read
+  and converted transparently.
+
+Read paths should use ``get_vector_store()``, which keeps one memory-mapped,
+read-only handle per index for the whole process and reloads it only when
+the index file on disk is replaced.
 """
 
 import json
 import logging
 import os
 import pickle
+import sqlite3
+import tempfile
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import faiss
 import numpy as np
@@ -24,6 +38,13 @@ from django.conf import settings
 
 logger = logging.getLogger(__name__)
 
+INDEX_TYPE_FLAT = 'flat'
+INDEX_TYPE_IVF = 'ivf'
+INDEX_TYPE_HNSW = 'hnsw'
+INDEX_TYPES = (INDEX_TYPE_FLAT, INDEX_TYPE_IVF, INDEX_TYPE_HNSW)
+
+SQLITE_HEADER = b'SQLite format 3\x00'
+
 
 class VectorStore:
     """
@@ -31,38 +52,136 @@ class VectorStore:
 
     Features:
     - Fast similarity search using L2 distance
-    - Metadata storage for each vector
-    - Persistence to disk
-    - Support for incremental additions
+    - Stable vector ids with real deletes and upserts
+    - Metadata storage for each vector (SQLite sidecar)
+    - Optional IVF/HNSW indexes for large corpora
+    - Persistence to disk, memory-mapped loading
     """
 
-    def __init__(self, index_name: str, dimension: int = 384):
+    def __init__(
+        self,
+        index_name: str,
+        dimension: int = 384,
+        index_type: str = INDEX_TYPE_FLAT,
+        nlist: int = 100,
+        nprobe: int = 8,
+        hnsw_m: int = 32,
+        ef_search: int = 64,
+    ):
         """
         Initialize vector store.
 
         Args:
             index_name: Name of this index (e.g., 'communities', 'assessments')
             dimension: Embedding dimension (default 384 for all-MiniLM-L6-v2)
+            index_type: 'flat' (exact), 'ivf' or 'hnsw' (approximate)
+            nlist: Maximum number of IVF clusters (trained on the first batch)
+            nprobe: IVF clusters visited per query
+            hnsw_m: HNSW graph degree
+            ef_search: HNSW search breadth (raised to k when needed)
         """
+        if index_type not in INDEX_TYPES:
+            raise ValueError(
+                f"Unknown index type '{index_type}'. Expected one of {INDEX_TYPES}"
+            )
+
         self.index_name = index_name
         self.dimension = dimension
+        self.index_type = index_type
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.hnsw_m = hnsw_m
+        self.ef_search = ef_search
+        self.read_only = False
 
         # FAISS index (using L2 distance for cosine similarity on normalized vectors)
-        self.index = faiss.IndexFlatL2(dimension)
+        self.index = self._create_index()
+
+        # Metadata keyed by vector id: {vector_id: {id, type, module, data}}
+        self._metadata: Dict[int, Dict] = {}
+
+        # (type, object id) -> vector id, used for upserts and deletes
+        self._keys: Dict[Tuple, int] = {}
+
+        self._next_id = 0
+
+        logger.info(
+            f"Initialized VectorStore '{index_name}' ({index_type}) with dimension {dimension}"
+        )
 
-        # Metadata storage: list of dicts with {id, type, module, data}
-        self.metadata: List[Dict] = []
+    # ------------------------------------------------------------------
+    # Index construction
+    # ------------------------------------------------------------------
+
+    def _create_index(self, training_size: int = 0) -> faiss.Index:
+        """Create an empty ID-mapped index of the configured type."""
+        if self.index_type == INDEX_TYPE_HNSW:
+            base = faiss.IndexHNSWFlat(self.dimension, self.hnsw_m)
+        elif self.index_type == INDEX_TYPE_IVF and training_size:
+            # ~39 training points per centroid is the FAISS minimum.
+            nlist = max(1, min(self.nlist, training_size // 39))
+            base = faiss.IndexIVFFlat(faiss.IndexFlatL2(self.dimension), self.dimension, nlist)
+        else:
+            base = faiss.IndexFlatL2(self.dimension)
+        return faiss.IndexIDMap2(base)
+
+    def _ensure_trained(self, vectors: np.ndarray):
+        """Train an IVF index on the first batch added to an empty store."""
+        if self.index_type != INDEX_TYPE_IVF or self.index.ntotal:
+            return
+        self.index = self._create_index(training_size=len(vectors))
+        if not self.index.is_trained:
+            self.index.train(vectors)
+
+    def _configure_search(self, k: int):
+        base = faiss.downcast_index(self.index.index)
+        if isinstance(base, faiss.IndexIVF):
+            base.nprobe = min(self.nprobe, base.nlist)
+        elif isinstance(base, faiss.IndexHNSW):
+            base.hnsw.efSearch = max(self.ef_search, k)
+
+    def _check_writable(self):
+        if self.read_only:
+            raise RuntimeError(
+                f"VectorStore '{self.index_name}' is a read-only shared handle; "
+                f"use VectorStore.load() to modify it"
+            )
 
-        # Track number of vectors
-        self._vector_count = 0
+    @staticmethod
+    def _key(object_type: Optional[str], object_id) -> Tuple:
+        # Ids go through JSON in the sidecar, so UUID (or other non-JSON)
+        # primary keys come back as strings; compare them as strings always.
+        return (object_type, str(object_id))
 
-        logger.info(f"Initialized VectorStore '{index_name}' with dimension {dimension}")
+    @classmethod
+    def _object_key(cls, metadata: Dict) -> Optional[Tuple]:
+        object_id = metadata.get('id')
+        if object_id is None:
+            return None
+        return cls._key(metadata.get('type'), object_id)
 
     @property
     def vector_count(self) -> int:
         """Get the number of vectors in the index."""
         return self.index.ntotal
 
+    @property
+    def metadata(self) -> List[Dict]:
+        """Metadata of every stored vector, in insertion order."""
+        return list(self._metadata.values())
+
+    def get_vector_id(self, object_id, object_type: Optional[str] = None) -> Optional[int]:
+        """Return the vector id stored for an object, if any."""
+        return self._keys.get(self._key(object_type, object_id))
+
+    def get_metadata(self, vector_id: int) -> Optional[Dict]:
+        """Return the metadata stored for a vector id."""
+        return self._metadata.get(vector_id)
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
     def add_vector(
         self,
         vector: np.ndarray,
@@ -71,12 +190,15 @@ class VectorStore:
         """
         Add a single vector to the index.
 
+        A vector already stored for the same ``(type, id)`` is replaced and
+        keeps its vector id.
+
         Args:
             vector: Embedding vector of shape (dimension,)
             metadata: Associated metadata dict
 
         Returns:
-            Index position of added vector
+            Vector id of the added vector
 
         Example:
             >>> store = VectorStore('communities')
@@ -87,22 +209,9 @@ class VectorStore:
         if vector.ndim == 1:
             vector = vector.reshape(1, -1)
 
-        # Validate dimension
-        if vector.shape[1] != self.dimension:
-            raise ValueError(
-                f"Vector dimension {vector.shape[1]} does not match "
-                f"index dimension {self.dimension}"
-            )
-
-        # Add to FAISS index
-        self.index.add(vector.astype('float32'))
-
-        # Store metadata
-        self.metadata.append(metadata)
-
-        position = len(self.metadata) - 1
-        logger.debug(f"Added vector at position {position}: {metadata.get('type', 'unknown')}")
-        return position
+        vector_id = self.add_vectors(vector, [metadata])[0]
+        logger.debug(f"Added vector {vector_id}: {metadata.get('type', 'unknown')}")
+        return vector_id
 
     def add_vectors(
         self,
@@ -110,21 +219,23 @@ class VectorStore:
         metadata_list: List[Dict]
     ) -> List[int]:
         """
-        Add multiple vectors to the index in batch.
+        Add or replace multiple vectors in batch.
 
         Args:
             vectors: Array of shape (n_vectors, dimension)
             metadata_list: List of metadata dicts (length must match n_vectors)
 
         Returns:
-            List of index positions for added vectors
+            List of vector ids, one per input row
 
         Example:
             >>> store = VectorStore('communities')
             >>> embeddings = np.random.rand(10, 384)
             >>> metadata = [{'id': i, 'type': 'community'} for i in range(10)]
-            >>> positions = store.add_vectors(embeddings, metadata)
+            >>> ids = store.add_vectors(embeddings, metadata)
         """
+        self._check_writable()
+
         if len(metadata_list) != len(vectors):
             raise ValueError(
                 f"Number of metadata items ({len(metadata_list)}) must match "
@@ -142,16 +253,105 @@ class VectorStore:
                 f"index dimension {self.dimension}"
             )
 
-        # Add to FAISS index
-        self.index.add(vectors.astype('float32'))
+        # Resolve ids: existing objects keep theirs, new ones get fresh ids.
+        # When an object appears twice in the batch the last row wins.
+        vector_ids: List[int] = []
+        batch_keys: Dict[Tuple, int] = {}
+        for metadata in metadata_list:
+            key = self._object_key(metadata)
+            vector_id = None
+            if key is not None:
+                vector_id = batch_keys.get(key, self._keys.get(key))
+            if vector_id is None:
+                vector_id = self._next_id
+                self._next_id += 1
+            if key is not None:
+                batch_keys[key] = vector_id
+            vector_ids.append(vector_id)
+
+        last_row = {vector_id: row for row, vector_id in enumerate(vector_ids)}
+        rows = sorted(last_row.values())
+        replaced = [vid for vid in last_row if vid in self._metadata]
+        if replaced:
+            self.remove_vectors(replaced)
+
+        data = np.ascontiguousarray(vectors[rows], dtype='float32')
+        self._ensure_trained(data)
+        self.index.add_with_ids(data, np.array([vector_ids[row] for row in rows], dtype='int64'))
+
+        for row in rows:
+            metadata = metadata_list[row]
+            vector_id = vector_ids[row]
+            self._metadata[vector_id] = metadata
+            key = self._object_key(metadata)
+            if key is not None:
+                self._keys[key] = vector_id
+
+        logger.info(f"Added {len(rows)} vectors to index '{self.index_name}'")
+        return vector_ids
+
+    def remove_vectors(self, vector_ids: Iterable[int]) -> int:
+        """
+        Remove vectors by vector id.
+
+        Args:
+            vector_ids: Vector ids to remove
+
+        Returns:
+            Number of vectors removed
+        """
+        self._check_writable()
+
+        vector_ids = [int(vid) for vid in vector_ids if int(vid) in self._metadata]
+        if not vector_ids:
+            return 0
+
+        ids = np.array(vector_ids, dtype='int64')
+        base = faiss.downcast_index(self.index.index)
+        if isinstance(base, faiss.IndexHNSW):
+            # HNSW graphs cannot drop nodes; rebuild from the surviving vectors.
+            self._rebuild_without(set(vector_ids))
+        else:
+            self.index.remove_ids(ids)
+
+        for vector_id in vector_ids:
+            metadata = self._metadata.pop(vector_id)
+            key = self._object_key(metadata)
+            if key is not None and self._keys.get(key) == vector_id:
+                del self._keys[key]
+
+        return len(vector_ids)
+
+    def _rebuild_without(self, removed: set):
+        keep = [vid for vid in self._metadata if vid not in removed]
+        vectors = np.vstack([self.index.reconstruct(vid) for vid in keep]) if keep else None
+        self.index = self._create_index()
+        if keep:
+            self.index.add_with_ids(vectors, np.array(keep, dtype='int64'))
+
+    def delete_by_id(self, object_id: int, object_type: str) -> int:
+        """
+        Remove the vector stored for a specific object_id and type.
+
+        Args:
+            object_id: ID to remove
+            object_type: Type to remove
+
+        Returns:
+            Number of vectors removed
+        """
+        vector_id = self._keys.get(self._key(object_type, object_id))
+        if vector_id is None:
+            logger.warning(f"No vectors found to delete for {object_type} ID {object_id}")
+            return 0
 
-        # Store metadata
-        start_position = len(self.metadata)
-        self.metadata.extend(metadata_list)
+        removed = self.remove_vectors([vector_id])
+        logger.info(f"Deleted {removed} vectors from '{self.index_name}'")
+        return removed
 
-        positions = list(range(start_position, start_position + len(metadata_list)))
-        logger.info(f"Added {len(vectors)} vectors to index '{self.index_name}'")
-        return positions
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
 
     def search(
         self,
@@ -166,14 +366,14 @@ class VectorStore:
             k: Number of nearest neighbors to return
 
         Returns:
-            List of tuples: (position, distance, metadata)
+            List of tuples: (vector_id, distance, metadata)
             Sorted by distance (lower = more similar)
 
         Example:
             >>> store = VectorStore('communities')
             >>> query = np.random.rand(384)
             >>> results = store.search(query, k=5)
-            >>> for pos, dist, meta in results:
+            >>> for vector_id, dist, meta in results:
             ...     print(f"Community {meta['id']}: distance={dist:.3f}")
         """
         if self.vector_count == 0:
@@ -188,13 +388,17 @@ class VectorStore:
         k = min(k, self.vector_count)
 
         # Search FAISS index
-        distances, indices = self.index.search(query_vector.astype('float32'), k)
+        self._configure_search(k)
+        distances, ids = self.index.search(query_vector.astype('float32'), k)
 
         # Convert to list of tuples with metadata
         results = []
-        for dist, idx in zip(distances[0], indices[0]):
-            if 0 <= idx < len(self.metadata):
-                results.append((int(idx), float(dist), self.metadata[idx]))
+        for dist, vector_id in zip(distances[0], ids[0]):
+            if vector_id < 0:
+                continue
+            metadata = self._metadata.get(int(vector_id))
+            if metadata is not None:
+                results.append((int(vector_id), float(dist), metadata))
 
         return results
 
@@ -213,7 +417,7 @@ class VectorStore:
             max_results: Maximum number of results to return
 
         Returns:
-            List of tuples: (position, similarity_score, metadata)
+            List of tuples: (vector_id, similarity_score, metadata)
             Sorted by similarity (higher = more similar)
 
         Note:
@@ -227,26 +431,39 @@ class VectorStore:
         # Convert L2 distance to similarity score
         # For normalized vectors: similarity = 1 - (L2_distance^2 / 2)
         filtered_results = []
-        for pos, dist, meta in raw_results:
+        for vector_id, dist, meta in raw_results:
             similarity = 1 - (dist ** 2 / 2)
             if similarity >= threshold:
-                filtered_results.append((pos, similarity, meta))
+                filtered_results.append((vector_id, similarity, meta))
 
         # Sort by similarity (descending)
         filtered_results.sort(key=lambda x: x[1], reverse=True)
 
         return filtered_results[:max_results]
 
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def default_path(index_name: str) -> Path:
+        """Default index file path for ``index_name``."""
+        return Path(settings.BASE_DIR) / 'ai_assistant' / 'vector_indices' / f"{index_name}.index"
+
     def get_storage_path(self) -> Path:
         """Get the file path for storing this index."""
-        base_dir = Path(settings.BASE_DIR) / 'ai_assistant' / 'vector_indices'
-        base_dir.mkdir(parents=True, exist_ok=True)
-        return base_dir / f"{self.index_name}.index"
+        path = self.default_path(self.index_name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return path
 
     def save(self, filepath: Optional[str] = None):
         """
         Persist the index and metadata to disk.
 
+        Both files are written to temporary names and atomically renamed. The
+        metadata sidecar is replaced first and the index file last, so shared
+        handles (which watch the index file) never reload a half-written pair.
+
         Args:
             filepath: Optional custom filepath. If None, uses default path.
 
@@ -261,33 +478,89 @@ class VectorStore:
         filepath = Path(filepath)
         filepath.parent.mkdir(parents=True, exist_ok=True)
 
+        # Save metadata sidecar
+        metadata_file = filepath.with_suffix('.metadata')
+        tmp_metadata = self._temp_path(metadata_file)
+        try:
+            self._write_metadata(tmp_metadata)
+            os.replace(tmp_metadata, metadata_file)
+        finally:
+            if os.path.exists(tmp_metadata):
+                os.unlink(tmp_metadata)
+
         # Save FAISS index
-        index_file = str(filepath)
-        faiss.write_index(self.index, index_file)
-
-        # Save metadata
-        metadata_file = str(filepath.with_suffix('.metadata'))
-        with open(metadata_file, 'wb') as f:
-            pickle.dump({
-                'metadata': self.metadata,
-                'dimension': self.dimension,
-                'index_name': self.index_name,
-                'vector_count': self.vector_count
-            }, f)
+        tmp_index = self._temp_path(filepath)
+        try:
+            faiss.write_index(self.index, tmp_index)
+            os.replace(tmp_index, filepath)
+        finally:
+            if os.path.exists(tmp_index):
+                os.unlink(tmp_index)
 
         logger.info(
             f"Saved VectorStore '{self.index_name}' with {self.vector_count} vectors "
             f"to {filepath}"
         )
 
+    @staticmethod
+    def _temp_path(target: Path) -> str:
+        fd, path = tempfile.mkstemp(prefix=f".{target.name}.", dir=str(target.parent))
+        os.close(fd)
+        return path
+
+    def _write_metadata(self, path: str):
+        if os.path.exists(path):
+            os.unlink(path)
+        with sqlite3.connect(path) as conn:
+            conn.execute('CREATE TABLE store_info (key TEXT PRIMARY KEY, value TEXT NOT NULL)')
+            conn.execute(
+                'CREATE TABLE vectors ('
+                'vector_id INTEGER PRIMARY KEY, object_type TEXT, object_id TEXT, '
+                'metadata TEXT NOT NULL)'
+            )
+            conn.executemany(
+                'INSERT INTO store_info (key, value) VALUES (?, ?)',
+                [
+                    ('index_name', self.index_name),
+                    ('dimension', str(self.dimension)),
+                    ('index_type', self.index_type),
+                    ('next_id', str(self._next_id)),
+                    ('nlist', str(self.nlist)),
+                    ('nprobe', str(self.nprobe)),
+                    ('hnsw_m', str(self.hnsw_m)),
+                    ('ef_search', str(self.ef_search)),
+                ],
+            )
+            conn.executemany(
+                'INSERT INTO vectors (vector_id, object_type, object_id, metadata) '
+                'VALUES (?, ?, ?, ?)',
+                (
+                    (
+                        vector_id,
+                        meta.get('type'),
+                        None if meta.get('id') is None else str(meta.get('id')),
+                        json.dumps(meta, default=str),
+                    )
+                    for vector_id, meta in self._metadata.items()
+                ),
+            )
+        conn.close()
+
     @classmethod
-    def load(cls, index_name: str, filepath: Optional[str] = None) -> 'VectorStore':
+    def load(
+        cls,
+        index_name: str,
+        filepath: Optional[str] = None,
+        mmap: bool = False,
+    ) -> 'VectorStore':
         """
         Load a vector store from disk.
 
         Args:
             index_name: Name of the index to load
             filepath: Optional custom filepath. If None, uses default path.
+            mmap: Memory-map the index instead of reading it into RAM. The
+                returned store is read-only.
 
         Returns:
             Loaded VectorStore instance
@@ -297,30 +570,48 @@ class VectorStore:
             >>> print(f"Loaded {store.vector_count} vectors")
         """
         if filepath is None:
-            base_dir = Path(settings.BASE_DIR) / 'ai_assistant' / 'vector_indices'
-            filepath = str(base_dir / f"{index_name}.index")
+            filepath = str(cls.default_path(index_name))
 
         filepath = Path(filepath)
 
         if not filepath.exists():
             raise FileNotFoundError(f"Index file not found: {filepath}")
 
-        # Load FAISS index
-        index = faiss.read_index(str(filepath))
-
-        # Load metadata
         metadata_file = filepath.with_suffix('.metadata')
         if not metadata_file.exists():
             raise FileNotFoundError(f"Metadata file not found: {metadata_file}")
 
         with open(metadata_file, 'rb') as f:
-            stored_data = pickle.load(f)
-
-        # Create instance
-        dimension = stored_data['dimension']
-        store = cls(index_name=index_name, dimension=dimension)
-        store.index = index
-        store.metadata = stored_data['metadata']
+            is_sqlite = f.read(len(SQLITE_HEADER)) == SQLITE_HEADER
+
+        if not is_sqlite:
+            return cls._load_legacy(index_name, filepath, metadata_file)
+
+        with sqlite3.connect(f"file:{metadata_file}?mode=ro", uri=True) as conn:
+            info = dict(conn.execute('SELECT key, value FROM store_info'))
+            rows = conn.execute('SELECT vector_id, metadata FROM vectors ORDER BY vector_id')
+            metadata = {int(vector_id): json.loads(meta) for vector_id, meta in rows}
+        conn.close()
+
+        store = cls(
+            index_name=index_name,
+            dimension=int(info['dimension']),
+            index_type=info.get('index_type', INDEX_TYPE_FLAT),
+            nlist=int(info.get('nlist', 100)),
+            nprobe=int(info.get('nprobe', 8)),
+            hnsw_m=int(info.get('hnsw_m', 32)),
+            ef_search=int(info.get('ef_search', 64)),
+        )
+        io_flags = faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY if mmap else 0
+        store.index = faiss.read_index(str(filepath), io_flags)
+        store._metadata = metadata
+        store._keys = {}
+        for vector_id, meta in metadata.items():
+            key = cls._object_key(meta)
+            if key is not None:
+                store._keys[key] = vector_id
+        store._next_id = max(int(info.get('next_id', 0)), max(metadata, default=-1) + 1)
+        store.read_only = mmap
 
         logger.info(
             f"Loaded VectorStore '{index_name}' with {store.vector_count} vectors "
@@ -329,6 +620,27 @@ class VectorStore:
 
         return store
 
+    @classmethod
+    def _load_legacy(cls, index_name: str, filepath: Path, metadata_file: Path) -> 'VectorStore':
+        """Convert an index saved with pickled, position-based metadata."""
+        with open(metadata_file, 'rb') as f:
+            stored_data = pickle.load(f)
+
+        legacy_index = faiss.read_index(str(filepath))
+        store = cls(index_name=index_name, dimension=stored_data['dimension'])
+
+        # Positions beyond the metadata list were never addressable; drop them.
+        count = min(legacy_index.ntotal, len(stored_data['metadata']))
+        if count:
+            vectors = legacy_index.reconstruct_n(0, count)
+            store.add_vectors(vectors, stored_data['metadata'][:count])
+
+        logger.info(
+            f"Converted legacy VectorStore '{index_name}' with {store.vector_count} vectors "
+            f"from {filepath}"
+        )
+        return store
+
     @classmethod
     def load_or_create(cls, index_name: str, dimension: int = 384) -> 'VectorStore':
         """
@@ -347,44 +659,12 @@ class VectorStore:
             logger.info(f"Creating new VectorStore '{index_name}'")
             return cls(index_name=index_name, dimension=dimension)
 
-    def delete_by_id(self, object_id: int, object_type: str):
-        """
-        Remove vectors with specific object_id and type.
-
-        Note: FAISS doesn't support deletion, so we rebuild the index.
-
-        Args:
-            object_id: ID to remove
-            object_type: Type to remove
-        """
-        # Filter out matching metadata
-        keep_indices = []
-        for i, meta in enumerate(self.metadata):
-            if not (meta.get('id') == object_id and meta.get('type') == object_type):
-                keep_indices.append(i)
-
-        if len(keep_indices) == len(self.metadata):
-            logger.warning(f"No vectors found to delete for {object_type} ID {object_id}")
-            return
-
-        # Rebuild index with remaining vectors
-        old_count = self.vector_count
-        vectors_to_keep = []
-
-        # Extract vectors from old index
-        for i in keep_indices:
-            # FAISS doesn't allow direct vector extraction, so we need to rebuild
-            pass
-
-        logger.info(f"Deleted {old_count - len(keep_indices)} vectors from '{self.index_name}'")
-
-        # Update metadata
-        self.metadata = [self.metadata[i] for i in keep_indices]
-
     def clear(self):
         """Clear all vectors and metadata from the index."""
-        self.index = faiss.IndexFlatL2(self.dimension)
-        self.metadata = []
+        self._check_writable()
+        self.index = self._create_index()
+        self._metadata = {}
+        self._keys = {}
         logger.info(f"Cleared VectorStore '{self.index_name}'")
 
     def get_stats(self) -> Dict:
@@ -395,14 +675,77 @@ class VectorStore:
             Dictionary with statistics
         """
         type_counts = {}
-        for meta in self.metadata:
+        for meta in self._metadata.values():
             obj_type = meta.get('type', 'unknown')
             type_counts[obj_type] = type_counts.get(obj_type, 0) + 1
 
         return {
             'index_name': self.index_name,
+            'index_type': self.index_type,
             'dimension': self.dimension,
             'total_vectors': self.vector_count,
             'type_distribution': type_counts,
             'storage_path': str(self.get_storage_path())
         }
+
+
+# ----------------------------------------------------------------------
+# Process-wide shared handles
+# ----------------------------------------------------------------------
+
+_shared_stores: Dict[str, Tuple[Tuple, VectorStore]] = {}
+_shared_lock = threading.Lock()
+
+
+def _file_signature(path: Path) -> Tuple:
+    stat = path.stat()
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+def get_vector_store(index_name: str, filepath: Optional[str] = None) -> VectorStore:
+    """
+    Get the shared, memory-mapped, read-only handle for an index.
+
+    The handle is loaded once per process and reused across requests. Each
+    call compares the index file's signature (inode, mtime, size) with the
+    loaded one; ``VectorStore.save()`` replaces the file atomically, so a
+    reindex is picked up on the next call without a restart.
+
+    Args:
+        index_name: Name of the index
+        filepath: Optional custom filepath. If None, uses default path.
+
+    Returns:
+        Read-only VectorStore instance
+
+    Raises:
+        FileNotFoundError: If the index has not been built yet
+    """
+    path = Path(filepath) if filepath else VectorStore.default_path(index_name)
+    cache_key = str(path)
+
+    try:
+        signature = _file_signature(path)
+    except FileNotFoundError:
+        with _shared_lock:
+            _shared_stores.pop(cache_key, None)
+        raise FileNotFoundError(f"Index file not found: {path}")
+
+    cached = _shared_stores.get(cache_key)
+    if cached and cached[0] == signature:
+        return cached[1]
+
+    with _shared_lock:
+        cached = _shared_stores.get(cache_key)
+        if cached and cached[0] == signature:
+            return cached[1]
+        store = VectorStore.load(index_name, filepath=str(path), mmap=True)
+        _shared_stores[cache_key] = (signature, store)
+        logger.info(f"Loaded shared VectorStore handle '{index_name}'")
+        return store
+
+
+def reset_vector_store_handles():
+    """Drop every shared handle (used by tests and after bulk rebuilds)."""
+    with _shared_lock:
+        _shared_stores.clear()
@@ -170,3 +170,53 @@ class TestEmbeddingServiceIntegration:
 
         assert embedding is not None
         assert len(embedding) == 384
+
+
+class TestEmbeddingCache:
+    """Test cases for the query embedding cache."""
+
+    def setup_method(self):
+        from django.core.cache import cache
+
+        cache.clear()
+        EmbeddingService.embedding_cache.clear()
+        EmbeddingService.embedding_cache.reset_stats()
+
+    def test_repeated_text_is_served_from_cache(self):
+        """Encoding the same text twice runs the model once."""
+        service = EmbeddingService()
+        first = service.generate_embedding("Coastal fishing communities")
+        second = service.generate_embedding("  Coastal   fishing communities ")
+
+        stats = service.get_stats()['cache']
+        assert np.allclose(first, second)
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+        assert stats['hit_rate'] == 50.0
+
+    def test_shared_cache_is_used_after_local_eviction(self):
+        """Vectors evicted from the LRU are restored from the Django cache."""
+        from ai_assistant.services.embedding_service import EmbeddingCache
+
+        embedding_cache = EmbeddingCache(max_entries=1)
+        key_a = embedding_cache.make_key("a", "model", True)
+        key_b = embedding_cache.make_key("b", "model", True)
+        embedding_cache.set(key_a, np.arange(4, dtype=np.float32))
+        embedding_cache.set(key_b, np.ones(4, dtype=np.float32))
+
+        restored = embedding_cache.get(key_a)
+
+        assert restored.dtype == np.float32
+        assert np.array_equal(restored, np.arange(4, dtype=np.float32))
+        assert embedding_cache.get_stats()['shared_hits'] == 1
+        assert embedding_cache.get_stats()['size'] == 1
+
+    def test_keys_depend_on_model_and_normalization(self):
+        """Different models or normalization settings never share entries."""
+        from ai_assistant.services.embedding_service import EmbeddingCache
+
+        embedding_cache = EmbeddingCache()
+        base = embedding_cache.make_key("x", "model-a", True)
+
+        assert base != embedding_cache.make_key("x", "model-b", True)
+        assert base != embedding_cache.make_key("x", "model-a", False)
@@ -6,12 +6,17 @@ Run with:
 """
 
 import tempfile
+import uuid
 from pathlib import Path
 
 import numpy as np
 import pytest
 
-from ai_assistant.services.vector_store import VectorStore
+from ai_assistant.services.vector_store import (
+    VectorStore,
+    get_vector_store,
+    reset_vector_store_handles,
+)
 
 
 class TestVectorStore:
@@ -263,3 +268,152 @@ class TestVectorStoreIntegration:
             results = store2.search(vectors[0], k=1)
             assert len(results) == 1
             assert results[0][2]['name'] == 'Community A'
+
+
+class TestVectorStoreIdMapping:
+    """Stable ids, deletes, upserts and alternative index types."""
+
+    def test_delete_by_id_removes_vector(self):
+        """Deleted vectors are no longer returned and ids stay aligned."""
+        store = VectorStore('test', dimension=16)
+        vectors = np.random.rand(5, 16)
+        store.add_vectors(vectors, [{'id': i, 'type': 'test'} for i in range(5)])
+
+        removed = store.delete_by_id(2, 'test')
+
+        assert removed == 1
+        assert store.vector_count == 4
+        results = store.search(vectors[3], k=4)
+        assert 2 not in [meta['id'] for _, _, meta in results]
+        assert results[0][2]['id'] == 3
+
+    def test_add_vector_upserts_existing_object(self):
+        """Re-adding an object replaces its vector and keeps its id."""
+        store = VectorStore('test', dimension=16)
+        vectors = np.random.rand(3, 16)
+        first_id = store.add_vector(vectors[0], {'id': 7, 'type': 'test', 'v': 1})
+
+        second_id = store.add_vector(vectors[1], {'id': 7, 'type': 'test', 'v': 2})
+
+        assert first_id == second_id
+        assert store.vector_count == 1
+        vector_id, distance, meta = store.search(vectors[1], k=1)[0]
+        assert meta['v'] == 2
+        assert distance < 0.01
+
+    @pytest.mark.parametrize('index_type', ['ivf', 'hnsw'])
+    def test_approximate_index_types(self, index_type):
+        """IVF and HNSW indexes support search and deletes."""
+        store = VectorStore('test', dimension=16, index_type=index_type, nlist=4)
+        vectors = np.random.rand(200, 16).astype('float32')
+        store.add_vectors(vectors, [{'id': i, 'type': 'test'} for i in range(200)])
+
+        assert store.search(vectors[10], k=1)[0][2]['id'] == 10
+
+        store.delete_by_id(10, 'test')
+
+        assert store.vector_count == 199
+        assert 10 not in [meta['id'] for _, _, meta in store.search(vectors[10], k=5)]
+
+    def test_save_uses_sqlite_sidecar_and_keeps_ids(self):
+        """Metadata is stored in SQLite and ids survive a round trip."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = VectorStore('test', dimension=16)
+            vectors = np.random.rand(4, 16)
+            store.add_vectors(vectors, [{'id': i, 'type': 'test'} for i in range(4)])
+            store.delete_by_id(0, 'test')
+
+            filepath = Path(tmpdir) / 'test.index'
+            store.save(str(filepath))
+            loaded = VectorStore.load('test', filepath=str(filepath))
+
+            assert filepath.with_suffix('.metadata').read_bytes().startswith(b'SQLite format 3')
+            assert loaded.vector_count == 3
+            assert loaded.get_vector_id(3, 'test') == store.get_vector_id(3, 'test')
+            new_id = loaded.add_vector(np.random.rand(16), {'id': 99, 'type': 'test'})
+            assert new_id == 4
+
+    def test_uuid_ids_upsert_after_reload(self):
+        """UUID keys still match their vectors after a save/load round trip."""
+        object_id = uuid.uuid4()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = VectorStore('test', dimension=16)
+            store.add_vector(np.random.rand(16), {'id': object_id, 'type': 'organization'})
+            filepath = Path(tmpdir) / 'test.index'
+            store.save(str(filepath))
+
+            loaded = VectorStore.load('test', filepath=str(filepath))
+            vector_id = loaded.get_vector_id(object_id, 'organization')
+
+            assert vector_id is not None
+            assert loaded.add_vector(
+                np.random.rand(16), {'id': object_id, 'type': 'organization'}
+            ) == vector_id
+            assert loaded.vector_count == 1
+            assert loaded.delete_by_id(object_id, 'organization') == 1
+            assert loaded.vector_count == 0
+
+    def test_load_legacy_pickle_metadata(self):
+        """Indexes saved with pickled metadata are converted on load."""
+        import pickle
+
+        import faiss
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filepath = Path(tmpdir) / 'legacy.index'
+            vectors = np.random.rand(3, 16).astype('float32')
+            legacy_index = faiss.IndexFlatL2(16)
+            legacy_index.add(vectors)
+            faiss.write_index(legacy_index, str(filepath))
+            with open(filepath.with_suffix('.metadata'), 'wb') as f:
+                pickle.dump({'metadata': [{'id': i, 'type': 'test'} for i in range(3)],
+                             'dimension': 16, 'index_name': 'legacy', 'vector_count': 3}, f)
+
+            store = VectorStore.load('legacy', filepath=str(filepath))
+
+            assert store.vector_count == 3
+            assert store.search(vectors[1], k=1)[0][2]['id'] == 1
+
+
+class TestSharedVectorStoreHandle:
+    """Process-wide memory-mapped handles."""
+
+    def setup_method(self):
+        reset_vector_store_handles()
+
+    def teardown_method(self):
+        reset_vector_store_handles()
+
+    def test_handle_is_reused_until_file_changes(self):
+        """The same handle is returned until the index is saved again."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filepath = str(Path(tmpdir) / 'shared.index')
+            store = VectorStore('shared', dimension=16)
+            store.add_vectors(np.random.rand(2, 16), [{'id': i, 'type': 'test'} for i in range(2)])
+            store.save(filepath)
+
+            first = get_vector_store('shared', filepath=filepath)
+            assert get_vector_store('shared', filepath=filepath) is first
+            assert first.read_only
+
+            store.add_vector(np.random.rand(16), {'id': 5, 'type': 'test'})
+            store.save(filepath)
+
+            reloaded = get_vector_store('shared', filepath=filepath)
+            assert reloaded is not first
+            assert reloaded.vector_count == 3
+
+    def test_shared_handle_rejects_writes(self):
+        """Shared handles are read-only."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filepath = str(Path(tmpdir) / 'shared.index')
+            VectorStore('shared', dimension=16).save(filepath)
+            handle = get_vector_store('shared', filepath=filepath)
+
+            with pytest.raises(RuntimeError, match='read-only'):
+                handle.add_vector(np.random.rand(16), {'id': 1})
+
+    def test_missing_index_raises(self):
+        """A missing index raises FileNotFoundError like VectorStore.load."""
+        with pytest.raises(FileNotFoundError):
+            get_vector_store('missing', filepath='/nonexistent/missing.index')
@@ -694,6 +694,7 @@ class ConversationalAssistant:
             "intents": [],
             "has_ai": self.has_gemini,
             "available_models": self.query_executor.get_available_models(),
+            "query_cache": self.query_executor.get_cache_stats(),
         }
 
         # Add intent info
@@ -0,0 +1,200 @@
+"""
+Compiled Entity Extraction Engine for OBCMS Chat.
+
+Merges the vocabularies of every keyword-based resolver (ethnolinguistic
+group, livelihood, status, sector, priority, urgency, need status, ministry,
+assessment type, partnership type, written and ordinal numbers) into one
+token-level Aho-Corasick automaton, built once per process.
+
+A query is tokenized once and scanned once; every entity type is emitted from
+that scan. Each vocabulary term keeps its rank (dictionary order, then
+variant order) so the winner per entity type is exactly the term the
+resolver's own loop would have returned first.
+
+Locations come from the gazetteer and date/budget ranges from their
+regex-based resolvers.
+"""
+
+import re
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .gazetteer import AhoCorasick
+
+# Word runs, plus each punctuation character as its own token, so that
+# matching whole token sequences is equivalent to ``\b...\b`` regex matching.
+_TOKEN_RE = re.compile(r"\w+|[^\w\s]")
+
+NUMBERS_KEY = 'numbers'
+_WRITTEN = 'written'
+_ORDINAL = 'ordinal'
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase ``text`` and split it into word and punctuation tokens."""
+    return _TOKEN_RE.findall(text.lower()) if text else []
+
+
+def _confidence_if_canonical(high: float, low: float, canonical: Callable[[str], str] = str):
+    def build(key: str, term: str) -> Dict[str, Any]:
+        return {'value': key, 'confidence': high if term == canonical(key) else low}
+    return build
+
+
+def _ethnic_group(key: str, term: str) -> Dict[str, Any]:
+    return {
+        'value': key.replace('_', ' ').title(),
+        'confidence': 0.95 if term == key else 0.90,
+    }
+
+
+def _priority_level(key: str, term: str) -> Dict[str, Any]:
+    return {'value': key, 'urgency_level': key, 'confidence': 0.95}
+
+
+def _fixed_confidence(confidence: float):
+    def build(key: str, term: str) -> Dict[str, Any]:
+        return {'value': key, 'confidence': confidence}
+    return build
+
+
+def vocabulary_specs() -> List[Tuple[str, Dict[str, List[str]], Callable]]:
+    """
+    Return ``(entity_key, vocabulary, build_entity)`` for every keyword resolver.
+
+    Vocabularies are read from the resolver classes so there is a single
+    source of truth; ``build_entity(key, term)`` mirrors each resolver's output.
+    """
+    from .entity_resolvers import (
+        AssessmentTypeResolver,
+        EthnicGroupResolver,
+        LivelihoodResolver,
+        MinistryResolver,
+        NeedStatusResolver,
+        PartnershipTypeResolver,
+        PriorityLevelResolver,
+        SectorResolver,
+        StatusResolver,
+        UrgencyLevelResolver,
+    )
+
+    return [
+        ('ethnolinguistic_group', EthnicGroupResolver.ETHNIC_GROUP_VARIATIONS, _ethnic_group),
+        ('livelihood', LivelihoodResolver.LIVELIHOOD_KEYWORDS, _confidence_if_canonical(0.95, 0.90)),
+        ('status', StatusResolver.STATUS_KEYWORDS, _confidence_if_canonical(0.95, 0.90)),
+        ('sector', SectorResolver.SECTOR_PATTERNS, _confidence_if_canonical(0.95, 0.90)),
+        ('priority_level', PriorityLevelResolver.PRIORITY_PATTERNS, _priority_level),
+        ('urgency_level', UrgencyLevelResolver.URGENCY_PATTERNS, _fixed_confidence(1.0)),
+        ('need_status', NeedStatusResolver.STATUS_PATTERNS, _fixed_confidence(0.95)),
+        ('ministry', MinistryResolver.MINISTRY_PATTERNS, _confidence_if_canonical(0.95, 0.90, str.lower)),
+        ('assessment_type', AssessmentTypeResolver.ASSESSMENT_PATTERNS, _confidence_if_canonical(0.95, 0.90)),
+        ('partnership_type', PartnershipTypeResolver.PARTNERSHIP_PATTERNS, _confidence_if_canonical(0.95, 0.90, str.lower)),
+    ]
+
+
+class CompiledEntityEngine:
+    """
+    Single-pass matcher for all vocabulary-based entity types.
+
+    Example:
+        >>> engine = get_entity_engine()
+        >>> engine.scan("ongoing maranao fishing projects, top five")
+        {'ethnolinguistic_group': {'value': 'Meranaw', 'confidence': 0.9},
+         'livelihood': {'value': 'fishing', 'confidence': 0.95},
+         'status': {'value': 'ongoing', 'confidence': 0.95},
+         'numbers': [{'value': 5, 'type': 'cardinal', 'confidence': 0.95}], ...}
+    """
+
+    def __init__(self, specs: Optional[Iterable[Tuple[str, Dict[str, List[str]], Callable]]] = None):
+        from .entity_resolvers import NumberResolver
+
+        self._automaton = AhoCorasick()
+        self._builders: Dict[str, Callable] = {}
+        self.entity_keys: List[str] = []
+        self.term_count = 0
+
+        for entity_key, vocabulary, build_entity in specs or vocabulary_specs():
+            self.entity_keys.append(entity_key)
+            self._builders[entity_key] = build_entity
+            rank = 0
+            for key, terms in vocabulary.items():
+                for term in terms:
+                    self._add(tokenize(term), (entity_key, rank, key, term))
+                    rank += 1
+
+        for kind, table in ((_WRITTEN, NumberResolver.WRITTEN_NUMBERS), (_ORDINAL, NumberResolver.ORDINAL_PATTERNS)):
+            for rank, (word, value) in enumerate(table.items()):
+                self._add(tokenize(word), (kind, rank, value, word))
+
+        self._automaton.build()
+
+    def _add(self, tokens: List[str], payload: Tuple):
+        if tokens:
+            self._automaton.add(tuple(tokens), payload)
+            self.term_count += 1
+
+    def scan(self, query: str) -> Dict[str, Any]:
+        """Return every vocabulary entity and the numbers found in ``query``."""
+        tokens = tokenize(query)
+
+        best: Dict[str, Tuple[int, str, str]] = {}
+        numbers: Dict[str, Dict[int, Any]] = {_WRITTEN: {}, _ORDINAL: {}}
+        for _, _, (entity_key, rank, key, term) in self._automaton.iter_matches(tokens):
+            if entity_key in numbers:
+                numbers[entity_key][rank] = key
+            elif entity_key not in best or rank < best[entity_key][0]:
+                best[entity_key] = (rank, key, term)
+
+        entities = {}
+        for entity_key in self.entity_keys:
+            if entity_key in best:
+                _, key, term = best[entity_key]
+                entities[entity_key] = self._builders[entity_key](key, term)
+
+        entities[NUMBERS_KEY] = self._numbers(tokens, numbers)
+        return entities
+
+    @staticmethod
+    def _numbers(tokens: List[str], matched: Dict[str, Dict[int, Any]]) -> List[Dict[str, Any]]:
+        """Same order and de-duplication as ``NumberResolver.resolve``."""
+        found = [
+            {'value': int(token), 'type': 'cardinal', 'confidence': 1.0}
+            for token in tokens
+            if token.isdecimal()
+        ]
+        found.extend(
+            {'value': value, 'type': 'cardinal', 'confidence': 0.95}
+            for _, value in sorted(matched[_WRITTEN].items())
+        )
+        found.extend(
+            {'value': value, 'type': 'ordinal', 'confidence': 0.95}
+            for _, value in sorted(matched[_ORDINAL].items())
+        )
+
+        unique: Dict[int, Dict[str, Any]] = {}
+        for number in found:
+            value = number['value']
+            if value not in unique or number['confidence'] > unique[value]['confidence']:
+                unique[value] = number
+        return list(unique.values())
+
+
+_lock = threading.Lock()
+_engine: Optional[CompiledEntityEngine] = None
+
+
+def get_entity_engine() -> CompiledEntityEngine:
+    """Return the process-wide compiled engine, building it on first use."""
+    global _engine
+    if _engine is None:
+        with _lock:
+            if _engine is None:
+                _engine = CompiledEntityEngine()
+    return _engine
+
+
+def reset_entity_engine():
+    """Drop the compiled engine (after changing a resolver vocabulary)."""
+    global _engine
+    with _lock:
+        _engine = None
@@ -4,7 +4,10 @@ Entity Extractor for OBCMS Chat System.
 This module extracts structured entities from natural language queries without using AI.
 Supports locations, ethnolinguistic groups, livelihoods, date ranges, status, and numbers.
 
-Performance target: <20ms per extraction
+Keyword vocabularies are matched in one pass by the compiled engine in
+``entity_engine``; locations come from the in-memory gazetteer.
+
+Performance target: <1ms per extraction
 """
 
 import re
@@ -40,6 +43,25 @@ from common.ai_services.chat.entity_resolvers import (
     AssessmentTypeResolver,
     PartnershipTypeResolver,
 )
+from common.ai_services.chat.entity_engine import get_entity_engine
+
+# Output order of extract_entities (kept stable for callers and logs).
+ENTITY_ORDER = (
+    'location',
+    'ethnolinguistic_group',
+    'livelihood',
+    'date_range',
+    'status',
+    'numbers',
+    'sector',
+    'priority_level',
+    'urgency_level',
+    'need_status',
+    'ministry',
+    'budget_range',
+    'assessment_type',
+    'partnership_type',
+)
 
 
 class EntityExtractor:
@@ -111,67 +133,47 @@ class EntityExtractor:
         # Normalize query
         normalized_query = query.lower().strip()
 
-        entities = {}
-
-        # Extract each entity type
-        location = self._extract_location(normalized_query)
-        if location:
-            entities['location'] = location
-
-        ethnic_group = self._extract_ethnolinguistic_group(normalized_query)
-        if ethnic_group:
-            entities['ethnolinguistic_group'] = ethnic_group
-
-        livelihood = self._extract_livelihood(normalized_query)
-        if livelihood:
-            entities['livelihood'] = livelihood
-
-        date_range = self._extract_date_range(normalized_query)
-        if date_range:
-            entities['date_range'] = date_range
-
-        status = self._extract_status(normalized_query)
-        if status:
-            entities['status'] = status
-
-        numbers = self._extract_numbers(normalized_query)
-        if numbers:
-            entities['numbers'] = numbers
-
-        # Needs-specific entities
-        sector = self._extract_sector(normalized_query)
-        if sector:
-            entities['sector'] = sector
+        found = get_entity_engine().scan(normalized_query)
+        found['location'] = self._extract_location(normalized_query)
+        found['date_range'] = self._extract_date_range(normalized_query)
+        found['budget_range'] = self._extract_budget_range(normalized_query)
 
-        priority_level = self._extract_priority_level(normalized_query)
-        if priority_level:
-            entities['priority_level'] = priority_level
+        return {key: found[key] for key in ENTITY_ORDER if found.get(key)}
 
-        urgency_level = self._extract_urgency_level(normalized_query)
-        if urgency_level:
-            entities['urgency_level'] = urgency_level
-
-        need_status = self._extract_need_status(normalized_query)
-        if need_status:
-            entities['need_status'] = need_status
-
-        # Advanced entities
-        ministry = self._extract_ministry(normalized_query)
-        if ministry:
-            entities['ministry'] = ministry
-
-        budget_range = self._extract_budget_range(normalized_query)
-        if budget_range:
-            entities['budget_range'] = budget_range
+    def extract_entities_sequential(self, query: str) -> Dict[str, Any]:
+        """
+        Extract entities by running every resolver in turn.
 
-        assessment_type = self._extract_assessment_type(normalized_query)
-        if assessment_type:
-            entities['assessment_type'] = assessment_type
+        Produces the same result as ``extract_entities`` using each resolver's
+        own matching loop. Kept as the reference implementation for parity
+        tests and the ``benchmark_query_system`` comparison.
+        """
+        if not query or not isinstance(query, str):
+            return {}
 
-        partnership_type = self._extract_partnership_type(normalized_query)
-        if partnership_type:
-            entities['partnership_type'] = partnership_type
+        normalized_query = query.lower().strip()
+        extractors = {
+            'location': self._extract_location,
+            'ethnolinguistic_group': self._extract_ethnolinguistic_group,
+            'livelihood': self._extract_livelihood,
+            'date_range': self._extract_date_range,
+            'status': self._extract_status,
+            'numbers': self._extract_numbers,
+            'sector': self._extract_sector,
+            'priority_level': self._extract_priority_level,
+            'urgency_level': self._extract_urgency_level,
+            'need_status': self._extract_need_status,
+            'ministry': self._extract_ministry,
+            'budget_range': self._extract_budget_range,
+            'assessment_type': self._extract_assessment_type,
+            'partnership_type': self._extract_partnership_type,
+        }
 
+        entities = {}
+        for key in ENTITY_ORDER:
+            value = extractors[key](normalized_query)
+            if value:
+                entities[key] = value
         return entities
 
     def _extract_location(self, query: str) -> Optional[Dict[str, Any]]:
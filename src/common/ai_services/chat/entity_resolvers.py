@@ -18,7 +18,6 @@ from typing import Any, Dict, List, Optional
 
 try:
     from django.utils import timezone
-    from django.db.models import Q
     HAS_DJANGO = True
 except ImportError:
     # Fallback for testing without Django
@@ -30,7 +29,6 @@ except ImportError:
         @staticmethod
         def get_current_timezone():
             return pytz.UTC
-    Q = None
     HAS_DJANGO = False
 
 
@@ -87,15 +85,31 @@ class LocationResolver:
         'davao occidental': ['davao occidental', 'docc', 'd occidental'],
     }
 
-    def __init__(self):
-        """Initialize location resolver with cached data."""
-        self._region_cache = None
-        self._province_cache = None
+    def __init__(self, gazetteer=None):
+        """
+        Initialize location resolver.
+
+        Args:
+            gazetteer: Gazetteer to match against (defaults to the shared,
+                version-refreshed instance from ``get_gazetteer()``)
+        """
+        self._gazetteer = gazetteer
+
+    @property
+    def gazetteer(self):
+        from .gazetteer import get_gazetteer
+
+        return self._gazetteer or get_gazetteer(include_database=HAS_DJANGO)
 
     def resolve(self, query: str) -> Optional[Dict[str, Any]]:
         """
         Resolve location entity from query.
 
+        Provinces win over regions, regions over municipalities and
+        municipalities over barangays. All aliases are matched in one pass
+        over the in-memory gazetteer, with a fuzzy fallback for typos; no
+        database queries are made once the gazetteer is built.
+
         Args:
             query: Normalized query string (lowercase)
 
@@ -104,119 +118,12 @@ class LocationResolver:
 
         Example:
             >>> resolve("communities in zamboanga")
-            {'type': 'region', 'value': 'Region IX', 'confidence': 0.85}
+            {'type': 'region', 'value': 'Region IX', 'code': 'IX', 'confidence': 0.85}
         """
         if not query:
             return None
 
-        normalized_query = query.lower()
-
-        # Try province patterns first (more specific the region names)
-        province = self._match_province(normalized_query)
-        if province:
-            return province
-
-        # Try region patterns
-        region = self._match_region(normalized_query)
-        if region:
-            return region
-
-        # Try database lookup for municipalities
-        municipality = self._match_municipality(normalized_query)
-        if municipality:
-            return municipality
-
-        return None
-
-    def _match_region(self, query: str) -> Optional[Dict[str, Any]]:
-        """Match region from query using pattern matching."""
-        for region_code, region_data in self.REGION_PATTERNS.items():
-            for name_variant in region_data['names']:
-                pattern = rf"\b{re.escape(name_variant)}\b"
-                if re.search(pattern, query):
-                    # Calculate confidence based on match quality
-                    confidence = 0.95 if name_variant.startswith('region') else 0.85
-
-                    return {
-                        'type': 'region',
-                        'value': region_data['official_name'],
-                        'code': region_data['code'],
-                        'confidence': confidence,
-                    }
-        return None
-
-    def _match_province(self, query: str) -> Optional[Dict[str, Any]]:
-        """Match province from query using fuzzy matching."""
-        for province_name, variations in self.PROVINCE_VARIATIONS.items():
-            for variant in variations:
-                pattern = rf"\b{re.escape(variant)}\b"
-                if re.search(pattern, query):
-                    # Calculate confidence based on match length
-                    confidence = min(0.92, 0.7 + (len(variant) / 20))
-
-                    # Try to get actual province from database for validation
-                    validated_name = self._validate_province_db(province_name)
-
-                    return {
-                        'type': 'province',
-                        'value': validated_name or province_name.title(),
-                        'confidence': confidence if validated_name else confidence * 0.9,
-                    }
-        return None
-
-    def _match_municipality(self, query: str) -> Optional[Dict[str, Any]]:
-        """Match municipality from query using database lookup."""
-        if not HAS_DJANGO:
-            return None
-
-        try:
-            from common.models import Municipality
-
-            # Extract potential municipality names (2-3 word phrases)
-            words = query.split()
-            for i in range(len(words)):
-                for length in [3, 2, 1]:  # Try 3-word, then 2-word, then 1-word
-                    if i + length <= len(words):
-                        phrase = ' '.join(words[i:i+length])
-
-                        # Case-insensitive lookup
-                        municipality = Municipality.objects.filter(
-                            Q(name__iexact=phrase) | Q(name__icontains=phrase)
-                        ).first()
-
-                        if municipality:
-                            confidence = 0.90 if municipality.name.lower() == phrase else 0.75
-                            return {
-                                'type': 'municipality',
-                                'value': municipality.name,
-                                'province': municipality.province.name,
-                                'region': municipality.province.region.name,
-                                'confidence': confidence,
-                            }
-        except Exception:
-            # Database not available or model import failed
-            pass
-
-        return None
-
-    def _validate_province_db(self, province_name: str) -> Optional[str]:
-        """Validate and get official province name from database."""
-        if not HAS_DJANGO:
-            return None
-
-        try:
-            from common.models import Province
-
-            province = Province.objects.filter(
-                Q(name__iexact=province_name) | Q(name__icontains=province_name)
-            ).first()
-
-            if province:
-                return province.name
-        except Exception:
-            pass
-
-        return None
+        return self.gazetteer.resolve(query)
 
 
 class EthnicGroupResolver:
@@ -0,0 +1,375 @@
+"""
+Offline Gazetteer for Chat Location Resolution.
+
+Holds every region, province, municipality and barangay name, plus the
+aliases declared on ``LocationResolver``, in an in-memory Aho-Corasick
+automaton built over word tokens. A message is matched in one linear pass
+with no database access; the automaton only touches the database when it is
+(re)built.
+
+The process-wide instance returned by ``get_gazetteer()`` is rebuilt when the
+``locations`` cache tag is bumped (see ``common.services.locations``), checked
+at most every ``VERSION_CHECK_INTERVAL`` seconds.
+
+Typos fall back to a fuzzy comparison against region, province and
+municipality names bucketed by token count, first letter and length.
+"""
+
+import logging
+import re
+import threading
+import time
+import unicodedata
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Resolution priority when several locations are mentioned.
+TYPE_PRIORITY = ('province', 'region', 'municipality', 'barangay')
+FUZZY_TYPES = ('province', 'region', 'municipality')
+
+FUZZY_THRESHOLD = 0.85
+FUZZY_MIN_LENGTH = 5
+FUZZY_MAX_CONFIDENCE = 0.75
+FUZZY_LENGTH_SLACK = 2
+
+VERSION_CHECK_INTERVAL = 30.0
+
+_TOKEN_RE = re.compile(r"\w+")
+_CITY_RE = re.compile(r"^(?:city of )?(.+?)(?: city)?$")
+
+
+def tokenize(text: str) -> Tuple[str, ...]:
+    """Lowercase, strip accents and split ``text`` into word tokens."""
+    if not text:
+        return ()
+    decomposed = unicodedata.normalize('NFKD', text.lower())
+    folded = ''.join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return tuple(_TOKEN_RE.findall(folded))
+
+
+class AhoCorasick:
+    """
+    Aho-Corasick automaton over token sequences.
+
+    Patterns are tuples of tokens, so every match falls on word boundaries.
+
+    Example:
+        >>> automaton = AhoCorasick()
+        >>> automaton.add(('sultan', 'kudarat'), 'SK')
+        >>> automaton.build()
+        >>> list(automaton.iter_matches(('in', 'sultan', 'kudarat')))
+        [(1, 3, 'SK')]
+    """
+
+    def __init__(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[Tuple[int, Any]]] = [[]]
+        self._built = False
+
+    def add(self, tokens: Tuple[str, ...], value: Any):
+        if not tokens:
+            return
+        node = 0
+        for token in tokens:
+            nxt = self._goto[node].get(token)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][token] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        self._out[node].append((len(tokens), value))
+        self._built = False
+
+    def build(self):
+        """Compute failure links breadth first."""
+        queue = list(self._goto[0].values())
+        for node in queue:
+            self._fail[node] = 0
+        head = 0
+        while head < len(queue):
+            node = queue[head]
+            head += 1
+            for token, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and token not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(token, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+        self._built = True
+
+    def iter_matches(self, tokens: Iterable[str]) -> Iterator[Tuple[int, int, Any]]:
+        """Yield ``(start, end, value)`` for every pattern found in ``tokens``."""
+        if not self._built:
+            self.build()
+        node = 0
+        for index, token in enumerate(tokens):
+            while node and token not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(token, 0)
+            for length, value in self._out[node]:
+                yield index + 1 - length, index + 1, value
+
+
+@dataclass(frozen=True)
+class GazetteerEntry:
+    """One alias of a location and the entity it resolves to."""
+
+    type: str
+    value: str
+    alias: str
+    confidence: float
+    details: Tuple[Tuple[str, str], ...] = ()
+
+    def as_entity(self, confidence: Optional[float] = None) -> Dict[str, Any]:
+        entity = {'type': self.type, 'value': self.value}
+        entity.update(self.details)
+        entity['confidence'] = round(self.confidence if confidence is None else confidence, 2)
+        return entity
+
+
+class Gazetteer:
+    """
+    In-memory location index with single-pass exact matching.
+
+    Example:
+        >>> gazetteer = Gazetteer(entries)
+        >>> gazetteer.resolve("communities in sultan kudarat")
+        {'type': 'province', 'value': 'Sultan Kudarat', 'confidence': 0.92}
+    """
+
+    def __init__(self, entries: Iterable[GazetteerEntry], version: Any = None, complete: bool = True):
+        self.version = version
+        self.complete = complete
+        self.size = 0
+        self._automaton = AhoCorasick()
+        self._fuzzy: Dict[Tuple[int, str, int], List[Tuple[str, int, GazetteerEntry]]] = {}
+
+        for order, entry in enumerate(entries):
+            tokens = tokenize(entry.alias)
+            if not tokens:
+                continue
+            self._automaton.add(tokens, (order, entry))
+            self.size += 1
+
+            alias = ' '.join(tokens)
+            if entry.type in FUZZY_TYPES and len(alias) >= FUZZY_MIN_LENGTH:
+                key = (len(tokens), alias[0], len(alias))
+                self._fuzzy.setdefault(key, []).append((alias, order, entry))
+
+        self._automaton.build()
+
+    def find(self, text: str) -> List[Tuple[int, int, GazetteerEntry]]:
+        """Return every exact alias match as ``(start, end, entry)``."""
+        return [
+            (start, end, entry)
+            for start, end, (_, entry) in self._automaton.iter_matches(tokenize(text))
+        ]
+
+    def resolve(self, text: str) -> Optional[Dict[str, Any]]:
+        """Return the best location entity in ``text`` or None."""
+        tokens = tokenize(text)
+        if not tokens:
+            return None
+
+        best = None
+        best_key = None
+        for start, end, (order, entry) in self._automaton.iter_matches(tokens):
+            key = (TYPE_PRIORITY.index(entry.type), start - end, start, order)
+            if best_key is None or key < best_key:
+                best, best_key = entry, key
+        if best is not None:
+            return best.as_entity()
+
+        return self._resolve_fuzzy(tokens)
+
+    def _resolve_fuzzy(self, tokens: Tuple[str, ...]) -> Optional[Dict[str, Any]]:
+        best = None
+        best_key = None
+        for size in (3, 2, 1):
+            for start in range(len(tokens) - size + 1):
+                phrase = ' '.join(tokens[start:start + size])
+                if len(phrase) < FUZZY_MIN_LENGTH:
+                    continue
+                for length in range(len(phrase) - FUZZY_LENGTH_SLACK, len(phrase) + FUZZY_LENGTH_SLACK + 1):
+                    for alias, order, entry in self._fuzzy.get((size, phrase[0], length), ()):
+                        matcher = SequenceMatcher(None, phrase, alias)
+                        if matcher.quick_ratio() < FUZZY_THRESHOLD:
+                            continue
+                        ratio = matcher.ratio()
+                        if ratio < FUZZY_THRESHOLD:
+                            continue
+                        key = (-ratio, TYPE_PRIORITY.index(entry.type), order)
+                        if best_key is None or key < best_key:
+                            best, best_key = (entry, ratio), key
+
+        if best is None:
+            return None
+        entry, ratio = best
+        return entry.as_entity(min(entry.confidence, FUZZY_MAX_CONFIDENCE) * ratio)
+
+
+# ----------------------------------------------------------------------
+# Building
+# ----------------------------------------------------------------------
+
+
+def _province_confidence(alias: str) -> float:
+    # Same scale LocationResolver has always used: longer aliases score higher.
+    return min(0.92, 0.7 + (len(alias) / 20))
+
+
+def _static_entries(province_names: Optional[List[str]] = None) -> List[GazetteerEntry]:
+    """Aliases declared on LocationResolver, validated against DB provinces."""
+    from .entity_resolvers import LocationResolver
+
+    by_name = {' '.join(tokenize(name)): name for name in province_names or []}
+
+    entries = []
+    for canonical, variations in LocationResolver.PROVINCE_VARIATIONS.items():
+        validated = by_name.get(canonical) or next(
+            (name for key, name in sorted(by_name.items()) if canonical in key), None
+        )
+        for variant in variations:
+            confidence = _province_confidence(variant)
+            entries.append(GazetteerEntry(
+                type='province',
+                value=validated or canonical.title(),
+                alias=variant,
+                confidence=confidence if validated else confidence * 0.9,
+            ))
+
+    for region_data in LocationResolver.REGION_PATTERNS.values():
+        for name_variant in region_data['names']:
+            entries.append(GazetteerEntry(
+                type='region',
+                value=region_data['official_name'],
+                alias=name_variant,
+                confidence=0.95 if name_variant.startswith('region') else 0.85,
+                details=(('code', region_data['code']),),
+            ))
+    return entries
+
+
+def _database_entries() -> Tuple[List[GazetteerEntry], List[str]]:
+    """Entries for every stored location, read with one query per level."""
+    from common.models import Barangay, Municipality, Province, Region
+    from .entity_resolvers import LocationResolver
+
+    entries = []
+
+    for code, name in Region.objects.values_list('code', 'name'):
+        pattern = LocationResolver.REGION_PATTERNS.get(code)
+        details = (('code', code),)
+        value = pattern['official_name'] if pattern else name
+        entries.append(GazetteerEntry('region', value, name, 0.90, details))
+        entries.append(GazetteerEntry('region', value, f"region {code}", 0.95, details))
+
+    province_names = list(Province.objects.values_list('name', flat=True))
+    for name in province_names:
+        entries.append(GazetteerEntry('province', name, name, _province_confidence(name)))
+
+    municipalities = Municipality.objects.values_list(
+        'name', 'province__name', 'province__region__name'
+    )
+    for name, province, region in municipalities.iterator(chunk_size=2000):
+        details = (('province', province), ('region', region))
+        entries.append(GazetteerEntry('municipality', name, name, 0.90, details))
+        # "Dipolog City" / "City of Dipolog" are usually written "Dipolog".
+        short = _CITY_RE.match(name.lower()).group(1)
+        if short != name.lower():
+            entries.append(GazetteerEntry('municipality', name, short, 0.85, details))
+
+    barangays = Barangay.objects.values_list(
+        'name', 'municipality__name', 'municipality__province__name'
+    )
+    for name, municipality, province in barangays.iterator(chunk_size=2000):
+        details = (('municipality', municipality), ('province', province))
+        entries.append(GazetteerEntry('barangay', name, name, 0.80, details))
+
+    return entries, province_names
+
+
+def build_gazetteer(include_database: bool = True, version: Any = None) -> Gazetteer:
+    """
+    Build a gazetteer from the static aliases and, when possible, the DB.
+
+    The curated aliases go first so their confidences win ties with stored
+    names. If the database cannot be read the gazetteer holds the static aliases only and is
+    flagged incomplete so it is rebuilt on the next request.
+    """
+    database_entries: List[GazetteerEntry] = []
+    province_names: List[str] = []
+    complete = True
+
+    if include_database:
+        try:
+            database_entries, province_names = _database_entries()
+        except Exception as e:
+            logger.warning(f"Gazetteer built without database locations: {e}")
+            complete = False
+
+    entries = _static_entries(province_names) + database_entries
+    return Gazetteer(entries, version=version, complete=complete)
+
+
+# ----------------------------------------------------------------------
+# Process-wide instance
+# ----------------------------------------------------------------------
+
+_lock = threading.Lock()
+_gazetteer: Optional[Gazetteer] = None
+_checked_at = 0.0
+
+
+def _current_version():
+    try:
+        from common.services.cache_tags import get_tag_versions
+        from common.services.locations import LOCATIONS_CACHE_TAG
+
+        return get_tag_versions([LOCATIONS_CACHE_TAG])[LOCATIONS_CACHE_TAG]
+    except Exception:
+        return None
+
+
+def get_gazetteer(include_database: bool = True) -> Gazetteer:
+    """Return the shared gazetteer, rebuilding it when locations changed."""
+    global _gazetteer, _checked_at
+
+    gazetteer = _gazetteer
+    now = time.monotonic()
+    if (
+        gazetteer is not None
+        and gazetteer.complete
+        and now - _checked_at < VERSION_CHECK_INTERVAL
+    ):
+        return gazetteer
+
+    with _lock:
+        version = _current_version() if include_database else None
+        gazetteer = _gazetteer
+        if gazetteer is None or not gazetteer.complete or gazetteer.version != version:
+            started = time.perf_counter()
+            gazetteer = build_gazetteer(include_database=include_database, version=version)
+            logger.info(
+                f"Gazetteer built with {gazetteer.size} aliases in "
+                f"{(time.perf_counter() - started) * 1000:.1f}ms"
+            )
+            _gazetteer = gazetteer
+        _checked_at = now
+    return gazetteer
+
+
+def reset_gazetteer():
+    """Drop the shared gazetteer so the next lookup rebuilds it."""
+    global _gazetteer, _checked_at
+    with _lock:
+        _gazetteer = None
+        _checked_at = 0.0
@@ -3,16 +3,54 @@ Query Executor for Conversational AI
 
 Safely executes Django ORM queries generated from natural language.
 Implements comprehensive security validation to prevent dangerous operations.
+
+Results of string queries are cached under the canonical query string plus
+the data version of every exposed model the query reads. Saving or deleting
+one of those models bumps its version (see ``connect_query_cache_signals``),
+so cached answers never outlive the data they were computed from.
 """
 
 import ast
+import hashlib
 import logging
-from typing import Any, Dict, List, Optional
-
+import re
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
 from django.db.models import Avg, Count, Max, Min, Q, Sum
+from django.db.models.signals import post_delete, post_save
+
+from common.services.cache_tags import (
+    build_versioned_key,
+    has_pending_invalidation,
+    invalidate_tags,
+)
 
 logger = logging.getLogger(__name__)
 
+QUERY_CACHE_NAMESPACE = "chat:query"
+QUERY_CACHE_TTL = getattr(settings, "CHAT_QUERY_CACHE_TTL", 3600)  # seconds
+
+_IDENTIFIER_RE = re.compile(r"[A-Za-z_]\w*")
+_ROOT_MODEL_RE = re.compile(r"^\s*(\w+)\.objects\b")
+
+
+def query_cache_tag(model_name: str) -> str:
+    """Return the data-version tag for an exposed model."""
+    return f"chat:model:{model_name}"
+
+
+def invalidate_query_cache(model_names: Iterable[str], using: Optional[str] = None):
+    """Invalidate cached query results that read any of ``model_names``."""
+    invalidate_tags(
+        [query_cache_tag(name) for name in model_names],
+        using=using or DEFAULT_DB_ALIAS,
+    )
+
 
 class QueryExecutor:
     """
@@ -93,6 +131,9 @@ class QueryExecutor:
     def __init__(self):
         """Initialize query executor with safety context."""
         self._context = self._build_safe_context()
+        self._relation_index = self._build_relation_index()
+        self._stats_lock = threading.Lock()
+        self.reset_cache_stats()
 
     def execute(self, query_input: Any) -> Dict[str, Any]:
         """
@@ -106,7 +147,8 @@ class QueryExecutor:
                 - success: bool
                 - result: Query result or None
                 - error: Error message if failed
-                - query_info: Metadata about the query
+                - query_info: Metadata about the query (``cached`` is True
+                  when a string query was served from the result cache)
 
         Security:
             - If QuerySet is provided directly, no eval() or parsing is needed (most secure)
@@ -144,13 +186,20 @@ class QueryExecutor:
                         "query_info": validation,
                     }
 
-                # Step 2: Execute query in restricted context
+                # Step 2: Serve repeated queries from the result cache
+                cache_key = self._result_cache_key(query_string)
+                cached = self._get_cached_result(cache_key)
+                if cached is not None:
+                    return cached
+
+                # Step 3: Execute query in restricted context
+                started = time.perf_counter()
                 result = self._execute_safe(query_string)
 
-            # Step 3: Process and limit results
+            # Step 4: Process and limit results
             processed_result = self._process_result(result)
 
-            return {
+            response = {
                 "success": True,
                 "result": processed_result,
                 "error": None,
@@ -161,6 +210,12 @@ class QueryExecutor:
                 },
             }
 
+            if not isinstance(query_input, QuerySet):
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                self._store_cached_result(cache_key, response, elapsed_ms)
+
+            return response
+
         except Exception as e:
             query_repr = str(query_input)[:200] if query_input else "None"
             logger.error(f"Query execution failed: {query_repr} - {str(e)}")
@@ -171,6 +226,98 @@ class QueryExecutor:
                 "query_info": {"query": query_repr},
             }
 
+    def _query_cache_tags(self, query_string: str) -> List[str]:
+        """
+        Return the data-version tags of every exposed model a query reads.
+
+        The root model comes from ``<Model>.objects``; related models are
+        found by resolving each ``__``-separated lookup segment against the
+        relation names of the exposed models.
+        """
+        root = _ROOT_MODEL_RE.match(query_string)
+        if not root or root.group(1) not in self.ALLOWED_MODELS:
+            return []
+
+        models = {root.group(1)}
+        for identifier in _IDENTIFIER_RE.findall(query_string):
+            for segment in identifier.split("__"):
+                if segment in self._relation_index:
+                    models.add(self._relation_index[segment])
+                elif segment in self.ALLOWED_MODELS:
+                    models.add(segment)
+
+        return sorted(query_cache_tag(name) for name in models)
+
+    def _result_cache_key(self, query_string: str) -> Optional[str]:
+        """
+        Build the versioned cache key for a validated query string.
+
+        Returns None when the query cannot be cached, or when the current
+        transaction has uncommitted writes to a model it reads.
+        """
+        tags = self._query_cache_tags(query_string)
+        if not tags or has_pending_invalidation(tags):
+            return None
+
+        # Template substitution already yields one string per question; the
+        # AST round-trip also folds spacing and quoting differences.
+        canonical = ast.unparse(ast.parse(query_string, mode="eval"))
+        digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:32]
+        return build_versioned_key(QUERY_CACHE_NAMESPACE, tags, digest)
+
+    def _get_cached_result(self, cache_key: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Return the cached response for ``cache_key`` and record the access."""
+        if cache_key is None:
+            return None
+
+        entry = cache.get(cache_key)
+        with self._stats_lock:
+            if entry is None:
+                self._cache_stats["misses"] += 1
+                return None
+            self._cache_stats["hits"] += 1
+            self._cache_stats["time_saved_ms"] += entry["elapsed_ms"]
+
+        response = entry["response"]
+        response["query_info"]["cached"] = True
+        return response
+
+    def _store_cached_result(
+        self, cache_key: Optional[str], response: Dict[str, Any], elapsed_ms: float
+    ):
+        """Cache a successful response with the time it took to compute."""
+        if cache_key is None:
+            return
+        try:
+            cache.set(
+                cache_key,
+                {"response": response, "elapsed_ms": elapsed_ms},
+                QUERY_CACHE_TTL,
+            )
+        except Exception as e:
+            # Unpicklable results are simply not cached
+            logger.warning(f"Could not cache query result: {e}")
+
+    def reset_cache_stats(self):
+        """Reset the result cache counters."""
+        with self._stats_lock:
+            self._cache_stats = {"hits": 0, "misses": 0, "time_saved_ms": 0.0}
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get result cache statistics for this process.
+
+        Returns:
+            Dict with hits, misses, hit_rate (percent) and time_saved_ms
+        """
+        with self._stats_lock:
+            stats = dict(self._cache_stats)
+
+        total = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / total * 100, 2) if total else 0.0
+        stats["time_saved_ms"] = round(stats["time_saved_ms"], 2)
+        return stats
+
     def _validate_query(self, query_string: str) -> Dict[str, Any]:
         """
         Validate query safety using multiple approaches.
@@ -547,16 +694,8 @@ class QueryExecutor:
         Returns:
             Dictionary mapping names to safe objects
         """
-        context = {}
-
         # Import and add allowed models
-        for model_name, import_path in self.ALLOWED_MODELS.items():
-            try:
-                module_path, class_name = import_path.rsplit(".", 1)
-                module = __import__(module_path, fromlist=[class_name])
-                context[model_name] = getattr(module, class_name)
-            except (ImportError, AttributeError) as e:
-                logger.warning(f"Could not import {import_path}: {e}")
+        context = dict(_load_allowed_models(self.ALLOWED_MODELS))
 
         # Add aggregation functions
         context["Count"] = Count
@@ -568,6 +707,32 @@ class QueryExecutor:
 
         return context
 
+    def _build_relation_index(self) -> Dict[str, str]:
+        """
+        Map relation lookup names to the exposed model they lead to.
+
+        Covers forward and reverse relations between exposed models, e.g.
+        ``barangay`` -> Barangay or ``communities`` -> OBCCommunity.
+        """
+        exposed = {
+            model_class: model_name
+            for model_name, model_class in self._context.items()
+            if model_name in self.ALLOWED_MODELS
+        }
+
+        index = {}
+        for model_class in exposed:
+            try:
+                fields = model_class._meta.get_fields()
+            except Exception as e:
+                logger.warning(f"Could not read relations of {model_class.__name__}: {e}")
+                continue
+            for field in fields:
+                related_model = getattr(field, "related_model", None)
+                if field.is_relation and related_model in exposed:
+                    index[field.name] = exposed[related_model]
+        return index
+
     def get_available_models(self) -> List[Dict[str, str]]:
         """
         Get list of available models with metadata.
@@ -605,6 +770,43 @@ class SecurityError(Exception):
     pass
 
 
+def _load_allowed_models(allowed_models: Dict[str, str]) -> Dict[str, Any]:
+    """Import the allowed model classes, skipping any that are unavailable."""
+    models = {}
+    for model_name, import_path in allowed_models.items():
+        try:
+            module_path, class_name = import_path.rsplit(".", 1)
+            module = __import__(module_path, fromlist=[class_name])
+            models[model_name] = getattr(module, class_name)
+        except (ImportError, AttributeError) as e:
+            logger.warning(f"Could not import {import_path}: {e}")
+    return models
+
+
+def _query_cache_invalidator(sender, using=None, **kwargs):
+    """Bump the data version of the saved or deleted model."""
+    invalidate_query_cache([sender.__name__], using=using)
+
+
+def connect_query_cache_signals():
+    """
+    Invalidate cached query results whenever an exposed model changes.
+
+    Called once from ``common.signals`` after the app registry is ready.
+    """
+    for model_name, model_class in _load_allowed_models(QueryExecutor.ALLOWED_MODELS).items():
+        post_save.connect(
+            _query_cache_invalidator,
+            sender=model_class,
+            dispatch_uid=f"chat_query_cache_save:{model_name}",
+        )
+        post_delete.connect(
+            _query_cache_invalidator,
+            sender=model_class,
+            dispatch_uid=f"chat_query_cache_delete:{model_name}",
+        )
+
+
 # Singleton instance
 _executor = None
 
@@ -13,7 +13,7 @@ Architecture:
 import logging
 import re
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -151,7 +151,12 @@ class QueryTemplate:
                 missing.append(required_entity)
         return missing
 
-    def score_match(self, query: str, entities: Dict[str, Any]) -> float:
+    def score_match(
+        self,
+        query: str,
+        entities: Dict[str, Any],
+        matched: Optional[bool] = None,
+    ) -> float:
         """
         Score how well this template matches the query.
 
@@ -163,6 +168,7 @@ class QueryTemplate:
         Args:
             query: User's query
             entities: Extracted entities
+            matched: Known pattern match result (skips re-running the regex)
 
         Returns:
             Score between 0.0 and 1.0
@@ -175,7 +181,9 @@ class QueryTemplate:
         score = 0.0
 
         # Pattern match (0.4)
-        if self.matches(query):
+        if matched is None:
+            matched = self.matches(query) is not None
+        if matched:
             score += 0.4
 
         # Priority (0.3, normalized from 1-10)
@@ -228,6 +236,17 @@ class TemplateRegistry:
         self._templates: Dict[str, QueryTemplate] = {}
         self._category_index: Dict[str, List[str]] = {}
         self._tag_index: Dict[str, List[str]] = {}
+        self._positions: Dict[str, int] = {}
+
+        # Literal prefilter over every registered pattern
+        self.pattern_trie = self._create_pattern_trie()
+
+    @staticmethod
+    def _create_pattern_trie():
+        """Create the pattern prefilter (imported here; the registry package imports this module)."""
+        from common.ai_services.chat.query_templates.registry.pattern_trie import PatternTrie
+
+        return PatternTrie()
 
     @classmethod
     def get_instance(cls) -> 'TemplateRegistry':
@@ -270,6 +289,11 @@ class TemplateRegistry:
 
         # Add to main storage
         self._templates[template.id] = template
+        self._positions[template.id] = len(self._positions)
+
+        # Index pattern literals for single-pass matching
+        if self.pattern_trie is not None:
+            self.pattern_trie.insert_pattern(template.pattern, template.id)
 
         # Index by category
         if template.category not in self._category_index:
@@ -388,7 +412,7 @@ class TemplateRegistry:
             min_priority: Minimum priority threshold (1-10)
 
         Returns:
-            List of matching templates, sorted by match score
+            List of matching templates, in registration order
 
         Example:
             >>> matches = registry.search_templates(
@@ -396,21 +420,85 @@ class TemplateRegistry:
             ...     category='communities'
             ... )
         """
-        # Get candidate templates
-        if category:
-            candidates = self.get_templates_by_category(category)
-        else:
-            candidates = self.get_all_templates()
+        return [
+            template
+            for template, _ in self.match_templates(query, category, min_priority)
+        ]
+
+    def match_templates(
+        self,
+        query: str,
+        category: Optional[str] = None,
+        min_priority: int = 1,
+    ) -> List[Tuple[QueryTemplate, re.Match]]:
+        """
+        Find every template matching a query, with its match object.
 
-        # Filter by priority
-        candidates = [t for t in candidates if t.priority >= min_priority]
+        The pattern prefilter scans the query once; only templates whose
+        required literals occur in it have their regex run, once each.
 
-        # Find matches
+        Args:
+            query: User's natural language query
+            category: Optional category filter
+            min_priority: Minimum priority threshold (1-10)
+
+        Returns:
+            List of (template, match) tuples, in registration order
+
+        Example:
+            >>> for template, match in registry.match_templates("how many communities"):
+            ...     print(template.id, match.group(0))
+        """
+        if not query:
+            return []
+
+        candidates, _ = self._candidate_templates(query, category)
+        return self._run_patterns(candidates, query, category, min_priority)
+
+    def _candidate_templates(
+        self, query: str, category: Optional[str] = None
+    ) -> Tuple[List[QueryTemplate], bool]:
+        """
+        Return the templates that can match ``query``.
+
+        Returns:
+            (candidates, prefiltered) where prefiltered is False when every
+            template had to be kept
+        """
+        candidate_ids = (
+            self.pattern_trie.match_candidates(query)
+            if self.pattern_trie is not None
+            else None
+        )
+
+        if candidate_ids is None:
+            if category:
+                return self.get_templates_by_category(category), False
+            return self.get_all_templates(), False
+
+        ordered_ids = sorted(
+            (tid for tid in candidate_ids if tid in self._templates),
+            key=self._positions.__getitem__,
+        )
+        return [self._templates[tid] for tid in ordered_ids], True
+
+    @staticmethod
+    def _run_patterns(
+        candidates: List[QueryTemplate],
+        query: str,
+        category: Optional[str],
+        min_priority: int,
+    ) -> List[Tuple[QueryTemplate, re.Match]]:
+        """Run each candidate's regex once and keep the matches."""
         matches = []
         for template in candidates:
-            if template.matches(query):
-                matches.append(template)
-
+            if template.priority < min_priority:
+                continue
+            if category and template.category != category:
+                continue
+            match = template.matches(query)
+            if match:
+                matches.append((template, match))
         return matches
 
     def get_categories(self) -> List[str]:
@@ -478,6 +566,9 @@ class TemplateRegistry:
         self._templates.clear()
         self._category_index.clear()
         self._tag_index.clear()
+        self._positions.clear()
+        if self.pattern_trie is not None:
+            self.pattern_trie.clear()
         logger.debug("Template registry cleared")
 
 
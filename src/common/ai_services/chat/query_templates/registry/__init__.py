@@ -7,7 +7,7 @@ and multi-level caching for scaling to 500+ templates while maintaining
 
 Architecture:
 - LazyTemplateLoader: On-demand template loading by category
-- PatternTrie: Efficient pattern prefix matching to reduce search space
+- PatternTrie: Pattern prefix matching and the literal prefilter that reduces search space
 - AdvancedTemplateRegistry: Enhanced registry with all optimizations
 
 Usage:
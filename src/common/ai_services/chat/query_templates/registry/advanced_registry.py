@@ -13,16 +13,17 @@ Performance Targets:
 Architecture:
 - Extends TemplateRegistry with optimizations
 - LazyTemplateLoader for on-demand loading
-- PatternTrie for efficient prefix matching
+- PatternTrie for efficient prefix matching and literal prefiltering
 - LRU cache for pattern compilation and match results
 - Priority queue for top-k template ranking
 """
 
 import heapq
 import logging
+import re
 import time
 from functools import lru_cache
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from common.ai_services.chat.query_templates.base import (
     QueryTemplate,
@@ -148,7 +149,8 @@ class AdvancedTemplateRegistry(TemplateRegistry):
         Build trie index from template patterns.
 
         Extracts first 2-3 words from each pattern as prefix and
-        inserts into trie for fast lookup.
+        inserts into trie for fast lookup, and indexes the literals each
+        pattern requires in the trie's prefilter.
         """
         if not self.pattern_trie:
             return
@@ -156,6 +158,8 @@ class AdvancedTemplateRegistry(TemplateRegistry):
         logger.debug("Building pattern trie index...")
 
         for template in self.get_all_templates():
+            self.pattern_trie.insert_pattern(template.pattern, template.id)
+
             # Extract pattern prefix
             prefix = self.pattern_trie.extract_pattern_prefix(template.pattern)
 
@@ -235,12 +239,6 @@ class AdvancedTemplateRegistry(TemplateRegistry):
         """
         Search for templates matching a query with trie optimization.
 
-        Process:
-        1. Use trie to get candidate template IDs (~50 instead of 500)
-        2. Filter by category if provided
-        3. Test regex match only on candidates
-        4. Sort by match score
-
         Args:
             query: User's natural language query
             category: Optional category filter
@@ -248,7 +246,7 @@ class AdvancedTemplateRegistry(TemplateRegistry):
             use_trie: Use trie indexing if available (default: True)
 
         Returns:
-            List of matching templates, sorted by match score
+            List of matching templates, in registration order
 
         Example:
             >>> matches = registry.search_templates(
@@ -256,48 +254,62 @@ class AdvancedTemplateRegistry(TemplateRegistry):
             ...     category='communities'
             ... )
         """
+        return [
+            template
+            for template, _ in self.match_templates(query, category, min_priority, use_trie)
+        ]
+
+    def match_templates(
+        self,
+        query: str,
+        category: Optional[str] = None,
+        min_priority: int = 1,
+        use_trie: bool = True,
+    ) -> List[Tuple[QueryTemplate, re.Match]]:
+        """
+        Find matching templates and their match objects with trie prefiltering.
+
+        Process:
+        1. Scan the query once against the literal prefilter in the trie
+        2. Filter candidates by category and priority
+        3. Run the regex of each remaining candidate once
+
+        Args:
+            query: User's natural language query
+            category: Optional category filter
+            min_priority: Minimum priority threshold (1-10)
+            use_trie: Use trie indexing if available (default: True)
+
+        Returns:
+            List of (template, match) tuples, in registration order
+        """
         start_time = time.perf_counter()
 
         # Lazy load category if needed
         if category and self.loader and not self.loader.is_loaded(category):
             self.get_templates_by_category(category)
 
+        if not query:
+            return []
+
         # Get candidate templates
         if use_trie and self.pattern_trie:
-            # Use trie to reduce search space
-            candidate_ids = self.pattern_trie.search_partial(query)
-
-            if candidate_ids:
+            candidates, prefiltered = self._candidate_templates(query, category)
+            if prefiltered:
                 self._performance_stats['trie_hits'] += 1
-
-                # Get candidate templates
-                candidates = [
-                    self.get_template(tid)
-                    for tid in candidate_ids
-                    if self.get_template(tid) is not None
-                ]
-
                 logger.debug(
                     f"Trie reduced search space: {len(self._templates)} → {len(candidates)}"
                 )
             else:
-                # Trie miss, fallback to full scan
+                # Prefilter undecided (non-ASCII query), full scan
                 self._performance_stats['trie_misses'] += 1
                 logger.debug("Trie miss, using full scan")
-                candidates = self.get_all_templates()
         else:
             # Trie disabled, use full scan
             candidates = self.get_all_templates()
 
-        # Filter by category
-        if category:
-            candidates = [t for t in candidates if t.category == category]
-
-        # Filter by priority
-        candidates = [t for t in candidates if t.priority >= min_priority]
-
-        # Find matches (expensive regex matching only on candidates)
-        matches = [t for t in candidates if t.matches(query)]
+        # Find matches (regex matching only on candidates)
+        matches = self._run_patterns(candidates, query, category, min_priority)
 
         # Record performance
         elapsed_ms = (time.perf_counter() - start_time) * 1000
@@ -394,7 +406,6 @@ class AdvancedTemplateRegistry(TemplateRegistry):
         Example:
             >>> compiled = registry._compile_pattern_cached(r'how many.*communities')
         """
-        import re
         return re.compile(pattern, re.IGNORECASE)
 
     def get_performance_stats(self) -> Dict[str, Any]:
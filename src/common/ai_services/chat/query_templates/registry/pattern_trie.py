@@ -4,6 +4,14 @@ Pattern Trie for Efficient Template Matching
 Implements a trie (prefix tree) data structure for reducing search space
 from 500+ templates to ~50 candidates based on query prefix matching.
 
+The trie also holds the literal prefilter used by the template registry.
+Every template pattern is parsed once to find the literal text any match
+must contain (e.g. ``communit`` in ``(?:how many|count).*communit``). Those
+literals are compiled into a character-level Aho-Corasick automaton, so a
+single pass over the query yields every template that can possibly match;
+only those patterns are then run. The cost of that pass depends on the
+query length and the number of hits, not on the number of templates.
+
 Performance Impact:
 - Search space reduction: 500 → ~50 templates (90% reduction)
 - Match time: 10ms → 3ms (70% faster)
@@ -12,10 +20,99 @@ Performance Impact:
 
 import logging
 import re
-from typing import Dict, List, Set
+from typing import Dict, FrozenSet, List, Optional, Set
+
+try:
+    from re import _parser as sre_parse  # Python 3.11+
+except ImportError:  # pragma: no cover - Python < 3.11
+    import sre_parse
+
+from common.ai_services.chat.gazetteer import AhoCorasick
 
 logger = logging.getLogger(__name__)
 
+_REPEATS = {
+    op
+    for op in (
+        sre_parse.MAX_REPEAT,
+        sre_parse.MIN_REPEAT,
+        getattr(sre_parse, 'POSSESSIVE_REPEAT', None),
+    )
+    if op is not None
+}
+_ATOMIC_GROUP = getattr(sre_parse, 'ATOMIC_GROUP', None)
+
+
+def _best_requirement(requirements: List[FrozenSet[str]]) -> Optional[FrozenSet[str]]:
+    """Pick the most selective requirement: longest shortest literal, fewest options."""
+    if not requirements:
+        return None
+    return max(
+        requirements,
+        key=lambda options: (min(len(option) for option in options), -len(options)),
+    )
+
+
+def _required_literals(items) -> List[FrozenSet[str]]:
+    """
+    Collect the literal requirements of a parsed regex sequence.
+
+    Each requirement is a set of lowercase strings of which at least one
+    appears in any text the sequence matches. Only ASCII literals are used,
+    so a lowercase ASCII query can be checked without case-folding rules.
+    """
+    requirements: List[FrozenSet[str]] = []
+    run: List[str] = []
+
+    def flush():
+        if run:
+            requirements.append(frozenset({''.join(run)}))
+            run.clear()
+
+    for op, av in items:
+        if op is sre_parse.LITERAL and av < 128:
+            run.append(chr(av).lower())
+            continue
+
+        flush()
+        if op is sre_parse.SUBPATTERN:
+            requirements.extend(_required_literals(av[-1]))
+        elif op in _REPEATS:
+            min_count, _, sub = av
+            if min_count >= 1:
+                requirements.extend(_required_literals(sub))
+        elif op is _ATOMIC_GROUP:
+            requirements.extend(_required_literals(av))
+        elif op is sre_parse.BRANCH:
+            options: Set[str] = set()
+            for branch in av[1]:
+                best = _best_requirement(_required_literals(branch))
+                if best is None:
+                    # One branch needs no literal, so the alternation doesn't either
+                    options = set()
+                    break
+                options |= best
+            if options:
+                requirements.append(frozenset(options))
+
+    flush()
+    return requirements
+
+
+def extract_required_literals(pattern: str, flags: int = re.IGNORECASE) -> List[FrozenSet[str]]:
+    """
+    Return the literal requirements of a regex pattern.
+
+    Example:
+        >>> extract_required_literals(r'(?:how many|count).*communit')
+        [frozenset({'how many', 'count'}), frozenset({'communit'})]
+    """
+    try:
+        return _required_literals(sre_parse.parse(pattern, flags))
+    except Exception as e:
+        logger.warning(f"Could not analyse pattern {pattern[:50]!r}: {e}")
+        return []
+
 
 class PatternTrie:
     """
@@ -51,6 +148,11 @@ class PatternTrie:
         """Initialize empty trie with root node."""
         self.root = self.TrieNode()
         self._total_templates = 0
+
+        # Literal prefilter
+        self._literals = AhoCorasick()
+        self._anchors: Dict[str, FrozenSet[str]] = {}
+        self._unanchored: Set[str] = set()
         logger.debug("PatternTrie initialized")
 
     def insert(self, pattern_prefix: str, template_id: str) -> None:
@@ -134,6 +236,55 @@ class PatternTrie:
 
         return template_ids
 
+    def insert_pattern(self, pattern: str, template_id: str, flags: int = re.IGNORECASE) -> None:
+        """
+        Index a template pattern in the literal prefilter.
+
+        The most selective literal requirement of the pattern becomes the
+        template's anchor. Patterns without one are returned as candidates
+        for every query.
+
+        Args:
+            pattern: Regex pattern string
+            template_id: Unique template identifier
+            flags: Flags the pattern is compiled with
+
+        Example:
+            >>> trie.insert_pattern(r'(?:how many|count).*communit', 'count_communities')
+        """
+        if not template_id or template_id in self._anchors or template_id in self._unanchored:
+            return
+
+        anchor = _best_requirement(extract_required_literals(pattern, flags))
+        if anchor is None:
+            self._unanchored.add(template_id)
+            return
+
+        self._anchors[template_id] = anchor
+        for literal in anchor:
+            self._literals.add(tuple(literal), template_id)
+
+    def match_candidates(self, query: str) -> Optional[Set[str]]:
+        """
+        Return the IDs of every indexed template that can match ``query``.
+
+        The query is scanned once. Returns None when the prefilter cannot
+        decide (non-ASCII queries), in which case callers test every template.
+
+        Example:
+            >>> trie.match_candidates("how many communities in Region IX")
+            {'count_communities', ...}
+        """
+        if not query:
+            return set()
+        if not query.isascii():
+            return None
+
+        candidates = set(self._unanchored)
+        for _, _, template_id in self._literals.iter_matches(query.lower()):
+            candidates.add(template_id)
+        return candidates
+
     def search_partial(self, query: str) -> List[str]:
         """
         Search with progressive relaxation (3 words → 2 words → 1 word).
@@ -234,6 +385,8 @@ class PatternTrie:
             'total_templates': self._total_templates,
             'max_depth': self._max_depth(self.root),
             'leaf_nodes': self._count_leaf_nodes(self.root),
+            'anchored_templates': len(self._anchors),
+            'unanchored_templates': len(self._unanchored),
         }
 
         return stats
@@ -267,6 +420,9 @@ class PatternTrie:
         """Clear all trie data (mainly for testing)."""
         self.root = self.TrieNode()
         self._total_templates = 0
+        self._literals = AhoCorasick()
+        self._anchors = {}
+        self._unanchored = set()
         logger.debug("PatternTrie cleared")
 
     def __repr__(self):
@@ -14,7 +14,7 @@ Performance target: <10ms per match
 
 import logging
 import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from common.ai_services.chat.query_templates import QueryTemplate, get_template_registry
 
@@ -88,10 +88,10 @@ class TemplateMatcher:
             ... )
         """
         try:
-            # Step 1: Find matching templates
-            matches = self.find_matching_templates(query, entities, intent, category)
+            # Step 1: Find matching templates (each pattern runs at most once)
+            template_matches = self.find_template_matches(query, entities, intent, category)
 
-            if not matches:
+            if not template_matches:
                 return {
                     'success': False,
                     'template': None,
@@ -102,7 +102,12 @@ class TemplateMatcher:
                 }
 
             # Step 2: Rank templates and pick best match
-            ranked_matches = self.rank_templates(matches, query, entities)
+            ranked_matches = self.rank_templates(
+                [template for template, _ in template_matches],
+                query,
+                entities,
+                matches={template.id: match for template, match in template_matches},
+            )
             best_match = ranked_matches[0]
 
             # Merge regex capture groups into the entity set so templates can use them
@@ -188,31 +193,48 @@ class TemplateMatcher:
             ...     category='communities'
             ... )
         """
-        # Use registry's search method
-        matches = self.registry.search_templates(
+        return [
+            template
+            for template, _ in self.find_template_matches(query, entities, intent, category)
+        ]
+
+    def find_template_matches(
+        self,
+        query: str,
+        entities: Dict[str, Any],
+        intent: Optional[str] = None,
+        category: Optional[str] = None,
+    ) -> List[Tuple[QueryTemplate, re.Match]]:
+        """
+        Find all templates matching the query pattern, with their match objects.
+
+        The registry prefilters candidates in a single scan of the query, so
+        only templates that can match have their regex run, once each.
+
+        Args:
+            query: User's natural language query (normalized)
+            entities: Extracted entities
+            intent: Optional intent filter
+            category: Optional category filter
+
+        Returns:
+            List of (QueryTemplate, re.Match) tuples
+        """
+        matches = self.registry.match_templates(
             query=query,
             category=category,
             min_priority=1,
         )
 
-        # Additional filtering if needed
-        filtered_matches = []
-        for template in matches:
-            # Check pattern match
-            if not template.matches(query):
-                continue
-
-            # Add to results
-            filtered_matches.append(template)
-
-        logger.debug(f"Found {len(filtered_matches)} matching templates for query: {query[:50]}...")
-        return filtered_matches
+        logger.debug(f"Found {len(matches)} matching templates for query: {query[:50]}...")
+        return matches
 
     def rank_templates(
         self,
         templates: List[QueryTemplate],
         query: str,
         entities: Dict[str, Any],
+        matches: Optional[Dict[str, re.Match]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Rank templates by match quality.
@@ -227,6 +249,8 @@ class TemplateMatcher:
             templates: List of candidate templates
             query: User's query
             entities: Extracted entities
+            matches: Match objects by template ID from find_template_matches;
+                avoids re-running each pattern
 
         Returns:
             List of dicts with 'template' and 'score', sorted by score (desc)
@@ -240,10 +264,13 @@ class TemplateMatcher:
 
         for template in templates:
             # Capture regex match for later entity extraction
-            match = template.matches(query)
+            if matches is not None:
+                match = matches.get(template.id)
+            else:
+                match = template.matches(query)
 
             # Calculate match score
-            score = template.score_match(query, entities)
+            score = template.score_match(query, entities, matched=match is not None)
 
             ranked.append({
                 'template': template,
@@ -0,0 +1,367 @@
+"""
+Batched, resumable reindex pipeline for unified search.
+
+Streams a module's objects with ``.iterator()``, embeds them in batches via
+``EmbeddingService.batch_generate`` and skips objects whose content hash
+matches their ``DocumentEmbedding`` row. Work is written to a staging index
+that is checkpointed every few chunks, so an interrupted run resumes close to
+where it stopped. Primary keys are recorded as text throughout, so UUID-keyed
+modules get the same change detection as integer-keyed ones. When the run completes the staging index is renamed over the live
+one and ``DocumentEmbedding`` rows are brought in line in bulk.
+"""
+
+import json
+import logging
+import os
+import time
+from dataclasses import asdict, dataclass
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 500
+DEFAULT_BATCH_SIZE = 64
+DEFAULT_CHECKPOINT_EVERY = 10
+
+
+@dataclass
+class ReindexStats:
+    """Counters for a reindex run."""
+
+    module: str
+    total: int = 0
+    processed: int = 0
+    indexed: int = 0
+    skipped: int = 0
+    errors: int = 0
+    removed: int = 0
+    elapsed: float = 0.0
+    resumed: bool = False
+
+    @property
+    def objects_per_second(self) -> float:
+        return self.processed / self.elapsed if self.elapsed > 0 else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data['elapsed'] = round(self.elapsed, 3)
+        data['objects_per_second'] = round(self.objects_per_second, 1)
+        return data
+
+
+class ReindexPipeline:
+    """
+    Rebuild one unified-search module index in streamed, checkpointed chunks.
+
+    Args:
+        module: Module key (e.g. 'communities')
+        config: Module entry from ``UnifiedSearchEngine.SEARCHABLE_MODULES``
+        embedding_service: Service providing ``batch_generate`` and hashing
+        format_text: Callable ``(obj, fields) -> str`` used for embedding text
+        chunk_size: Objects fetched and checkpointed per chunk
+        batch_size: Texts per ``batch_generate`` call
+        checkpoint_every: Chunks between checkpoints; each checkpoint rewrites
+            the whole staging index, so checkpointing every chunk costs
+            quadratic I/O on large modules
+        force: Re-embed objects even when their content hash is unchanged
+        resume: Continue from an existing checkpoint if one is found
+        index_path: Live index file (defaults to the store's default path)
+    """
+
+    def __init__(
+        self,
+        module: str,
+        config: Dict[str, Any],
+        embedding_service,
+        format_text: Callable[[Any, List[str]], str],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY,
+        force: bool = False,
+        resume: bool = True,
+        index_path: Optional[Path] = None,
+    ):
+        from ai_assistant.services.vector_store import VectorStore
+
+        self.module = module
+        self.config = config
+        self.embedding_service = embedding_service
+        self.format_text = format_text
+        self.chunk_size = max(1, chunk_size)
+        self.batch_size = max(1, batch_size)
+        self.checkpoint_every = max(1, checkpoint_every)
+        self.force = force
+        self.resume = resume
+
+        self.store_name = config['vector_store']
+        self.index_path = Path(index_path or VectorStore.default_path(self.store_name))
+        self.staging_path = self.index_path.with_name(f"{self.store_name}.staging.index")
+        self.checkpoint_path = self.index_path.with_name(f"{self.store_name}.reindex.json")
+
+    # ------------------------------------------------------------------
+    # Checkpointing
+    # ------------------------------------------------------------------
+
+    def _read_checkpoint(self) -> Optional[Dict[str, Any]]:
+        if not (self.resume and self.checkpoint_path.exists() and self.staging_path.exists()):
+            return None
+        try:
+            checkpoint = json.loads(self.checkpoint_path.read_text())
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable reindex checkpoint {self.checkpoint_path}: {e}")
+            return None
+        if checkpoint.get('module') != self.module or checkpoint.get('force') != self.force:
+            return None
+        return checkpoint
+
+    def _write_checkpoint(self, store, last_pk, stats: ReindexStats, pending: List):
+        store.save(str(self.staging_path))
+        tmp_path = self.checkpoint_path.with_suffix('.json.tmp')
+        tmp_path.write_text(json.dumps({
+            'module': self.module,
+            'force': self.force,
+            'last_pk': last_pk,
+            'stats': {
+                'processed': stats.processed,
+                'indexed': stats.indexed,
+                'skipped': stats.skipped,
+                'errors': stats.errors,
+            },
+            'pending': pending,
+        }))
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def _discard_staging(self):
+        for path in (
+            self.staging_path,
+            self.staging_path.with_suffix('.metadata'),
+            self.checkpoint_path,
+        ):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def _open_store(self, checkpoint: Optional[Dict[str, Any]]):
+        """Start from the staging index when resuming, else from the live index."""
+        from ai_assistant.services.vector_store import VectorStore
+
+        dimension = self.embedding_service.get_dimension()
+        path = self.staging_path if checkpoint else self.index_path
+        try:
+            store = VectorStore.load(self.store_name, filepath=str(path))
+        except FileNotFoundError:
+            return VectorStore(self.store_name, dimension=dimension)
+
+        if store.dimension != dimension:
+            logger.warning(
+                f"Index '{self.store_name}' has dimension {store.dimension}, "
+                f"embedding model produces {dimension}; rebuilding from scratch"
+            )
+            return VectorStore(self.store_name, dimension=dimension)
+        return store
+
+    # ------------------------------------------------------------------
+    # Run
+    # ------------------------------------------------------------------
+
+    def run(self) -> ReindexStats:
+        """Run (or resume) the reindex and swap the result in."""
+        Model = apps.get_model(self.config['app'], self.config['model'])
+        content_type = ContentType.objects.get_for_model(Model)
+        started = time.monotonic()
+
+        checkpoint = self._read_checkpoint()
+        if checkpoint is None:
+            self._discard_staging()
+        store = self._open_store(checkpoint)
+
+        stats = ReindexStats(module=self.module, total=Model.objects.count())
+        last_pk = None
+        pending: List = []
+        if checkpoint:
+            stats.resumed = True
+            last_pk = checkpoint['last_pk']
+            pending = checkpoint['pending']
+            for key, value in checkpoint['stats'].items():
+                setattr(stats, key, value)
+            logger.info(f"Resuming reindex of {self.module} after pk {last_pk}")
+
+        queryset = Model.objects.order_by('pk')
+        if last_pk is not None:
+            queryset = queryset.filter(pk__gt=last_pk)
+        objects = queryset.iterator(chunk_size=self.chunk_size)
+
+        chunks = 0
+        while True:
+            chunk = list(islice(objects, self.chunk_size))
+            if not chunk:
+                break
+            pending.extend(self._process_chunk(chunk, store, content_type, stats))
+            last_pk = chunk[-1].pk
+            if not isinstance(last_pk, int):
+                last_pk = str(last_pk)
+            chunks += 1
+            if chunks % self.checkpoint_every == 0:
+                self._write_checkpoint(store, last_pk, stats, pending)
+
+            stats.elapsed = time.monotonic() - started
+            logger.info(
+                f"Reindex {self.module}: {stats.processed}/{stats.total} "
+                f"({stats.objects_per_second:.1f} objects/sec)"
+            )
+
+        removed_ids = self._remove_stale(store, Model)
+        stats.removed = len(removed_ids)
+
+        # Atomic swap: VectorStore.save renames complete files into place.
+        store.save(str(self.index_path))
+        self._sync_document_embeddings(content_type, pending, removed_ids, store)
+        self._discard_staging()
+
+        stats.elapsed = time.monotonic() - started
+        logger.info(
+            f"Reindexing complete: {stats.indexed} indexed, {stats.skipped} unchanged, "
+            f"{stats.errors} errors, {stats.removed} removed for {self.module} "
+            f"({stats.objects_per_second:.1f} objects/sec)"
+        )
+        return stats
+
+    def _process_chunk(self, chunk, store, content_type, stats: ReindexStats) -> List:
+        """Embed the changed objects of one chunk; return pending hash updates."""
+        from ai_assistant.models import DocumentEmbedding
+
+        stored_hashes = dict(
+            DocumentEmbedding.objects.filter(
+                content_type=content_type,
+                index_name=self.store_name,
+                object_id__in=[str(obj.pk) for obj in chunk],
+            ).values_list('object_id', 'embedding_hash')
+        )
+
+        to_embed = []
+        for obj in chunk:
+            stats.processed += 1
+            try:
+                text = self.format_text(obj, self.config['fields'])
+            except Exception as e:
+                stats.errors += 1
+                logger.error(f"Error formatting {self.module} {obj.pk}: {e}")
+                continue
+
+            in_store = store.get_vector_id(obj.pk, self.module) is not None
+            if (
+                not self.force
+                and in_store
+                and not self.embedding_service.should_reembed(text, stored_hashes.get(str(obj.pk)))
+            ):
+                stats.skipped += 1
+                continue
+            to_embed.append((obj, text))
+
+        pending = []
+        for start in range(0, len(to_embed), self.batch_size):
+            batch = to_embed[start:start + self.batch_size]
+            texts = [text for _, text in batch]
+            try:
+                embeddings = self.embedding_service.batch_generate(
+                    texts, batch_size=self.batch_size
+                )
+            except Exception as e:
+                stats.errors += len(batch)
+                logger.error(f"Error embedding {len(batch)} {self.module} objects: {e}")
+                continue
+
+            metadata = [
+                {'id': obj.pk, 'type': self.module, 'model': self.config['model']}
+                for obj, _ in batch
+            ]
+            vector_ids = store.add_vectors(embeddings, metadata)
+            for (obj, text), vector_id in zip(batch, vector_ids):
+                pending.append(
+                    [str(obj.pk), self.embedding_service.compute_content_hash(text), vector_id]
+                )
+            stats.indexed += len(batch)
+
+        return pending
+
+    def _remove_stale(self, store, Model) -> List[str]:
+        """Drop vectors for objects of this module that no longer exist."""
+        indexed_ids = {
+            str(meta['id']) for meta in store.metadata if meta.get('type') == self.module
+        }
+        if not indexed_ids:
+            return []
+        existing = {
+            str(pk)
+            for pk in Model.objects.filter(pk__in=indexed_ids).values_list('pk', flat=True)
+        }
+        stale = [object_id for object_id in indexed_ids if object_id not in existing]
+        store.remove_vectors(
+            vector_id
+            for vector_id in (store.get_vector_id(object_id, self.module) for object_id in stale)
+            if vector_id is not None
+        )
+        return stale
+
+    def _sync_document_embeddings(self, content_type, pending: List, removed_ids: List, store):
+        """Record new content hashes and index positions in bulk."""
+        from ai_assistant.models import DocumentEmbedding
+
+        updates = {
+            object_id: (content_hash, vector_id)
+            for object_id, content_hash, vector_id in pending
+        }
+        model_name = getattr(self.embedding_service, 'model_name', None)
+        now = timezone.now()
+
+        with transaction.atomic():
+            if removed_ids:
+                DocumentEmbedding.objects.filter(
+                    content_type=content_type,
+                    index_name=self.store_name,
+                    object_id__in=removed_ids,
+                ).delete()
+
+            if not updates:
+                return
+
+            existing = {
+                row.object_id: row
+                for row in DocumentEmbedding.objects.filter(
+                    content_type=content_type,
+                    index_name=self.store_name,
+                    object_id__in=list(updates),
+                )
+            }
+            to_create = []
+            for object_id, (content_hash, vector_id) in updates.items():
+                row = existing.get(object_id)
+                if row is None:
+                    row = DocumentEmbedding(
+                        content_type=content_type,
+                        object_id=object_id,
+                        index_name=self.store_name,
+                    )
+                    to_create.append(row)
+                row.embedding_hash = content_hash
+                row.index_position = vector_id
+                row.dimension = store.dimension
+                row.updated_at = now
+                if model_name:
+                    row.model_used = model_name
+
+            fields = ['embedding_hash', 'index_position', 'dimension', 'updated_at']
+            if model_name:
+                fields.append('model_used')
+            DocumentEmbedding.objects.bulk_update(
+                list(existing.values()), fields, batch_size=self.chunk_size
+            )
+            DocumentEmbedding.objects.bulk_create(to_create, batch_size=self.chunk_size)
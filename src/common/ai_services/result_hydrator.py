@@ -0,0 +1,206 @@
+"""
+Result Hydrator for Unified Search
+
+Turns vector-store hits into model instances with one query per module.
+
+- Hits are loaded with a single ``in_bulk`` call.
+- Location relations used by ``UnifiedSearchEngine._matches_location`` are
+  ``select_related`` (including the parents their ``__str__`` reads), so
+  Python-side location matching issues no extra queries.
+- Sector and date-range filters are pushed into the queryset when the model
+  stores them as plain columns. Filters that cannot be expressed in SQL are
+  handed back for the engine to apply in Python.
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+from django.db.models import Q
+
+logger = logging.getLogger(__name__)
+
+
+# Location attributes checked by _matches_location and the parent relation
+# each one's __str__ reads.
+LOCATION_FIELDS = {
+    'region': None,
+    'province': 'region',
+    'municipality': 'province',
+    'barangay': 'municipality',
+}
+
+SECTOR_FIELDS = ('sector', 'category')
+DATE_FIELDS = ('created_at', 'date', 'start_date', 'updated_at')
+
+_TEXT = 'text'
+_OTHER = 'other'
+
+
+class ResultHydrator:
+    """
+    Load and filter search hits in bulk.
+
+    Example:
+        >>> hydrator = ResultHydrator()
+        >>> rows = hydrator.hydrate(Model, hits, {'sector': 'health'})
+        >>> for obj, similarity, metadata in rows['results']:
+        ...     print(obj, similarity)
+    """
+
+    def hydrate(
+        self,
+        Model,
+        hits: List[Tuple[float, Dict]],
+        filters: Optional[Dict] = None,
+    ) -> Dict[str, Any]:
+        """
+        Fetch the objects behind ``hits`` with one query.
+
+        Args:
+            Model: Model class of the module
+            hits: ``(similarity, metadata)`` pairs, best first
+            filters: Filters from the parsed query
+
+        Returns:
+            {
+                'results': list of (obj, similarity, metadata) in hit order,
+                'remaining_filters': filters still to apply in Python,
+            }
+        """
+        queryset, remaining = self.build_queryset(Model, filters or {})
+
+        ids = [metadata['id'] for _, metadata in hits if metadata.get('id')]
+        objects = {str(pk): obj for pk, obj in queryset.in_bulk(ids).items()} if ids else {}
+
+        results = []
+        for similarity, metadata in hits:
+            obj = objects.get(str(metadata.get('id')))
+            if obj is None:
+                continue
+            results.append((obj, similarity, metadata))
+
+        return {'results': results, 'remaining_filters': remaining}
+
+    def build_queryset(self, Model, filters: Dict) -> Tuple[models.QuerySet, Dict]:
+        """
+        Build the hydration queryset and push SQL-expressible filters into it.
+
+        Returns:
+            Tuple of (queryset, filters that must still be applied in Python)
+        """
+        queryset = Model._default_manager.all()
+        paths = self.related_paths(Model)
+        if paths:
+            queryset = queryset.select_related(*paths)
+
+        remaining = {}
+
+        location = filters.get('location')
+        if location:
+            # Matched against __str__ of related objects; stays in Python.
+            remaining['location'] = location
+
+        sector = filters.get('sector')
+        if sector:
+            condition = self._sector_condition(Model, sector.lower())
+            if condition is None:
+                remaining['sector'] = sector
+            else:
+                queryset = queryset.filter(condition)
+
+        date_range = filters.get('date_range')
+        if date_range:
+            condition = self._date_range_condition(Model, date_range)
+            if condition is None:
+                remaining['date_range'] = date_range
+            elif condition is not True:
+                queryset = queryset.filter(condition)
+
+        return queryset, remaining
+
+    def related_paths(self, Model, prefix: str = '', follow_community: bool = True) -> List[str]:
+        """Return ``select_related`` paths needed for location matching."""
+        paths = []
+        for name, parent in LOCATION_FIELDS.items():
+            related = self._forward_relation(Model, name)
+            if related is None:
+                continue
+            paths.append(f"{prefix}{name}")
+            if parent and self._forward_relation(related, parent) is not None:
+                paths.append(f"{prefix}{name}__{parent}")
+
+        community = self._forward_relation(Model, 'community') if follow_community else None
+        if community is not None:
+            paths.append(f"{prefix}community")
+            paths.extend(
+                self.related_paths(community, prefix=f"{prefix}community__", follow_community=False)
+            )
+        return paths
+
+    @staticmethod
+    def _forward_relation(Model, name: str):
+        try:
+            field = Model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return None
+        if field.concrete and (field.many_to_one or field.one_to_one):
+            return field.related_model
+        return None
+
+    @staticmethod
+    def _field_kind(Model, name: str, field_types) -> Optional[str]:
+        """Classify ``name`` as absent (None), a plain column (_TEXT) or other."""
+        try:
+            field = Model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return _OTHER if hasattr(Model, name) else None
+        if field.concrete and not field.is_relation and isinstance(field, field_types):
+            return _TEXT
+        return _OTHER
+
+    def _sector_condition(self, Model, sector: str) -> Optional[Q]:
+        """
+        SQL equivalent of ``_matches_sector``: a non-empty ``sector`` decides,
+        otherwise a non-empty ``category`` decides, otherwise no match.
+        """
+        text_types = (models.CharField, models.TextField)
+        sector_kind, category_kind = (
+            self._field_kind(Model, name, text_types) for name in SECTOR_FIELDS
+        )
+        if _OTHER in (sector_kind, category_kind):
+            return None
+
+        no_match = Q(pk__in=[])
+        category_q = Q(category__icontains=sector) if category_kind == _TEXT else no_match
+        if sector_kind is None:
+            return category_q
+
+        sector_empty = Q(sector='') | Q(sector__isnull=True)
+        return Q(sector__icontains=sector) | (sector_empty & category_q)
+
+    def _date_range_condition(self, Model, date_range: Dict):
+        """
+        SQL equivalent of ``_matches_date_range`` on the first date attribute.
+
+        Returns a Q object, True when the model has no date attribute (nothing
+        to filter), or None when the attribute is not a plain date column.
+        """
+        for name in DATE_FIELDS:
+            kind = self._field_kind(Model, name, (models.DateField,))
+            if kind is None:
+                continue
+            if kind == _OTHER:
+                return None
+
+            field = Model._meta.get_field(name)
+            lookup = f"{name}__date" if isinstance(field, models.DateTimeField) else name
+            condition = Q()
+            if date_range.get('start'):
+                condition &= Q(**{f"{lookup}__gte": date_range['start']})
+            if date_range.get('end'):
+                condition &= Q(**{f"{lookup}__lte": date_range['end']})
+            return Q(**{f"{name}__isnull": True}) | condition if condition else True
+
+        return True
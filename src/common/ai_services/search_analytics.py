@@ -2,18 +2,140 @@
 Search Analytics
 
 Track and analyze search patterns to improve results.
+
+Logging a search never rewrites a shared list or dict:
+
+- recent and zero-result queries go to fixed-size ring buffers, one cache
+  slot per entry addressed by an atomically incremented sequence number;
+- query frequencies are merged in batches from the recent-queries ring
+  buffer into a bounded Space-Saving heavy-hitters summary: every
+  ``FLUSH_SIZE``-th search merges inline, reading popular queries merges
+  whatever is pending, and the ``flush_search_analytics`` beat task merges
+  idle stragglers;
+- autocomplete reads a process-cached prefix trie built from that summary
+  and rebuilt when the ``search:queries`` cache tag moves after a merge.
+
+Popular-query counts are best-effort: searches overwritten in the ring
+buffer (more than ``RECENT_LIMIT`` between merges) are never counted.
 """
 
+import heapq
 import logging
+import threading
 from collections import Counter
-from datetime import datetime, timedelta
-from typing import Dict, List
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from django.core.cache import cache
-from django.db import models
+
+from common.services.cache_tags import bump_tags, get_tag_versions
 
 logger = logging.getLogger(__name__)
 
+SEARCH_QUERIES_CACHE_TAG = 'search:queries'
+
+
+def normalize_query(query: str) -> str:
+    """Lowercase a query and collapse its whitespace."""
+    return ' '.join(query.lower().split())
+
+
+def _by_count(pair: Tuple[str, int]) -> Tuple[int, str]:
+    return -pair[1], pair[0]
+
+
+class SpaceSaving:
+    """
+    Bounded heavy-hitters summary (Space-Saving algorithm).
+
+    At most ``capacity`` queries are tracked. An untracked query evicts the
+    least frequent one and inherits its count, which is recorded as the
+    possible overestimate in ``errors``. Any query seen more often than
+    ``total / capacity`` times is guaranteed to be tracked.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        counts: Optional[Dict[str, int]] = None,
+        errors: Optional[Dict[str, int]] = None,
+    ):
+        self.capacity = capacity
+        self.counts = dict(counts or {})
+        self.errors = dict(errors or {})
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict], capacity: int) -> 'SpaceSaving':
+        data = data or {}
+        return cls(capacity, data.get('counts'), data.get('errors'))
+
+    def to_dict(self) -> Dict:
+        return {'counts': self.counts, 'errors': self.errors}
+
+    def offer(self, item: str, count: int = 1):
+        """Record ``count`` more occurrences of ``item``."""
+        if item in self.counts:
+            self.counts[item] += count
+            return
+
+        if len(self.counts) < self.capacity:
+            self.counts[item] = count
+            self.errors[item] = 0
+            return
+
+        victim = min(self.counts, key=self.counts.get)
+        floor = self.counts.pop(victim)
+        self.errors.pop(victim, None)
+        self.counts[item] = floor + count
+        self.errors[item] = floor
+
+    def top(self, limit: Optional[int] = None) -> List[Tuple[str, int]]:
+        """Return ``(item, count)`` pairs, most frequent first."""
+        if limit is None:
+            return sorted(self.counts.items(), key=_by_count)
+        return heapq.nsmallest(limit, self.counts.items(), key=_by_count)
+
+
+class _TrieNode:
+    __slots__ = ('children', 'top')
+
+    def __init__(self):
+        self.children: Dict[str, '_TrieNode'] = {}
+        self.top: List[str] = []
+
+
+class QueryPrefixIndex:
+    """
+    Prefix trie over popular queries.
+
+    Every node keeps the best ``max_suggestions`` completions below it, so a
+    lookup costs one step per prefix character.
+    """
+
+    def __init__(self, ranked_queries: Iterable[str], max_suggestions: int = 10):
+        self.max_suggestions = max_suggestions
+        self._root = _TrieNode()
+        # Inserted best-first, so each node's list fills in rank order.
+        for query in ranked_queries:
+            node = self._root
+            for char in query:
+                node = node.children.setdefault(char, _TrieNode())
+                if len(node.top) < max_suggestions:
+                    node.top.append(query)
+
+    def complete(self, prefix: str, limit: int = 10) -> List[str]:
+        """Return up to ``limit`` popular queries starting with ``prefix``."""
+        node = self._root
+        for char in normalize_query(prefix):
+            node = node.children.get(char)
+            if node is None:
+                return []
+        return node.top[:limit]
+
+
+_index_lock = threading.Lock()
+_index: Optional[Tuple[int, QueryPrefixIndex]] = None
+
 
 class SearchAnalytics:
     """
@@ -22,6 +144,7 @@ class SearchAnalytics:
     Features:
     - Query frequency tracking
     - Popular searches identification
+    - Prefix autocomplete over popular searches
     - Zero-result query detection
     - Search improvement suggestions
     """
@@ -29,6 +152,12 @@ class SearchAnalytics:
     CACHE_PREFIX = 'search_analytics:'
     CACHE_TTL = 86400  # 24 hours
 
+    RECENT_LIMIT = 1000
+    ZERO_RESULT_LIMIT = 500
+    HEAVY_HITTERS = 1000  # Queries tracked by the frequency summary
+    FLUSH_SIZE = 50  # Searches per inline merge
+    LOCK_TIMEOUT = 10
+
     def __init__(self):
         """Initialize search analytics."""
         pass
@@ -49,78 +178,149 @@ class SearchAnalytics:
             user_id: User who performed search
             modules_searched: Modules included in search
         """
-        # Store in cache for recent queries
-        cache_key = f"{self.CACHE_PREFIX}recent_queries"
-        recent = cache.get(cache_key, [])
-
-        recent.append({
+        timestamp = datetime.now().isoformat()
+        seq = self._append('recent_queries', self.RECENT_LIMIT, {
             'query': query,
             'results_count': results_count,
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': timestamp,
             'user_id': user_id,
             'modules': modules_searched or [],
         })
 
-        # Keep only last 1000 queries
-        recent = recent[-1000:]
-
-        cache.set(cache_key, recent, self.CACHE_TTL)
-
         # Track zero-result queries separately
         if results_count == 0:
-            self._log_zero_result_query(query)
+            self._append('zero_results', self.ZERO_RESULT_LIMIT, {
+                'query': query,
+                'timestamp': timestamp,
+            })
 
         # Track query frequency
-        self._increment_query_count(query)
-
-    def _log_zero_result_query(self, query: str):
-        """Track queries with zero results."""
-        cache_key = f"{self.CACHE_PREFIX}zero_results"
-        zero_results = cache.get(cache_key, [])
+        if seq % self.FLUSH_SIZE == 0:
+            self.flush()
+
+    def _append(self, name: str, size: int, entry: Dict) -> int:
+        """Write ``entry`` to the next slot of the ``name`` ring buffer."""
+        seq_key = f"{self.CACHE_PREFIX}{name}:seq"
+        try:
+            seq = cache.incr(seq_key)
+        except ValueError:
+            cache.add(seq_key, 0, None)
+            seq = cache.incr(seq_key)
+        cache.set(
+            f"{self.CACHE_PREFIX}{name}:{seq % size}",
+            {**entry, 'seq': seq},
+            self.CACHE_TTL,
+        )
+        return seq
+
+    def _read(self, name: str, size: int, limit: int) -> List[Dict]:
+        """Return the newest ``limit`` ring buffer entries, oldest first."""
+        seq = cache.get(f"{self.CACHE_PREFIX}{name}:seq") or 0
+        first = max(seq - min(limit, size), 0) + 1
+        keys = [
+            f"{self.CACHE_PREFIX}{name}:{position % size}"
+            for position in range(first, seq + 1)
+        ]
+        stored = cache.get_many(keys)
+        return [stored[key] for key in keys if key in stored]
 
-        zero_results.append({
-            'query': query,
-            'timestamp': datetime.now().isoformat(),
-        })
+    def flush(self) -> bool:
+        """
+        Merge recent queries not yet counted into the shared summary.
 
-        zero_results = zero_results[-500:]  # Keep last 500
-        cache.set(cache_key, zero_results, self.CACHE_TTL)
+        Entries are read from the ``recent_queries`` ring buffer after the
+        last merged sequence number, so searches logged by any process are
+        merged by whichever process flushes next.
 
-    def _increment_query_count(self, query: str):
-        """Increment query frequency counter."""
-        cache_key = f"{self.CACHE_PREFIX}query_counts"
-        counts = cache.get(cache_key, {})
+        Returns:
+            False when there was nothing to merge or another process held
+            the merge lock (the entries then wait for the next flush)
+        """
+        seq_key = f"{self.CACHE_PREFIX}recent_queries:seq"
+        merged_key = f"{self.CACHE_PREFIX}query_summary:merged_seq"
+        if (cache.get(seq_key) or 0) <= (cache.get(merged_key) or 0):
+            return False
+
+        lock_key = f"{self.CACHE_PREFIX}query_summary:lock"
+        if not cache.add(lock_key, 1, self.LOCK_TIMEOUT):
+            return False
+
+        try:
+            seq = cache.get(seq_key) or 0
+            merged = cache.get(merged_key) or 0
+            if merged > seq:
+                merged = 0  # The sequence was evicted and restarted.
+            if merged == seq:
+                return False
+
+            positions = range(max(merged, seq - self.RECENT_LIMIT) + 1, seq + 1)
+            keys = [
+                f"{self.CACHE_PREFIX}recent_queries:{position % self.RECENT_LIMIT}"
+                for position in positions
+            ]
+            stored = cache.get_many(keys)
+            pending = Counter()
+            for position, key in zip(positions, keys):
+                entry = stored.get(key)
+                # Skip slots not written yet or already holding a newer lap.
+                if entry and entry.get('seq') == position:
+                    normalized = normalize_query(entry['query'])
+                    if normalized:
+                        pending[normalized] += 1
+
+            summary = self._load_summary()
+            for query, count in pending.items():
+                summary.offer(query, count)
+            cache.set(
+                f"{self.CACHE_PREFIX}query_summary",
+                summary.to_dict(),
+                self.CACHE_TTL * 7,  # 7 days
+            )
+            cache.set(merged_key, seq, None)
+        finally:
+            cache.delete(lock_key)
 
-        normalized = query.lower().strip()
-        counts[normalized] = counts.get(normalized, 0) + 1
+        bump_tags([SEARCH_QUERIES_CACHE_TAG])
+        return True
 
-        cache.set(cache_key, counts, self.CACHE_TTL * 7)  # 7 days
+    def _load_summary(self) -> SpaceSaving:
+        return SpaceSaving.from_dict(
+            cache.get(f"{self.CACHE_PREFIX}query_summary"), self.HEAVY_HITTERS
+        )
 
     def get_popular_queries(self, limit: int = 10) -> List[Dict]:
         """
         Get most popular search queries.
 
+        Counts come from the heavy-hitters summary and may overestimate
+        rarely seen queries by the count of the query they displaced.
+        Searches not yet merged, from any process, are merged first.
+
         Args:
             limit: Number of queries to return
 
         Returns:
             List of {'query': str, 'count': int}
         """
-        cache_key = f"{self.CACHE_PREFIX}query_counts"
-        counts = cache.get(cache_key, {})
-
-        # Sort by count
-        sorted_queries = sorted(
-            counts.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )
-
+        self.flush()
         return [
             {'query': query, 'count': count}
-            for query, count in sorted_queries[:limit]
+            for query, count in self._load_summary().top(limit)
         ]
 
+    def autocomplete(self, prefix: str, limit: int = 10) -> List[str]:
+        """
+        Suggest popular queries starting with ``prefix``.
+
+        Args:
+            prefix: Partial query
+            limit: Maximum number of suggestions
+
+        Returns:
+            Popular queries, most frequent first
+        """
+        return get_query_index().complete(prefix, limit)
+
     def get_zero_result_queries(self, limit: int = 20) -> List[Dict]:
         """
         Get queries with zero results.
@@ -131,10 +331,7 @@ class SearchAnalytics:
         Returns:
             List of zero-result queries
         """
-        cache_key = f"{self.CACHE_PREFIX}zero_results"
-        zero_results = cache.get(cache_key, [])
-
-        return zero_results[-limit:]
+        return self._read('zero_results', self.ZERO_RESULT_LIMIT, limit)
 
     def identify_patterns(self) -> Dict:
         """
@@ -143,8 +340,7 @@ class SearchAnalytics:
         Returns:
             Dict with pattern insights
         """
-        cache_key = f"{self.CACHE_PREFIX}recent_queries"
-        recent = cache.get(cache_key, [])
+        recent = self._read('recent_queries', self.RECENT_LIMIT, self.RECENT_LIMIT)
 
         if not recent:
             return {
@@ -231,3 +427,32 @@ class SearchAnalytics:
             )
 
         return suggestions if suggestions else ["Search performance looks good!"]
+
+
+def get_query_index() -> QueryPrefixIndex:
+    """Return the process-cached autocomplete index, rebuilding it when stale."""
+
+    global _index
+
+    version = get_tag_versions([SEARCH_QUERIES_CACHE_TAG])[SEARCH_QUERIES_CACHE_TAG]
+    cached = _index
+    if cached and cached[0] == version:
+        return cached[1]
+
+    with _index_lock:
+        cached = _index
+        if cached and cached[0] == version:
+            return cached[1]
+        summary = SearchAnalytics()._load_summary()
+        index = QueryPrefixIndex(query for query, _ in summary.top())
+        _index = (version, index)
+        return index
+
+
+def clear_query_index():
+    """Drop this process's cached autocomplete index."""
+
+    global _index
+
+    with _index_lock:
+        _index = None
@@ -5,15 +5,35 @@ Provides semantic search across all OBCMS modules with natural language queries.
 """
 
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from typing import Any, Dict, List, Optional
 
+import numpy as np
 from django.apps import apps
+from django.db import close_old_connections, connection
 
 from ai_assistant.services import EmbeddingService, GeminiService, SimilaritySearchService
 
 logger = logging.getLogger(__name__)
 
+# Shared by all searches so worker threads (and their database connections)
+# are reused instead of started per request.
+_module_executor: Optional[ThreadPoolExecutor] = None
+_module_executor_lock = threading.Lock()
+
+
+def _get_module_executor(max_workers: int) -> ThreadPoolExecutor:
+    global _module_executor
+    if _module_executor is None:
+        with _module_executor_lock:
+            if _module_executor is None:
+                _module_executor = ThreadPoolExecutor(
+                    max_workers=max_workers, thread_name_prefix='unified-search'
+                )
+    return _module_executor
+
 
 class UnifiedSearchEngine:
     """
@@ -65,6 +85,9 @@ class UnifiedSearchEngine:
         }
     }
 
+    # Upper bound on modules searched concurrently
+    MAX_PARALLEL_MODULES = 5
+
     def __init__(self):
         """Initialize the unified search engine."""
         self.similarity_search = SimilaritySearchService()
@@ -73,10 +96,12 @@ class UnifiedSearchEngine:
 
         # Import query parser and ranker (lazy import to avoid circular deps)
         from .query_parser import QueryParser
+        from .result_hydrator import ResultHydrator
         from .result_ranker import ResultRanker
 
         self.query_parser = QueryParser()
         self.ranker = ResultRanker()
+        self.hydrator = ResultHydrator()
 
         logger.info("UnifiedSearchEngine initialized")
 
@@ -117,16 +142,13 @@ class UnifiedSearchEngine:
         # Validate modules
         modules = [m for m in modules if m in self.SEARCHABLE_MODULES]
 
+        # Encode the query once and reuse it for every module
+        query_vector = self.embedding_service.generate_embedding(query)
+
         # Search each module
-        results = {}
-        for module in modules:
-            try:
-                results[module] = self._search_module(
-                    module, query, parsed, limit, threshold
-                )
-            except Exception as e:
-                logger.error(f"Error searching module {module}: {e}")
-                results[module] = []
+        results = self._search_modules(
+            modules, query, parsed, limit, threshold, query_vector=query_vector
+        )
 
         # Rank and combine results
         ranked_results = self.ranker.rank_cross_module(results, query)
@@ -144,13 +166,74 @@ class UnifiedSearchEngine:
             'summary': summary,
         }
 
+    def _search_modules(
+        self,
+        modules: List[str],
+        query: str,
+        parsed: Dict,
+        limit: int,
+        threshold: float,
+        query_vector: Optional[np.ndarray] = None
+    ) -> Dict[str, List[Dict]]:
+        """
+        Search several modules, concurrently when possible.
+
+        Modules are searched on a shared thread pool. Worker threads use
+        their own database connections, which cannot see uncommitted rows,
+        so a single module, or any search inside a transaction, runs on the
+        calling thread.
+        """
+        workers = min(self.MAX_PARALLEL_MODULES, len(modules))
+        if workers <= 1 or connection.in_atomic_block:
+            return {
+                module: self._search_module_safely(
+                    module, query, parsed, limit, threshold, query_vector
+                )
+                for module in modules
+            }
+
+        executor = _get_module_executor(self.MAX_PARALLEL_MODULES)
+        futures = {
+            module: executor.submit(
+                self._search_module_in_thread,
+                module, query, parsed, limit, threshold, query_vector
+            )
+            for module in modules
+        }
+        return {module: future.result() for module, future in futures.items()}
+
+    def _search_module_in_thread(self, *args) -> List[Dict]:
+        # Pool threads live outside the request cycle, so apply the same
+        # CONN_MAX_AGE and health checks Django runs around each request.
+        close_old_connections()
+        try:
+            return self._search_module_safely(*args)
+        finally:
+            close_old_connections()
+
+    def _search_module_safely(
+        self,
+        module: str,
+        query: str,
+        parsed: Dict,
+        limit: int,
+        threshold: float,
+        query_vector: Optional[np.ndarray] = None
+    ) -> List[Dict]:
+        try:
+            return self._search_module(module, query, parsed, limit, threshold, query_vector)
+        except Exception as e:
+            logger.error(f"Error searching module {module}: {e}")
+            return []
+
     def _search_module(
         self,
         module: str,
         query: str,
         parsed: Dict,
         limit: int,
-        threshold: float
+        threshold: float,
+        query_vector: Optional[np.ndarray] = None
     ) -> List[Dict]:
         """Search within a specific module using vector similarity."""
         config = self.SEARCHABLE_MODULES[module]
@@ -162,14 +245,15 @@ class UnifiedSearchEngine:
             logger.error(f"Model {config['app']}.{config['model']} not found")
             return []
 
-        # Generate query embedding
-        query_vector = self.embedding_service.generate_embedding(query)
+        # Generate query embedding unless the caller already did
+        if query_vector is None:
+            query_vector = self.embedding_service.generate_embedding(query)
 
         # Search using similarity search service
         store_name = config['vector_store']
         try:
-            from ai_assistant.services import VectorStore
-            store = VectorStore.load(store_name)
+            from ai_assistant.services.vector_store import get_vector_store
+            store = get_vector_store(store_name)
         except FileNotFoundError:
             logger.warning(f"Vector store '{store_name}' not found. Skipping {module}.")
             return []
@@ -181,29 +265,26 @@ class UnifiedSearchEngine:
             max_results=limit * 2  # Get more for filtering
         )
 
+        # Hydrate all hits with one query; SQL-expressible filters are
+        # applied in the database, the rest below.
+        hits = [(similarity, metadata) for _, similarity, metadata in raw_results]
+        hydrated = self.hydrator.hydrate(Model, hits, parsed.get('filters') or {})
+
         # Format results
-        results = []
-        for position, similarity, metadata in raw_results:
-            obj_id = metadata.get('id')
-            if not obj_id:
-                continue
+        results = [
+            {
+                'object': obj,
+                'module': module,
+                'similarity_score': similarity,
+                'snippet': self._extract_snippet(obj, query, config['fields']),
+                'template': config['display_template'],
+                'metadata': metadata,
+            }
+            for obj, similarity, metadata in hydrated['results']
+        ]
 
-            try:
-                obj = Model.objects.get(id=obj_id)
-                results.append({
-                    'object': obj,
-                    'module': module,
-                    'similarity_score': similarity,
-                    'snippet': self._extract_snippet(obj, query, config['fields']),
-                    'template': config['display_template'],
-                    'metadata': metadata,
-                })
-            except Model.DoesNotExist:
-                logger.warning(f"{Model.__name__} {obj_id} not found")
-                continue
-
-        # Apply filters from parsed query
-        results = self._apply_filters(results, parsed.get('filters', {}))
+        # Apply remaining filters from parsed query
+        results = self._apply_filters(results, hydrated['remaining_filters'])
 
         return results[:limit]
 
@@ -246,6 +327,8 @@ class UnifiedSearchEngine:
         """
         Apply filters to results based on parsed query.
 
+        Only filters the hydrator could not push into SQL reach this point.
+
         Args:
             results: List of search results
             filters: Filter criteria from parsed query
@@ -259,7 +342,7 @@ class UnifiedSearchEngine:
         filtered = results
 
         # Location filter
-        if 'location' in filters:
+        if filters.get('location'):
             location = filters['location'].lower()
             filtered = [
                 r for r in filtered
@@ -267,7 +350,7 @@ class UnifiedSearchEngine:
             ]
 
         # Sector filter
-        if 'sector' in filters:
+        if filters.get('sector'):
             sector = filters['sector'].lower()
             filtered = [
                 r for r in filtered
@@ -275,7 +358,7 @@ class UnifiedSearchEngine:
             ]
 
         # Date range filter
-        if 'date_range' in filters:
+        if filters.get('date_range'):
             date_range = filters['date_range']
             filtered = [
                 r for r in filtered
@@ -430,8 +513,8 @@ Provide helpful context about what was found. Be specific and concise.
 
         for module, config in self.SEARCHABLE_MODULES.items():
             try:
-                from ai_assistant.services import VectorStore
-                store = VectorStore.load(config['vector_store'])
+                from ai_assistant.services.vector_store import get_vector_store
+                store = get_vector_store(config['vector_store'])
                 stats[module] = {
                     'vector_count': store.vector_count,
                     'dimension': store.dimension,
@@ -450,12 +533,30 @@ Provide helpful context about what was found. Be specific and concise.
 
         return stats
 
-    def reindex_module(self, module: str) -> Dict[str, Any]:
+    def reindex_module(
+        self,
+        module: str,
+        chunk_size: int = 500,
+        batch_size: int = 64,
+        force: bool = False,
+        resume: bool = True,
+        checkpoint_every: Optional[int] = None,
+    ) -> Dict[str, Any]:
         """
         Reindex a specific module.
 
+        Objects are streamed in chunks, embedded in batches, and skipped when
+        their content hash is unchanged. Progress is checkpointed so an
+        interrupted run resumes; the finished index is swapped in atomically.
+
         Args:
             module: Module name to reindex
+            chunk_size: Objects fetched per chunk
+            batch_size: Texts per embedding batch
+            force: Re-embed unchanged objects as well
+            resume: Continue from a previous interrupted run if possible
+            checkpoint_every: Chunks between checkpoints (defaults to
+                ``reindex.DEFAULT_CHECKPOINT_EVERY``)
 
         Returns:
             Indexing statistics
@@ -465,63 +566,26 @@ Provide helpful context about what was found. Be specific and concise.
 
         config = self.SEARCHABLE_MODULES[module]
 
-        # Get model
+        # Validate model
         try:
-            Model = apps.get_model(config['app'], config['model'])
+            apps.get_model(config['app'], config['model'])
         except LookupError:
             raise ValueError(f"Model {config['app']}.{config['model']} not found")
 
-        # Get all objects
-        objects = Model.objects.all()
-        total_count = objects.count()
-
-        logger.info(f"Reindexing {module}: {total_count} objects")
-
-        # Create/load vector store
-        from ai_assistant.services import VectorStore
-        store = VectorStore(
-            config['vector_store'],
-            dimension=self.embedding_service.get_dimension()
+        from .reindex import DEFAULT_CHECKPOINT_EVERY, ReindexPipeline
+
+        pipeline = ReindexPipeline(
+            module,
+            config,
+            self.embedding_service,
+            self._format_object_text,
+            chunk_size=chunk_size,
+            batch_size=batch_size,
+            checkpoint_every=checkpoint_every or DEFAULT_CHECKPOINT_EVERY,
+            force=force,
+            resume=resume,
         )
-
-        # Generate embeddings and add to store
-        indexed_count = 0
-        for obj in objects:
-            try:
-                # Format object as text
-                text = self._format_object_text(obj, config['fields'])
-
-                # Generate embedding
-                embedding = self.embedding_service.generate_embedding(text)
-
-                # Add to store
-                metadata = {
-                    'id': obj.id,
-                    'type': module,
-                    'model': config['model'],
-                }
-                store.add_vector(embedding, metadata)
-
-                indexed_count += 1
-
-                if indexed_count % 100 == 0:
-                    logger.info(f"Indexed {indexed_count}/{total_count} {module}")
-
-            except Exception as e:
-                logger.error(f"Error indexing {module} {obj.id}: {e}")
-                continue
-
-        # Save store
-        store.save()
-
-        logger.info(f"Reindexing complete: {indexed_count}/{total_count} {module}")
-
-        return {
-            'module': module,
-            'total': total_count,
-            'indexed': indexed_count,
-            'skipped': total_count - indexed_count,
-        }
+        return pipeline.run().as_dict()
 
     def _format_object_text(self, obj: Any, fields: List[str]) -> str:
         """
@@ -4,6 +4,7 @@ from rest_framework.routers import DefaultRouter
 from .api_views import (
     BarangayViewSet,
     LocationDataView,
+    MunicipalityBarangaysView,
     MunicipalityViewSet,
     ProvinceViewSet,
     RegionViewSet,
@@ -22,4 +23,9 @@ app_name = "common_api"
 urlpatterns = [
     path("", include(router.urls)),
     path("location-data/", LocationDataView.as_view(), name="location-data"),
+    path(
+        "location-data/municipalities/<int:municipality_id>/barangays/",
+        MunicipalityBarangaysView.as_view(),
+        name="location-data-barangays",
+    ),
 ]
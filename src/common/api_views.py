@@ -1,3 +1,12 @@
+import re
+
+from django.http import HttpResponse
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    patch_vary_headers,
+)
+from django.utils.http import http_date
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters, permissions, viewsets
 from rest_framework.decorators import action
@@ -17,7 +26,13 @@ from .serializers import (
     UserCreateSerializer,
     UserSerializer,
 )
-from .services.locations import build_location_data
+from .services.locations import (
+    LocationDataArtifact,
+    get_barangay_chunk_artifact,
+    get_location_data_artifact,
+)
+
+_ACCEPTS_GZIP = re.compile(r"\bgzip\b")
 
 
 class UserViewSet(viewsets.ModelViewSet):
@@ -190,6 +205,28 @@ class BarangayViewSet(viewsets.ReadOnlyModelViewSet):
         return BarangaySerializer
 
 
+def _artifact_response(request, artifact: LocationDataArtifact) -> HttpResponse:
+    """Serve a prebuilt JSON artifact, answering revalidations with 304."""
+
+    last_modified = int(artifact.last_modified)
+    response = get_conditional_response(
+        request, etag=artifact.etag, last_modified=last_modified
+    )
+    if response is None:
+        if _ACCEPTS_GZIP.search(request.META.get("HTTP_ACCEPT_ENCODING", "")):
+            response = HttpResponse(artifact.body, content_type="application/json")
+            response["Content-Encoding"] = "gzip"
+        else:
+            response = HttpResponse(artifact.content, content_type="application/json")
+        patch_vary_headers(response, ("Accept-Encoding",))
+
+    response["ETag"] = artifact.etag
+    response["Last-Modified"] = http_date(last_modified)
+    # Authenticated data: keep it out of shared caches, but let browsers revalidate.
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
 class LocationDataView(APIView):
     """Return the reusable hierarchical location payload for client-side widgets."""
 
@@ -198,5 +235,15 @@ class LocationDataView(APIView):
     def get(self, request, *args, **kwargs):
         raw_include = request.query_params.get("include_barangays", "1").lower()
         include_barangays = raw_include not in {"0", "false", "no"}
-        payload = build_location_data(include_barangays=include_barangays)
-        return Response(payload)
+        artifact = get_location_data_artifact(include_barangays=include_barangays)
+        return _artifact_response(request, artifact)
+
+
+class MunicipalityBarangaysView(APIView):
+    """Return the barangays of one municipality for lazily loaded selects."""
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, municipality_id, *args, **kwargs):
+        artifact = get_barangay_chunk_artifact(municipality_id)
+        return _artifact_response(request, artifact)
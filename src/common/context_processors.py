@@ -5,14 +5,19 @@ from django.conf import settings
 
 
 def location_api(request):
-    """Expose the location-data API endpoint to templates."""
+    """Expose the location-data API endpoints to templates."""
 
     try:
         api_url = reverse("common_api:location-data")
+        # Widgets substitute the selected municipality for the placeholder.
+        barangays_url = reverse(
+            "common_api:location-data-barangays", args=[0]
+        ).replace("/0/", "/{municipality_id}/")
     except NoReverseMatch:
-        api_url = ""
+        api_url = barangays_url = ""
     return {
         "LOCATION_DATA_API_URL": api_url,
+        "LOCATION_BARANGAYS_API_URL": barangays_url,
     }
 
 
@@ -0,0 +1,58 @@
+"""Shared REST filter backends."""
+
+from datetime import datetime, time
+
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+
+
+class UpdatedSinceFilter(BaseFilterBackend):
+    """Delta sync: keep rows changed at or after ``?updated_since=``.
+
+    Accepts an ISO 8601 date or datetime; naive values use the site time
+    zone. The bound is inclusive so a client can resume from the newest
+    ``updated_at`` it has already seen. Views may set ``updated_since_field``
+    when their change timestamp is not ``updated_at``.
+    """
+
+    query_param = "updated_since"
+    field = "updated_at"
+
+    def filter_queryset(self, request, queryset, view):
+        raw = request.query_params.get(self.query_param)
+        if not raw:
+            return queryset
+
+        since = self.parse(raw)
+        if since is None:
+            raise ValidationError(
+                {self.query_param: "Enter an ISO 8601 date or datetime."}
+            )
+        field = getattr(view, "updated_since_field", self.field)
+        return queryset.filter(**{f"{field}__gte": since})
+
+    @staticmethod
+    def parse(raw):
+        try:
+            since = parse_datetime(raw)
+            if since is None:
+                day = parse_date(raw)
+                since = day and datetime.combine(day, time.min)
+        except ValueError:
+            return None
+        if since is not None and timezone.is_naive(since):
+            since = timezone.make_aware(since)
+        return since
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.query_param,
+                "required": False,
+                "in": "query",
+                "description": "Only rows updated at or after this ISO 8601 date/datetime.",
+                "schema": {"type": "string", "format": "date-time"},
+            }
+        ]
@@ -415,10 +415,10 @@ class LocationDataMixin:
 
     def get_location_context_data(self, **kwargs):
         """Add location data to template context."""
-        from ..services.locations import build_location_data
+        from ..services.locations import get_location_data
 
         context = kwargs
-        context["location_data"] = build_location_data(include_barangays=True)
+        context["location_data"] = get_location_data(include_barangays=False)
         return context
 
     def get_context_data(self, **kwargs):
@@ -14,7 +14,7 @@ from django.urls import reverse
 from django.utils.safestring import mark_safe
 
 from ..models import Region, Province, Municipality, Barangay
-from ..services.locations import build_location_data
+from ..services.locations import get_location_data
 
 
 class LocationHierarchyWidget(forms.MultiWidget):
@@ -223,7 +223,7 @@ class LocationHierarchyWidget(forms.MultiWidget):
                 "include_barangay": self.include_barangay,
                 "include_coordinates": self.include_coordinates,
                 "include_map": self.include_map,
-                "location_data": build_location_data(
+                "location_data": get_location_data(
                     include_barangays=self.include_barangay
                 ),
                 "centroid_url": reverse("common:location_centroid"),
@@ -0,0 +1,103 @@
+"""
+Management command to rebuild unified search indices.
+
+Objects are streamed in chunks and embedded in batches; unchanged objects are
+skipped. An interrupted run resumes from its last checkpoint unless
+``--restart`` is given.
+
+Usage:
+    python manage.py reindex_search
+    python manage.py reindex_search communities policies
+    python manage.py reindex_search communities --force --chunk-size 1000
+    python manage.py reindex_search --async
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from common.ai_services.reindex import DEFAULT_CHECKPOINT_EVERY
+from common.ai_services.unified_search import UnifiedSearchEngine
+
+
+class Command(BaseCommand):
+    help = 'Rebuild unified search vector indices in resumable batches'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'modules',
+            nargs='*',
+            help='Modules to reindex (default: all searchable modules)',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=500,
+            help='Objects fetched per chunk (default: 500)',
+        )
+        parser.add_argument(
+            '--checkpoint-every',
+            type=int,
+            default=DEFAULT_CHECKPOINT_EVERY,
+            help=(
+                'Chunks between checkpoints; a resumed run redoes at most this '
+                f'many chunks (default: {DEFAULT_CHECKPOINT_EVERY})'
+            ),
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=64,
+            help='Texts per embedding batch (default: 64)',
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Re-embed objects even when their content is unchanged',
+        )
+        parser.add_argument(
+            '--restart',
+            action='store_true',
+            help='Ignore any checkpoint left by an interrupted run',
+        )
+        parser.add_argument(
+            '--async',
+            action='store_true',
+            dest='run_async',
+            help='Queue one Celery task per module instead of running inline',
+        )
+
+    def handle(self, *args, **options):
+        modules = options['modules'] or list(UnifiedSearchEngine.SEARCHABLE_MODULES)
+        unknown = [m for m in modules if m not in UnifiedSearchEngine.SEARCHABLE_MODULES]
+        if unknown:
+            raise CommandError(f"Unknown module(s): {', '.join(unknown)}")
+
+        task_options = {
+            'chunk_size': options['chunk_size'],
+            'batch_size': options['batch_size'],
+            'checkpoint_every': options['checkpoint_every'],
+            'force': options['force'],
+            'resume': not options['restart'],
+        }
+
+        if options['run_async']:
+            from common.tasks import reindex_search_module
+
+            for module in modules:
+                result = reindex_search_module.delay(module, **task_options)
+                self.stdout.write(f'Queued {module} (task {result.id})')
+            return
+
+        from common.ai_services.unified_search import get_unified_search_engine
+
+        engine = get_unified_search_engine()
+        for module in modules:
+            self.stdout.write(self.style.WARNING(f'\n--- Reindexing {module} ---'))
+            stats = engine.reindex_module(module, **task_options)
+            if stats['resumed']:
+                self.stdout.write('Resumed from checkpoint')
+            self.stdout.write(self.style.SUCCESS(
+                f"Processed {stats['processed']}/{stats['total']}: "
+                f"{stats['indexed']} indexed, {stats['skipped']} unchanged, "
+                f"{stats['errors']} errors, {stats['removed']} removed "
+                f"in {stats['elapsed']:.1f}s ({stats['objects_per_second']:.1f} objects/sec)"
+            ))
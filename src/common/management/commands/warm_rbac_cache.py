@@ -147,9 +147,9 @@ class Command(BaseCommand):
         # Get cache stats
         try:
             cache_stats = RBACService.get_cache_stats()
-            if 'error' not in cache_stats:
-                self.stdout.write(f"\nCache Statistics:")
-                self.stdout.write(f"  Total cached keys:       {cache_stats.get('total_cached_keys', 'N/A')}")
+            self.stdout.write(f"\nCache Statistics:")
+            self.stdout.write(f"  Snapshot hit rate:       {cache_stats['hit_rate']:.1f}%")
+            self.stdout.write(f"  RBAC version:            {cache_stats['version']}")
         except Exception:
             pass
 
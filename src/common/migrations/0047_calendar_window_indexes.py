@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0046_grant_monitoring_to_oobc_staff'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='staffleave',
+            index=models.Index(fields=['start_date', 'end_date'], name='common_staf_start_d_cb00df_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='trainingenrollment',
+            index=models.Index(fields=['scheduled_date'], name='common_trai_schedul_26123c_idx'),
+        ),
+    ]
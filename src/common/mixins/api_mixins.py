@@ -0,0 +1,49 @@
+"""
+Mixins for high-volume REST viewsets.
+
+``DeltaSyncMixin`` gives a viewset the integration-friendly list options:
+``?updated_since=`` delta filtering, opt-in keyset pagination
+(``?pagination=cursor``) and, together with
+``common.serializers.SparseFieldsetMixin``, ``?fields=`` sparse fieldsets
+that also skip prefetching relations the client did not ask for.
+"""
+
+from django.db.models import Prefetch
+
+from common.filters import UpdatedSinceFilter
+from common.pagination import OptInKeysetPagination
+from common.serializers import requested_fields
+
+
+class DeltaSyncMixin:
+    """Delta sync, keyset pagination and sparse fieldsets for a viewset.
+
+    ``prefetch_fields`` maps a prefetched relation to the serializer fields
+    that read it when they are not named after it, e.g.
+    ``{"livelihoods": ("livelihoods", "livelihood_count")}``.
+    """
+
+    pagination_class = OptInKeysetPagination
+    delta_filter_class = UpdatedSinceFilter
+    prefetch_fields = {}
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        return self.delta_filter_class().filter_queryset(self.request, queryset, self)
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        wanted = requested_fields(getattr(self, "request", None))
+        lookups = queryset._prefetch_related_lookups
+        if wanted is None or not lookups:
+            return queryset
+
+        kept = [lookup for lookup in lookups if self._prefetch_wanted(lookup, wanted)]
+        if len(kept) == len(lookups):
+            return queryset
+        return queryset.prefetch_related(None).prefetch_related(*kept)
+
+    def _prefetch_wanted(self, lookup, wanted):
+        path = lookup.prefetch_to if isinstance(lookup, Prefetch) else lookup
+        root = path.split("__", 1)[0]
+        return not wanted.isdisjoint(self.prefetch_fields.get(root, (root,)))
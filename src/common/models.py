@@ -12,12 +12,12 @@ from django.utils import timezone
 from django.utils.text import slugify
 
 
-def _invalidate_calendar_cache() -> None:
-    """Safely clear cached calendar artefacts without circular imports."""
+def _invalidate_calendar_cache(*modules: str) -> None:
+    """Safely invalidate cached calendar artefacts without circular imports."""
 
     from common.services import calendar as calendar_service
 
-    calendar_service.invalidate_calendar_cache()
+    calendar_service.invalidate_calendar_cache(modules or None)
 
 
 class User(AbstractUser):
@@ -259,9 +259,13 @@ class Region(models.Model):
         """Check if given coordinates [lng, lat] are within region boundary."""
         if not self.boundary_geojson:
             return False
-        # Placeholder for actual geometric containment check
-        # In production, this would use proper GIS libraries like Shapely
-        return True
+        from .services.spatial_index import point_in_boundary
+
+        try:
+            lng, lat = float(coordinates[0]), float(coordinates[1])
+        except (TypeError, ValueError, IndexError):
+            return False
+        return point_in_boundary(self.boundary_geojson, lat, lng)
 
     def get_all_geographic_layers(self):
         """Get all geographic layers at this level and below."""
@@ -794,6 +798,9 @@ class TrainingEnrollment(models.Model):
 
     class Meta:
         ordering = ["-scheduled_date", "program__title"]
+        indexes = [
+            models.Index(fields=["scheduled_date"]),
+        ]
 
     def __str__(self):
         return f"{self.staff_profile.user.get_full_name()} - {self.program.title}"
@@ -1293,12 +1300,12 @@ class CalendarResourceBooking(models.Model):
 
     def save(self, *args, **kwargs):
         result = super().save(*args, **kwargs)
-        _invalidate_calendar_cache()
+        _invalidate_calendar_cache("resources")
         return result
 
     def delete(self, *args, **kwargs):
         result = super().delete(*args, **kwargs)
-        _invalidate_calendar_cache()
+        _invalidate_calendar_cache("resources")
         return result
 
 
@@ -1619,12 +1626,12 @@ class StaffLeave(models.Model):
 
     def save(self, *args, **kwargs):
         result = super().save(*args, **kwargs)
-        _invalidate_calendar_cache()
+        _invalidate_calendar_cache("staff")
         return result
 
     def delete(self, *args, **kwargs):
         result = super().delete(*args, **kwargs)
-        _invalidate_calendar_cache()
+        _invalidate_calendar_cache("staff")
         return result
 
     created_at = models.DateTimeField(auto_now_add=True)
@@ -1635,6 +1642,9 @@ class StaffLeave(models.Model):
         ordering = ["-start_date"]
         verbose_name = "Staff Leave"
         verbose_name_plural = "Staff Leaves"
+        indexes = [
+            models.Index(fields=["start_date", "end_date"]),
+        ]
 
     def __str__(self):
         return f"{self.staff.get_full_name()} - {self.get_leave_type_display()} ({self.start_date})"
@@ -1646,12 +1656,12 @@ class StaffLeave(models.Model):
 
     def save(self, *args, **kwargs):
         result = super().save(*args, **kwargs)
-        _invalidate_calendar_cache()
+        _invalidate_calendar_cache("staff")
         return result
 
     def delete(self, *args, **kwargs):
         result = super().delete(*args, **kwargs)
-        _invalidate_calendar_cache()
+        _invalidate_calendar_cache("staff")
         return result
 
 # ========== UNIFIED WORK HIERARCHY ==========
@@ -0,0 +1,149 @@
+"""
+Pagination classes for high-volume REST endpoints.
+
+``OptInKeysetPagination`` keeps the default page-number responses and
+switches to forward-only keyset (cursor) pages when a client asks for them
+with ``?pagination=cursor`` or follows a ``cursor`` link. Keyset pages walk a
+stable ``(updated_at, pk)`` ordering with a ``WHERE`` clause instead of
+``OFFSET`` and never run ``COUNT(*)``, so syncing thousands of rows costs
+the same per page at any depth.
+"""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """Forward-only keyset pagination on ``(ordering_field, pk)``."""
+
+    cursor_query_param = "cursor"
+    page_size = api_settings.PAGE_SIZE or 20
+    page_size_query_param = "page_size"
+    max_page_size = 1000
+    ordering_field = "updated_at"
+    invalid_cursor_message = "Invalid cursor"
+
+    def __init__(self, ordering_field=None):
+        if ordering_field:
+            self.ordering_field = ordering_field
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        page_size = self.get_page_size(request)
+        position = self.decode_cursor(request)
+
+        queryset = queryset.order_by(self.ordering_field, "pk")
+        if position is not None:
+            value, pk = position
+            queryset = queryset.filter(
+                Q(**{f"{self.ordering_field}__gt": value})
+                | Q(**{self.ordering_field: value, "pk__gt": pk})
+            )
+
+        # One extra row tells whether another page exists.
+        rows = list(queryset[: page_size + 1])
+        self.has_next = len(rows) > page_size
+        self.page = rows[:page_size]
+        return self.page
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(max(size, 1), self.max_page_size)
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            padded = encoded + "=" * (-len(encoded) % 4)
+            data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+            return datetime.fromisoformat(data["v"]), data["pk"]
+        except (binascii.Error, ValueError, TypeError, KeyError, UnicodeError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, instance):
+        value = getattr(instance, self.ordering_field)
+        pk = instance.pk
+        data = {"v": value.isoformat(), "pk": pk if isinstance(pk, int) else str(pk)}
+        encoded = base64.urlsafe_b64encode(json.dumps(data).encode("ascii"))
+        return encoded.decode("ascii").rstrip("=")
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        return replace_query_param(
+            self.request.build_absolute_uri(),
+            self.cursor_query_param,
+            self.encode_cursor(self.page[-1]),
+        )
+
+    def get_paginated_response(self, data):
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+
+class OptInKeysetPagination(PageNumberPagination):
+    """Page numbers by default; keyset pages on ``?pagination=cursor``.
+
+    Views may set ``keyset_ordering_field`` when their change timestamp is
+    not ``updated_at``.
+    """
+
+    mode_query_param = "pagination"
+    keyset_class = KeysetPagination
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = None
+        if (
+            request.query_params.get(self.mode_query_param) == "cursor"
+            or self.keyset_class.cursor_query_param in request.query_params
+        ):
+            self.keyset = self.keyset_class(
+                getattr(view, "keyset_ordering_field", None)
+            )
+            return self.keyset.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+    def get_schema_operation_parameters(self, view):
+        return super().get_schema_operation_parameters(view) + [
+            {
+                "name": self.mode_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Use 'cursor' for keyset pages ordered by last update.",
+                "schema": {"type": "string", "enum": ["cursor"]},
+            },
+            {
+                "name": self.keyset_class.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Cursor from the previous keyset page's 'next' link.",
+                "schema": {"type": "string"},
+            },
+        ]
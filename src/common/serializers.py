@@ -4,6 +4,41 @@ from .models import Barangay, Municipality, Province, Region, User
 from .work_item_model import WorkItem
 
 
+def requested_fields(request, query_param="fields"):
+    """Return the field names asked for with ``?fields=a,b``, or None."""
+
+    if request is None or request.method != "GET":
+        return None
+    raw = request.query_params.get(query_param)
+    if not raw:
+        return None
+    return {name.strip() for name in raw.split(",") if name.strip()}
+
+
+class SparseFieldsetMixin:
+    """Render only the fields listed in ``?fields=`` on GET requests.
+
+    Applies to the serializer rendering the response (and each item of a
+    list response); nested serializers keep their full output. Unknown
+    names are ignored, and omitting the parameter returns every field.
+    """
+
+    fields_query_param = "fields"
+
+    def get_fields(self):
+        fields = super().get_fields()
+        parent = self.parent
+        if isinstance(parent, serializers.ListSerializer):
+            parent = parent.parent
+        if parent is not None:
+            return fields
+
+        wanted = requested_fields(self.context.get("request"), self.fields_query_param)
+        if wanted is None:
+            return fields
+        return {name: field for name, field in fields.items() if name in wanted}
+
+
 class BarangaySerializer(serializers.ModelSerializer):
     """Serializer for Barangay model."""
 
@@ -0,0 +1,154 @@
+"""Versioned, tag-based cache invalidation helpers.
+
+Cached artefacts embed the current version of every tag they depend on in
+their cache key. Invalidating a tag increments its version counter, so stale
+entries simply stop being addressed and age out via their TTL. Nothing is
+ever deleted by pattern and the shared cache (sessions, RBAC, AI responses)
+is left untouched.
+
+Invalidations raised inside a database transaction are collected per
+connection and applied once when the transaction commits; a rolled back
+transaction never bumps anything.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from typing import Dict, Iterable, Set
+
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+
+from .on_commit_batch import OnCommitBatch
+
+
+TAG_VERSION_PREFIX = "cachetag:version"
+TAG_STATS_PREFIX = "cachetag:stats"
+
+
+def _version_key(tag: str) -> str:
+    return f"{TAG_VERSION_PREFIX}:{tag}"
+
+
+def _initial_version() -> int:
+    """Seed counters from the clock so an evicted counter never reuses a value."""
+
+    return int(time.time() * 1000)
+
+
+def get_tag_versions(tags: Iterable[str]) -> Dict[str, int]:
+    """Return the current version for each tag, initialising missing counters."""
+
+    tags = sorted(set(tags))
+    if not tags:
+        return {}
+
+    keys = {tag: _version_key(tag) for tag in tags}
+    stored = cache.get_many(list(keys.values()))
+
+    versions: Dict[str, int] = {}
+    for tag, key in keys.items():
+        version = stored.get(key)
+        if version is None:
+            seed = _initial_version()
+            cache.add(key, seed, None)
+            version = cache.get(key) or seed
+        versions[tag] = int(version)
+    return versions
+
+
+def build_versioned_key(namespace: str, tags: Iterable[str], *parts: object) -> str:
+    """Return a cache key bound to the current versions of ``tags``.
+
+    ``parts`` identify the cached view of the data (modules, user, window…)
+    and are kept readable; the tag versions are folded into a short digest.
+    """
+
+    versions = get_tag_versions(tags)
+    fingerprint = ",".join(f"{tag}={version}" for tag, version in versions.items())
+    digest = hashlib.md5(fingerprint.encode("utf-8")).hexdigest()[:12]
+    readable = ":".join("-" if part is None else str(part) for part in parts)
+    return f"{namespace}:{readable}:{digest}" if readable else f"{namespace}:{digest}"
+
+
+def bump_tags(tags: Iterable[str]) -> None:
+    """Immediately increment the version counter of every tag."""
+
+    for tag in set(tags):
+        key = _version_key(tag)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, _initial_version(), None)
+
+
+_pending_tags: OnCommitBatch[Set[str]] = OnCommitBatch("cache_tags", set, bump_tags)
+
+
+def invalidate_tags(tags: Iterable[str], *, using: str = DEFAULT_DB_ALIAS) -> None:
+    """Invalidate ``tags`` now, or once on commit when inside a transaction."""
+
+    tags = set(tags)
+    if not tags:
+        return
+
+    pending = _pending_tags.collect(using)
+    if pending is None:
+        bump_tags(tags)
+        return
+    pending.update(tags)
+
+
+def has_pending_invalidation(
+    tags: Iterable[str], *, using: str = DEFAULT_DB_ALIAS
+) -> bool:
+    """Return True when the current transaction has uncommitted changes to ``tags``.
+
+    Readers use this to bypass the cache so a request sees its own writes
+    without publishing data the rest of the system cannot see yet.
+    """
+
+    pending = _pending_tags.pending(using)
+    return bool(pending and pending.intersection(tags))
+
+
+def record_cache_access(namespace: str, hit: bool) -> None:
+    """Increment the shared hit or miss counter for ``namespace``."""
+
+    key = f"{TAG_STATS_PREFIX}:{namespace}:{'hits' if hit else 'misses'}"
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, 0, None)
+        try:
+            cache.incr(key)
+        except ValueError:
+            pass
+
+
+def get_cache_stats(namespace: str) -> Dict[str, float]:
+    """Return hit/miss counters and the hit rate (a percentage) for ``namespace``."""
+
+    hits_key = f"{TAG_STATS_PREFIX}:{namespace}:hits"
+    misses_key = f"{TAG_STATS_PREFIX}:{namespace}:misses"
+    stored = cache.get_many([hits_key, misses_key])
+    hits = int(stored.get(hits_key) or 0)
+    misses = int(stored.get(misses_key) or 0)
+    total = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": round(hits / total * 100, 2) if total else 0.0,
+    }
+
+
+def reset_cache_stats(namespace: str) -> None:
+    """Reset the hit/miss counters for ``namespace``."""
+
+    cache.delete_many(
+        [
+            f"{TAG_STATS_PREFIX}:{namespace}:hits",
+            f"{TAG_STATS_PREFIX}:{namespace}:misses",
+        ]
+    )
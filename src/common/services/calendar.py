@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-from copy import deepcopy
+import heapq
 from dataclasses import dataclass
-from datetime import datetime, time, timedelta
-from typing import Dict, List, Optional, Sequence, Tuple
+from datetime import date, datetime, time, timedelta
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 from django.core.cache import cache
 from django.db.models import Q
@@ -14,6 +14,13 @@ from django.utils import timezone
 from django.utils.dateparse import parse_date
 
 from common.constants import CALENDAR_MODULE_ORDER
+from common.services.cache_tags import (
+    build_versioned_key,
+    get_cache_stats,
+    has_pending_invalidation,
+    invalidate_tags,
+    record_cache_access,
+)
 from common.models import (
     CalendarResourceBooking,
     StaffLeave,
@@ -34,14 +41,77 @@ from monitoring.models import MonitoringEntry, MonitoringEntryWorkflowStage
 from recommendations.policy_tracking.models import PolicyRecommendation
 
 
-CALENDAR_CACHE_INDEX_KEY = "calendar:payload:index"
+CALENDAR_CACHE_NAMESPACE = "calendar:payload"
 CALENDAR_CACHE_TTL = 300  # seconds
 
+# Every module ``build_calendar_payload`` can emit, including the ones that are
+# only shown when explicitly requested.
+CALENDAR_CACHE_MODULES = tuple(CALENDAR_MODULE_ORDER) + ("communities", "resources")
+
+# Calendar modules whose cached payloads depend on each model.
+CALENDAR_SENDER_MODULES = {
+    WorkItem: ("coordination", "staff"),
+    StakeholderEngagement: ("coordination",),
+    Communication: ("coordination",),
+    Partnership: ("coordination",),
+    PartnershipMilestone: ("coordination",),
+    BaselineDataCollection: ("mana",),
+    TrainingEnrollment: ("staff",),
+    StaffLeave: ("staff",),
+    PolicyRecommendation: ("policy",),
+    MonitoringEntry: ("planning",),
+    MonitoringEntryWorkflowStage: ("planning",),
+    CommunityEvent: ("communities",),
+    CalendarResourceBooking: ("resources",),
+}
+
+# Inclusive (first day, last day) range; either bound may be open.
+CalendarWindow = Tuple[Optional[date], Optional[date]]
+
+
+def calendar_cache_tags(modules: Optional[Iterable[str]] = None) -> List[str]:
+    """Return the invalidation tags covering ``modules`` (all when omitted)."""
+
+    selected = set(modules) if modules else set(CALENDAR_CACHE_MODULES)
+    return sorted(f"calendar:{module}" for module in selected)
+
+
+def invalidate_calendar_cache(modules: Optional[Iterable[str]] = None) -> None:
+    """Invalidate cached calendar payloads for ``modules``.
+
+    Only the tags of the touched modules are bumped, so payloads for other
+    modules stay warm. Calls made inside a transaction collapse into a single
+    bump on commit.
+    """
+
+    invalidate_tags(calendar_cache_tags(modules))
+
+
+def calendar_cache_key(
+    namespace: str,
+    filter_modules: Optional[Iterable[str]] = None,
+    *,
+    user_id: Optional[int] = None,
+    window: Optional[Tuple[object, object]] = None,
+) -> str:
+    """Build a versioned cache key scoped by module set, user and date window."""
+
+    modules = sorted(set(filter_modules or [])) or None
+    window_start, window_end = window or (None, None)
+    return build_versioned_key(
+        namespace,
+        calendar_cache_tags(modules),
+        "|".join(modules) if modules else "__all__",
+        user_id,
+        window_start,
+        window_end,
+    )
 
-def invalidate_calendar_cache() -> None:
-    """Clear cached calendar payloads and per-view responses."""
 
-    cache.clear()
+def get_calendar_cache_stats() -> Dict[str, float]:
+    """Return hit/miss counters for cached calendar payloads."""
+
+    return get_cache_stats(CALENDAR_CACHE_NAMESPACE)
 
 
 @dataclass
@@ -120,35 +190,122 @@ def _oobc_workitem_scope() -> Q:
     return ~moa_filter
 
 
-def build_calendar_payload(
-    *,
-    filter_modules: Optional[Sequence[str]] = None,
-) -> Dict[str, object]:
-    """Gather calendar entries across OOBC modules.
+def _to_date(value: object) -> Optional[date]:
+    """Return the calendar day of a date, datetime or ISO 8601 string."""
 
-    Args:
-        filter_modules: optional iterable restricting modules to include.
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        if timezone.is_aware(value):
+            value = timezone.localtime(value)
+        return value.date()
+    if isinstance(value, date):
+        return value
+    try:
+        # FullCalendar sends local ISO datetimes; the day is the first part.
+        return parse_date(str(value).strip()[:10])
+    except ValueError:
+        return None
 
-    Returns:
-        Dict containing entries, module statistics, upcoming highlights, and
-        conflict hints suitable for rendering calendar dashboards.
+
+def parse_calendar_window(
+    start: object = None, end: object = None
+) -> Optional[CalendarWindow]:
+    """Normalise ``start``/``end`` request values into an inclusive date window.
+
+    Accepts dates, datetimes or ISO 8601 strings (as sent by FullCalendar).
+    Unparseable bounds are dropped; returns ``None`` when neither is usable.
     """
 
-    requested_modules = list(filter_modules) if filter_modules is not None else None
-    allowed_modules_set = set(requested_modules or []) or None
+    window = (_to_date(start), _to_date(end))
+    return window if any(window) else None
 
-    now = timezone.now()
-    due_soon_cutoff = now + timedelta(days=2)
-    oobc_scope = _oobc_workitem_scope()
 
-    normalized_modules = ("__all__",)
-    if allowed_modules_set is not None:
-        normalized_modules = tuple(sorted(allowed_modules_set)) or ("__all__",)
+def _window_bounds(
+    window: Optional[CalendarWindow],
+) -> Tuple[Optional[datetime], Optional[datetime]]:
+    """Return aware datetimes bounding ``window`` (end exclusive)."""
+
+    window_start, window_end = window or (None, None)
+    if window_end:
+        window_end += timedelta(days=1)
+    return _ensure_aware(_combine(window_start)), _ensure_aware(_combine(window_end))
+
 
-    cache_key = f"calendar:payload:{'|'.join(normalized_modules)}"
-    cached_payload = cache.get(cache_key)
-    if cached_payload is not None:
-        return deepcopy(cached_payload)
+def _in_window(value: Optional[date], window: Optional[CalendarWindow]) -> bool:
+    """Return True when the day ``value`` falls inside ``window``."""
+
+    if window is None:
+        return True
+    if value is None:
+        return False
+    window_start, window_end = window
+    return (window_start is None or value >= window_start) and (
+        window_end is None or value <= window_end
+    )
+
+
+def _date_in_window(field: str, window: Optional[CalendarWindow]) -> Q:
+    """Q clause restricting a date column to ``window``."""
+
+    window_start, window_end = window or (None, None)
+    lookups = {}
+    if window_start:
+        lookups[f"{field}__gte"] = window_start
+    if window_end:
+        lookups[f"{field}__lte"] = window_end
+    return Q(**lookups)
+
+
+def _any_date_in_window(fields: Sequence[str], window: Optional[CalendarWindow]) -> Q:
+    """Q clause matching rows with at least one of ``fields`` inside ``window``."""
+
+    if window is None:
+        return Q()
+    clause = Q()
+    for field in fields:
+        clause |= _date_in_window(field, window)
+    return clause
+
+
+def _span_in_window(
+    start_field: str, end_field: str, window: Optional[CalendarWindow]
+) -> Q:
+    """Q clause matching rows whose [start, end] span overlaps ``window``.
+
+    A missing end means the span is the start day alone, and a missing start
+    means it is the end day alone.
+    """
+
+    window_start, window_end = window or (None, None)
+    clause = Q()
+    if window_end:
+        clause &= Q(**{f"{start_field}__lte": window_end}) | Q(
+            **{f"{start_field}__isnull": True, f"{end_field}__lte": window_end}
+        )
+    if window_start:
+        clause &= Q(**{f"{end_field}__gte": window_start}) | Q(
+            **{f"{end_field}__isnull": True, f"{start_field}__gte": window_start}
+        )
+    return clause
+
+
+def _collect_module(
+    module: str, window: Optional[CalendarWindow], now: datetime
+) -> Dict[str, object]:
+    """Build the calendar entries of a single module inside ``window``.
+
+    Returns the raw pieces ``build_calendar_payload`` merges across modules
+    (entries, stats, upcoming and timed items, workflow actions and analytics
+    counters). The result is cached per (module, window).
+    """
+
+    due_soon_cutoff = now + timedelta(days=2)
+    oobc_scope = (
+        _oobc_workitem_scope()
+        if module in CALENDAR_SENDER_MODULES[WorkItem]
+        else Q()
+    )
 
     entries: List[Dict] = []
     stats: Dict[str, CalendarStats] = {}
@@ -168,18 +325,8 @@ def build_calendar_payload(
         "workflow": 0,
     }
 
-    if requested_modules:
-        module_seed = [
-            module for module in requested_modules if module in CALENDAR_MODULE_ORDER
-        ]
-        module_seed += [
-            module for module in requested_modules if module not in module_seed
-        ]
-    else:
-        module_seed = list(CALENDAR_MODULE_ORDER)
-
     def include_module(module_name: str) -> bool:
-        return allowed_modules_set is None or module_name in allowed_modules_set
+        return module_name == module
 
     def severity_for_due(due_datetime: Optional[datetime]) -> str:
         if not due_datetime:
@@ -227,6 +374,7 @@ def build_calendar_payload(
         events = (
             WorkItem.objects.filter(
                 oobc_scope,
+                _span_in_window("start_date", "due_date", window),
                 work_type__in=['activity', 'sub_activity'],
             )
             .select_related("created_by")
@@ -367,9 +515,14 @@ def build_calendar_payload(
 
     # Coordination Stakeholder Engagements ---------------------------------
     if include_module("coordination"):
+        window_start_dt, window_end_dt = _window_bounds(window)
         engagements = StakeholderEngagement.objects.select_related(
             "community", "engagement_type"
         )
+        if window_start_dt:
+            engagements = engagements.filter(planned_date__gte=window_start_dt)
+        if window_end_dt:
+            engagements = engagements.filter(planned_date__lt=window_end_dt)
 
         for engagement in engagements:
             start_dt = engagement.planned_date
@@ -454,6 +607,11 @@ def build_calendar_payload(
         communications = Communication.objects.select_related("organization").filter(
             requires_follow_up=True
         )
+        if window is not None:
+            communications = communications.filter(
+                _date_in_window("follow_up_date", window)
+                | (Q(follow_up_date__isnull=True) & _date_in_window("due_date", window))
+            )
 
         for communication in communications:
             due_source = communication.follow_up_date or communication.due_date
@@ -543,6 +701,18 @@ def build_calendar_payload(
     if include_module("coordination"):
         partnerships = Partnership.objects.select_related(
             "lead_organization", "focal_person"
+        ).filter(
+            _any_date_in_window(
+                (
+                    "concept_date",
+                    "negotiation_start_date",
+                    "signing_date",
+                    "start_date",
+                    "end_date",
+                    "renewal_date",
+                ),
+                window,
+            )
         )
 
         for partnership in partnerships:
@@ -598,7 +768,7 @@ def build_calendar_payload(
             }
 
             for category, date_value, label, bg_color, border_color in timeline:
-                if not date_value:
+                if not date_value or not _in_window(date_value, window):
                     continue
 
                 start_dt = _combine(date_value)
@@ -757,7 +927,9 @@ def build_calendar_payload(
 
     # Partnership Milestones -----------------------------------------------
     if include_module("coordination"):
-        milestones = PartnershipMilestone.objects.select_related("partnership")
+        milestones = PartnershipMilestone.objects.select_related(
+            "partnership"
+        ).filter(_date_in_window("due_date", window))
 
         for milestone in milestones:
             if not milestone.due_date:
@@ -864,7 +1036,7 @@ def build_calendar_payload(
     if include_module("mana"):
         baseline_qs = BaselineDataCollection.objects.select_related(
             "study", "supervisor"
-        )
+        ).filter(_date_in_window("planned_date", window))
 
         for baseline in baseline_qs:
             start_dt = _combine(baseline.planned_date)
@@ -950,6 +1122,7 @@ def build_calendar_payload(
         tasks = (
             WorkItem.objects.filter(
                 oobc_scope,
+                _span_in_window("start_date", "due_date", window),
                 work_type__in=['task', 'subtask'],
             )
             .prefetch_related(
@@ -1090,7 +1263,7 @@ def build_calendar_payload(
     if include_module("staff"):
         enrollments = TrainingEnrollment.objects.select_related(
             "staff_profile__user", "program"
-        )
+        ).filter(_date_in_window("scheduled_date", window))
 
         for enrollment in enrollments:
             scheduled_date = enrollment.scheduled_date
@@ -1170,6 +1343,16 @@ def build_calendar_payload(
     if include_module("policy"):
         policies = PolicyRecommendation.objects.select_related(
             "proposed_by", "lead_author"
+        ).filter(
+            _any_date_in_window(
+                (
+                    "submission_date",
+                    "review_deadline",
+                    "implementation_start_date",
+                    "implementation_deadline",
+                ),
+                window,
+            )
         )
 
         for policy in policies:
@@ -1189,7 +1372,7 @@ def build_calendar_payload(
             ]
 
             for category, date_value, label in milestones:
-                if not date_value:
+                if not date_value or not _in_window(date_value, window):
                     continue
 
                 start_dt = _combine(date_value)
@@ -1297,6 +1480,15 @@ def build_calendar_payload(
         planning_entries = MonitoringEntry.objects.select_related(
             "lead_organization", "submitted_by_community", "related_policy"
         )
+        if window is not None:
+            # JSON milestone dates cannot be filtered in SQL; rows carrying
+            # them are checked per milestone below.
+            planning_entries = planning_entries.filter(
+                _any_date_in_window(
+                    ("start_date", "next_milestone_date", "target_end_date"), window
+                )
+                | ~Q(milestone_dates=[])
+            )
 
         for entry in planning_entries:
             date_milestones = [
@@ -1306,7 +1498,7 @@ def build_calendar_payload(
             ]
 
             for category, date_value, label in date_milestones:
-                if not date_value:
+                if not date_value or not _in_window(date_value, window):
                     continue
 
                 start_dt = _combine(date_value)
@@ -1457,7 +1649,7 @@ def build_calendar_payload(
                         except ValueError:
                             parsed_date = None
 
-                if parsed_date is None:
+                if parsed_date is None or not _in_window(parsed_date, window):
                     continue
 
                 start_dt = _combine(parsed_date)
@@ -1582,7 +1774,7 @@ def build_calendar_payload(
         if include_module("planning"):
             stages = MonitoringEntryWorkflowStage.objects.select_related(
                 "entry"
-            ).filter(due_date__isnull=False)
+            ).filter(_date_in_window("due_date", window), due_date__isnull=False)
 
             for stage in stages:
                 if stage.status == MonitoringEntryWorkflowStage.STATUS_COMPLETED:
@@ -1669,7 +1861,7 @@ def build_calendar_payload(
     # Community Events ------------------------------------------------------
     if include_module("communities"):
         community_events = CommunityEvent.objects.select_related("community").filter(
-            is_public=True
+            _span_in_window("start_date", "end_date", window), is_public=True
         )
 
         for ce in community_events:
@@ -1746,7 +1938,8 @@ def build_calendar_payload(
     # Staff Leave -----------------------------------------------------------
     if include_module("staff"):
         staff_leaves = StaffLeave.objects.select_related("staff").filter(
-            status__in=["pending", "approved"]
+            _span_in_window("start_date", "end_date", window),
+            status__in=["pending", "approved"],
         )
 
         for leave in staff_leaves:
@@ -1821,9 +2014,14 @@ def build_calendar_payload(
 
     # Resource Bookings -----------------------------------------------------
     if include_module("resources"):
+        window_start_dt, window_end_dt = _window_bounds(window)
         bookings = CalendarResourceBooking.objects.select_related(
             "resource", "booked_by"
         ).filter(status__in=["pending", "approved"])
+        if window_start_dt:
+            bookings = bookings.filter(end_datetime__gt=window_start_dt)
+        if window_end_dt:
+            bookings = bookings.filter(start_datetime__lt=window_end_dt)
 
         for booking in bookings:
             aware_start = _ensure_aware(booking.start_datetime)
@@ -1915,6 +2113,197 @@ def build_calendar_payload(
                     notes=f"{booking.resource.name} - {description[:100]}",
                 )
 
+    for entry in entries:
+        props = entry.setdefault("extendedProps", {})
+        if props.get("supportsEditing") is True:
+            entry.setdefault("editable", True)
+        else:
+            props["supportsEditing"] = False
+            if entry.get("editable") is not True:
+                entry["editable"] = False
+            entry.setdefault("durationEditable", False)
+
+    return {
+        "entries": entries,
+        "stats": stats,
+        "upcoming_items": upcoming_items,
+        "timed_entries": timed_entries,
+        "follow_up_items": follow_up_items,
+        "workflow_actions": workflow_actions_global,
+        "status_counts": status_counts,
+        "modules": sorted(module_set),
+        "heatmap_counts": heatmap_counts,
+        "workflow_summary": workflow_summary,
+    }
+
+
+def _get_module_parts(
+    modules: Sequence[str], window: Optional[CalendarWindow], now: datetime
+) -> List[Dict[str, object]]:
+    """Return the parts of each module, building only the ones not cached."""
+
+    cache_keys: Dict[str, str] = {}
+    for module in modules:
+        # Uncommitted changes in this transaction must not be served from (or
+        # written to) the shared cache.
+        if not has_pending_invalidation(calendar_cache_tags([module])):
+            cache_keys[module] = calendar_cache_key(
+                CALENDAR_CACHE_NAMESPACE, [module], window=window
+            )
+    cached = cache.get_many(list(cache_keys.values())) if cache_keys else {}
+
+    module_parts = []
+    for module in modules:
+        cache_key = cache_keys.get(module)
+        parts = cached.get(cache_key) if cache_key else None
+        if cache_key:
+            record_cache_access(CALENDAR_CACHE_NAMESPACE, hit=parts is not None)
+        if parts is None:
+            parts = _collect_module(module, window, now)
+            if cache_key:
+                cache.set(cache_key, parts, timeout=CALENDAR_CACHE_TTL)
+        module_parts.append(parts)
+    return module_parts
+
+
+def _detect_conflicts(
+    timed_entries: Sequence[Dict], window: Optional[CalendarWindow] = None
+) -> List[Dict[str, object]]:
+    """Return overlapping entries that share a module or a location.
+
+    Entries are swept in start order per module and per location while a heap
+    keyed by end time holds the ones still running, so the cost is
+    O(n log n) plus the number of conflicts. Entries outside ``window`` are
+    ignored.
+    """
+
+    window_start_dt, window_end_dt = _window_bounds(window)
+    timeline = []
+    for item in timed_entries:
+        start = item.get("start")
+        if not start:
+            continue
+        end = item.get("end") or start
+        if window_start_dt and end < window_start_dt:
+            continue
+        if window_end_dt and start >= window_end_dt:
+            continue
+        timeline.append((start, end, item))
+    timeline.sort(key=lambda row: row[0])
+
+    groups: Dict[Tuple[str, object], List[int]] = {}
+    for index, (_, _, item) in enumerate(timeline):
+        groups.setdefault(("module", item["module"]), []).append(index)
+        if item.get("location"):
+            groups.setdefault(("location", item["location"]), []).append(index)
+
+    pairs = set()
+    for indexes in groups.values():
+        running: List[Tuple[datetime, int]] = []
+        for index in indexes:
+            start, end, _ = timeline[index]
+            while running and running[0][0] <= start:
+                heapq.heappop(running)
+            for _, earlier in running:
+                if end > timeline[earlier][0]:
+                    pairs.add((earlier, index))
+            heapq.heappush(running, (end, index))
+
+    conflicts: List[Dict[str, object]] = []
+    for earlier, later in sorted(pairs):
+        candidate_start, candidate_end, candidate = timeline[earlier]
+        other = timeline[later][2]
+        conflicts.append(
+            {
+                "module": candidate["module"],
+                "title_a": candidate["title"],
+                "title_b": other["title"],
+                "start": candidate_start,
+                "end": candidate_end,
+                "location": candidate.get("location") or other.get("location"),
+            }
+        )
+    return conflicts
+
+
+def build_calendar_payload(
+    *,
+    filter_modules: Optional[Sequence[str]] = None,
+    start: object = None,
+    end: object = None,
+) -> Dict[str, object]:
+    """Gather calendar entries across OOBC modules.
+
+    Args:
+        filter_modules: optional iterable restricting modules to include.
+        start: optional first day of the window (date, datetime or ISO string).
+        end: optional last day of the window, inclusive.
+
+    The window is pushed into every module query, and each module's part is
+    cached on its own per (module, window), so a change in one module only
+    rebuilds that module. Without a window every entry is returned.
+
+    Returns:
+        Dict containing entries, module statistics, upcoming highlights, and
+        conflict hints suitable for rendering calendar dashboards.
+    """
+
+    requested_modules = list(filter_modules) if filter_modules is not None else None
+    allowed_modules_set = set(requested_modules or []) or None
+    window = parse_calendar_window(start, end)
+
+    now = timezone.now()
+
+    entries: List[Dict] = []
+    stats: Dict[str, CalendarStats] = {}
+    upcoming_items: List[Tuple[datetime, Dict]] = []
+    timed_entries: List[Dict] = []
+    follow_up_items: List[Dict] = []
+    workflow_actions_global: List[Dict] = []
+
+    status_counts: Dict[str, Dict[str, int]] = {}
+    module_set: set[str] = set()
+    heatmap_days = [now.date() + timedelta(days=index) for index in range(7)]
+    heatmap_counts: Dict[str, List[int]] = {}
+    workflow_summary = {
+        "follow_up": 0,
+        "approval": 0,
+        "escalation": 0,
+        "workflow": 0,
+    }
+
+    if requested_modules:
+        module_seed = [
+            module for module in requested_modules if module in CALENDAR_MODULE_ORDER
+        ]
+        module_seed += [
+            module for module in requested_modules if module not in module_seed
+        ]
+    else:
+        module_seed = list(CALENDAR_MODULE_ORDER)
+
+    collected_modules = [
+        module
+        for module in CALENDAR_CACHE_MODULES
+        if allowed_modules_set is None or module in allowed_modules_set
+    ]
+    for parts in _get_module_parts(collected_modules, window, now):
+        entries.extend(parts["entries"])
+        for module, record in parts["stats"].items():
+            merged = stats.setdefault(module, CalendarStats())
+            merged.total += record.total
+            merged.upcoming += record.upcoming
+            merged.completed += record.completed
+        upcoming_items.extend(parts["upcoming_items"])
+        timed_entries.extend(parts["timed_entries"])
+        follow_up_items.extend(parts["follow_up_items"])
+        workflow_actions_global.extend(parts["workflow_actions"])
+        status_counts.update(parts["status_counts"])
+        module_set.update(parts["modules"])
+        heatmap_counts.update(parts["heatmap_counts"])
+        for action_type, count in parts["workflow_summary"].items():
+            workflow_summary[action_type] = workflow_summary.get(action_type, 0) + count
+
     # Sort upcoming highlights ---------------------------------------------
     upcoming_items.sort(key=lambda item: item[0])
     upcoming_highlights = [
@@ -1928,43 +2317,7 @@ def build_calendar_payload(
     ]
 
     # Conflict detection ----------------------------------------------------
-    conflicts: List[Dict[str, object]] = []
-    timed_entries.sort(key=lambda item: item["start"] or now)
-
-    for idx, candidate in enumerate(timed_entries):
-        candidate_start = candidate["start"]
-        candidate_end = candidate.get("end") or candidate_start
-        if not candidate_start or not candidate_end:
-            continue
-
-        for other in timed_entries[idx + 1 :]:
-            other_start = other["start"]
-            if not other_start:
-                continue
-            if other_start >= candidate_end:
-                break
-            other_end = other.get("end") or other_start
-            if other_end <= candidate_start:
-                continue
-
-            same_module = candidate["module"] == other["module"]
-            same_location = candidate.get("location") and candidate.get(
-                "location"
-            ) == other.get("location")
-
-            if not (same_module or same_location):
-                continue
-
-            conflicts.append(
-                {
-                    "module": candidate["module"],
-                    "title_a": candidate["title"],
-                    "title_b": other["title"],
-                    "start": candidate_start,
-                    "end": candidate_end,
-                    "location": candidate.get("location") or other.get("location"),
-                }
-            )
+    conflicts = _detect_conflicts(timed_entries, window)
 
     follow_up_items.sort(key=lambda item: item["due"])
 
@@ -2054,17 +2407,7 @@ def build_calendar_payload(
         "totals": compliance_totals,
     }
 
-    for entry in entries:
-        props = entry.setdefault("extendedProps", {})
-        if props.get("supportsEditing") is True:
-            entry.setdefault("editable", True)
-        else:
-            props["supportsEditing"] = False
-            if entry.get("editable") is not True:
-                entry["editable"] = False
-            entry.setdefault("durationEditable", False)
-
-    payload = {
+    return {
         "entries": entries,
         "module_stats": module_stats,
         "upcoming_highlights": upcoming_highlights,
@@ -2073,10 +2416,3 @@ def build_calendar_payload(
         "workflow_actions": workflow_actions_global,
         "analytics": analytics,
     }
-
-    cache.set(cache_key, payload, timeout=CALENDAR_CACHE_TTL)
-    cache_index = set(cache.get(CALENDAR_CACHE_INDEX_KEY, []))
-    cache_index.add(cache_key)
-    cache.set(CALENDAR_CACHE_INDEX_KEY, list(cache_index), timeout=CALENDAR_CACHE_TTL)
-
-    return deepcopy(payload)
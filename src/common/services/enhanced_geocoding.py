@@ -30,6 +30,7 @@ CACHE_DURATION = 86400 * 7  # Cache geocoding results for 7 days
 GOOGLE_RATE_LIMIT_DELAY = 0.1  # 100ms delay between Google requests
 ARCGIS_RATE_LIMIT_DELAY = getattr(settings, "GEOCODING_ARCGIS_DELAY", 0.2)
 NOMINATIM_RATE_LIMIT_DELAY = 1.0  # 1 second delay between Nominatim requests
+RATE_LIMIT_KEY_PREFIX = "geocode:next_slot"
 
 
 @dataclass
@@ -53,6 +54,44 @@ def _to_float(value: Any) -> Optional[float]:
         return None
 
 
+def reserve_provider_slot(provider: str, interval: float) -> float:
+    """
+    Reserve the next request slot for ``provider``.
+
+    Slots are handed out from a counter in the shared cache, so the interval
+    between requests holds across every worker and web process rather than
+    per call. Returns the number of seconds to wait before the slot opens.
+    """
+    if interval <= 0:
+        return 0.0
+
+    key = f"{RATE_LIMIT_KEY_PREFIX}:{provider}"
+    step_ms = int(interval * 1000)
+    now_ms = int(time.time() * 1000)
+    timeout = max(60, int(interval * 10))
+
+    cache.add(key, now_ms - step_ms, timeout)
+    try:
+        slot_ms = cache.incr(key, step_ms)
+    except ValueError:
+        cache.set(key, now_ms, timeout)
+        return 0.0
+
+    if slot_ms < now_ms:
+        # Idle provider: move the schedule up to now instead of allowing a burst
+        cache.set(key, now_ms, timeout)
+        return 0.0
+
+    return (slot_ms - now_ms) / 1000
+
+
+def _wait_for_provider_slot(provider: str, interval: float) -> None:
+    """Block until ``provider`` may receive another request."""
+    delay = reserve_provider_slot(provider, interval)
+    if delay > 0:
+        time.sleep(delay)
+
+
 def _format_query_for_google(obj) -> Optional[str]:
     """Format query optimized for Google Maps Geocoding API."""
     from common.models import Barangay, Municipality, Province, Region
@@ -146,7 +185,7 @@ def _geocode_with_google(query: str) -> GeocodeResult:
     headers = {"User-Agent": USER_AGENT}
 
     try:
-        time.sleep(GOOGLE_RATE_LIMIT_DELAY)  # Rate limiting
+        _wait_for_provider_slot("google", GOOGLE_RATE_LIMIT_DELAY)
 
         response = requests.get(
             GOOGLE_GEOCODING_URL,
@@ -251,7 +290,7 @@ def _geocode_with_arcgis(query: str) -> GeocodeResult:
     headers = {"User-Agent": USER_AGENT}
 
     try:
-        time.sleep(max(0.0, ARCGIS_RATE_LIMIT_DELAY))
+        _wait_for_provider_slot("arcgis", ARCGIS_RATE_LIMIT_DELAY)
 
         response = requests.get(
             ARCGIS_GEOCODING_URL,
@@ -361,7 +400,7 @@ def _geocode_with_nominatim(query: str) -> GeocodeResult:
     headers = {"User-Agent": USER_AGENT}
 
     try:
-        time.sleep(NOMINATIM_RATE_LIMIT_DELAY)  # Rate limiting
+        _wait_for_provider_slot("nominatim", NOMINATIM_RATE_LIMIT_DELAY)
 
         response = requests.get(
             NOMINATIM_URL, params=params, headers=headers, timeout=TIMEOUT_SECONDS
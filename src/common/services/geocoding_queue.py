@@ -0,0 +1,266 @@
+"""Background geocoding queue for administrative locations.
+
+Saving a municipality or barangay without coordinates no longer geocodes it
+inside the request. The instance is queued instead; every location queued in
+one transaction is handed to a single Celery task once the transaction
+commits. The task
+
+- loads the batch in one query per model,
+- geocodes each distinct normalized query once,
+- waits on the shared per-provider rate limiter instead of sleeping per call,
+- falls back to the centroid of ``boundary_geojson`` when no provider answers
+  (e.g. no network), and
+- writes coordinates back with ``bulk_update``.
+
+Providers are pluggable: ``set_geocoding_providers`` replaces them (tests use a
+local stub), and the ``GEOCODING_OFFLINE`` setting keeps the defaults off the
+network (the test settings enable it).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+
+from .enhanced_geocoding import (
+    GOOGLE_API_KEY,
+    GeocodeResult,
+    _format_query_for_google,
+    _format_query_for_nominatim,
+    _geocode_with_arcgis,
+    _geocode_with_google,
+    _geocode_with_nominatim,
+)
+from .locations import get_boundary_centroid, get_object_centroid, invalidate_location_caches
+from .on_commit_batch import OnCommitBatch
+
+logger = logging.getLogger(__name__)
+
+GEOCODE_BATCH_SIZE = getattr(settings, "GEOCODING_BATCH_SIZE", 200)
+# Queries no provider could resolve are not retried for a day.
+FAILED_QUERY_TTL = 86400
+FAILED_QUERY_PREFIX = "geocode:failed"
+
+QUEUED_MODELS = ("common.municipality", "common.barangay")
+_SELECT_RELATED = {
+    "common.municipality": ("province",),
+    "common.barangay": ("municipality__province",),
+}
+
+
+@dataclass(frozen=True)
+class GeocodingProvider:
+    """A geocoding backend: builds its query from a location and resolves it."""
+
+    name: str
+    geocode: Callable[[str], GeocodeResult]
+    build_query: Callable[[object], Optional[str]] = _format_query_for_google
+
+
+def default_geocoding_providers() -> List[GeocodingProvider]:
+    """Google (when configured), then ArcGIS, then Nominatim."""
+
+    providers = []
+    if GOOGLE_API_KEY:
+        providers.append(GeocodingProvider("google", _geocode_with_google))
+    providers.append(GeocodingProvider("arcgis", _geocode_with_arcgis))
+    providers.append(
+        GeocodingProvider(
+            "nominatim", _geocode_with_nominatim, _format_query_for_nominatim
+        )
+    )
+    return providers
+
+
+_providers: Optional[List[GeocodingProvider]] = None
+
+
+def get_geocoding_providers() -> List[GeocodingProvider]:
+    """Return the active providers.
+
+    Providers installed with ``set_geocoding_providers`` always win; otherwise
+    the defaults are used unless ``GEOCODING_OFFLINE`` is set.
+    """
+
+    if _providers is not None:
+        return list(_providers)
+    if getattr(settings, "GEOCODING_OFFLINE", False):
+        return []
+    return default_geocoding_providers()
+
+
+def set_geocoding_providers(providers: Optional[Sequence[GeocodingProvider]]) -> None:
+    """Replace the providers (``None`` restores the defaults)."""
+
+    global _providers
+    _providers = list(providers) if providers is not None else None
+
+
+def normalize_geocoding_query(query: Optional[str]) -> str:
+    """Case- and whitespace-insensitive form of a query, used for deduplication."""
+
+    if not query:
+        return ""
+    parts = (re.sub(r"\s+", " ", part).strip() for part in query.lower().split(","))
+    return ", ".join(part for part in parts if part)
+
+
+def _failed_key(normalized_query: str) -> str:
+    digest = hashlib.sha1(normalized_query.encode("utf-8")).hexdigest()
+    return f"{FAILED_QUERY_PREFIX}:{digest}"
+
+
+# ---------------------------------------------------------------------------
+# Queueing
+# ---------------------------------------------------------------------------
+
+
+def _dispatch(targets: List[List]) -> None:
+    from common.tasks import geocode_locations
+
+    for start in range(0, len(targets), GEOCODE_BATCH_SIZE):
+        chunk = targets[start : start + GEOCODE_BATCH_SIZE]
+        try:
+            geocode_locations.delay(chunk)
+        except Exception as e:
+            # The save stands; the location is queued again the next time it is saved.
+            logger.error(f"Could not queue geocoding for {len(chunk)} locations: {e}")
+
+
+# Insertion-ordered set of (model label, pk) targets.
+_pending_locations: OnCommitBatch[Dict[Tuple[str, int], None]] = OnCommitBatch(
+    "geocoding", dict, lambda targets: _dispatch([list(target) for target in targets])
+)
+
+
+def queue_location_geocoding(instance, *, using: str = DEFAULT_DB_ALIAS) -> None:
+    """Geocode ``instance`` in the background once the current transaction commits.
+
+    Locations queued inside one transaction are geocoded by a single task.
+    """
+
+    label = instance._meta.label_lower
+    if label not in QUEUED_MODELS or instance.pk is None:
+        return
+
+    target = (label, instance.pk)
+    pending = _pending_locations.collect(using)
+    if pending is None:
+        _dispatch([list(target)])
+        return
+    pending[target] = None
+
+
+# ---------------------------------------------------------------------------
+# Processing
+# ---------------------------------------------------------------------------
+
+
+def _load_targets(targets: Iterable[Sequence]) -> List:
+    """Fetch the queued locations that still lack coordinates, one query per model."""
+
+    ids_by_label: Dict[str, List[int]] = defaultdict(list)
+    for label, pk in targets:
+        if label in QUEUED_MODELS:
+            ids_by_label[label].append(pk)
+
+    objects = []
+    for label, ids in ids_by_label.items():
+        model = apps.get_model(label)
+        queryset = model.objects.filter(pk__in=ids).select_related(
+            *_SELECT_RELATED.get(label, ())
+        )
+        objects.extend(
+            obj for obj in queryset if get_object_centroid(obj) == (None, None)
+        )
+    return objects
+
+
+def _geocode_group(
+    representative, providers: Sequence[GeocodingProvider]
+) -> Optional[GeocodeResult]:
+    """Ask each provider in turn; return the first result with coordinates."""
+
+    for provider in providers:
+        query = provider.build_query(representative)
+        if not query:
+            continue
+        try:
+            result = provider.geocode(query)
+        except Exception as e:
+            logger.warning(f"Geocoding provider {provider.name} failed for '{query}': {e}")
+            continue
+        if result.latitude is not None and result.longitude is not None:
+            return result
+    return None
+
+
+def geocode_batch(targets: Iterable[Sequence]) -> Dict[str, int]:
+    """Geocode a batch of ``(model_label, pk)`` targets and save the coordinates.
+
+    Returns counts of ``geocoded``, ``centroid`` (offline fallback),
+    ``failed`` and ``queries`` (distinct provider lookups).
+    """
+
+    objects = _load_targets(targets)
+    stats = {"geocoded": 0, "centroid": 0, "failed": 0, "queries": 0}
+    if not objects:
+        return stats
+
+    groups: Dict[str, List] = defaultdict(list)
+    for obj in objects:
+        groups[normalize_geocoding_query(_format_query_for_google(obj))].append(obj)
+
+    providers = get_geocoding_providers()
+    changed: Dict[type, List] = defaultdict(list)
+    update_fields: Dict[type, set] = defaultdict(set)
+
+    for normalized_query, members in groups.items():
+        result = None
+        if providers and normalized_query and not cache.get(_failed_key(normalized_query)):
+            stats["queries"] += 1
+            result = _geocode_group(members[0], providers)
+            if result is None:
+                cache.set(_failed_key(normalized_query), 1, FAILED_QUERY_TTL)
+
+        for obj in members:
+            model = type(obj)
+            if result is not None:
+                obj.center_coordinates = [result.longitude, result.latitude]
+                update_fields[model].add("center_coordinates")
+                if result.bounding_box:
+                    obj.bounding_box = result.bounding_box
+                    update_fields[model].add("bounding_box")
+                stats["geocoded"] += 1
+            else:
+                lat, lng = get_boundary_centroid(getattr(obj, "boundary_geojson", None))
+                if lat is None or lng is None:
+                    stats["failed"] += 1
+                    continue
+                obj.center_coordinates = [lng, lat]
+                update_fields[model].add("center_coordinates")
+                stats["centroid"] += 1
+            changed[model].append(obj)
+
+    for model, instances in changed.items():
+        model.objects.bulk_update(
+            instances, sorted(update_fields[model]), batch_size=GEOCODE_BATCH_SIZE
+        )
+
+    if changed:
+        # bulk_update sends no post_save, so invalidate derived caches here.
+        from common.ai_services.chat.query_executor import invalidate_query_cache
+
+        invalidate_location_caches()
+        invalidate_query_cache(model.__name__ for model in changed)
+
+    return stats
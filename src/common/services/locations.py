@@ -1,13 +1,49 @@
 """Location-related services shared across modules."""
 
+import gzip
+import hashlib
+import json
+import time
 from collections import defaultdict
-from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
 
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db.models import Avg, Count
 
 from ..models import Barangay, Municipality, Province, Region
+from .cache_tags import (
+    build_versioned_key,
+    get_cache_stats,
+    has_pending_invalidation,
+    invalidate_tags,
+    record_cache_access,
+)
 from .enhanced_geocoding import enhanced_ensure_location_coordinates
 
+# Cache tag for artefacts derived from the location hierarchy.
+LOCATIONS_CACHE_TAG = "locations"
+# Cache tag for the community and geographic-layer counts folded into the
+# location payload.
+LOCATION_GEODATA_CACHE_TAG = "locations:geodata"
+
+LOCATION_DATA_NAMESPACE = "locations:payload"
+# Artifacts are versioned by tag, so the TTL only bounds memory use.
+LOCATION_DATA_TTL = 86400
+
+
+def invalidate_location_caches() -> None:
+    """Invalidate caches built from regions, provinces, municipalities or barangays."""
+
+    invalidate_tags([LOCATIONS_CACHE_TAG])
+
+
+def invalidate_location_geodata_caches() -> None:
+    """Invalidate location payloads after community or geographic-layer changes."""
+
+    invalidate_tags([LOCATION_GEODATA_CACHE_TAG])
+
 
 def _normalise_float(value: object) -> Optional[float]:
     """Best-effort conversion to float, returning ``None`` on failure."""
@@ -88,6 +124,86 @@ def _extract_bbox_center(bounding_box) -> Tuple[Optional[float], Optional[float]
     return lat, lng
 
 
+def geojson_polygons(geometry) -> List[list]:
+    """Return every polygon, as its list of rings, in a GeoJSON geometry.
+
+    Features, feature collections and geometry collections are walked
+    recursively; non-polygon geometries contribute nothing.
+    """
+
+    if not isinstance(geometry, dict):
+        return []
+
+    kind = geometry.get("type")
+    if kind == "FeatureCollection":
+        polygons: List[list] = []
+        for feature in geometry.get("features") or []:
+            polygons.extend(geojson_polygons(feature))
+        return polygons
+    if kind == "Feature":
+        return geojson_polygons(geometry.get("geometry"))
+    if kind == "GeometryCollection":
+        polygons = []
+        for member in geometry.get("geometries") or []:
+            polygons.extend(geojson_polygons(member))
+        return polygons
+
+    coordinates = geometry.get("coordinates") or []
+    if kind == "Polygon":
+        return [coordinates] if coordinates else []
+    if kind == "MultiPolygon":
+        return [polygon for polygon in coordinates if polygon]
+    return []
+
+
+def _outer_rings(geometry) -> List[list]:
+    """Return the exterior rings of a GeoJSON geometry, feature or collection."""
+
+    return [polygon[0] for polygon in geojson_polygons(geometry)]
+
+
+def get_boundary_centroid(boundary_geojson) -> Tuple[Optional[float], Optional[float]]:
+    """Area-weighted centroid of the exterior rings of a GeoJSON boundary.
+
+    Used as the offline fallback when no geocoding provider is reachable.
+    """
+
+    area_sum = 0.0
+    lng_sum = 0.0
+    lat_sum = 0.0
+    vertices: List[Tuple[float, float]] = []
+
+    for ring in _outer_rings(boundary_geojson):
+        points = [
+            (_normalise_float(point[0]), _normalise_float(point[1]))
+            for point in ring
+            if isinstance(point, (list, tuple)) and len(point) >= 2
+        ]
+        points = [(x, y) for x, y in points if x is not None and y is not None]
+        vertices.extend(points)
+        for (x0, y0), (x1, y1) in zip(points, points[1:] + points[:1]):
+            cross = x0 * y1 - x1 * y0
+            area_sum += cross
+            lng_sum += (x0 + x1) * cross
+            lat_sum += (y0 + y1) * cross
+
+    if not vertices:
+        return None, None
+
+    if abs(area_sum) > 1e-12:
+        lng = lng_sum / (3 * area_sum)
+        lat = lat_sum / (3 * area_sum)
+    else:
+        # Degenerate rings: fall back to the vertex average
+        lng = sum(x for x, _ in vertices) / len(vertices)
+        lat = sum(y for _, y in vertices) / len(vertices)
+
+    if not (-90 <= lat <= 90) or not (-180 <= lng <= 180):
+        return None, None
+
+    return lat, lng
+
+
 def get_object_centroid(obj) -> Tuple[Optional[float], Optional[float]]:
     """Best available centroid for a location-aware model instance."""
 
@@ -126,6 +242,148 @@ def _apply_centroid_fallback(
     return metadata
 
 
+def _active_barangays():
+    return (
+        Barangay.objects.filter(
+            is_active=True,
+            municipality__is_active=True,
+            municipality__province__is_active=True,
+            municipality__province__region__is_active=True,
+        )
+        .select_related("municipality__province__region")
+        .order_by("name")
+    )
+
+
+def _community_geodata_records(**filters):
+    """Per-community geodata counts and coordinates, or ``[]`` during migrations."""
+
+    try:
+        from communities.models import OBCCommunity
+    except ImportError:  # pragma: no cover - defensive fallback during migrations
+        return []
+    return (
+        OBCCommunity.objects.filter(is_active=True, **filters)
+        .annotate(
+            geo_layers_count=Count("geographic_layers", distinct=True),
+            map_visualizations_count=Count(
+                "community_map_visualizations", distinct=True
+            ),
+            spatial_points_count=Count("spatial_points", distinct=True),
+            communities_count=Count("id"),
+            avg_latitude=Avg("latitude"),
+            avg_longitude=Avg("longitude"),
+        )
+        .values(
+            "barangay_id",
+            "barangay__municipality_id",
+            "barangay__municipality__province_id",
+            "barangay__municipality__province__region_id",
+            "geo_layers_count",
+            "map_visualizations_count",
+            "spatial_points_count",
+            "communities_count",
+            "avg_latitude",
+            "avg_longitude",
+        )
+    )
+
+
+def _direct_layer_records(**filters):
+    """Geographic layers attached straight to an administrative unit."""
+
+    try:
+        from communities.models import GeographicDataLayer
+    except ImportError:  # pragma: no cover - defensive fallback during migrations
+        return []
+    layers = GeographicDataLayer.objects.filter(community__isnull=True, **filters)
+    return layers.values(
+        "id",
+        "region_id",
+        "province_id",
+        "province__region_id",
+        "municipality_id",
+        "municipality__province_id",
+        "municipality__province__region_id",
+        "barangay_id",
+        "barangay__municipality_id",
+        "barangay__municipality__province_id",
+        "barangay__municipality__province__region_id",
+        "center_point",
+    )
+
+
+def _serialize_barangays(
+    barangays, community_records, direct_layer_records
+) -> List[dict]:
+    """Return barangay entries with the geodata counts found in the given records."""
+
+    geodata_by_barangay = defaultdict(
+        lambda: {"total": 0, "layers": 0, "visualizations": 0, "points": 0}
+    )
+    coords_by_barangay: Dict[int, Tuple[float, float]] = {}
+
+    for record in community_records:
+        total_geodata = (
+            int(record["geo_layers_count"])
+            + int(record["map_visualizations_count"])
+            + int(record["spatial_points_count"])
+        )
+        if total_geodata <= 0:
+            continue
+
+        barangay_id = record["barangay_id"]
+        barangay_stats = geodata_by_barangay[barangay_id]
+        barangay_stats["total"] += total_geodata
+        barangay_stats["layers"] += int(record["geo_layers_count"])
+        barangay_stats["visualizations"] += int(record["map_visualizations_count"])
+        barangay_stats["points"] += int(record["spatial_points_count"])
+
+        avg_lat = _normalise_float(record.get("avg_latitude"))
+        avg_lng = _normalise_float(record.get("avg_longitude"))
+        if avg_lat is not None and avg_lng is not None:
+            coords_by_barangay.setdefault(barangay_id, (avg_lat, avg_lng))
+
+    for layer in direct_layer_records:
+        barangay_id = layer["barangay_id"]
+        if not barangay_id:
+            continue
+        barangay_stats = geodata_by_barangay[barangay_id]
+        barangay_stats["total"] += 1
+        barangay_stats["layers"] += 1
+        center_lat, center_lng = _extract_lat_lng(layer.get("center_point"))
+        if center_lat is not None and center_lng is not None:
+            coords_by_barangay.setdefault(barangay_id, (center_lat, center_lng))
+
+    return [
+        {
+            "id": barangay.id,
+            "name": barangay.name,
+            "municipality_id": barangay.municipality_id,
+            "population": barangay.population_total,
+            "code": barangay.code,
+            **_apply_centroid_fallback(
+                _centroid_metadata(barangay),
+                coords_by_barangay.get(barangay.id),
+            ),
+            "geodata_count": int(
+                geodata_by_barangay.get(barangay.id, {}).get("total", 0)
+            ),
+            "geodata_layers": int(
+                geodata_by_barangay.get(barangay.id, {}).get("layers", 0)
+            ),
+            "geodata_visualizations": int(
+                geodata_by_barangay.get(barangay.id, {}).get("visualizations", 0)
+            ),
+            "geodata_points": int(
+                geodata_by_barangay.get(barangay.id, {}).get("points", 0)
+            ),
+            "has_geodata": barangay.id in geodata_by_barangay,
+        }
+        for barangay in barangays
+    ]
+
+
 def build_location_data(include_barangays: bool = True) -> Dict[str, List[dict]]:
     """Return hierarchical location data for cascading selects with geo metadata."""
 
@@ -155,18 +413,6 @@ def build_location_data(include_barangays: bool = True) -> Dict[str, List[dict]]
     geodata_communities_by_province = defaultdict(int)
     geodata_by_municipality = defaultdict(int)
     geodata_communities_by_municipality = defaultdict(int)
-    geodata_by_barangay = defaultdict(
-        lambda: {
-            "total": 0,
-            "layers": 0,
-            "visualizations": 0,
-            "points": 0,
-            "lat": None,
-            "lng": None,
-        }
-    )
-
-    coords_by_barangay: Dict[int, Tuple[float, float]] = {}
     coords_accumulator_by_municipality = defaultdict(
         lambda: {"lat": 0.0, "lng": 0.0, "count": 0}
     )
@@ -177,55 +423,8 @@ def build_location_data(include_barangays: bool = True) -> Dict[str, List[dict]]
         lambda: {"lat": 0.0, "lng": 0.0, "count": 0}
     )
 
-    direct_layer_records = []
-
-    try:
-        from communities.models import GeographicDataLayer, OBCCommunity
-    except ImportError:  # pragma: no cover - defensive fallback during migrations
-        community_records = []
-    else:
-        community_records = (
-            OBCCommunity.objects.filter(is_active=True)
-            .annotate(
-                geo_layers_count=Count("geographic_layers", distinct=True),
-                map_visualizations_count=Count(
-                    "community_map_visualizations", distinct=True
-                ),
-                spatial_points_count=Count("spatial_points", distinct=True),
-                communities_count=Count("id"),
-                avg_latitude=Avg("latitude"),
-                avg_longitude=Avg("longitude"),
-            )
-            .values(
-                "barangay_id",
-                "barangay__municipality_id",
-                "barangay__municipality__province_id",
-                "barangay__municipality__province__region_id",
-                "geo_layers_count",
-                "map_visualizations_count",
-                "spatial_points_count",
-                "communities_count",
-                "avg_latitude",
-                "avg_longitude",
-            )
-        )
-
-        direct_layer_records = GeographicDataLayer.objects.filter(
-            community__isnull=True
-        ).values(
-            "id",
-            "region_id",
-            "province_id",
-            "province__region_id",
-            "municipality_id",
-            "municipality__province_id",
-            "municipality__province__region_id",
-            "barangay_id",
-            "barangay__municipality_id",
-            "barangay__municipality__province_id",
-            "barangay__municipality__province__region_id",
-            "center_point",
-        )
+    community_records = _community_geodata_records()
+    direct_layer_records = _direct_layer_records()
 
     for record in community_records:
         total_geodata = (
@@ -236,24 +435,13 @@ def build_location_data(include_barangays: bool = True) -> Dict[str, List[dict]]
         if total_geodata <= 0:
             continue
 
-        barangay_id = record["barangay_id"]
         municipality_id = record["barangay__municipality_id"]
         province_id = record["barangay__municipality__province_id"]
         region_id = record["barangay__municipality__province__region_id"]
 
-        barangay_stats = geodata_by_barangay[barangay_id]
-        barangay_stats["total"] += total_geodata
-        barangay_stats["layers"] += int(record["geo_layers_count"])
-        barangay_stats["visualizations"] += int(record["map_visualizations_count"])
-        barangay_stats["points"] += int(record["spatial_points_count"])
-
         avg_lat = _normalise_float(record.get("avg_latitude"))
         avg_lng = _normalise_float(record.get("avg_longitude"))
         if avg_lat is not None and avg_lng is not None:
-            barangay_stats["lat"] = avg_lat
-            barangay_stats["lng"] = avg_lng
-            coords_by_barangay.setdefault(barangay_id, (avg_lat, avg_lng))
-
             if municipality_id:
                 acc = coords_accumulator_by_municipality[municipality_id]
                 acc["lat"] += avg_lat
@@ -282,7 +470,6 @@ def build_location_data(include_barangays: bool = True) -> Dict[str, List[dict]]
         geodata_communities_by_region[region_id] += 1
 
     for layer in direct_layer_records:
-        barangay_id = layer["barangay_id"]
         municipality_id = layer["municipality_id"] or layer["barangay__municipality_id"]
         province_id = (
             layer["province_id"]
@@ -319,19 +506,6 @@ def build_location_data(include_barangays: bool = True) -> Dict[str, List[dict]]
                 acc["lat"] += center_lat
                 acc["lng"] += center_lng
                 acc["count"] += 1
-        if barangay_id:
-            barangay_stats = geodata_by_barangay[barangay_id]
-            barangay_stats["total"] += 1
-            barangay_stats["layers"] += 1
-            if (
-                center_lat is not None
-                and center_lng is not None
-                and barangay_stats["lat"] is None
-                and barangay_stats["lng"] is None
-            ):
-                barangay_stats["lat"] = center_lat
-                barangay_stats["lng"] = center_lng
-                coords_by_barangay.setdefault(barangay_id, (center_lat, center_lng))
 
     def _finalise_accumulator(accumulator):
         results = {}
@@ -456,42 +630,107 @@ def build_location_data(include_barangays: bool = True) -> Dict[str, List[dict]]
     }
 
     if include_barangays:
-        barangays = (
-            Barangay.objects.filter(
-                is_active=True,
-                municipality__is_active=True,
-                municipality__province__is_active=True,
-                municipality__province__region__is_active=True,
-            )
-            .select_related("municipality__province__region")
-            .order_by("name")
+        data["barangays"] = _serialize_barangays(
+            _active_barangays(), community_records, direct_layer_records
         )
-        data["barangays"] = [
-            {
-                "id": barangay.id,
-                "name": barangay.name,
-                "municipality_id": barangay.municipality_id,
-                "population": barangay.population_total,
-                "code": barangay.code,
-                **_apply_centroid_fallback(
-                    _centroid_metadata(barangay),
-                    coords_by_barangay.get(barangay.id),
-                ),
-                "geodata_count": int(
-                    geodata_by_barangay.get(barangay.id, {}).get("total", 0)
-                ),
-                "geodata_layers": int(
-                    geodata_by_barangay.get(barangay.id, {}).get("layers", 0)
-                ),
-                "geodata_visualizations": int(
-                    geodata_by_barangay.get(barangay.id, {}).get("visualizations", 0)
-                ),
-                "geodata_points": int(
-                    geodata_by_barangay.get(barangay.id, {}).get("points", 0)
-                ),
-                "has_geodata": barangay.id in geodata_by_barangay,
-            }
-            for barangay in barangays
-        ]
 
     return data
+
+
+def build_barangay_data(municipality_id: int) -> List[dict]:
+    """Return the ``build_location_data`` barangay entries of one municipality."""
+
+    return _serialize_barangays(
+        _active_barangays().filter(municipality_id=municipality_id),
+        _community_geodata_records(barangay__municipality_id=municipality_id),
+        _direct_layer_records(barangay__municipality_id=municipality_id),
+    )
+
+
+@dataclass(frozen=True)
+class LocationDataArtifact:
+    """A serialized location payload, gzip-compressed, with its HTTP validators."""
+
+    body: bytes
+    etag: str
+    last_modified: float
+
+    @property
+    def content(self) -> bytes:
+        """The uncompressed JSON document."""
+
+        return gzip.decompress(self.body)
+
+    @property
+    def data(self) -> dict:
+        return json.loads(self.content)
+
+
+def _location_data_tags() -> List[str]:
+    return [LOCATIONS_CACHE_TAG, LOCATION_GEODATA_CACHE_TAG]
+
+
+def _build_artifact(payload: dict) -> LocationDataArtifact:
+    content = json.dumps(payload, cls=DjangoJSONEncoder, separators=(",", ":"))
+    content = content.encode("utf-8")
+    return LocationDataArtifact(
+        body=gzip.compress(content),
+        # Weak: the same entity is served gzip-encoded or as identity.
+        etag=f'W/"{hashlib.md5(content).hexdigest()}"',
+        last_modified=time.time(),
+    )
+
+
+def _cached_artifact(
+    variant: str, builder: Callable[[], dict]
+) -> LocationDataArtifact:
+    tags = _location_data_tags()
+    # Uncommitted location edits in this transaction bypass the shared cache
+    if has_pending_invalidation(tags):
+        return _build_artifact(builder())
+
+    cache_key = build_versioned_key(LOCATION_DATA_NAMESPACE, tags, variant)
+    artifact = cache.get(cache_key)
+    record_cache_access(LOCATION_DATA_NAMESPACE, hit=artifact is not None)
+    if artifact is None:
+        artifact = _build_artifact(builder())
+        cache.set(cache_key, artifact, LOCATION_DATA_TTL)
+    return artifact
+
+
+def get_location_data_artifact(include_barangays: bool = True) -> LocationDataArtifact:
+    """Return the materialized ``build_location_data`` payload.
+
+    The payload is built once per version of the location and geodata tags
+    and shared by every request until a region, province, municipality,
+    barangay, community or geographic layer changes.
+    """
+
+    variant = "full" if include_barangays else "no-barangays"
+    return _cached_artifact(
+        variant, lambda: build_location_data(include_barangays=include_barangays)
+    )
+
+
+def get_location_data(include_barangays: bool = True) -> Dict[str, List[dict]]:
+    """Cached equivalent of ``build_location_data`` for views and forms."""
+
+    return get_location_data_artifact(include_barangays=include_barangays).data
+
+
+def get_barangay_chunk_artifact(municipality_id: int) -> LocationDataArtifact:
+    """Return the barangays of one municipality, for forms that load them lazily."""
+
+    def build() -> dict:
+        return {
+            "municipality_id": municipality_id,
+            "barangays": build_barangay_data(municipality_id),
+        }
+
+    return _cached_artifact(f"barangays:{municipality_id}", build)
+
+
+def get_location_data_cache_stats() -> Dict[str, float]:
+    """Return hit/miss counters for cached location payloads."""
+
+    return get_cache_stats(LOCATION_DATA_NAMESPACE)
@@ -0,0 +1,75 @@
+"""Work collected during a transaction and handed off once when it commits.
+
+Side effects raised by individual saves (cache tag bumps, for instance) are
+far cheaper applied together. An ``OnCommitBatch`` keeps one container per
+database connection for the current transaction, registers a single
+``on_commit`` hook for it and passes the collected items to its ``flush``
+callable on commit. A rolled back transaction drops the hook, and with it the
+batch.
+
+Callers handle the no-transaction case themselves, since each one treats it
+differently: ``collect`` returns ``None`` there.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Generic, Optional, TypeVar
+
+from django.db import DEFAULT_DB_ALIAS, transaction
+
+T = TypeVar("T")
+
+
+class _Batch(Generic[T]):
+    def __init__(self, factory: Callable[[], T], flush: Callable[[T], None]):
+        self._factory = factory
+        self._flush = flush
+        self.items = factory()
+
+    def flush(self) -> None:
+        items, self.items = self.items, self._factory()
+        self._flush(items)
+
+
+class OnCommitBatch(Generic[T]):
+    """A per-transaction container flushed by one ``on_commit`` hook.
+
+    ``factory`` builds an empty container (``set``, ``dict``…) and ``flush``
+    receives the filled one after the transaction commits.
+    """
+
+    def __init__(
+        self, name: str, factory: Callable[[], T], flush: Callable[[T], None]
+    ):
+        self.name = name
+        self._factory = factory
+        self._flush = flush
+        self._attr = f"_on_commit_batch_{name}"
+
+    def pending(self, using: str = DEFAULT_DB_ALIAS) -> Optional[T]:
+        """Return the items collected in the current transaction, if any."""
+
+        connection = transaction.get_connection(using)
+        batch = getattr(connection, self._attr, None)
+        if batch is None:
+            return None
+        # A rollback discards the on_commit hook; treat the batch as dead then.
+        for entry in connection.run_on_commit:
+            if entry[1] == batch.flush:
+                return batch.items
+        return None
+
+    def collect(self, using: str = DEFAULT_DB_ALIAS) -> Optional[T]:
+        """Return the container to add to, or ``None`` outside a transaction."""
+
+        connection = transaction.get_connection(using)
+        if not connection.in_atomic_block:
+            return None
+
+        items = self.pending(using)
+        if items is None:
+            batch = _Batch(self._factory, self._flush)
+            setattr(connection, self._attr, batch)
+            transaction.on_commit(batch.flush, using=using)
+            items = batch.items
+        return items
@@ -11,24 +11,62 @@ Features:
 - Organization-scoped permissions (MOA A cannot access MOA B)
 - OCM aggregation access (read-only across all MOAs)
 - Multi-organization access for OOBC staff
-- Caching for performance
+- Compiled per-user permission snapshots for performance
 - Integration with middleware organization context
 
+Every check is answered from a snapshot of the user's effective permissions
+in one organization context (permission ids and the feature ids they unlock),
+built once from roles, role permissions and user overrides. Snapshots and the
+active feature catalog are cached under the ``rbac`` cache tag; any RBAC
+change invalidates all of them with a single version bump.
+
 See:
 - docs/plans/bmms/TRANSITION_PLAN.md
 - docs/improvements/NAVBAR_RBAC_ANALYSIS.md
 - src/common/rbac_models.py
 """
 
-from typing import Optional, List, Set
+import logging
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+from uuid import UUID
+
 from django.core.cache import cache
 from django.db import models
 from django.http import HttpRequest
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 
+from common.services.cache_tags import (
+    build_versioned_key,
+    get_cache_stats,
+    get_tag_versions,
+    has_pending_invalidation,
+    invalidate_tags,
+    record_cache_access,
+)
+
 
 User = get_user_model()
+logger = logging.getLogger('rbac.cache')
+
+RBAC_CACHE_TAG = "rbac"
+SNAPSHOT_NAMESPACE = "rbac:snapshot"
+FEATURE_CATALOG_NAMESPACE = "rbac:features"
+
+
+@dataclass(frozen=True)
+class PermissionSnapshot:
+    """A user's effective RBAC grants within one organization context."""
+
+    permission_ids: FrozenSet[UUID]
+    feature_ids: FrozenSet[UUID]
+
+
+def invalidate_rbac_cache() -> None:
+    """Invalidate every permission snapshot and the feature catalog."""
+
+    invalidate_tags([RBAC_CACHE_TAG])
 
 
 class RBACService:
@@ -42,15 +80,114 @@ class RBACService:
     - Permission caching for performance
     """
 
-    # Cache timeout in seconds (5 minutes)
+    # Cache timeout in seconds (5 minutes); also bounds how long an expired
+    # role or grant can outlive its expiry in a snapshot.
     CACHE_TIMEOUT = 300
 
+    # Process-local copy of the feature catalog: (tag version, catalog)
+    _catalog_memo: Optional[Tuple[int, Dict[str, Tuple[UUID, Optional[UUID]]]]] = None
+
+    @classmethod
+    def _rbac_version(cls) -> int:
+        return get_tag_versions([RBAC_CACHE_TAG])[RBAC_CACHE_TAG]
+
+    @classmethod
+    def _get_feature_catalog(cls, use_cache: bool = True) -> Dict[str, Tuple[UUID, Optional[UUID]]]:
+        """
+        Map every active feature key to ``(feature_id, organization_id)``.
+
+        Shared by all users; kept in the cache and memoized per process for
+        the current RBAC version.
+        """
+        if not use_cache or has_pending_invalidation([RBAC_CACHE_TAG]):
+            return cls._build_feature_catalog()
+
+        version = cls._rbac_version()
+        memo = cls._catalog_memo
+        if memo and memo[0] == version:
+            return memo[1]
+
+        cache_key = build_versioned_key(FEATURE_CATALOG_NAMESPACE, [RBAC_CACHE_TAG])
+        catalog = cache.get(cache_key)
+        if catalog is None:
+            catalog = cls._build_feature_catalog()
+            cache.set(cache_key, catalog, cls.CACHE_TIMEOUT)
+        cls._catalog_memo = (version, catalog)
+        return catalog
+
+    @classmethod
+    def _build_feature_catalog(cls) -> Dict[str, Tuple[UUID, Optional[UUID]]]:
+        from common.rbac_models import Feature
+
+        return {
+            feature_key: (feature_id, organization_id)
+            for feature_key, feature_id, organization_id in Feature.objects.filter(
+                is_active=True
+            ).values_list('feature_key', 'id', 'organization_id')
+        }
+
+    @classmethod
+    def get_permission_snapshot(
+        cls,
+        user,
+        organization=None,
+        use_cache: bool = True
+    ) -> PermissionSnapshot:
+        """
+        Return the user's compiled permissions in an organization context.
+
+        Snapshots are memoized on the user object for the current RBAC
+        version, so repeated template tag and decorator checks in one request
+        cost a single cache round trip for the version counter.
+        """
+        org_id = organization.id if organization else None
+
+        if not use_cache or has_pending_invalidation([RBAC_CACHE_TAG]):
+            return cls._compile_snapshot(user, organization)
+
+        version = cls._rbac_version()
+        memo = getattr(user, '_rbac_snapshots', None)
+        if memo is None:
+            memo = {}
+            user._rbac_snapshots = memo
+        snapshot = memo.get((version, org_id))
+        if snapshot is not None:
+            return snapshot
+
+        cache_key = build_versioned_key(
+            SNAPSHOT_NAMESPACE, [RBAC_CACHE_TAG], user.id, org_id
+        )
+        snapshot = cache.get(cache_key)
+        record_cache_access(SNAPSHOT_NAMESPACE, hit=snapshot is not None)
+        if snapshot is None:
+            snapshot = cls._compile_snapshot(user, organization)
+            cache.set(cache_key, snapshot, cls.CACHE_TIMEOUT)
+
+        memo.clear()
+        memo[(version, org_id)] = snapshot
+        return snapshot
+
     @classmethod
-    def _get_cache_key(cls, user_id: int, feature_code: str, org_id: Optional[str] = None) -> str:
-        """Generate cache key for permission check."""
-        if org_id:
-            return f"rbac:user:{user_id}:feature:{feature_code}:org:{org_id}"
-        return f"rbac:user:{user_id}:feature:{feature_code}"
+    def _compile_snapshot(cls, user, organization=None) -> PermissionSnapshot:
+        """Resolve roles, role permissions and overrides into one snapshot."""
+        permission_ids = cls._compute_user_permissions(user, organization)
+        feature_ids: Set[UUID] = set()
+
+        if permission_ids:
+            try:
+                from common.rbac_models import Permission
+
+                feature_ids.update(
+                    Permission.objects.filter(
+                        id__in=permission_ids,
+                        is_active=True,
+                        feature__is_active=True,
+                    ).values_list('feature_id', flat=True)
+                )
+            except Exception:
+                pass
+
+        return PermissionSnapshot(frozenset(permission_ids), frozenset(feature_ids))
 
     @classmethod
     def get_user_organization_context(cls, request: HttpRequest):
@@ -107,28 +244,14 @@ class RBACService:
         if organization is None:
             organization = cls.get_user_organization_context(request)
 
-        # Build cache key
-        org_id = str(organization.id) if organization else None
-        cache_key = cls._get_cache_key(request.user.id, feature_code, org_id)
-
-        # Check cache
-        if use_cache:
-            cached_result = cache.get(cache_key)
-            if cached_result is not None:
-                return cached_result
-
-        # Perform permission check
-        has_perm = cls._check_permission(request.user, feature_code, organization)
-
-        # Cache result and track key
-        if use_cache:
-            cache.set(cache_key, has_perm, cls.CACHE_TIMEOUT)
-            cls._track_cache_key(cache_key)
-
-        return has_perm
+        return cls._check_permission(
+            request.user, feature_code, organization, use_cache=use_cache
+        )
 
     @classmethod
-    def _check_permission(cls, user, feature_code: str, organization) -> bool:
+    def _check_permission(
+        cls, user, feature_code: str, organization, use_cache: bool = True
+    ) -> bool:
         """
         Internal permission check logic.
 
@@ -155,16 +278,12 @@ class RBACService:
         if user.is_oobc_staff:
             # Check if this feature has RBAC restrictions
             try:
-                from common.rbac_models import Feature
-                feature_obj = Feature.objects.filter(
-                    feature_key=feature_code,
-                    is_active=True
-                ).first()
-
-                if feature_obj:
+                if feature_code in cls._get_feature_catalog(use_cache):
                     # Feature exists in RBAC system - delegate to RBAC check
                     # This will check user's roles and permissions properly
-                    return cls._check_feature_access(user, feature_code, organization)
+                    return cls._check_feature_access(
+                        user, feature_code, organization, use_cache=use_cache
+                    )
             except Exception:
                 # RBAC models not available - fall back to legacy behavior
                 pass
@@ -323,74 +442,58 @@ class RBACService:
         if user.is_superuser:
             return True
 
-        # Build cache key
-        org_id = str(organization.id) if organization else None
-        cache_key = cls._get_cache_key(user.id, f"feature:{feature_key}", org_id)
-
-        # Check cache
-        if use_cache:
-            cached_result = cache.get(cache_key)
-            if cached_result is not None:
-                return cached_result
-
-        # Perform feature access check
-        has_access = cls._check_feature_access(user, feature_key, organization)
-
-        # Cache result and track key
-        if use_cache:
-            cache.set(cache_key, has_access, cls.CACHE_TIMEOUT)
-            cls._track_cache_key(cache_key)
-
-        return has_access
+        return cls._check_feature_access(
+            user, feature_key, organization, use_cache=use_cache
+        )
 
     @classmethod
-    def _check_feature_access(cls, user, feature_key: str, organization) -> bool:
+    def _check_feature_access(
+        cls, user, feature_key: str, organization, use_cache: bool = True
+    ) -> bool:
         """
-        Internal feature access check using RBAC models.
+        Internal feature access check using the permission snapshot.
 
         Checks:
         1. Feature exists and is active
-        2. User has role-based permission for feature
-        3. User has direct permission override
-        4. Organization context is valid
+        2. Organization context is valid
+        3. User's snapshot (roles, grants, denials) unlocks the feature
         """
         try:
-            from common.rbac_models import Feature, UserRole, UserPermission
+            entry = cls._get_feature_catalog(use_cache).get(feature_key)
+        except Exception:
+            entry = None
 
-            # Get feature
-            feature = Feature.objects.filter(
-                feature_key=feature_key,
-                is_active=True
-            ).first()
+        if entry is None:
+            # Feature not found - fall back to legacy permission check
+            return cls._check_permission(
+                user, feature_key, organization, use_cache=use_cache
+            )
 
-            if not feature:
-                # Feature not found - fall back to legacy permission check
-                return cls._check_permission(user, feature_key, organization)
+        feature_id, feature_org_id = entry
 
-            # Check if feature is organization-specific
-            if feature.organization and organization:
-                if feature.organization != organization:
-                    return False
+        # Check if feature is organization-specific
+        if feature_org_id and organization and feature_org_id != organization.id:
+            return False
 
-            # Get user's permissions for this feature
-            user_perms = cls.get_user_permissions(user, organization)
+        snapshot = cls.get_permission_snapshot(user, organization, use_cache=use_cache)
+        return feature_id in snapshot.feature_ids
 
-            # Check if user has any permission for this feature
-            feature_perms = feature.permissions.filter(
-                id__in=user_perms,
-                is_active=True
-            )
+    @classmethod
+    def get_user_permissions(cls, user, organization = None) -> Set:
+        """
+        Get all permission IDs for a user (from roles and direct grants).
 
-            return feature_perms.exists()
+        Served from the user's permission snapshot.
+        """
+        if not user.is_authenticated:
+            return set()
 
-        except Exception:
-            # Fall back to legacy permission check
-            return cls._check_permission(user, feature_key, organization)
+        return set(cls.get_permission_snapshot(user, organization).permission_ids)
 
     @classmethod
-    def get_user_permissions(cls, user, organization = None) -> Set:
+    def _compute_user_permissions(cls, user, organization = None) -> Set:
         """
-        Get all permission IDs for a user (from roles and direct grants).
+        Compute all permission IDs for a user (from roles and direct grants).
 
         OPTIMIZED VERSION - Fixes N+1 query issue.
 
@@ -514,18 +617,13 @@ class RBACService:
             if user.is_superuser:
                 return list(Feature.objects.filter(is_active=True))
 
-            # Get user's permission IDs
-            user_perms = cls.get_user_permissions(user, organization)
+            # Features unlocked by the user's active permissions
+            feature_ids = cls.get_permission_snapshot(user, organization).feature_ids
 
-            if not user_perms:
+            if not feature_ids:
                 return []
 
-            # Get features that have permissions in user's permission set
-            features = Feature.objects.filter(
-                permissions__id__in=user_perms,
-                permissions__is_active=True,
-                is_active=True
-            ).distinct()
+            features = Feature.objects.filter(id__in=feature_ids, is_active=True)
 
             # Filter by organization if provided
             if organization:
@@ -541,122 +639,24 @@ class RBACService:
     @classmethod
     def clear_cache(cls, user_id: int = None, feature_key: str = None):
         """
-        Clear RBAC cache with Redis pattern support.
+        Invalidate cached RBAC decisions.
 
         Args:
-            user_id: Clear cache for specific user (None = all users)
-            feature_key: Clear cache for specific feature (None = all features)
+            user_id: Accepted for compatibility; all snapshots are invalidated
+            feature_key: Accepted for compatibility; the catalog is invalidated
 
         Implementation:
-        - Uses Redis pattern deletion if available (django-redis)
-        - Falls back to tracking set for cache-agnostic deletion
-        - Gracefully handles non-Redis backends
-
-        Performance: O(N) where N is number of matching keys
-        """
-        from django.core.cache import cache
-        import logging
-
-        logger = logging.getLogger('rbac.cache')
-
-        # Build pattern based on parameters
-        if user_id and feature_key:
-            pattern = f"rbac:user:{user_id}:feature:{feature_key}:*"
-        elif user_id:
-            pattern = f"rbac:user:{user_id}:*"
-        elif feature_key:
-            pattern = f"rbac:*:feature:{feature_key}:*"
-        else:
-            pattern = "rbac:*"
-
-        try:
-            # Try Redis-specific pattern deletion (django-redis backend)
-            if hasattr(cache, 'delete_pattern'):
-                deleted_count = cache.delete_pattern(pattern)
-                logger.info(f"Cleared {deleted_count} RBAC cache keys matching: {pattern}")
-                return deleted_count
-
-            # Fallback: Use cache key tracking set
-            tracker_key = "rbac:cache_keys"
-
-            if hasattr(cache, 'smembers'):
-                # Redis SET-based tracking
-                all_keys = cache.smembers(tracker_key) or set()
-
-                deleted_count = 0
-                for key in all_keys:
-                    # Simple pattern matching
-                    if cls._matches_pattern(key.decode() if isinstance(key, bytes) else key, pattern):
-                        cache.delete(key)
-                        cache.srem(tracker_key, key)
-                        deleted_count += 1
-
-                logger.info(f"Cleared {deleted_count} RBAC cache keys using tracker: {pattern}")
-                return deleted_count
-
-            # Last resort: Clear all RBAC cache (inefficient but safe)
-            logger.warning(f"Cache backend doesn't support pattern deletion. Clearing all RBAC cache.")
-
-            # Try to clear at least user-specific or feature-specific
-            if user_id:
-                # Clear known cache key combinations for this user
-                for org_id in ['', 'none']:
-                    base_key = f"rbac:user:{user_id}:feature:"
-                    # Can't enumerate all features, so just note the limitation
-                    logger.warning(f"Limited cache invalidation for user {user_id}")
-
-            return 0
-
-        except Exception as e:
-            logger.error(f"Error clearing RBAC cache: {e}")
-            # Don't fail - cache invalidation errors shouldn't break the app
-            return 0
-
-    @classmethod
-    def _matches_pattern(cls, key: str, pattern: str) -> bool:
-        """
-        Simple pattern matching for cache keys.
-
-        Args:
-            key: Cache key to test
-            pattern: Pattern with * wildcards
-
-        Returns:
-            bool: True if key matches pattern
+        - One increment of the ``rbac`` tag version, collapsed to a single
+          bump on commit inside a transaction
+        - Works on every cache backend; stale snapshots age out via TTL
         """
-        import re
-
-        # Convert wildcard pattern to regex
-        regex_pattern = pattern.replace('*', '.*')
-        regex_pattern = f"^{regex_pattern}$"
-
-        return bool(re.match(regex_pattern, key))
-
-    @classmethod
-    def _track_cache_key(cls, cache_key: str):
-        """
-        Track cache key for pattern-based deletion.
-
-        Only used when cache backend doesn't support delete_pattern.
-
-        Args:
-            cache_key: Key to track
-        """
-        from django.core.cache import cache
-
-        tracker_key = "rbac:cache_keys"
-
-        try:
-            if hasattr(cache, 'sadd'):
-                cache.sadd(tracker_key, cache_key)
-        except Exception:
-            # Tracking failure shouldn't break caching
-            pass
+        invalidate_rbac_cache()
+        cls._catalog_memo = None
 
     @classmethod
     def warm_cache_for_user(cls, user, organization=None):
         """
-        Pre-populate cache with user's most common permissions.
+        Compile and cache the user's permission snapshot.
 
         Call this after login for faster initial page load.
 
@@ -665,43 +665,18 @@ class RBACService:
             organization: Optional organization context
 
         Returns:
-            int: Number of permissions cached
+            int: Number of features unlocked by the snapshot
         """
         if not user.is_authenticated:
             return 0
 
-        import logging
-        logger = logging.getLogger('rbac.cache')
-
         try:
-            from common.rbac_models import Feature
-
-            # Get frequently accessed features (navbar, dashboards, common actions)
-            common_features = Feature.objects.filter(
-                is_active=True,
-                category__in=['navigation', 'dashboard', 'common']
-            ).values_list('feature_key', flat=True)
-
-            # Fallback: if no features have categories, get by module
-            if not common_features:
-                common_features = Feature.objects.filter(
-                    is_active=True,
-                    module__in=['common', 'communities', 'coordination']
-                ).values_list('feature_key', flat=True)[:20]  # Limit to 20
-
-            cached_count = 0
-
-            # Pre-compute and cache permissions for common features
-            for feature_key in common_features:
-                try:
-                    # This will cache the result
-                    cls.has_feature_access(user, feature_key, organization, use_cache=True)
-                    cached_count += 1
-                except Exception as e:
-                    logger.warning(f"Failed to warm cache for feature {feature_key}: {e}")
-
-            logger.info(f"Warmed RBAC cache for user {user.username}: {cached_count} features cached")
-            return cached_count
+            snapshot = cls.get_permission_snapshot(user, organization)
+            logger.info(
+                f"Warmed RBAC snapshot for user {user.username}: "
+                f"{len(snapshot.feature_ids)} features"
+            )
+            return len(snapshot.feature_ids)
 
         except Exception as e:
             logger.error(f"Error warming RBAC cache for user {user.username}: {e}")
@@ -761,48 +736,13 @@ class RBACService:
         return all(results) if require_all else any(results)
 
     @classmethod
-    def get_cache_stats(cls, user_id: int = None) -> dict:
+    def get_cache_stats(cls) -> dict:
         """
-        Get cache statistics for monitoring.
-
-        Args:
-            user_id: Optional user ID to get specific stats
+        Get snapshot cache statistics for monitoring.
 
         Returns:
-            dict: Cache statistics
+            dict: Snapshot hits, misses, hit rate and the current RBAC version
         """
-        from django.core.cache import cache
-        import logging
-
-        logger = logging.getLogger('rbac.cache')
-
-        try:
-            tracker_key = "rbac:cache_keys"
-
-            if hasattr(cache, 'smembers'):
-                all_keys = cache.smembers(tracker_key) or set()
-
-                if user_id:
-                    # Filter keys for specific user
-                    user_pattern = f"rbac:user:{user_id}:*"
-                    user_keys = [k for k in all_keys if cls._matches_pattern(
-                        k.decode() if isinstance(k, bytes) else k, user_pattern
-                    )]
-
-                    return {
-                        'total_cached_keys': len(all_keys),
-                        'user_cached_keys': len(user_keys),
-                        'user_id': user_id,
-                    }
-
-                return {
-                    'total_cached_keys': len(all_keys),
-                }
-
-            return {
-                'error': 'Cache stats not available - backend does not support key tracking'
-            }
-
-        except Exception as e:
-            logger.error(f"Error getting cache stats: {e}")
-            return {'error': str(e)}
+        stats = dict(get_cache_stats(SNAPSHOT_NAMESPACE))
+        stats['version'] = cls._rbac_version()
+        return stats
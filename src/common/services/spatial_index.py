@@ -0,0 +1,279 @@
+"""Offline point-in-boundary lookups over administrative ``boundary_geojson``.
+
+Each administrative level (region, province, municipality, barangay) gets an
+index built from the stored boundaries:
+
+- every unit's rings are flattened into NumPy edge arrays and its bounding box
+  is precomputed;
+- bounding boxes are bucketed into a uniform grid so a point only meets the
+  units whose box overlaps its cell;
+- candidate units test all of their points at once with a vectorized
+  even-odd ray cast (holes and multipolygons fall out naturally).
+
+Indexes are cached per process and rebuilt lazily when the ``locations``
+cache tag moves, which happens on every region/province/municipality/barangay
+save, including the ``update_province_geodata`` and
+``update_municipality_geodata`` commands and the background geocoder.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from django.apps import apps
+
+from .cache_tags import get_tag_versions
+from .locations import LOCATIONS_CACHE_TAG, geojson_polygons
+
+LEVELS = {
+    "region": "common.region",
+    "province": "common.province",
+    "municipality": "common.municipality",
+    "barangay": "common.barangay",
+}
+
+GRID_SIZE = 64
+# Upper bound on point x edge comparisons evaluated in one vectorized step.
+MAX_CHUNK_ELEMENTS = 2_000_000
+
+
+def _ring_points(ring) -> Optional[np.ndarray]:
+    try:
+        points = np.asarray(
+            [point[:2] for point in ring if isinstance(point, (list, tuple))],
+            dtype=float,
+        )
+    except (TypeError, ValueError):
+        return None
+    if points.ndim != 2 or points.shape[0] < 3 or points.shape[1] != 2:
+        return None
+    if not np.isfinite(points).all():
+        return None
+    return points
+
+
+def _boundary_edges(boundary_geojson) -> Optional[np.ndarray]:
+    """Flatten every ring of a boundary into an ``(n, 4)`` array of edges.
+
+    Columns are ``x0, y0, y1, dx/dy``; horizontal edges never cross a ray and
+    get a zero slope.
+    """
+
+    segments = []
+    for polygon in geojson_polygons(boundary_geojson):
+        for ring in polygon:
+            points = _ring_points(ring)
+            if points is None:
+                continue
+            # Closed and open rings alike: the wrap-around edge of a closed
+            # ring is degenerate and is ignored by the crossing test.
+            segments.append(np.hstack([points, np.roll(points, -1, axis=0)]))
+
+    if not segments:
+        return None
+
+    x0, y0, x1, y1 = np.vstack(segments).T
+    dy = y1 - y0
+    slope = np.divide(x1 - x0, dy, out=np.zeros_like(dy), where=dy != 0)
+    return np.column_stack([x0, y0, y1, slope])
+
+
+def _points_in_edges(lngs: np.ndarray, lats: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    """Even-odd ray cast of every point against one unit's edges."""
+
+    x0, y0, y1, slope = edges.T
+    inside = np.zeros(len(lngs), dtype=bool)
+    step = max(1, MAX_CHUNK_ELEMENTS // len(edges))
+    for start in range(0, len(lngs), step):
+        px = lngs[start : start + step, None]
+        py = lats[start : start + step, None]
+        crosses = (y0 > py) != (y1 > py)
+        crossing_x = x0 + (py - y0) * slope
+        hits = np.count_nonzero(crosses & (px < crossing_x), axis=1)
+        inside[start : start + step] = hits % 2 == 1
+    return inside
+
+
+def point_in_boundary(boundary_geojson, lat: float, lng: float) -> bool:
+    """Return whether ``(lat, lng)`` lies inside a single GeoJSON boundary."""
+
+    edges = _boundary_edges(boundary_geojson)
+    if edges is None:
+        return False
+    return bool(
+        _points_in_edges(np.array([float(lng)]), np.array([float(lat)]), edges)[0]
+    )
+
+
+class SpatialIndex:
+    """Grid-bucketed boundaries of one administrative level."""
+
+    def __init__(self, units: Iterable[Tuple[int, object]], grid_size: int = GRID_SIZE):
+        entries = []
+        for unit_id, boundary in units:
+            edges = _boundary_edges(boundary)
+            if edges is None:
+                continue
+            xs = edges[:, 0]
+            ys = edges[:, 1]
+            bbox = (xs.min(), ys.min(), xs.max(), ys.max())
+            entries.append((unit_id, bbox, edges))
+
+        # Smallest units first, so the tightest boundary wins any overlap.
+        entries.sort(key=lambda entry: (entry[1][2] - entry[1][0]) * (entry[1][3] - entry[1][1]))
+
+        self.ids: List[int] = [entry[0] for entry in entries]
+        self.bboxes = np.array([entry[1] for entry in entries], dtype=float).reshape(-1, 4)
+        self._edges: List[np.ndarray] = [entry[2] for entry in entries]
+        self._positions = {unit_id: index for index, unit_id in enumerate(self.ids)}
+
+        self.grid_size = grid_size
+        self._cells: Dict[int, List[int]] = {}
+        if not entries:
+            self.extent = None
+            return
+
+        min_x, min_y = self.bboxes[:, 0].min(), self.bboxes[:, 1].min()
+        max_x, max_y = self.bboxes[:, 2].max(), self.bboxes[:, 3].max()
+        self.extent = (min_x, min_y, max_x, max_y)
+        self._cell_w = (max_x - min_x) / grid_size or 1.0
+        self._cell_h = (max_y - min_y) / grid_size or 1.0
+
+        x_lo, y_lo = self._cell_xy(self.bboxes[:, 0], self.bboxes[:, 1])
+        x_hi, y_hi = self._cell_xy(self.bboxes[:, 2], self.bboxes[:, 3])
+        for index in range(len(entries)):
+            for cy in range(y_lo[index], y_hi[index] + 1):
+                for cx in range(x_lo[index], x_hi[index] + 1):
+                    self._cells.setdefault(cy * grid_size + cx, []).append(index)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _cell_xy(self, xs: np.ndarray, ys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        last = self.grid_size - 1
+        cx = np.clip(((xs - self.extent[0]) / self._cell_w).astype(int), 0, last)
+        cy = np.clip(((ys - self.extent[1]) / self._cell_h).astype(int), 0, last)
+        return cx, cy
+
+    def locate(self, lats: Sequence[float], lngs: Sequence[float]) -> List[Optional[int]]:
+        """Return the id of the unit containing each point (``None`` when outside)."""
+
+        lats = np.asarray(lats, dtype=float).ravel()
+        lngs = np.asarray(lngs, dtype=float).ravel()
+        if lats.shape != lngs.shape:
+            raise ValueError("lats and lngs must have the same length")
+
+        found = np.full(len(lats), -1, dtype=np.int64)
+        if self.extent is None or not len(lats):
+            return [None] * len(lats)
+
+        min_x, min_y, max_x, max_y = self.extent
+        valid = (
+            np.isfinite(lats)
+            & np.isfinite(lngs)
+            & (lngs >= min_x)
+            & (lngs <= max_x)
+            & (lats >= min_y)
+            & (lats <= max_y)
+        )
+        points = np.flatnonzero(valid)
+        cx, cy = self._cell_xy(lngs[points], lats[points])
+        cells = cy * self.grid_size + cx
+
+        order = np.argsort(cells, kind="stable")
+        points, cells = points[order], cells[order]
+        cell_ids, starts = np.unique(cells, return_index=True)
+        bounds = list(starts[1:]) + [len(points)]
+
+        for cell_id, start, end in zip(cell_ids, starts, bounds):
+            group = points[start:end]
+            for index in self._cells.get(int(cell_id), ()):
+                group = group[found[group] < 0]
+                if not len(group):
+                    break
+                bx0, by0, bx1, by1 = self.bboxes[index]
+                x, y = lngs[group], lats[group]
+                in_box = group[(x >= bx0) & (x <= bx1) & (y >= by0) & (y <= by1)]
+                if not len(in_box):
+                    continue
+                inside = _points_in_edges(lngs[in_box], lats[in_box], self._edges[index])
+                found[in_box[inside]] = index
+
+        return [self.ids[index] if index >= 0 else None for index in found]
+
+    def contains(self, unit_id: int, lat: float, lng: float) -> bool:
+        """Return whether the given unit's boundary contains the point."""
+
+        index = self._positions.get(unit_id)
+        if index is None:
+            return False
+        bx0, by0, bx1, by1 = self.bboxes[index]
+        if not (bx0 <= lng <= bx1 and by0 <= lat <= by1):
+            return False
+        return bool(
+            _points_in_edges(np.array([float(lng)]), np.array([float(lat)]), self._edges[index])[0]
+        )
+
+
+_indexes: Dict[str, Tuple[int, SpatialIndex]] = {}
+_build_lock = threading.Lock()
+
+
+def _load_units(level: str) -> Iterable[Tuple[int, object]]:
+    model = apps.get_model(LEVELS[level])
+    return (
+        model.objects.filter(is_active=True, boundary_geojson__isnull=False)
+        .values_list("pk", "boundary_geojson")
+        .iterator()
+    )
+
+
+def get_spatial_index(level: str = "municipality") -> SpatialIndex:
+    """Return the process-cached index for ``level``, rebuilding it when stale."""
+
+    if level not in LEVELS:
+        raise ValueError(f"Unknown administrative level: {level}")
+
+    version = get_tag_versions([LOCATIONS_CACHE_TAG])[LOCATIONS_CACHE_TAG]
+    cached = _indexes.get(level)
+    if cached and cached[0] == version:
+        return cached[1]
+
+    with _build_lock:
+        cached = _indexes.get(level)
+        if cached and cached[0] == version:
+            return cached[1]
+        index = SpatialIndex(_load_units(level))
+        _indexes[level] = (version, index)
+        return index
+
+
+def clear_spatial_indexes() -> None:
+    """Drop every cached index in this process."""
+
+    with _build_lock:
+        _indexes.clear()
+
+
+def locate_points(
+    lats: Sequence[float], lngs: Sequence[float], level: str = "municipality"
+) -> List[Optional[int]]:
+    """Return the id of the ``level`` unit containing each ``(lat, lng)`` pair."""
+
+    return get_spatial_index(level).locate(lats, lngs)
+
+
+def reverse_geocode_points(
+    lats: Sequence[float],
+    lngs: Sequence[float],
+    levels: Sequence[str] = tuple(LEVELS),
+) -> List[Dict[str, Optional[int]]]:
+    """Resolve each point to the containing unit id at every requested level."""
+
+    located = {level: locate_points(lats, lngs, level) for level in levels}
+    return [
+        {level: located[level][position] for level in levels}
+        for position in range(len(np.ravel(lats)))
+    ]
@@ -0,0 +1,181 @@
+"""Set-based progress rollup for WorkItem hierarchies.
+
+A work item with ``auto_calculate_progress`` enabled reports the share of its
+direct children that are completed (see
+``WorkItem.calculate_progress_from_children``). Instead of walking the parent
+chain and running ``exists``/``count`` queries per node, this engine computes
+those ratios for many nodes at once with a single grouped, conditional
+aggregate and writes the changed rows back with ``bulk_update``.
+
+Two entry points are provided:
+
+- ``rollup_progress`` recomputes whole trees (or every tree) in one pass, for
+  the monthly maintenance task.
+- ``rollup_ancestor_progress`` recomputes only the ancestors of the given
+  work items, for use right after edits.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from django.db import transaction
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from common.work_item_model import WorkItem
+
+
+logger = logging.getLogger(__name__)
+
+BULK_UPDATE_BATCH_SIZE = 500
+
+
+@dataclass
+class ProgressRollupResult:
+    """Summary of a rollup run."""
+
+    evaluated: int = 0
+    updated: int = 0
+    tree_ids: set = field(default_factory=set)
+    updated_ids: List = field(default_factory=list)
+
+    @property
+    def unchanged(self) -> int:
+        return self.evaluated - self.updated
+
+
+def _child_completion(parent_filter: Q) -> Dict[object, tuple]:
+    """Return ``{parent_id: (total_children, completed_children)}``."""
+
+    rows = (
+        WorkItem.objects.filter(parent_filter)
+        .order_by()
+        .values("parent_id")
+        .annotate(
+            total=Count("pk"),
+            completed=Count("pk", filter=Q(status=WorkItem.STATUS_COMPLETED)),
+        )
+    )
+    return {row["parent_id"]: (row["total"], row["completed"]) for row in rows}
+
+
+def _apply(candidates: Q, children: Optional[Q] = None) -> ProgressRollupResult:
+    """Recompute progress for every auto-calculating node matched by ``candidates``.
+
+    ``children`` scopes the aggregate over child rows; it defaults to the
+    direct children of the candidate nodes.
+    """
+
+    result = ProgressRollupResult()
+    nodes = list(
+        WorkItem.objects.filter(candidates, auto_calculate_progress=True)
+        .order_by()
+        .only("pk", "progress", "tree_id", "parent_id")
+    )
+    if not nodes:
+        return result
+
+    if children is None:
+        children = Q(parent_id__in=[node.pk for node in nodes])
+    completion = _child_completion(children)
+    now = timezone.now()
+
+    changed: List[WorkItem] = []
+    for node in nodes:
+        result.evaluated += 1
+        total, completed = completion.get(node.pk, (0, 0))
+        if not total:
+            # Leaf nodes keep their manually reported progress.
+            continue
+        new_progress = int((completed / total) * 100)
+        if new_progress != node.progress:
+            node.progress = new_progress
+            node.updated_at = now
+            changed.append(node)
+
+    if changed:
+        with transaction.atomic():
+            WorkItem.objects.bulk_update(
+                changed, ["progress", "updated_at"], batch_size=BULK_UPDATE_BATCH_SIZE
+            )
+        _after_update(changed)
+
+    result.updated = len(changed)
+    result.updated_ids = [node.pk for node in changed]
+    result.tree_ids = {node.tree_id for node in changed}
+    return result
+
+
+def _after_update(changed: Sequence[WorkItem]) -> None:
+    """Replay the side effects ``save()`` would have triggered, once per batch."""
+
+    from common.ai_services.chat.query_executor import invalidate_query_cache
+    from common.services.calendar import CALENDAR_SENDER_MODULES, invalidate_calendar_cache
+
+    invalidate_calendar_cache(CALENDAR_SENDER_MODULES[WorkItem])
+    invalidate_query_cache(["WorkItem"])
+
+    # Root execution projects push their progress to the linked PPA.
+    root_ids = [node.pk for node in changed if node.parent_id is None]
+    if not root_ids:
+        return
+
+    from monitoring.models import MonitoringEntry
+
+    linked_roots = WorkItem.objects.filter(
+        pk__in=MonitoringEntry.objects.filter(
+            execution_project_id__in=root_ids
+        ).values("execution_project_id")
+    )
+    for root in linked_roots:
+        try:
+            root.sync_to_ppa()
+        except Exception as exc:  # pragma: no cover - defensive logging
+            logger.error(
+                "Failed to sync WorkItem %s progress to PPA: %s", root.pk, exc, exc_info=True
+            )
+
+
+def rollup_progress(tree_ids: Optional[Iterable[int]] = None) -> ProgressRollupResult:
+    """
+    Recompute progress for whole WorkItem trees in one pass.
+
+    Args:
+        tree_ids: MPTT ``tree_id`` values to process; every tree when omitted.
+
+    Returns:
+        ProgressRollupResult with evaluated/updated counts.
+    """
+    candidates = Q(pk__in=WorkItem.objects.filter(children__isnull=False).values("pk"))
+    children = Q(parent__isnull=False)
+    if tree_ids is not None:
+        tree_ids = list(tree_ids)
+        candidates &= Q(tree_id__in=tree_ids)
+        children &= Q(tree_id__in=tree_ids)
+    return _apply(candidates, children)
+
+
+def rollup_ancestor_progress(
+    work_items: Iterable[WorkItem], *, include_self: bool = False
+) -> ProgressRollupResult:
+    """
+    Recompute progress for the ancestors of ``work_items`` after an edit.
+
+    Ancestors are selected with MPTT range predicates (one query for all of
+    them) instead of by walking ``parent`` links.
+
+    Args:
+        work_items: Work items whose status or membership changed.
+        include_self: Also recompute the given work items themselves.
+    """
+    ancestor_filter = Q(pk__in=[])
+    for item in work_items:
+        ancestor_filter |= Q(
+            tree_id=item.tree_id, lft__lt=item.lft, rght__gt=item.rght
+        )
+        if include_self:
+            ancestor_filter |= Q(pk=item.pk)
+    return _apply(ancestor_filter)
@@ -1,20 +1,53 @@
 """Common signals for the OBCMS application."""
 
 import logging
-from django.core.cache import cache
-from django.db import models
+from django.db import DEFAULT_DB_ALIAS, models
 from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
 from .models import (
+    Region,
+    Province,
     Municipality,
     Barangay,
     StaffLeave,
     CalendarResourceBooking,
+    TrainingEnrollment,
     WorkItem,
 )
-from .services.enhanced_geocoding import enhanced_ensure_location_coordinates
-from monitoring.models import MonitoringEntry
+from .rbac_models import (
+    Feature,
+    Permission,
+    Role,
+    RolePermission,
+    UserPermission,
+    UserRole,
+)
+from .ai_services.chat.query_executor import connect_query_cache_signals
+from .services.calendar import CALENDAR_SENDER_MODULES, invalidate_calendar_cache
+from .services.geocoding_queue import queue_location_geocoding
+from .services.rbac_service import invalidate_rbac_cache
+from .services.locations import (
+    invalidate_location_caches,
+    invalidate_location_geodata_caches,
+)
+from .work_item_model import work_item_side_effects_deferred, work_item_subtree_deleted
+from communities.models import (
+    CommunityEvent,
+    GeographicDataLayer,
+    MapVisualization,
+    OBCCommunity,
+    SpatialDataPoint,
+)
+from coordination.models import (
+    Communication,
+    Partnership,
+    PartnershipMilestone,
+    StakeholderEngagement,
+)
+from mana.models import BaselineDataCollection
+from monitoring.models import MonitoringEntry, MonitoringEntryWorkflowStage
+from recommendations.policy_tracking.models import PolicyRecommendation
 
 # DEPRECATED: StaffTask and Event imports removed
 # Replaced by WorkItem system
@@ -22,91 +55,112 @@ from monitoring.models import MonitoringEntry
 
 logger = logging.getLogger(__name__)
 
-
-CALENDAR_CACHE_INDEX_KEY = "calendar:payload:index"
-
-
-def _invalidate_calendar_cache():
-    """Remove cached calendar payloads after data mutations."""
-
-    cached_keys = cache.get(CALENDAR_CACHE_INDEX_KEY) or []
-
-    if cached_keys:
-        cache.delete_many(cached_keys)
-
-    cache.delete(CALENDAR_CACHE_INDEX_KEY)
+# Cached chat query results are versioned per exposed model.
+connect_query_cache_signals()
 
 
 @receiver(post_save, sender=Municipality)
 def municipality_post_save(sender, instance, created, **kwargs):
     """
     Signal handler for when a Municipality is saved.
-    This will automatically geocode the municipality if it doesn't have coordinates.
+    Queues background geocoding if the municipality doesn't have coordinates.
     """
     if not instance.center_coordinates:
         logger.info(
-            f"Municipality {instance.name} has no coordinates. Triggering geocoding."
+            f"Municipality {instance.name} has no coordinates. Queueing geocoding."
         )
-        try:
-            lat, lng, updated, source = enhanced_ensure_location_coordinates(instance)
-            if updated:
-                logger.info(
-                    f"Successfully geocoded Municipality {instance.name} using {source}. New coordinates: [{lng}, {lat}]"
-                )
-            elif lat and lng:
-                logger.info(
-                    f"Municipality {instance.name} already had coordinates from {source}: [{lng}, {lat}]"
-                )
-            else:
-                logger.warning(
-                    f"Geocoding failed for Municipality {instance.name} from source {source}."
-                )
-        except Exception as e:
-            logger.error(
-                f"An error occurred during geocoding for Municipality {instance.name}: {e}",
-                exc_info=True,
-            )
+        queue_location_geocoding(instance, using=kwargs.get("using") or DEFAULT_DB_ALIAS)
 
 
 @receiver(post_save, sender=Barangay)
 def barangay_post_save(sender, instance, created, **kwargs):
     """
     Signal handler for when a Barangay is saved.
-    This will automatically geocode the barangay if it doesn't have coordinates.
+    Queues background geocoding if the barangay doesn't have coordinates.
     """
     if not instance.center_coordinates:
         logger.info(
-            f"Barangay {instance.name} has no coordinates. Triggering geocoding."
+            f"Barangay {instance.name} has no coordinates. Queueing geocoding."
         )
-        try:
-            lat, lng, updated, source = enhanced_ensure_location_coordinates(instance)
-            if updated:
-                logger.info(
-                    f"Successfully geocoded Barangay {instance.name} using {source}. New coordinates: [{lng}, {lat}]"
-                )
-            elif lat and lng:
-                logger.info(
-                    f"Barangay {instance.name} already had coordinates from {source}: [{lng}, {lat}]"
-                )
-            else:
-                logger.warning(
-                    f"Geocoding failed for Barangay {instance.name} from source {source}."
-                )
-        except Exception as e:
-            logger.error(
-                f"An error occurred during geocoding for Barangay {instance.name}: {e}",
-                exc_info=True,
-            )
+        queue_location_geocoding(instance, using=kwargs.get("using") or DEFAULT_DB_ALIAS)
+
+
+@receiver([post_save, post_delete], sender=Region)
+@receiver([post_save, post_delete], sender=Province)
+@receiver([post_save, post_delete], sender=Municipality)
+@receiver([post_save, post_delete], sender=Barangay)
+def location_cache_invalidator(sender, **kwargs):
+    """Invalidate location-derived caches such as the chat gazetteer."""
+
+    invalidate_location_caches()
+
+
+@receiver([post_save, post_delete], sender=OBCCommunity)
+@receiver([post_save, post_delete], sender=GeographicDataLayer)
+@receiver([post_save, post_delete], sender=MapVisualization)
+@receiver([post_save, post_delete], sender=SpatialDataPoint)
+def location_geodata_cache_invalidator(sender, **kwargs):
+    """Invalidate location payloads that embed community and layer counts."""
+
+    invalidate_location_geodata_caches()
+
+
+@receiver([post_save, post_delete], sender=Feature)
+@receiver([post_save, post_delete], sender=Permission)
+@receiver([post_save, post_delete], sender=Role)
+@receiver([post_save, post_delete], sender=RolePermission)
+@receiver([post_save, post_delete], sender=UserRole)
+@receiver([post_save, post_delete], sender=UserPermission)
+def rbac_cache_invalidator(sender, **kwargs):
+    """Invalidate every compiled RBAC permission snapshot."""
+
+    invalidate_rbac_cache()
 
 
 # StaffTask and Event signals removed - models deleted
 # See: docs/refactor/WORKITEM_MIGRATION_COMPLETE.md
 
+@receiver([post_save, post_delete], sender=StakeholderEngagement)
+@receiver([post_save, post_delete], sender=Communication)
+@receiver([post_save, post_delete], sender=Partnership)
+@receiver([post_save, post_delete], sender=PartnershipMilestone)
+@receiver([post_save, post_delete], sender=BaselineDataCollection)
+@receiver([post_save, post_delete], sender=TrainingEnrollment)
+@receiver([post_save, post_delete], sender=PolicyRecommendation)
 @receiver([post_save, post_delete], sender=MonitoringEntry)
+@receiver([post_save, post_delete], sender=MonitoringEntryWorkflowStage)
+@receiver([post_save, post_delete], sender=CommunityEvent)
 @receiver([post_save, post_delete], sender=StaffLeave)
 @receiver([post_save, post_delete], sender=CalendarResourceBooking)
 @receiver([post_save, post_delete], sender=WorkItem)
 def calendar_cache_invalidator(sender, **kwargs):
-    """Clear cached calendar payloads when core calendar data changes."""
+    """Invalidate cached calendar payloads for the modules a change touches."""
+
+    if sender is WorkItem and work_item_side_effects_deferred():
+        return
+
+    invalidate_calendar_cache(CALENDAR_SENDER_MODULES.get(sender))
 
-    _invalidate_calendar_cache()
+
+@receiver(work_item_subtree_deleted)
+def work_item_subtree_deleted_handler(sender, parent_id=None, **kwargs):
+    """Apply the side effects of a bulk subtree delete once, after commit."""
+
+    invalidate_calendar_cache(CALENDAR_SENDER_MODULES[WorkItem])
+
+    if not parent_id:
+        return
+
+    parent = WorkItem.objects.filter(pk=parent_id).first()
+    if parent is None:
+        return
+
+    try:
+        # Saving the parent cascades the rollup upwards and, at the root,
+        # triggers the regular WorkItem -> PPA sync.
+        parent.update_progress()
+    except Exception as e:
+        logger.error(
+            f"Failed to roll up progress after deleting children of WorkItem {parent_id}: {e}",
+            exc_info=True,
+        )
@@ -488,3 +488,75 @@ def send_calendar_notifications_batch(batch_size=100):
     ).apply_async()
     logger.info("Queued %s calendar notifications for delivery", len(pending_ids))
     return {"queued": len(pending_ids)}
+
+
+@shared_task(bind=True, acks_late=True)
+def reindex_search_module(
+    self,
+    module,
+    chunk_size=500,
+    batch_size=64,
+    force=False,
+    resume=True,
+    checkpoint_every=None,
+):
+    """Rebuild a unified-search module index.
+
+    The pipeline checkpoints every ``checkpoint_every`` chunks (default
+    ``reindex.DEFAULT_CHECKPOINT_EVERY``, i.e. 10). A retried or redelivered
+    task resumes from the last checkpoint, so it may redo up to
+    ``checkpoint_every - 1`` chunks. Pass ``checkpoint_every=1`` to
+    checkpoint after every chunk, at the cost of rewriting the staging index
+    each time.
+    """
+
+    from common.ai_services.unified_search import get_unified_search_engine
+
+    stats = get_unified_search_engine().reindex_module(
+        module,
+        chunk_size=chunk_size,
+        batch_size=batch_size,
+        force=force,
+        resume=resume,
+        checkpoint_every=checkpoint_every,
+    )
+    logger.info(
+        "Reindexed %s: %s indexed, %s unchanged, %s errors (%.1f objects/sec)",
+        module,
+        stats["indexed"],
+        stats["skipped"],
+        stats["errors"],
+        stats["objects_per_second"],
+    )
+    return stats
+
+
+@shared_task(bind=True, acks_late=True)
+def geocode_locations(self, targets):
+    """Geocode a batch of ``[model_label, pk]`` locations queued on save."""
+
+    from common.services.geocoding_queue import geocode_batch
+
+    stats = geocode_batch(targets)
+    logger.info(
+        "Geocoded %s locations (%s from boundary centroids, %s failed) with %s lookups",
+        stats["geocoded"] + stats["centroid"],
+        stats["centroid"],
+        stats["failed"],
+        stats["queries"],
+    )
+    return stats
+
+
+@shared_task
+def flush_search_analytics():
+    """
+    Merge searches logged since the last merge into the popular-query summary.
+
+    Called by Celery Beat every minute, so counts and autocomplete catch up
+    even when no further search triggers an inline merge.
+    """
+
+    from common.ai_services.search_analytics import SearchAnalytics
+
+    return SearchAnalytics().flush()
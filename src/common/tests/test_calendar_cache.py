@@ -0,0 +1,94 @@
+"""Tests for tag-based calendar cache invalidation."""
+
+from datetime import timedelta
+
+import pytest
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from common.models import StaffLeave, User
+from common.services.cache_tags import get_tag_versions
+from common.services.calendar import (
+    build_calendar_payload,
+    calendar_cache_tags,
+    get_calendar_cache_stats,
+    invalidate_calendar_cache,
+)
+from common.work_item_model import WorkItem
+
+
+pytestmark = pytest.mark.usefixtures("clear_cache")
+
+
+def test_invalidation_only_bumps_touched_modules():
+    before = get_tag_versions(calendar_cache_tags())
+
+    invalidate_calendar_cache(["staff"])
+
+    after = get_tag_versions(calendar_cache_tags())
+    assert after["calendar:staff"] == before["calendar:staff"] + 1
+    for tag, version in before.items():
+        if tag != "calendar:staff":
+            assert after[tag] == version
+
+
+def test_invalidation_leaves_unrelated_cache_entries():
+    cache.set("session:unrelated", "keep-me")
+
+    invalidate_calendar_cache()
+
+    assert cache.get("session:unrelated") == "keep-me"
+
+
+@pytest.mark.django_db(transaction=True)
+def test_invalidations_collapse_into_single_bump_per_transaction():
+    user = User.objects.create_user(username="cache_collapse", password="secret")
+    before = get_tag_versions(calendar_cache_tags(["staff"]))["calendar:staff"]
+
+    with transaction.atomic():
+        for index in range(5):
+            WorkItem.objects.create(
+                title=f"Task {index}",
+                work_type=WorkItem.WORK_TYPE_TASK,
+                due_date=timezone.now().date() + timedelta(days=index),
+                created_by=user,
+            )
+        assert get_tag_versions(["calendar:staff"])["calendar:staff"] == before
+
+    assert get_tag_versions(["calendar:staff"])["calendar:staff"] == before + 1
+
+
+@pytest.mark.django_db(transaction=True)
+def test_rolled_back_transaction_does_not_bump():
+    before = get_tag_versions(["calendar:staff"])["calendar:staff"]
+
+    with pytest.raises(RuntimeError):
+        with transaction.atomic():
+            invalidate_calendar_cache(["staff"])
+            raise RuntimeError("rollback")
+
+    assert get_tag_versions(["calendar:staff"])["calendar:staff"] == before
+
+
+@pytest.mark.django_db(transaction=True)
+def test_payload_cache_survives_changes_to_other_modules():
+    user = User.objects.create_user(username="cache_scope", password="secret")
+
+    build_calendar_payload(filter_modules=["planning"])
+    StaffLeave.objects.create(
+        staff=user,
+        leave_type="vacation",
+        start_date=timezone.now().date(),
+        end_date=timezone.now().date() + timedelta(days=1),
+    )
+
+    with CaptureQueriesContext(connection) as queries:
+        build_calendar_payload(filter_modules=["planning"])
+
+    assert len(queries) == 0
+    stats = get_calendar_cache_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 50.0
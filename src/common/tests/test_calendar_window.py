@@ -0,0 +1,135 @@
+"""Tests for date-windowed, per-module calendar payloads."""
+
+from datetime import date, datetime, timedelta
+from itertools import combinations
+
+import pytest
+from django.utils import timezone
+
+from common.models import StaffLeave, User
+from common.services.calendar import (
+    _detect_conflicts,
+    build_calendar_payload,
+    get_calendar_cache_stats,
+    parse_calendar_window,
+)
+from monitoring.models import MonitoringEntry
+
+
+pytestmark = pytest.mark.usefixtures("clear_cache")
+
+
+@pytest.fixture
+def staff_user():
+    return User.objects.create_user(username="window_staff", password="secret")
+
+
+def _leave(user, start, days=1):
+    return StaffLeave.objects.create(
+        staff=user,
+        leave_type="vacation",
+        start_date=start,
+        end_date=start + timedelta(days=days),
+    )
+
+
+def test_parse_calendar_window_accepts_fullcalendar_values():
+    assert parse_calendar_window() is None
+    assert parse_calendar_window("not-a-date", "") is None
+    assert parse_calendar_window(
+        "2025-03-01T00:00:00+08:00", "2025-04-12"
+    ) == (date(2025, 3, 1), date(2025, 4, 12))
+    assert parse_calendar_window(datetime(2025, 3, 1, 9), None) == (
+        date(2025, 3, 1),
+        None,
+    )
+
+
+@pytest.mark.django_db
+def test_window_limits_entries_to_overlapping_spans(staff_user):
+    today = timezone.localdate()
+    inside = _leave(staff_user, today)
+    spanning = _leave(staff_user, today - timedelta(days=10), days=12)
+    _leave(staff_user, today + timedelta(days=40))
+
+    payload = build_calendar_payload(
+        filter_modules=["staff"], start=today, end=today + timedelta(days=7)
+    )
+
+    leave_ids = {
+        entry["id"]
+        for entry in payload["entries"]
+        if entry["extendedProps"]["category"] == "leave"
+    }
+    assert leave_ids == {f"staff-leave-{inside.pk}", f"staff-leave-{spanning.pk}"}
+    assert len(build_calendar_payload(filter_modules=["staff"])["entries"]) == 3
+
+
+@pytest.mark.django_db(transaction=True)
+def test_module_parts_are_cached_independently(staff_user):
+    today = timezone.localdate()
+    window = {"start": today, "end": today + timedelta(days=30)}
+    _leave(staff_user, today)
+
+    build_calendar_payload(filter_modules=["staff", "planning"], **window)
+    assert get_calendar_cache_stats()["misses"] == 2
+
+    MonitoringEntry.objects.create(
+        title="Windowed Program",
+        category="oobc_ppa",
+        start_date=today + timedelta(days=3),
+    )
+    payload = build_calendar_payload(filter_modules=["staff", "planning"], **window)
+
+    stats = get_calendar_cache_stats()
+    assert stats["hits"] == 1  # staff stays warm
+    assert stats["misses"] == 3  # planning is rebuilt
+    assert payload["module_stats"]["planning"]["total"] == 1
+    assert payload["module_stats"]["staff"]["total"] == 1
+
+
+def _brute_force_conflicts(timed_entries):
+    ordered = sorted(timed_entries, key=lambda item: item["start"])
+    pairs = []
+    for candidate, other in combinations(ordered, 2):
+        if other["start"] >= candidate["end"] or other["end"] <= candidate["start"]:
+            continue
+        same_location = candidate["location"] and candidate["location"] == other["location"]
+        if candidate["module"] == other["module"] or same_location:
+            pairs.append((candidate["title"], other["title"]))
+    return pairs
+
+
+def test_conflict_sweep_matches_pairwise_scan():
+    base = timezone.now().replace(hour=8, minute=0, second=0, microsecond=0)
+    timed_entries = [
+        {
+            "module": module,
+            "title": f"{module}-{index}",
+            "start": base + timedelta(hours=start),
+            "end": base + timedelta(hours=start + length),
+            "location": location,
+        }
+        for index, (module, start, length, location) in enumerate(
+            [
+                ("staff", 0, 4, None),
+                ("staff", 1, 1, None),
+                ("staff", 4, 1, None),
+                ("coordination", 2, 2, "Hall A"),
+                ("resources", 3, 2, "Hall A"),
+                ("resources", 30, 1, "Hall B"),
+                ("policy", 0, 48, None),
+            ]
+        )
+    ]
+
+    conflicts = _detect_conflicts(timed_entries)
+
+    assert [(c["title_a"], c["title_b"]) for c in conflicts] == _brute_force_conflicts(
+        timed_entries
+    )
+
+    day = timezone.localtime(base).date()
+    assert _detect_conflicts(timed_entries, (day, day)) == conflicts
+    next_week = day + timedelta(days=7)
+    assert _detect_conflicts(timed_entries, (next_week, next_week)) == []
@@ -0,0 +1,87 @@
+"""Tests for the compiled single-pass entity extraction engine."""
+
+from unittest.mock import patch
+
+import pytest
+
+from common.ai_services.chat import entity_engine
+from common.ai_services.chat.entity_engine import (
+    CompiledEntityEngine,
+    reset_entity_engine,
+    tokenize,
+)
+from common.ai_services.chat.entity_extractor import EntityExtractor
+from common.ai_services.chat.gazetteer import reset_gazetteer
+
+PARITY_QUERIES = [
+    "how many maranao fishing communities in zamboanga",
+    "show me maguindanao farmers in sultan kudarat",
+    "ongoing projects in region xii with budget under 5 million",
+    "top five completed in-progress workshops this year",
+    "critical unmet health needs, high priority",
+    "sama-bajau and sama badjao traders selling sari-sari goods",
+    "milg projects with joint program and technical assistance",
+    "rapid needs assessment for the 1st and 3rd quarter of 2024",
+    "long-term needs over a year, 1+ years and 1-6 months",
+    "moa and mou partnerships for capacity building training",
+    "twenty-five fisherfolk, 25 farmers, 1,000 traders",
+    "cancelled or canceled or postponed coordination meetings",
+    "What can you help me with?",
+    "",
+]
+
+
+@pytest.fixture(autouse=True)
+def static_gazetteer():
+    reset_gazetteer()
+    yield
+    reset_gazetteer()
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("query", PARITY_QUERIES)
+def test_compiled_engine_matches_sequential_resolvers(query):
+    extractor = EntityExtractor()
+
+    compiled = extractor.extract_entities(query)
+    sequential = extractor.extract_entities_sequential(query)
+
+    # Date ranges embed timezone.now(); compare their shape separately.
+    compiled_range = compiled.pop("date_range", None)
+    sequential_range = sequential.pop("date_range", None)
+    assert list(compiled) == list(sequential)
+    assert compiled == sequential
+    assert (compiled_range is None) == (sequential_range is None)
+    if compiled_range:
+        assert compiled_range["range_type"] == sequential_range["range_type"]
+
+
+def test_tokens_keep_punctuation_for_word_boundaries():
+    assert tokenize("Sari-sari, 1+ years") == ["sari", "-", "sari", ",", "1", "+", "years"]
+
+
+def test_lowest_ranked_term_wins_regardless_of_position():
+    engine = CompiledEntityEngine(
+        [("status", {"ongoing": ["ongoing", "active"], "completed": ["done"]}, lambda key, term: {"value": key, "term": term})]
+    )
+
+    # 'done' appears first in the text but 'ongoing' comes first in the vocabulary.
+    assert engine.scan("done and active")["status"] == {"value": "ongoing", "term": "active"}
+
+
+@pytest.mark.django_db
+def test_engine_is_compiled_once_and_scans_each_query_once():
+    reset_entity_engine()
+    extractor = EntityExtractor()
+    queries = [query for query in PARITY_QUERIES if query]
+
+    with patch.object(
+        entity_engine, "CompiledEntityEngine", wraps=CompiledEntityEngine
+    ) as build:
+        extractor.extract_entities("warm up")
+        with patch.object(entity_engine, "tokenize", wraps=tokenize) as tokens:
+            for query in queries * 3:
+                extractor.extract_entities(query)
+
+    assert build.call_count == 1
+    assert tokens.call_count == len(queries) * 3
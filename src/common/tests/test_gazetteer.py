@@ -0,0 +1,103 @@
+"""Tests for the in-memory location gazetteer used by the chat resolvers."""
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from common.ai_services.chat import gazetteer as gazetteer_module
+from common.ai_services.chat.entity_resolvers import LocationResolver
+from common.ai_services.chat.gazetteer import AhoCorasick, get_gazetteer, reset_gazetteer
+from common.services.cache_tags import bump_tags
+from common.services.locations import LOCATIONS_CACHE_TAG
+from common.tests.factories import (
+    create_barangay,
+    create_municipality,
+    create_province,
+    create_region,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_gazetteer():
+    reset_gazetteer()
+    yield
+    reset_gazetteer()
+
+
+@pytest.fixture
+def zamboanga_del_norte(db):
+    region = create_region(code="IX", name="Zamboanga Peninsula")
+    province = create_province(region=region, name="Zamboanga del Norte")
+    dipolog = create_municipality(province=province, name="Dipolog City")
+    create_barangay(municipality=dipolog, name="Miputak")
+    return province
+
+
+def test_automaton_reports_overlapping_matches():
+    automaton = AhoCorasick()
+    automaton.add(("cotabato",), "province")
+    automaton.add(("south", "cotabato"), "south")
+    automaton.add(("cotabato", "city"), "city")
+
+    matches = sorted(automaton.iter_matches(("in", "south", "cotabato", "city")))
+
+    assert matches == [(1, 3, "south"), (2, 3, "province"), (2, 4, "city")]
+
+
+@pytest.mark.django_db
+def test_resolution_makes_no_queries_once_built(zamboanga_del_norte):
+    resolver = LocationResolver()
+    get_gazetteer()
+
+    with CaptureQueriesContext(connection) as queries:
+        municipality = resolver.resolve("obc communities in dipolog")
+        barangay = resolver.resolve("households in miputak")
+        province = resolver.resolve("projects in zdn")
+
+    assert len(queries) == 0
+    assert municipality == {
+        "type": "municipality",
+        "value": "Dipolog City",
+        "province": "Zamboanga del Norte",
+        "region": "Zamboanga Peninsula",
+        "confidence": 0.85,
+    }
+    assert barangay["type"] == "barangay"
+    assert barangay["municipality"] == "Dipolog City"
+    # Aliases resolve to the stored province name.
+    assert province["value"] == "Zamboanga del Norte"
+
+
+@pytest.mark.django_db
+def test_province_beats_region_and_longest_alias_wins(zamboanga_del_norte):
+    result = LocationResolver().resolve("zamboanga del norte and region ix")
+
+    assert result["type"] == "province"
+    assert result["value"] == "Zamboanga del Norte"
+    assert result["confidence"] == 0.92
+
+
+@pytest.mark.django_db
+def test_typos_fall_back_to_fuzzy_match(zamboanga_del_norte):
+    region = LocationResolver().resolve("communities in zambanga")
+    municipality = LocationResolver().resolve("dipolg city")
+
+    assert region["value"] == "Region IX"
+    assert region["confidence"] < 0.75
+    assert municipality["value"] == "Dipolog City"
+    assert LocationResolver().resolve("fishing communities") is None
+
+
+@pytest.mark.django_db
+def test_gazetteer_rebuilds_when_locations_change(zamboanga_del_norte, monkeypatch):
+    monkeypatch.setattr(gazetteer_module, "VERSION_CHECK_INTERVAL", 0)
+    first = get_gazetteer()
+    assert get_gazetteer() is first
+
+    create_municipality(province=zamboanga_del_norte, name="Sindangan")
+    # The post_save signal defers the bump until commit; apply it directly.
+    bump_tags([LOCATIONS_CACHE_TAG])
+
+    rebuilt = get_gazetteer()
+    assert rebuilt is not first
+    assert LocationResolver().resolve("farmers in sindangan")["value"] == "Sindangan"
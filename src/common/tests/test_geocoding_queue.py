@@ -0,0 +1,90 @@
+"""Tests for the background geocoding queue."""
+
+import pytest
+from django.core.cache import cache
+from django.db import transaction
+
+from common.models import Barangay
+from common.services.enhanced_geocoding import GeocodeResult, reserve_provider_slot
+from common.services.geocoding_queue import GeocodingProvider, set_geocoding_providers
+from common.services.locations import get_boundary_centroid
+from common.tests.factories import create_barangay, create_municipality
+
+SQUARE = {
+    "type": "Polygon",
+    "coordinates": [[[122.0, 6.0], [124.0, 6.0], [124.0, 8.0], [122.0, 8.0], [122.0, 6.0]]],
+}
+
+
+class StubProvider:
+    """Local provider that records every lookup."""
+
+    def __init__(self, found=True):
+        self.queries = []
+        self.found = found
+
+    def __call__(self, query):
+        self.queries.append(query)
+        if not self.found:
+            return GeocodeResult(None, None, "low", "stub")
+        return GeocodeResult(7.5, 123.5, "high", "stub", bounding_box=[123, 7, 124, 8])
+
+
+@pytest.fixture(autouse=True)
+def clear_state():
+    cache.clear()
+    yield
+    set_geocoding_providers(None)
+    cache.clear()
+
+
+def test_boundary_centroid_of_polygon_and_feature_collection():
+    assert get_boundary_centroid(SQUARE) == pytest.approx((7.0, 123.0))
+
+    collection = {
+        "type": "FeatureCollection",
+        "features": [{"type": "Feature", "geometry": SQUARE, "properties": {}}],
+    }
+    assert get_boundary_centroid(collection) == pytest.approx((7.0, 123.0))
+    assert get_boundary_centroid({}) == (None, None)
+
+
+def test_rate_limiter_spaces_requests_across_callers():
+    assert reserve_provider_slot("stub", 1.0) == 0.0
+    assert reserve_provider_slot("stub", 1.0) == pytest.approx(1.0, abs=0.05)
+    assert reserve_provider_slot("stub", 1.0) == pytest.approx(2.0, abs=0.05)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_saves_in_one_transaction_share_a_batch_and_deduplicate_queries():
+    stub = StubProvider()
+    set_geocoding_providers([GeocodingProvider("stub", stub)])
+    municipality = create_municipality()
+    stub.queries.clear()
+
+    with transaction.atomic():
+        first = create_barangay(municipality=municipality, name="Poblacion")
+        second = create_barangay(municipality=municipality, name="  POBLACION ")
+        third = create_barangay(municipality=municipality, name="Tubod")
+        # Nothing is geocoded inside the saving transaction.
+        assert stub.queries == []
+
+    assert len(stub.queries) == 2
+    for barangay in (first, second, third):
+        barangay.refresh_from_db()
+        assert barangay.center_coordinates == [123.5, 7.5]
+        assert barangay.bounding_box == [123, 7, 124, 8]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_falls_back_to_boundary_centroid_when_providers_fail():
+    stub = StubProvider(found=False)
+    set_geocoding_providers([GeocodingProvider("stub", stub)])
+    municipality = create_municipality()
+
+    barangay = Barangay.objects.create(
+        municipality=municipality, code="BR-OFFLINE", name="Offline", boundary_geojson=SQUARE
+    )
+
+    barangay.refresh_from_db()
+    assert barangay.center_coordinates == pytest.approx([123.0, 7.0])
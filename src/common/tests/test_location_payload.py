@@ -0,0 +1,129 @@
+"""Tests for the materialized location payload and its HTTP validators."""
+
+import gzip
+import json
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from common.context_processors import location_api
+from common.services.locations import (
+    build_barangay_data,
+    build_location_data,
+    get_location_data,
+    get_location_data_cache_stats,
+)
+from common.tests.factories import create_barangay, create_community, create_municipality
+
+
+pytestmark = pytest.mark.usefixtures("clear_cache")
+
+
+@pytest.fixture
+def api_client(client):
+    user = get_user_model().objects.create_user(
+        username="payload-etag-tester", password="changeme123"
+    )
+    client.force_login(user)
+    return client
+
+
+@pytest.mark.django_db(transaction=True)
+def test_payload_is_built_once_per_version():
+    municipality = create_municipality()
+    create_barangay(municipality=municipality)
+
+    first = get_location_data()
+    with CaptureQueriesContext(connection) as queries:
+        second = get_location_data()
+
+    assert len(queries) == 0
+    assert first == second == json.loads(json.dumps(build_location_data()))
+    assert get_location_data_cache_stats()["hits"] == 1
+
+    create_barangay(municipality=municipality)
+    assert len(get_location_data()["barangays"]) == 2
+
+
+@pytest.mark.django_db(transaction=True)
+def test_community_writes_refresh_the_payload():
+    before = get_location_data(include_barangays=False)
+    community = create_community()
+
+    after = get_location_data(include_barangays=False)
+    assert community.barangay.municipality_id in {m["id"] for m in after["municipalities"]}
+    assert before != after
+
+
+@pytest.mark.django_db(transaction=True)
+def test_location_data_view_revalidates_with_etag(api_client):
+    create_barangay()
+    url = reverse("common_api:location-data")
+
+    response = api_client.get(url)
+    assert response.status_code == 200
+    assert response["ETag"].startswith('W/"')
+    assert "Last-Modified" in response
+    assert "private" in response["Cache-Control"]
+
+    revalidated = api_client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+
+    create_barangay()
+    changed = api_client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+    assert changed.status_code == 200
+    assert changed["ETag"] != response["ETag"]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_location_data_view_serves_stored_gzip(api_client):
+    create_barangay()
+    url = reverse("common_api:location-data")
+
+    response = api_client.get(url, HTTP_ACCEPT_ENCODING="gzip, deflate")
+
+    assert response["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in response["Vary"]
+    assert json.loads(gzip.decompress(response.content)) == api_client.get(url).json()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_barangays_are_served_per_municipality(api_client):
+    municipality = create_municipality()
+    barangay = create_barangay(municipality=municipality)
+    create_barangay()
+
+    url = reverse("common_api:location-data-barangays", args=[municipality.pk])
+    payload = api_client.get(url).json()
+
+    assert payload["municipality_id"] == municipality.pk
+    assert [item["id"] for item in payload["barangays"]] == [barangay.pk]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_barangay_chunks_match_the_full_payload():
+    community = create_community()
+    municipality = community.barangay.municipality
+    create_barangay(municipality=municipality)
+    create_barangay()
+
+    expected = [
+        barangay
+        for barangay in build_location_data()["barangays"]
+        if barangay["municipality_id"] == municipality.pk
+    ]
+    assert len(expected) == 2
+    assert build_barangay_data(municipality.pk) == expected
+
+
+def test_barangay_endpoint_template_is_exposed_to_widgets(rf):
+    url = location_api(rf.get("/"))["LOCATION_BARANGAYS_API_URL"]
+
+    assert url.endswith("/municipalities/{municipality_id}/barangays/")
+    assert url.replace("{municipality_id}", "7") == reverse(
+        "common_api:location-data-barangays", args=[7]
+    )
@@ -0,0 +1,102 @@
+"""Tests for the versioned chat query result cache."""
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from common.ai_services.chat.query_executor import QueryExecutor, query_cache_tag
+from common.models import Region
+from common.services.work_item_progress import rollup_progress
+from common.work_item_model import WorkItem
+
+REGION_COUNT = "Region.objects.filter(code__startswith='QC-').count()"
+
+
+pytestmark = pytest.mark.usefixtures("clear_cache")
+
+
+@pytest.fixture
+def executor():
+    return QueryExecutor()
+
+
+def test_related_lookups_add_their_model_tags(executor):
+    tags = executor._query_cache_tags(
+        "OBCCommunity.objects.filter(barangay__municipality__province__name='Sulu').count()"
+    )
+
+    assert query_cache_tag("OBCCommunity") in tags
+    assert query_cache_tag("Province") in tags
+    assert query_cache_tag("Municipality") in tags
+    assert query_cache_tag("Assessment") not in tags
+
+
+def test_equivalent_query_strings_share_a_key(executor):
+    assert executor._result_cache_key(
+        'Region.objects.filter(name="Region IX").count()'
+    ) == executor._result_cache_key("Region.objects.filter( name='Region IX' ).count()")
+
+
+@pytest.mark.django_db(transaction=True)
+def test_repeated_query_is_served_from_cache(executor):
+    Region.objects.create(code="QC-IX", name="Region IX")
+
+    first = executor.execute(REGION_COUNT)
+    with CaptureQueriesContext(connection) as queries:
+        second = executor.execute(REGION_COUNT)
+
+    assert len(queries) == 0
+    assert second["result"] == first["result"] == 1
+    assert second["query_info"]["cached"] is True
+    stats = executor.get_cache_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 50.0
+
+
+@pytest.mark.django_db(transaction=True)
+def test_model_writes_invalidate_cached_results(executor):
+    Region.objects.create(code="QC-IX", name="Region IX")
+    assert executor.execute(REGION_COUNT)["result"] == 1
+
+    Region.objects.create(code="QC-XII", name="Region XII")
+    assert executor.execute(REGION_COUNT)["result"] == 2
+
+    Region.objects.filter(code="QC-XII").first().delete()
+    assert executor.execute(REGION_COUNT)["result"] == 1
+    assert executor.get_cache_stats()["hits"] == 0
+
+
+@pytest.mark.django_db
+def test_failed_queries_are_not_cached(executor):
+    executor.execute("Region.objects.filter(no_such_field=1).count()")
+    executor.execute("Region.objects.filter(no_such_field=1).count()")
+
+    assert executor.get_cache_stats()["hits"] == 0
+
+
+@pytest.mark.django_db(transaction=True)
+def test_bulk_work_item_writes_invalidate_cached_results(executor):
+    project = WorkItem.objects.create(
+        work_type=WorkItem.WORK_TYPE_PROJECT,
+        title="QC project",
+        auto_calculate_progress=True,
+    )
+    task = WorkItem.objects.create(
+        work_type=WorkItem.WORK_TYPE_TASK,
+        title="QC task",
+        parent=project,
+        status=WorkItem.STATUS_COMPLETED,
+    )
+    WorkItem.objects.filter(pk=project.pk).update(progress=0)
+    finished = "WorkItem.objects.filter(title__startswith='QC', progress=100).count()"
+    remaining = "WorkItem.objects.filter(title__startswith='QC').count()"
+    assert executor.execute(finished)["result"] == 0
+    assert executor.execute(remaining)["result"] == 2
+
+    rollup_progress()  # bulk_update sends no post_save
+    assert executor.execute(finished)["result"] == 1
+
+    WorkItem.objects.get(pk=task.pk).delete_subtree()
+    assert executor.execute(remaining)["result"] == 1
+    assert executor.get_cache_stats()["hits"] == 0
@@ -0,0 +1,104 @@
+"""Tests for compiled RBAC permission snapshots."""
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+
+from common.rbac_models import Feature, Permission, Role, RolePermission, UserPermission, UserRole
+from common.services.rbac_service import RBACService
+
+User = get_user_model()
+
+
+pytestmark = pytest.mark.usefixtures("clear_cache")
+
+
+@pytest.fixture
+def oobc_staff():
+    return User.objects.create_user(
+        username="snapshot-staff",
+        password="testpass123",
+        user_type="oobc_staff",
+        is_approved=True,
+    )
+
+
+@pytest.fixture
+def feature():
+    return Feature.objects.create(
+        feature_key="communities.barangay_obc", name="Barangay OBC", module="communities"
+    )
+
+
+@pytest.fixture
+def permission(feature):
+    return Permission.objects.create(feature=feature, codename="view", name="View")
+
+
+@pytest.fixture
+def role(permission):
+    role = Role.objects.create(name="Viewer", slug="viewer", scope="system")
+    RolePermission.objects.create(role=role, permission=permission)
+    return role
+
+
+@pytest.mark.django_db(transaction=True)
+def test_snapshot_answers_repeated_checks_without_queries(oobc_staff, feature, role):
+    UserRole.objects.create(user=oobc_staff, role=role)
+
+    assert RBACService.has_feature_access(oobc_staff, "communities.barangay_obc")
+
+    user = User.objects.get(pk=oobc_staff.pk)
+    user.moa_organization  # load the relation used by the legacy checks
+    with CaptureQueriesContext(connection) as queries:
+        for _ in range(20):
+            assert RBACService.has_feature_access(user, "communities.barangay_obc")
+    assert len(queries) == 0
+
+    snapshot = RBACService.get_permission_snapshot(user)
+    assert snapshot.feature_ids == frozenset({feature.id})
+    assert RBACService.get_cache_stats()["hits"] >= 1
+
+
+@pytest.mark.django_db(transaction=True)
+def test_rbac_writes_invalidate_every_snapshot(oobc_staff, permission, role):
+    assert not RBACService.has_feature_access(oobc_staff, "communities.barangay_obc")
+
+    user_role = UserRole.objects.create(user=oobc_staff, role=role)
+    assert RBACService.has_feature_access(oobc_staff, "communities.barangay_obc")
+
+    UserPermission.objects.create(user=oobc_staff, permission=permission, is_granted=False)
+    assert not RBACService.has_feature_access(oobc_staff, "communities.barangay_obc")
+
+    user_role.delete()
+    UserPermission.objects.all().delete()
+    assert not RBACService.has_feature_access(oobc_staff, "communities.barangay_obc")
+
+
+@pytest.mark.django_db(transaction=True)
+def test_clear_cache_is_a_single_version_bump(oobc_staff, permission, role):
+    UserRole.objects.create(user=oobc_staff, role=role)
+    assert RBACService.has_feature_access(oobc_staff, "communities.barangay_obc")
+    version = RBACService.get_cache_stats()["version"]
+
+    # Bypass signals, as bulk updates do, then invalidate explicitly.
+    RolePermission.objects.filter(role=role).update(is_granted=False)
+    RBACService.clear_cache(user_id=oobc_staff.id)
+
+    assert RBACService.get_cache_stats()["version"] == version + 1
+    assert not RBACService.has_feature_access(oobc_staff, "communities.barangay_obc")
+
+
+@pytest.mark.django_db(transaction=True)
+def test_has_permission_uses_snapshot_for_rbac_features(oobc_staff, role):
+    request = RequestFactory().get("/")
+    request.user = oobc_staff
+
+    # Codes outside the RBAC catalog keep the legacy OOBC full access.
+    assert RBACService.has_permission(request, "planning.view_plan")
+    assert not RBACService.has_permission(request, "communities.barangay_obc")
+
+    UserRole.objects.create(user=oobc_staff, role=role)
+    assert RBACService.has_permission(request, "communities.barangay_obc")
@@ -0,0 +1,93 @@
+"""Tests for bulk hydration of unified search hits."""
+
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from common.ai_services.result_hydrator import ResultHydrator
+from common.models import Barangay, TrainingProgram
+from common.tests.factories import (
+    create_barangay,
+    create_municipality,
+    create_stakeholder,
+)
+from communities.models import Stakeholder
+
+
+def _hits(objects):
+    return [(0.9 - index * 0.01, {"id": obj.pk}) for index, obj in enumerate(objects)]
+
+
+@pytest.mark.django_db
+def test_hits_are_loaded_in_one_query_with_location_relations():
+    municipality = create_municipality(name="Zamboanga City")
+    barangays = [create_barangay(municipality=municipality) for _ in range(5)]
+
+    with CaptureQueriesContext(connection) as queries:
+        hydrated = ResultHydrator().hydrate(
+            Barangay, _hits(barangays), {"location": "zamboanga"}
+        )
+        # What _matches_location reads for every result.
+        labels = [str(obj.municipality) for obj, _, _ in hydrated["results"]]
+
+    assert len(queries) == 1
+    assert len(labels) == 5
+    assert [obj.pk for obj, _, _ in hydrated["results"]] == [b.pk for b in barangays]
+    assert hydrated["remaining_filters"] == {"location": "zamboanga"}
+
+
+@pytest.mark.django_db
+def test_missing_hits_are_skipped():
+    barangay = create_barangay()
+
+    hydrated = ResultHydrator().hydrate(
+        Barangay, [(0.9, {"id": 999999}), (0.8, {"id": barangay.pk}), (0.7, {})]
+    )
+
+    assert [obj.pk for obj, _, _ in hydrated["results"]] == [barangay.pk]
+
+
+def test_community_relations_are_followed_once():
+    paths = ResultHydrator().related_paths(Stakeholder)
+
+    assert "community" in paths
+    assert "community__barangay" in paths
+    assert "community__barangay__municipality" in paths
+
+
+@pytest.mark.django_db
+def test_sector_and_date_filters_are_pushed_into_sql():
+    health = TrainingProgram.objects.create(title="Health", category="Health Services")
+    blank = TrainingProgram.objects.create(title="Blank", category="")
+    education = TrainingProgram.objects.create(title="Education", category="Education")
+    old = TrainingProgram.objects.create(title="Old", category="Public Health")
+    TrainingProgram.objects.filter(pk=old.pk).update(
+        created_at=timezone.now() - timedelta(days=400)
+    )
+
+    hydrated = ResultHydrator().hydrate(
+        TrainingProgram,
+        _hits([health, blank, education, old]),
+        {
+            "sector": "Health",
+            "date_range": {"start": timezone.now().date() - timedelta(days=30), "end": None},
+        },
+    )
+
+    assert [obj.pk for obj, _, _ in hydrated["results"]] == [health.pk]
+    assert hydrated["remaining_filters"] == {}
+
+
+@pytest.mark.django_db
+def test_models_without_sector_columns_match_nothing():
+    stakeholder = create_stakeholder()
+
+    hydrated = ResultHydrator().hydrate(
+        Stakeholder, _hits([stakeholder]), {"sector": "health"}
+    )
+
+    # Same outcome as _matches_sector: no sector/category attribute, no match.
+    assert hydrated["results"] == []
@@ -0,0 +1,159 @@
+"""Tests for streaming search analytics and prefix autocomplete."""
+
+import json
+from collections import Counter
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+
+from common.ai_services.search_analytics import (
+    QueryPrefixIndex,
+    SearchAnalytics,
+    SpaceSaving,
+    clear_query_index,
+)
+from common.models import User
+
+
+@pytest.fixture(autouse=True)
+def reset_search_state(clear_cache):
+    clear_query_index()
+    yield
+    clear_query_index()
+
+
+def _log(analytics, queries, results_count=3):
+    for query in queries:
+        analytics.log_search(query, results_count=results_count)
+
+
+def test_ring_buffers_keep_the_newest_entries(monkeypatch):
+    monkeypatch.setattr(SearchAnalytics, "RECENT_LIMIT", 5)
+    monkeypatch.setattr(SearchAnalytics, "ZERO_RESULT_LIMIT", 2)
+    analytics = SearchAnalytics()
+
+    for index in range(8):
+        analytics.log_search(f"query {index}", results_count=index % 2)
+
+    patterns = analytics.identify_patterns()
+    assert patterns["total_searches"] == 5
+    assert patterns["zero_result_rate"] == pytest.approx(2 / 5)
+    assert [e["query"] for e in analytics.get_zero_result_queries()] == [
+        "query 4",
+        "query 6",
+    ]
+    assert [e["query"] for e in analytics.get_zero_result_queries(limit=1)] == [
+        "query 6"
+    ]
+
+
+def test_query_counts_merge_in_batches(monkeypatch):
+    monkeypatch.setattr(SearchAnalytics, "FLUSH_SIZE", 4)
+    analytics = SearchAnalytics()
+
+    with patch.object(SearchAnalytics, "flush", wraps=analytics.flush) as flush:
+        _log(analytics, ["Health", "health ", "EDUCATION", "health", "water"])
+    assert flush.call_count == 1  # after the fourth search
+
+    assert analytics.get_popular_queries(limit=2) == [
+        {"query": "health", "count": 3},
+        {"query": "education", "count": 1},
+    ]
+
+
+def test_flush_keeps_counts_buffered_while_another_process_merges():
+    analytics = SearchAnalytics()
+    _log(analytics, ["livelihood"])
+
+    cache.add(f"{SearchAnalytics.CACHE_PREFIX}query_summary:lock", 1)
+    assert analytics.flush() is False
+    cache.delete(f"{SearchAnalytics.CACHE_PREFIX}query_summary:lock")
+
+    assert analytics.flush() is True
+    assert analytics.get_popular_queries() == [{"query": "livelihood", "count": 1}]
+
+
+def test_beat_task_merges_searches_from_any_process():
+    from common.tasks import flush_search_analytics
+
+    _log(SearchAnalytics(), ["solar dryers", "Solar  Dryers"])
+    clear_query_index()  # As seen from another worker process.
+
+    assert flush_search_analytics() is True
+    assert SearchAnalytics()._load_summary().counts == {"solar dryers": 2}
+    assert flush_search_analytics() is False  # Nothing new to merge.
+
+
+def test_flush_skips_entries_overwritten_before_the_merge(monkeypatch):
+    monkeypatch.setattr(SearchAnalytics, "RECENT_LIMIT", 3)
+    analytics = SearchAnalytics()
+    _log(analytics, ["old"] * 2 + ["new"] * 3)
+
+    assert analytics.flush() is True
+    assert analytics._load_summary().counts == {"new": 3}
+
+
+def test_space_saving_tracks_every_heavy_hitter():
+    stream = ["a"] * 40 + ["b"] * 25 + ["c"] * 22
+    stream += [f"rare {index}" for index in range(120)]
+    # Deterministic shuffle so heavy hitters arrive between the rare queries.
+    ordered = [stream[(index * 97) % len(stream)] for index in range(len(stream))]
+    assert Counter(ordered) == Counter(stream)
+
+    summary = SpaceSaving(capacity=10)
+    for item in ordered:
+        summary.offer(item)
+
+    exact = Counter(stream)
+    assert len(summary.counts) == 10
+    # Anything seen more than len(stream) / capacity times stays tracked, and
+    # counts never underestimate nor overshoot by more than the error.
+    for item in ("a", "b", "c"):
+        assert exact[item] <= summary.counts[item] <= exact[item] + summary.errors[item]
+    assert {item for item, _ in summary.top(3)} == {"a", "b", "c"}
+
+
+def test_prefix_index_returns_ranked_completions():
+    index = QueryPrefixIndex(
+        ["health center", "education", "health", "healthcare workers", "hea"],
+        max_suggestions=2,
+    )
+
+    assert index.complete("Hea") == ["health center", "health"]
+    assert index.complete("health") == ["health center", "health"]
+    assert index.complete("health c") == ["health center"]
+    assert index.complete("educ", limit=1) == ["education"]
+    assert index.complete("water") == []
+
+
+def test_autocomplete_index_rebuilds_after_merge():
+    analytics = SearchAnalytics()
+    _log(analytics, ["madrasah enrollment"] * 2 + ["madrasah teachers"])
+    analytics.flush()
+
+    assert analytics.autocomplete("madr") == ["madrasah enrollment", "madrasah teachers"]
+
+    _log(analytics, ["madrasah teachers"] * 3)
+    analytics.flush()
+
+    assert analytics.autocomplete("madr") == ["madrasah teachers", "madrasah enrollment"]
+
+
+@pytest.mark.django_db
+def test_autocomplete_view_uses_prefix_index(client):
+    user = User.objects.create_user(username="searcher", password="secret")
+    client.force_login(user)
+    analytics = SearchAnalytics()
+    _log(analytics, ["infrastructure", "infra gaps", "water infrastructure"])
+    analytics.flush()
+
+    response = client.post(
+        reverse("common:search_autocomplete"),
+        data=json.dumps({"query": "infra"}),
+        content_type="application/json",
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"suggestions": ["infra gaps", "infrastructure"]}
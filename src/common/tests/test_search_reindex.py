@@ -0,0 +1,192 @@
+"""Tests for the batched, resumable unified-search reindex pipeline."""
+
+import hashlib
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from ai_assistant.models import DocumentEmbedding
+from ai_assistant.services.vector_store import VectorStore
+from common.ai_services.reindex import ReindexPipeline
+from common.models import Region
+from coordination.models import Organization
+
+MODULE_CONFIG = {
+    "app": "common",
+    "model": "Region",
+    "fields": ["name", "description"],
+    "vector_store": "test_regions",
+}
+
+
+class FakeEmbeddingService:
+    """Deterministic embeddings so the pipeline can run without a model."""
+
+    model_name = "test-embedder"
+
+    def __init__(self, fail_on_call=None):
+        self.batch_calls = []
+        self.fail_on_call = fail_on_call
+
+    def get_dimension(self):
+        return 8
+
+    def batch_generate(self, texts, batch_size=32):
+        self.batch_calls.append(list(texts))
+        if self.fail_on_call == len(self.batch_calls):
+            raise KeyboardInterrupt("worker stopped")
+        rows = []
+        for text in texts:
+            seed = int(hashlib.md5(text.encode("utf-8")).hexdigest()[:8], 16)
+            rows.append(np.random.default_rng(seed).random(8))
+        return np.array(rows, dtype="float32")
+
+    def compute_content_hash(self, text):
+        return hashlib.md5(text.encode("utf-8")).hexdigest()
+
+    def should_reembed(self, current_text, stored_hash):
+        return not stored_hash or self.compute_content_hash(current_text) != stored_hash
+
+
+def format_text(obj, fields):
+    return "\n".join(str(getattr(obj, field) or "") for field in fields)
+
+
+@pytest.fixture
+def regions(db):
+    return [
+        Region.objects.create(code=f"R{index}", name=f"Region {index}")
+        for index in range(7)
+    ]
+
+
+def _load_store(tmp_path):
+    return VectorStore.load("test_regions", filepath=str(tmp_path / "test_regions.index"))
+
+
+def _pipeline(tmp_path, embedder, **kwargs):
+    return ReindexPipeline(
+        "regions",
+        MODULE_CONFIG,
+        embedder,
+        format_text,
+        chunk_size=3,
+        batch_size=2,
+        index_path=tmp_path / "test_regions.index",
+        **kwargs,
+    )
+
+
+# Migrations seed regions too, so expectations count the whole table.
+
+
+
+def test_initial_run_indexes_in_batches_and_swaps_index(tmp_path, regions):
+    embedder = FakeEmbeddingService()
+    total = Region.objects.count()
+
+    stats = _pipeline(tmp_path, embedder).run()
+
+    assert stats.indexed == total
+    assert stats.skipped == 0
+    # Each chunk of three objects is embedded two at a time.
+    assert sum(len(call) for call in embedder.batch_calls) == total
+    assert max(len(call) for call in embedder.batch_calls) == 2
+    store = _load_store(tmp_path)
+    assert store.vector_count == total
+    assert all(store.get_vector_id(region.pk, "regions") is not None for region in regions)
+    assert DocumentEmbedding.objects.filter(index_name="test_regions").count() == total
+    assert not (tmp_path / "test_regions.staging.index").exists()
+    assert not (tmp_path / "test_regions.reindex.json").exists()
+
+
+def test_rerun_skips_unchanged_and_drops_deleted_objects(tmp_path, regions):
+    _pipeline(tmp_path, FakeEmbeddingService()).run()
+    regions[0].name = "Renamed Region"
+    regions[0].save()
+    deleted_pk = regions[1].pk
+    regions[1].delete()
+
+    embedder = FakeEmbeddingService()
+    total = Region.objects.count()
+    stats = _pipeline(tmp_path, embedder).run()
+
+    assert stats.indexed == 1
+    assert stats.skipped == total - 1
+    assert stats.removed == 1
+    assert embedder.batch_calls == [["Renamed Region\n"]]
+    store = _load_store(tmp_path)
+    assert store.vector_count == total
+    assert store.get_vector_id(deleted_pk, "regions") is None
+    assert not DocumentEmbedding.objects.filter(
+        index_name="test_regions", object_id=deleted_pk
+    ).exists()
+
+
+def test_interrupted_run_resumes_from_checkpoint(tmp_path, regions):
+    total = Region.objects.count()
+    # Third embedding call belongs to the second chunk.
+    with pytest.raises(KeyboardInterrupt):
+        _pipeline(
+            tmp_path, FakeEmbeddingService(fail_on_call=3), checkpoint_every=1
+        ).run()
+
+    assert (tmp_path / "test_regions.reindex.json").exists()
+    assert not (tmp_path / "test_regions.index").exists()
+
+    embedder = FakeEmbeddingService()
+    stats = _pipeline(tmp_path, embedder).run()
+
+    assert stats.resumed
+    assert stats.indexed == total
+    # Only the first chunk of three survived the interruption.
+    assert sum(len(call) for call in embedder.batch_calls) == total - 3
+    store = _load_store(tmp_path)
+    assert store.vector_count == total
+    assert DocumentEmbedding.objects.filter(index_name="test_regions").count() == total
+
+
+def test_checkpoints_are_written_every_few_chunks(tmp_path, regions):
+    pipeline = _pipeline(tmp_path, FakeEmbeddingService(), checkpoint_every=2)
+    with patch.object(
+        ReindexPipeline, "_write_checkpoint", wraps=pipeline._write_checkpoint
+    ) as checkpoint:
+        pipeline.run()
+
+    chunks = -(-Region.objects.count() // 3)
+    assert checkpoint.call_count == chunks // 2
+
+
+def test_uuid_keyed_objects_skip_unchanged_rows(tmp_path, db):
+    organizations = [
+        Organization.objects.create(name=f"Partner {index}", organization_type="ngo")
+        for index in range(3)
+    ]
+    config = {
+        "app": "coordination",
+        "model": "Organization",
+        "fields": ["name"],
+        "vector_store": "test_organizations",
+    }
+
+    def pipeline(embedder):
+        return ReindexPipeline(
+            "coordination",
+            config,
+            embedder,
+            format_text,
+            index_path=tmp_path / "test_organizations.index",
+        )
+
+    pipeline(FakeEmbeddingService()).run()
+    row = DocumentEmbedding.objects.get(object_id=str(organizations[0].pk))
+    assert row.index_name == "test_organizations"
+
+    embedder = FakeEmbeddingService()
+    stats = pipeline(embedder).run()
+
+    assert stats.indexed == 0
+    assert stats.removed == 0
+    assert stats.skipped == Organization.objects.count()
+    assert embedder.batch_calls == []
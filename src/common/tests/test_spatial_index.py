@@ -0,0 +1,105 @@
+"""Tests for the offline administrative boundary index."""
+
+import pytest
+from django.core.cache import cache
+
+from common.services.spatial_index import (
+    SpatialIndex,
+    clear_spatial_indexes,
+    get_spatial_index,
+    locate_points,
+    point_in_boundary,
+    reverse_geocode_points,
+)
+from common.tests.factories import create_municipality, create_province, create_region
+
+
+def _square(min_lng, min_lat, size):
+    return [
+        [min_lng, min_lat],
+        [min_lng + size, min_lat],
+        [min_lng + size, min_lat + size],
+        [min_lng, min_lat + size],
+        [min_lng, min_lat],
+    ]
+
+
+def _polygon(*rings):
+    return {"type": "Polygon", "coordinates": list(rings)}
+
+
+@pytest.fixture(autouse=True)
+def clear_state():
+    cache.clear()
+    clear_spatial_indexes()
+    yield
+    clear_spatial_indexes()
+    cache.clear()
+
+
+def test_point_in_boundary_respects_holes_and_multipolygons():
+    donut = _polygon(_square(0, 0, 10), _square(4, 4, 2))
+    assert point_in_boundary(donut, lat=1, lng=1)
+    assert not point_in_boundary(donut, lat=5, lng=5)
+    assert not point_in_boundary(donut, lat=11, lng=1)
+
+    islands = {
+        "type": "Feature",
+        "geometry": {
+            "type": "MultiPolygon",
+            "coordinates": [[_square(0, 0, 1)], [_square(5, 5, 1)]],
+        },
+    }
+    assert point_in_boundary(islands, lat=5.5, lng=5.5)
+    assert not point_in_boundary(islands, lat=3, lng=3)
+
+
+def test_index_locates_batches_and_prefers_the_smallest_unit():
+    index = SpatialIndex(
+        [
+            (1, _polygon(_square(0, 0, 10))),
+            (2, _polygon(_square(20, 0, 10))),
+            (3, _polygon(_square(2, 2, 2))),
+            (4, {}),
+        ]
+    )
+
+    assert len(index) == 3
+    assert index.locate([1, 3, 5, 50, float("nan")], [1, 3, 25, 50, 1]) == [1, 3, 2, None, None]
+    assert index.contains(1, lat=3, lng=3)
+    assert not index.contains(2, lat=3, lng=3)
+    with pytest.raises(ValueError):
+        index.locate([1, 2], [1])
+
+
+@pytest.mark.django_db(transaction=True)
+def test_lookups_follow_saved_boundaries():
+    region = create_region()
+    province = create_province(region=region)
+    province.boundary_geojson = _polygon(_square(120, 5, 4))
+    province.save()
+    north = create_municipality(province=province)
+    north.boundary_geojson = _polygon(_square(120, 7, 2))
+    north.save()
+    south = create_municipality(province=province)
+
+    assert locate_points([7.5, 5.5], [121, 121]) == [north.pk, None]
+    assert reverse_geocode_points([7.5], [121], levels=("province", "municipality")) == [
+        {"province": province.pk, "municipality": north.pk}
+    ]
+
+    south.boundary_geojson = _polygon(_square(120, 5, 2))
+    south.save()
+
+    assert locate_points([7.5, 5.5], [121, 121]) == [north.pk, south.pk]
+    assert len(get_spatial_index("municipality")) == 2
+
+
+@pytest.mark.django_db
+def test_region_contained_coordinates_uses_boundary():
+    region = create_region()
+    assert region.get_contained_coordinates([121, 6]) is False
+
+    region.boundary_geojson = _polygon(_square(120, 5, 4))
+    assert region.get_contained_coordinates([121, 6]) is True
+    assert region.get_contained_coordinates([130, 6]) is False
@@ -0,0 +1,79 @@
+"""Tests for the literal prefilter behind single-pass template matching."""
+
+import pytest
+
+from common.ai_services.chat.query_templates import get_template_registry
+from common.ai_services.chat.query_templates.base import QueryTemplate, TemplateRegistry
+from common.ai_services.chat.query_templates.registry.pattern_trie import (
+    PatternTrie,
+    extract_required_literals,
+)
+
+
+def _template(template_id, pattern, **kwargs):
+    return QueryTemplate(
+        id=template_id,
+        category=kwargs.pop('category', 'communities'),
+        pattern=pattern,
+        query_template='OBCCommunity.objects.count()',
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def registry():
+    return TemplateRegistry()
+
+
+def test_required_literals_cover_alternations_and_repeats():
+    requirements = extract_required_literals(
+        r'\b(?:how many|count)\s+(?:obc\s+)?communit(?:y|ies)(?:\s+in\s+(.+))?'
+    )
+
+    assert frozenset({'how many', 'count'}) in requirements
+    assert frozenset({'communit'}) in requirements
+    # Optional parts never become requirements
+    assert all('obc' not in option for options in requirements for option in options)
+
+
+def test_pattern_without_literals_is_always_a_candidate():
+    trie = PatternTrie()
+    trie.insert_pattern(r'^\d+$', 'digits_only')
+    trie.insert_pattern(r'communit', 'communities')
+
+    assert trie.match_candidates('42') == {'digits_only'}
+    assert trie.match_candidates('Communities') == {'digits_only', 'communities'}
+
+
+def test_non_ascii_queries_fall_back_to_full_scan():
+    trie = PatternTrie()
+    trie.insert_pattern(r'communit', 'communities')
+
+    assert trie.match_candidates('comunidades en Mindanao ñ') is None
+
+
+def test_match_templates_returns_match_objects_in_registration_order(registry):
+    registry.register_many([
+        _template('list_communities', r'(?:list|show).*communit'),
+        _template('count_communities', r'(?:how many|count).*communit.*in\s+(?P<place>.+)'),
+        _template('count_workshops', r'(?:how many|count).*workshop', category='mana'),
+    ])
+
+    matches = registry.match_templates('How many communities in Region IX')
+
+    assert [template.id for template, _ in matches] == ['count_communities']
+    assert matches[0][1].group('place') == 'Region IX'
+    assert registry.match_templates('how many workshops', category='communities') == []
+
+
+def test_prefilter_agrees_with_full_scan_on_registered_templates():
+    registry = get_template_registry()
+    queries = [
+        example
+        for template in registry.get_all_templates()
+        for example in template.examples
+    ]
+
+    for query in queries:
+        expected = [t.id for t in registry.get_all_templates() if t.matches(query)]
+        assert [t.id for t, _ in registry.match_templates(query)] == expected, query
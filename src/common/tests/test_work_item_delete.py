@@ -128,3 +128,105 @@ class WorkItemDeleteTest(TestCase):
 
         # Work item should still exist
         self.assertTrue(WorkItem.objects.filter(pk=self.work_item.pk).exists())
+
+
+class WorkItemBulkSubtreeDeleteTest(TestCase):
+    """Test batched subtree deletion via WorkItem.delete_subtree()."""
+
+    def setUp(self):
+        """Create a project with two activities and 100 tasks."""
+        self.user = User.objects.create_user(
+            username='bulkdelete',
+            email='bulk@example.com',
+            password='testpass123'
+        )
+        self.project = WorkItem.objects.create(
+            work_type=WorkItem.WORK_TYPE_PROJECT,
+            title='Bulk Project',
+            auto_calculate_progress=True,
+            created_by=self.user
+        )
+        self.doomed = WorkItem.objects.create(
+            work_type=WorkItem.WORK_TYPE_ACTIVITY,
+            title='Doomed Activity',
+            parent=self.project,
+            status=WorkItem.STATUS_NOT_STARTED,
+            created_by=self.user
+        )
+        self.kept = WorkItem.objects.create(
+            work_type=WorkItem.WORK_TYPE_ACTIVITY,
+            title='Kept Activity',
+            parent=self.project,
+            status=WorkItem.STATUS_COMPLETED,
+            created_by=self.user
+        )
+        for index in range(100):
+            WorkItem.objects.create(
+                work_type=WorkItem.WORK_TYPE_TASK,
+                title=f'Task {index:03d}',
+                parent=self.doomed,
+                created_by=self.user
+            )
+
+    def test_delete_subtree_removes_all_descendants(self):
+        """The node and its whole subtree are deleted."""
+        deleted = self.doomed.delete_subtree()
+
+        self.assertEqual(deleted, 101)
+        self.assertEqual(
+            list(WorkItem.objects.values_list('pk', flat=True).order_by('lft')),
+            [self.project.pk, self.kept.pk],
+        )
+
+    def test_delete_subtree_keeps_tree_consistent(self):
+        """Remaining nodes keep valid lft/rght values."""
+        self.doomed.delete_subtree()
+
+        project = WorkItem.objects.get(pk=self.project.pk)
+        kept = WorkItem.objects.get(pk=self.kept.pk)
+        self.assertEqual((project.lft, project.rght), (1, 4))
+        self.assertEqual((kept.lft, kept.rght), (2, 3))
+        self.assertEqual(project.get_descendant_count(), 1)
+
+    def test_delete_subtree_query_count_is_independent_of_size(self):
+        """Deleting 100 children does not issue per-row queries."""
+        with self.assertNumQueriesLessThan(25):
+            self.doomed.delete_subtree()
+
+    def test_delete_subtree_rolls_up_parent_progress_after_commit(self):
+        """One aggregated notification recomputes the parent's progress."""
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            self.doomed.delete_subtree()
+
+        self.assertEqual(len(callbacks), 1)
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.progress, 100)
+
+    def test_delete_subtree_audits_every_row_with_the_request_actor(self):
+        """Each deleted row gets a DELETE log entry stamped with the actor."""
+        from auditlog.context import set_actor
+        from auditlog.models import LogEntry
+
+        with set_actor(self.user, remote_addr='10.0.0.7'):
+            self.doomed.delete_subtree()
+
+        entries = LogEntry.objects.filter(action=LogEntry.Action.DELETE)
+        self.assertEqual(entries.count(), 101)
+        self.assertEqual(
+            set(entries.values_list('actor_id', 'remote_addr')),
+            {(self.user.pk, '10.0.0.7')},
+        )
+
+    def assertNumQueriesLessThan(self, limit):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        test_case = self
+
+        class _Context(CaptureQueriesContext):
+            def __exit__(self, exc_type, exc_value, traceback):
+                super().__exit__(exc_type, exc_value, traceback)
+                if exc_type is None:
+                    test_case.assertLess(len(self), limit)
+
+        return _Context(connection)
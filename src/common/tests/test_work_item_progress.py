@@ -0,0 +1,136 @@
+"""Tests for the set-based WorkItem progress rollup engine."""
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from common.services.work_item_progress import (
+    rollup_ancestor_progress,
+    rollup_progress,
+)
+from common.work_item_model import WorkItem
+
+
+def _project_with_tasks(title, completed, pending):
+    project = WorkItem.objects.create(
+        work_type=WorkItem.WORK_TYPE_PROJECT,
+        title=title,
+        auto_calculate_progress=True,
+    )
+    activity = WorkItem.objects.create(
+        work_type=WorkItem.WORK_TYPE_ACTIVITY,
+        title=f"{title} activity",
+        parent=project,
+        auto_calculate_progress=True,
+    )
+    for index in range(completed):
+        WorkItem.objects.create(
+            work_type=WorkItem.WORK_TYPE_TASK,
+            title=f"{title} done {index}",
+            parent=activity,
+            status=WorkItem.STATUS_COMPLETED,
+        )
+    for index in range(pending):
+        WorkItem.objects.create(
+            work_type=WorkItem.WORK_TYPE_TASK,
+            title=f"{title} open {index}",
+            parent=activity,
+            status=WorkItem.STATUS_IN_PROGRESS,
+        )
+    return project, activity
+
+
+@pytest.mark.django_db
+class TestRollupProgress:
+    """Whole-tree rollup."""
+
+    def test_rollup_matches_per_node_calculation(self):
+        _, first_activity = _project_with_tasks("First", completed=1, pending=3)
+        _, second_activity = _project_with_tasks("Second", completed=2, pending=0)
+
+        result = rollup_progress()
+
+        first_activity.refresh_from_db()
+        second_activity.refresh_from_db()
+        assert first_activity.progress == 25
+        assert second_activity.progress == 100
+        assert result.updated == 2
+        assert first_activity.calculate_progress_from_children() == 25
+
+    def test_rollup_query_count_is_independent_of_tree_count(self):
+        for index in range(10):
+            _project_with_tasks(f"Project {index}", completed=1, pending=1)
+
+        with CaptureQueriesContext(connection) as queries:
+            rollup_progress()
+
+        assert len(queries) <= 8
+
+    def test_rollup_can_be_limited_to_trees(self):
+        first_project, first_activity = _project_with_tasks("Only", completed=1, pending=1)
+        _, other_activity = _project_with_tasks("Other", completed=1, pending=1)
+
+        rollup_progress(tree_ids=[first_project.tree_id])
+
+        first_activity.refresh_from_db()
+        other_activity.refresh_from_db()
+        assert first_activity.progress == 50
+        assert other_activity.progress == 0
+
+    def test_manual_progress_is_preserved(self):
+        project = WorkItem.objects.create(
+            work_type=WorkItem.WORK_TYPE_PROJECT,
+            title="Manual",
+            auto_calculate_progress=False,
+            progress=40,
+        )
+        WorkItem.objects.create(
+            work_type=WorkItem.WORK_TYPE_TASK,
+            title="Done",
+            parent=project,
+            status=WorkItem.STATUS_COMPLETED,
+        )
+
+        rollup_progress()
+
+        project.refresh_from_db()
+        assert project.progress == 40
+
+
+@pytest.mark.django_db
+class TestRollupAncestorProgress:
+    """Incremental rollup after edits."""
+
+    def test_recomputes_only_ancestors(self):
+        project, activity = _project_with_tasks("Incremental", completed=0, pending=2)
+        _, untouched = _project_with_tasks("Untouched", completed=1, pending=0)
+        task = activity.get_children().first()
+        task.status = WorkItem.STATUS_COMPLETED
+        task.save()
+
+        rollup_ancestor_progress([task])
+
+        activity.refresh_from_db()
+        untouched.refresh_from_db()
+        assert activity.progress == 50
+        assert untouched.progress == 0
+
+    def test_update_progress_uses_rollup(self):
+        _, activity = _project_with_tasks("Legacy", completed=1, pending=1)
+
+        activity.update_progress()
+
+        assert activity.progress == 50
+
+
+@pytest.mark.django_db
+def test_recalculate_all_progress_task_reports_updates():
+    from project_central.tasks import recalculate_all_progress_task
+
+    _project_with_tasks("Task Run", completed=1, pending=1)
+
+    result = recalculate_all_progress_task.apply().get()
+
+    assert result["status"] == "completed"
+    assert result["total_projects"] == 1
+    assert result["total_recalculated"] == 1
@@ -0,0 +1,82 @@
+"""
+Tests for the versioned WorkItem tree-expansion cache.
+
+Verifies:
+- Fragments are shared across viewers with the same access profile
+- Edits invalidate the node and its ancestors without per-user work
+"""
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from common.views.work_items import invalidate_work_item_tree_cache
+from common.work_item_model import WorkItem
+
+User = get_user_model()
+
+
+class WorkItemTreeCacheTest(TestCase):
+    """Test work_item_tree_partial caching and invalidation."""
+
+    def setUp(self):
+        cache.clear()
+        self.first_user = User.objects.create_user(
+            username='tree_viewer_one', password='testpass123', user_type='oobc_staff'
+        )
+        self.second_user = User.objects.create_user(
+            username='tree_viewer_two', password='testpass123', user_type='oobc_staff'
+        )
+        self.project = WorkItem.objects.create(
+            work_type=WorkItem.WORK_TYPE_PROJECT, title='Tree Project'
+        )
+        self.activity = WorkItem.objects.create(
+            work_type=WorkItem.WORK_TYPE_ACTIVITY, title='Tree Activity', parent=self.project
+        )
+        self.task = WorkItem.objects.create(
+            work_type=WorkItem.WORK_TYPE_TASK, title='Tree Task', parent=self.activity
+        )
+        self.url = reverse('common:work_item_tree_partial', kwargs={'pk': self.project.pk})
+
+    def tearDown(self):
+        cache.clear()
+
+    def _get_as(self, user, url=None):
+        client = Client()
+        client.force_login(user)
+        return client.get(url or self.url)
+
+    def test_fragment_is_shared_across_same_profile_users(self):
+        """A second viewer with the same profile is served from cache."""
+        first = self._get_as(self.first_user)
+        self.assertContains(first, 'Tree Activity')
+
+        WorkItem.objects.filter(pk=self.activity.pk).update(title='Renamed Silently')
+        second = self._get_as(self.second_user)
+
+        self.assertContains(second, 'Tree Activity')
+
+    def test_invalidation_refreshes_ancestor_fragments(self):
+        """Editing a grandchild invalidates every ancestor's fragment."""
+        self._get_as(self.first_user)
+
+        self.activity.title = 'Renamed Activity'
+        self.activity.save()
+        invalidate_work_item_tree_cache(self.task)
+
+        response = self._get_as(self.second_user)
+        self.assertContains(response, 'Renamed Activity')
+
+    def test_invalidation_cost_is_independent_of_user_count(self):
+        """Invalidation issues a single ancestor query and no user lookups."""
+        for index in range(20):
+            User.objects.create_user(username=f'extra_viewer_{index}', password='x')
+
+        with CaptureQueriesContext(connection) as queries:
+            invalidate_work_item_tree_cache(self.task)
+
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn('auth_user', queries[0]['sql'])
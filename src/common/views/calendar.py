@@ -18,6 +18,7 @@ from django.shortcuts import get_object_or_404, render
 from django.views.decorators.cache import never_cache
 
 from common.models import WorkItem
+from common.services.calendar import CALENDAR_SENDER_MODULES, calendar_cache_key
 
 
 @login_required
@@ -103,13 +104,16 @@ def work_items_calendar_feed(request):
                 pass
 
     # Cache key based on filters with versioning
-    # Version invalidates ALL caches when any work item changes
+    # Work item tag versions invalidate the feed for every user when any work
+    # item changes; the per-user version covers edits made by this user.
     user_id = request.user.id
     cache_version = cache.get(f'calendar_version:{user_id}') or 0
-    cache_key = (
-        f"calendar_feed:{user_id}:v{cache_version}:{work_type}:{activity_category}:"
-        f"{status}:{assignee_id}:{start_date}:{end_date}"
-    )
+    cache_key = calendar_cache_key(
+        "calendar_feed",
+        CALENDAR_SENDER_MODULES[WorkItem],
+        user_id=user_id,
+        window=(start_date, end_date),
+    ) + f":v{cache_version}:{work_type}:{activity_category}:{status}:{assignee_id}"
     cached = cache.get(cache_key)
     if cached:
         return JsonResponse(cached, safe=False)
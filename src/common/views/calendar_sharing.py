@@ -16,6 +16,10 @@ from django.urls import reverse
 from common.models import SharedCalendarLink
 from common.services.calendar import build_calendar_payload
 
+# Date range served by a shared calendar when the request names none.
+SHARED_CALENDAR_PAST_DAYS = 90
+SHARED_CALENDAR_FUTURE_DAYS = 365
+
 
 @login_required
 def calendar_share_create(request):
@@ -141,9 +145,16 @@ def calendar_share_view(request, token):
     share_link.view_count += 1
     share_link.save(update_fields=["view_count"])
 
-    # Build calendar payload with module filter
+    # Build calendar payload with module filter, limited to a date window
     filter_modules = share_link.filter_modules if share_link.filter_modules else None
-    payload = build_calendar_payload(filter_modules=filter_modules)
+    today = timezone.localdate()
+    payload = build_calendar_payload(
+        filter_modules=filter_modules,
+        start=request.GET.get("start")
+        or today - timedelta(days=SHARED_CALENDAR_PAST_DAYS),
+        end=request.GET.get("end")
+        or today + timedelta(days=SHARED_CALENDAR_FUTURE_DAYS),
+    )
 
     # Remove sensitive data from entries
     for entry in payload.get("entries", []):
@@ -35,7 +35,7 @@ from ..forms import (
 )
 from ..models import Barangay, Municipality, Province, Region
 from ..services.enhanced_geocoding import enhanced_ensure_location_coordinates
-from ..services.locations import build_location_data, get_object_centroid
+from ..services.locations import get_location_data, get_object_centroid
 from ..utils.permissions import has_oobc_management_access
 
 
@@ -561,7 +561,7 @@ def communities_add(request):
         "form": form,
         "recent_communities": recent_communities,
         "barangays": barangays,
-        "location_data": build_location_data(),
+        "location_data": get_location_data(),
         "show_barangay_field": True,
         "page_title": "Add Barangay OBC",
         "breadcrumb_label": "Add Barangay OBC",
@@ -603,7 +603,7 @@ def communities_add_municipality(request):
     context = {
         "form": form,
         "recent_communities": [],
-        "location_data": build_location_data(include_barangays=False),
+        "location_data": get_location_data(include_barangays=False),
         "show_barangay_field": False,
         "page_title": "Add Municipal / City OBC",
         "breadcrumb_label": "Add Municipal / City OBC",
@@ -647,7 +647,7 @@ def communities_add_province(request):
         "form": form,
         "recent_communities": [],
         "recent_coverages": recent_coverages,
-        "location_data": build_location_data(include_barangays=False),
+        "location_data": get_location_data(include_barangays=False),
         "show_barangay_field": False,
         "page_title": "Add Provincial OBC",
         "breadcrumb_label": "Add Provincial OBC",
@@ -2389,7 +2389,7 @@ def communities_edit(request, community_id):
         "breadcrumb_label": "Edit Barangay OBC",
         "page_subtitle": "Update barangay-level community information.",
         "form_heading": "Barangay OBC Form",
-        "location_data": build_location_data(),
+        "location_data": get_location_data(),
         "show_barangay_field": True,
         "recent_communities": recent_communities,
     }
@@ -2538,7 +2538,7 @@ def communities_edit_municipal(request, coverage_id):
         "breadcrumb_label": "Edit Municipal OBC",
         "page_subtitle": "Update municipality-level Bangsamoro coverage data.",
         "form_heading": "Municipal OBC Form",
-        "location_data": build_location_data(include_barangays=False),
+        "location_data": get_location_data(include_barangays=False),
         "show_barangay_field": False,
         "recent_coverages": recent_coverages,
     }
@@ -2609,7 +2609,7 @@ def communities_edit_provincial(request, coverage_id):
         "breadcrumb_label": "Edit Provincial OBC",
         "page_subtitle": "Update province-level Bangsamoro coverage data.",
         "form_heading": "Provincial OBC Form",
-        "location_data": build_location_data(include_barangays=False),
+        "location_data": get_location_data(include_barangays=False),
         "show_barangay_field": False,
         "recent_coverages": recent_coverages,
     }
@@ -19,7 +19,7 @@ from django.views.decorators.http import require_POST
 from communities.models import OBCCommunity
 
 from ..models import Barangay, Municipality, Province, Region, StaffProfile
-from ..services.locations import build_location_data
+from ..services.locations import get_location_data
 from common.forms import ProvinceForm
 from common.services.geodata import serialize_layers_for_map
 from mana.forms import (
@@ -1097,7 +1097,7 @@ def mana_assessment_edit(request, assessment_id):
         {
             "assessment": assessment,
             "form": form,
-            "location_data": build_location_data(include_barangays=True),
+            "location_data": get_location_data(include_barangays=False),
             "community_data": community_data,
         },
     )
@@ -1724,7 +1724,7 @@ def mana_regional_overview(request):
         "workshop_forms": workshop_forms,
         "active_workshop_tab": active_workshop_tab,
         "regional_setup_form": setup_form,
-        "location_data": build_location_data(include_barangays=False),
+        "location_data": get_location_data(include_barangays=False),
     }
     return render(request, "mana/mana_regional_overview.html", context)
 
@@ -3308,7 +3308,7 @@ def mana_geographic_data(request):
         "visualizations": visualizations,
         "communities": communities_qs,
         "stats": stats,
-        "location_data": build_location_data(),
+        "location_data": get_location_data(),
         "current_region": str(region_id or ""),
         "current_province": str(province_id or ""),
         "current_municipality": str(municipality_id or ""),
@@ -5,11 +5,13 @@ import re
 import warnings
 from collections import defaultdict
 from datetime import date, datetime, time, timedelta, timezone as datetime_timezone
+from functools import wraps
 
 from django import forms
 from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
+from django.core.cache import cache
 from django.core.exceptions import PermissionDenied
 from django.db import OperationalError, transaction
 from common.decorators.rbac import require_feature_access
@@ -31,7 +33,6 @@ from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse
 from django.utils import formats, timezone
 from django.utils.http import url_has_allowed_host_and_scheme
-from django.views.decorators.cache import cache_page
 from django.views.decorators.http import require_POST
 
 from common.constants import (
@@ -76,7 +77,13 @@ from common.services.staff import (
     ensure_membership,
     ensure_staff_profiles_for_users,
 )
-from common.services.calendar import CALENDAR_CACHE_TTL, build_calendar_payload
+from common.services.cache_tags import has_pending_invalidation, record_cache_access
+from common.services.calendar import (
+    CALENDAR_CACHE_TTL,
+    build_calendar_payload,
+    calendar_cache_key,
+    calendar_cache_tags,
+)
 from common.security_logging import log_unauthorized_access
 from monitoring.models import (
     MonitoringEntry,
@@ -531,6 +538,39 @@ def _parse_module_filters(request):
     return valid or None
 
 
+def _cache_calendar_response(view_func):
+    """Cache a calendar feed response under tag-versioned keys.
+
+    Entries are scoped by module filter, user and requested date window, and
+    expire together with the payloads of the modules they cover instead of
+    relying on a global cache flush.
+    """
+
+    namespace = f"calendar:response:{view_func.__name__}"
+
+    @wraps(view_func)
+    def _wrapped(request, *args, **kwargs):
+        modules_filter = _parse_module_filters(request)
+        if has_pending_invalidation(calendar_cache_tags(modules_filter)):
+            return view_func(request, *args, **kwargs)
+
+        cache_key = calendar_cache_key(
+            namespace,
+            modules_filter,
+            user_id=request.user.pk,
+            window=(request.GET.get("start"), request.GET.get("end")),
+        )
+        response = cache.get(cache_key)
+        record_cache_access(namespace, hit=response is not None)
+        if response is None:
+            response = view_func(request, *args, **kwargs)
+            if response.status_code == 200:
+                cache.set(cache_key, response, CALENDAR_CACHE_TTL)
+        return response
+
+    return _wrapped
+
+
 def _parse_iso_datetime(value):
     """Convert ISO format string to aware datetime in local timezone."""
 
@@ -847,12 +887,20 @@ def oobc_calendar_advanced_modern(request):
 
 
 @login_required
-@cache_page(CALENDAR_CACHE_TTL)
+@_cache_calendar_response
 def oobc_calendar_feed_json(request):
-    """Return calendar events as JSON for integrations."""
+    """Return calendar events as JSON for integrations.
+
+    FullCalendar's ``start``/``end`` parameters limit the payload to the
+    visible range; without them every entry is returned.
+    """
 
     modules_filter = _parse_module_filters(request)
-    payload = build_calendar_payload(filter_modules=modules_filter)
+    payload = build_calendar_payload(
+        filter_modules=modules_filter,
+        start=request.GET.get("start"),
+        end=request.GET.get("end"),
+    )
 
     follow_up_export = [
         {
@@ -896,12 +944,16 @@ def oobc_calendar_feed_json(request):
 
 
 @login_required
-@cache_page(CALENDAR_CACHE_TTL)
+@_cache_calendar_response
 def oobc_calendar_feed_ics(request):
-    """Provide an ICS feed of calendar events."""
+    """Provide an ICS feed of calendar events, optionally within start/end."""
 
     modules_filter = _parse_module_filters(request)
-    payload = build_calendar_payload(filter_modules=modules_filter)
+    payload = build_calendar_payload(
+        filter_modules=modules_filter,
+        start=request.GET.get("start"),
+        end=request.GET.get("end"),
+    )
 
     def ics_escape(value: str) -> str:
         return (
@@ -94,16 +94,9 @@ def search_autocomplete(request):
         if len(query) < 3:
             return JsonResponse({'suggestions': []})
 
-        # Get popular queries that match
+        # Popular queries starting with the typed prefix
         analytics = SearchAnalytics()
-        popular = analytics.get_popular_queries(limit=50)
-
-        # Filter by query prefix
-        suggestions = [
-            p['query']
-            for p in popular
-            if query.lower() in p['query'].lower()
-        ][:10]
+        suggestions = analytics.autocomplete(query, limit=10)
 
         return JsonResponse({'suggestions': suggestions})
 
@@ -50,46 +50,43 @@ def invalidate_calendar_cache(user_id):
         cache.set(version_key, 1, None)  # Never expire
 
 
+def _work_item_tree_tag(work_item_id):
+    """Return the cache version tag for a work item's tree-children fragment."""
+    return f"work_item_tree:{work_item_id}"
+
+
+def work_item_tree_access_profile(user):
+    """
+    Return the access profile a cached tree fragment is shared under.
+
+    The tree-children fragment is rendered without any per-user content, so
+    every viewer with the same account type and superuser flag can share one
+    cached copy. Anything user-specific that is later added to the fragment
+    must be reflected here.
+    """
+    user_type = getattr(user, 'user_type', '') or ''
+    return f"{'su' if user.is_superuser else 'std'}:{user_type}"
+
+
 def invalidate_work_item_tree_cache(work_item):
     """
     Invalidate tree expansion cache for a work item and its ancestors.
 
-    When a work item is created, updated, or deleted, we need to invalidate:
-    1. Cache for the work item's parent (if it exists)
-    2. Cache for all ancestors up the tree
-    3. Cache for the work item itself (if it has children)
-    4. Cache for all users who might have viewed it
-
-    This ensures that the tree view shows up-to-date data after modifications.
+    Cached fragments are keyed by per-node version counters instead of by
+    viewer, so an edit bumps the counters of the work item and each ancestor
+    (one ``get_ancestors`` query) and costs O(depth) cache operations
+    regardless of how many users exist.
 
     Args:
         work_item: WorkItem instance that was modified
     """
-    from django.core.cache import cache
-    from django.contrib.auth import get_user_model
-
-    User = get_user_model()
-
-    # Get all users (for cache key invalidation)
-    # In production, consider storing active viewers in cache instead
-    user_ids = User.objects.values_list('id', flat=True)
+    from common.services.cache_tags import invalidate_tags
 
-    # Invalidate cache for the work item itself (if it has children)
-    for user_id in user_ids:
-        cache_key = f"work_item_children:{work_item.id}:{user_id}"
-        cache.delete(cache_key)
+    node_ids = [work_item.pk]
+    if work_item.parent_id:
+        node_ids.extend(work_item.get_ancestors().values_list('pk', flat=True))
 
-    # Invalidate cache for parent and all ancestors
-    if work_item.parent:
-        for user_id in user_ids:
-            cache_key = f"work_item_children:{work_item.parent.id}:{user_id}"
-            cache.delete(cache_key)
-
-        # Recursively invalidate ancestors
-        for ancestor in work_item.get_ancestors():
-            for user_id in user_ids:
-                cache_key = f"work_item_children:{ancestor.id}:{user_id}"
-                cache.delete(cache_key)
+    invalidate_tags(_work_item_tree_tag(node_id) for node_id in node_ids)
 
 
 def get_work_item_permissions(user, work_item):
@@ -680,8 +677,8 @@ def work_item_delete(request, pk):
         # Invalidate tree cache BEFORE deletion (while parent still exists)
         invalidate_work_item_tree_cache(work_item)
 
-        # Cascade delete (MPTT handles this automatically)
-        work_item.delete()
+        # Bulk subtree delete (single range query, batched SQL, one rollup)
+        work_item.delete_subtree()
 
         # CRITICAL: Invalidate calendar cache to prevent stale data
         invalidate_calendar_cache(request.user.id)
@@ -747,8 +744,8 @@ def work_item_delete(request, pk):
             # Invalidate tree cache BEFORE deletion
             invalidate_work_item_tree_cache(work_item)
 
-            # Delete the work item
-            work_item.delete()
+            # Delete the work item and any remaining descendants
+            work_item.delete_subtree()
 
             # Invalidate calendar cache
             invalidate_calendar_cache(request.user.id)
@@ -782,13 +779,21 @@ def work_item_tree_partial(request, pk):
     - Caching with 5-minute TTL for frequently accessed children
     """
     from django.core.cache import cache
-    import hashlib
-
-    # Generate cache key based on work item ID and user (for permission-aware caching)
-    cache_key = f"work_item_children:{pk}:{request.user.id}"
+    from common.services.cache_tags import build_versioned_key, has_pending_invalidation
+
+    # Versioned per node and shared by every viewer with the same access profile
+    cache_tags = [_work_item_tree_tag(pk)]
+    cache_key = build_versioned_key(
+        "work_item_children",
+        cache_tags,
+        pk,
+        work_item_tree_access_profile(request.user),
+    )
+    # Uncommitted edits in this transaction bypass the shared cache
+    use_cache = not has_pending_invalidation(cache_tags)
 
     # Try to get from cache
-    cached_html = cache.get(cache_key)
+    cached_html = cache.get(cache_key) if use_cache else None
     if cached_html:
         return HttpResponse(cached_html)
 
@@ -823,8 +828,9 @@ def work_item_tree_partial(request, pk):
     response = render(request, 'work_items/_work_item_tree_nodes.html', context)
 
     # Cache for 5 minutes (300 seconds)
-    # Invalidated on work item updates via signal or explicit cache clear
-    cache.set(cache_key, response.content.decode('utf-8'), 300)
+    # Invalidated by bumping the node version in invalidate_work_item_tree_cache
+    if use_cache:
+        cache.set(cache_key, response.content.decode('utf-8'), 300)
 
     return response
 
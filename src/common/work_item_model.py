@@ -11,17 +11,207 @@ Architecture: MPTT + JSON Fields + Generic Foreign Keys
 Documentation: docs/refactor/UNIFIED_WORK_HIERARCHY_EVALUATION.md
 """
 
+import threading
 import uuid
+from contextlib import contextmanager
 from decimal import Decimal
+from functools import partial
 
+from auditlog import get_logentry_model
+from auditlog.context import disable_auditlog
+from auditlog.diff import model_instance_diff
+from auditlog.registry import auditlog
 from django.conf import settings
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
 from django.core.validators import MaxValueValidator, MinValueValidator
-from django.db import models
+from django.db import models, transaction
+from django.db.models.deletion import Collector
+from django.dispatch import Signal
 from django.utils import timezone
+from django.utils.encoding import smart_str
+from mptt.managers import TreeManager
 from mptt.models import MPTTModel, TreeForeignKey
+from mptt.querysets import TreeQuerySet
+
+
+# ========== BULK SIDE-EFFECT CONTROL ==========
+
+_side_effects = threading.local()
+
+# Sent once, after commit, for every subtree removed by ``delete_subtrees``.
+# Receivers get ``root_id``, ``parent_id``, ``tree_id`` and ``deleted_ids``.
+work_item_subtree_deleted = Signal()
+
+
+@contextmanager
+def defer_work_item_side_effects():
+    """
+    Suppress per-row WorkItem signal side effects inside the block.
+
+    Receivers that do per-instance work (calendar cache, PPA sync, progress
+    rollup) check ``work_item_side_effects_deferred()`` and skip; the bulk
+    operation is responsible for sending one aggregated notification instead.
+    """
+    depth = getattr(_side_effects, "depth", 0)
+    _side_effects.depth = depth + 1
+    try:
+        yield
+    finally:
+        _side_effects.depth = depth
+
+
+def work_item_side_effects_deferred():
+    """Return True while per-row WorkItem side effects are suppressed."""
+    return getattr(_side_effects, "depth", 0) > 0
+
+
+# LogEntry fields that auditlog fills from the request (``set_actor``) or
+# the correlation id rather than from the logged instance.
+_AUDIT_REQUEST_FIELDS = ("actor_id", "actor_email", "remote_addr", "remote_port", "cid")
+
+
+def _bulk_audit_deletions(model, instances, using):
+    """
+    Record auditlog DELETE entries for ``instances`` with two INSERTs.
+
+    The first entry is written with ``LogEntry.objects.log_create`` so the
+    ``AuditlogMiddleware`` receivers stamp the actor and remote address; the
+    others copy those fields and are inserted with one ``bulk_create``.
+    ``serialized_data`` is not captured.
+    """
+    if not instances or not auditlog.contains(model):
+        return
+
+    LogEntry = get_logentry_model()
+
+    def changes(instance):
+        return model_instance_diff(
+            instance, None, use_json_for_changes=settings.AUDITLOG_STORE_JSON_CHANGES
+        )
+
+    first = LogEntry.objects.db_manager(using).log_create(
+        instances[0],
+        force_log=True,
+        action=LogEntry.Action.DELETE,
+        changes=changes(instances[0]),
+        serialized_data=None,
+    )
+    request_fields = {name: getattr(first, name) for name in _AUDIT_REQUEST_FIELDS}
+    content_type = ContentType.objects.db_manager(using).get_for_model(model)
+
+    entries = [
+        LogEntry(
+            content_type=content_type,
+            object_pk=str(instance.pk),
+            object_repr=smart_str(instance),
+            action=LogEntry.Action.DELETE,
+            changes=changes(instance),
+            **request_fields,
+        )
+        for instance in instances[1:]
+    ]
+    LogEntry.objects.using(using).bulk_create(entries)
+
+
+def _close_subtree_gap(model, using, root):
+    """
+    Shift the ``lft``/``rght`` values that follow a deleted subtree.
+
+    django-mptt has no public call for this: ``partial_rebuild`` rewrites
+    every node of the tree and skips trees whose root was deleted. This
+    wrapper is the only use of ``TreeManager._close_gap``, checked against
+    django-mptt 0.16-0.18.
+    """
+    model._tree_manager.db_manager(using)._close_gap(
+        root["rght"] - root["lft"] + 1, root["rght"], root["tree_id"]
+    )
+
+
+class WorkItemQuerySet(TreeQuerySet):
+    """QuerySet adding bulk, tree-aware operations for WorkItem."""
+
+    def delete_subtrees(self, batch_size=500):
+        """
+        Delete every work item in this queryset together with its descendants.
+
+        Each subtree is collected with a single ``tree_id``/``lft``/``rght``
+        range query and deleted leaves-first in batches, so the ORM never has
+        to walk the parent cascade level by level. The MPTT gap is closed once
+        per subtree and per-row side effects are replaced by a single
+        ``work_item_subtree_deleted`` notification after commit.
+
+        Returns:
+            int: Number of WorkItem rows deleted.
+        """
+        model = self.model
+        roots = list(
+            self.order_by("tree_id", "lft").values(
+                "pk", "parent_id", "tree_id", "lft", "rght"
+            )
+        )
+
+        # Drop nodes that live inside another selected subtree.
+        top_level = []
+        for root in roots:
+            enclosing = top_level[-1] if top_level else None
+            if (
+                enclosing
+                and enclosing["tree_id"] == root["tree_id"]
+                and enclosing["lft"] < root["lft"]
+                and root["rght"] < enclosing["rght"]
+            ):
+                continue
+            top_level.append(root)
+
+        deleted_total = 0
+        with transaction.atomic(using=self.db), defer_work_item_side_effects():
+            # Close gaps right-to-left so earlier offsets stay valid.
+            for root in reversed(top_level):
+                subtree_ids = list(
+                    model._base_manager.using(self.db)
+                    .filter(
+                        tree_id=root["tree_id"],
+                        lft__gte=root["lft"],
+                        rght__lte=root["rght"],
+                    )
+                    .order_by("-level")
+                    .values_list("pk", flat=True)
+                )
+
+                for start in range(0, len(subtree_ids), batch_size):
+                    batch = list(
+                        model._base_manager.using(self.db).filter(
+                            pk__in=subtree_ids[start : start + batch_size]
+                        )
+                    )
+                    _bulk_audit_deletions(model, batch, self.db)
+                    with disable_auditlog():
+                        collector = Collector(using=self.db)
+                        collector.collect(batch)
+                        _, per_model = collector.delete()
+                    deleted_total += per_model.get(model._meta.label, 0)
+
+                _close_subtree_gap(model, self.db, root)
+
+                transaction.on_commit(
+                    partial(
+                        work_item_subtree_deleted.send,
+                        sender=model,
+                        root_id=root["pk"],
+                        parent_id=root["parent_id"],
+                        tree_id=root["tree_id"],
+                        deleted_ids=subtree_ids,
+                    ),
+                    using=self.db,
+                )
+
+        return deleted_total
+
+
+class WorkItemManager(TreeManager.from_queryset(WorkItemQuerySet)):
+    """Tree manager exposing WorkItemQuerySet bulk operations."""
 
 
 class WorkItem(MPTTModel):
@@ -325,6 +515,8 @@ class WorkItem(MPTTModel):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = WorkItemManager()
+
     # ========== MPTT CONFIGURATION ==========
     class MPTTMeta:
         order_insertion_by = ["priority", "title"]
@@ -549,6 +741,22 @@ class WorkItem(MPTTModel):
         for sibling in siblings:
             self.add_related_link(sibling)
 
+    # ========== BULK DELETION ==========
+
+    def delete_subtree(self, batch_size=500):
+        """
+        Delete this work item and all descendants in batched SQL.
+
+        Faster alternative to ``delete()`` for large trees; see
+        ``WorkItemQuerySet.delete_subtrees``.
+
+        Returns:
+            int: Number of WorkItem rows deleted.
+        """
+        return type(self).objects.filter(pk=self.pk).delete_subtrees(
+            batch_size=batch_size
+        )
+
     # ========== PROGRESS CALCULATION ==========
 
     def calculate_progress_from_children(self):
@@ -570,16 +778,18 @@ class WorkItem(MPTTModel):
         return calculated_progress
 
     def update_progress(self):
-        """Update progress and propagate to ancestors."""
-        if self.auto_calculate_progress:
-            new_progress = self.calculate_progress_from_children()
-            if new_progress != self.progress:
-                self.progress = new_progress
-                self.save(update_fields=["progress", "updated_at"])
-
-        # Propagate to parent
-        if self.parent and self.parent.auto_calculate_progress:
-            self.parent.update_progress()
+        """
+        Update progress and propagate to ancestors.
+
+        Recomputes this item and every ancestor with one set-based rollup
+        (see ``common.services.work_item_progress``) instead of recursing up
+        the parent chain.
+        """
+        from common.services.work_item_progress import rollup_ancestor_progress
+
+        result = rollup_ancestor_progress([self], include_self=True)
+        if self.pk in result.updated_ids:
+            self.refresh_from_db(fields=["progress", "updated_at"])
 
     # ========== CALENDAR INTEGRATION ==========
 
@@ -1,8 +1,9 @@
 """
-AI-powered community similarity matching using vector embeddings.
+AI-powered community similarity matching.
 
-Uses Google Gemini embeddings to find similar communities based on
-demographic profiles, infrastructure, and cultural characteristics.
+Similarity is scored locally from a vectorized community feature matrix
+(demographic profiles, infrastructure, and cultural characteristics); Google
+Gemini writes rationales, best-practice and peer-learning suggestions.
 """
 
 import json
@@ -11,13 +12,14 @@ from typing import Dict, List, Optional
 
 import google.generativeai as genai
 from django.conf import settings
-from django.db.models import Q
+
+from communities.utils.similarity import get_feature_matrix
 
 logger = logging.getLogger(__name__)
 
 
 class CommunityMatcher:
-    """Find similar communities using vector similarity and AI analysis."""
+    """Find similar communities using vectorized scoring and AI analysis."""
 
     def __init__(self):
         """Initialize Gemini AI service."""
@@ -36,15 +38,22 @@ class CommunityMatcher:
         self,
         community: 'OBCCommunity',
         limit: int = 5,
-        same_province_only: bool = False
+        same_province_only: bool = False,
+        explain: bool = False,
     ) -> List[dict]:
         """
         Find communities with similar characteristics.
 
+        Every community is scored at once by the local feature matrix (see
+        ``communities.utils.similarity``); Gemini is only asked, when
+        ``explain`` is set, to write the rationale for the final matches in
+        one prompt.
+
         Args:
             community: OBCCommunity model instance
             limit: Maximum number of similar communities to return
             same_province_only: If True, only match within same province
+            explain: If True, ask Gemini for a rationale per match
 
         Returns:
             List of:
@@ -59,61 +68,33 @@ class CommunityMatcher:
         try:
             from communities.models import OBCCommunity
 
-            # Get candidate communities
-            candidates = OBCCommunity.objects.exclude(id=community.id)
-
-            if same_province_only and hasattr(community, 'province'):
-                candidates = candidates.filter(
-                    barangay__municipality__province=community.province
-                )
-
-            # Limit candidates for performance
-            candidates = candidates[:50]
-
-            if not candidates.exists():
+            matches = get_feature_matrix().rank(
+                community,
+                limit=limit,
+                min_score=0.5,  # Only include reasonably similar
+                same_province_only=same_province_only,
+            )
+            if not matches:
                 return []
 
-            # Build profile for target community
-            target_profile = self._build_comparison_profile(community)
+            communities = OBCCommunity.objects.select_related(
+                'barangay__municipality__province'
+            ).in_bulk([match['community_id'] for match in matches])
 
-            # Build profiles for candidates
-            candidate_profiles = []
-            for candidate in candidates:
-                try:
-                    profile = self._build_comparison_profile(candidate)
-                    candidate_profiles.append({
-                        'community': candidate,
-                        'profile': profile
-                    })
-                except Exception as e:
-                    logger.warning(f"Error building profile for {candidate.id}: {str(e)}")
-                    continue
-
-            # Use AI to analyze similarities
             similar_communities = []
-
-            for candidate_data in candidate_profiles[:limit * 2]:  # Process 2x limit for filtering
-                try:
-                    similarity = self._calculate_similarity(
-                        target_profile,
-                        candidate_data['profile']
-                    )
-
-                    if similarity['score'] > 0.5:  # Only include reasonably similar
-                        similar_communities.append({
-                            'community': candidate_data['community'],
-                            'similarity_score': similarity['score'],
-                            'matching_features': similarity['matching_features'],
-                            'differences': similarity['differences'],
-                            'rationale': similarity['rationale']
-                        })
-                except Exception as e:
-                    logger.warning(f"Error calculating similarity: {str(e)}")
+            for match in matches:
+                candidate = communities.get(match.pop('community_id'))
+                if candidate is None:
                     continue
+                similar_communities.append({
+                    'community': candidate,
+                    **match,
+                    'rationale': self._describe_match(match),
+                })
 
-            # Sort by similarity score and return top matches
-            similar_communities.sort(key=lambda x: x['similarity_score'], reverse=True)
-            return similar_communities[:limit]
+            if explain:
+                self._explain_matches(community, similar_communities)
+            return similar_communities
 
         except Exception as e:
             logger.error(f"Find similar communities error: {str(e)}")
@@ -323,90 +304,58 @@ Respond in JSON format:
             'proximity_to_barmm': community.proximity_to_barmm or 'unknown',
         }
 
-    def _calculate_similarity(self, profile1: dict, profile2: dict) -> dict:
-        """
-        Use AI to calculate similarity between two community profiles.
-
-        Returns similarity score, matching features, and differences.
-        """
+    def _describe_match(self, match: dict) -> str:
+        """Summarise a locally scored match in one sentence."""
+        shared = [
+            feature.replace('_', ' ') for feature in match['matching_features']
+        ]
+        if not shared:
+            return 'Partially similar community profile'
+        return f"Similar {', '.join(shared[:4])}"
+
+    def _explain_matches(
+        self, community: 'OBCCommunity', matches: List[dict]
+    ) -> None:
+        """Replace match rationales with a single batched Gemini explanation."""
         try:
+            target = self._build_comparison_profile(community)
+            lines = []
+            for index, match in enumerate(matches, 1):
+                profile = self._build_comparison_profile(match['community'])
+                lines.append(
+                    f"{index}. {profile['name']} ({profile['province']}): "
+                    f"score {match['similarity_score']:.2f}, "
+                    f"shared {', '.join(match['matching_features']) or 'none'}, "
+                    f"different {', '.join(match['differences']) or 'none'}"
+                )
+
             prompt = f"""
 You are a community similarity analyst.
 
-Compare these two Bangsamoro community profiles:
-
-Community 1: {profile1['name']}
-- Province: {profile1['province']}
-- Population: {profile1['population']}
-- Households: {profile1['households']}
-- Ethnolinguistic: {profile1['ethnolinguistic_group']}
-- Livelihoods: {profile1['primary_livelihoods']}
-- Poverty: {profile1['poverty_incidence']}
-- Water Access: {profile1['access_water']}
-- Electricity: {profile1['access_electricity']}
-- Healthcare: {profile1['access_healthcare']}
-- Education: {profile1['access_education']}
-
-Community 2: {profile2['name']}
-- Province: {profile2['province']}
-- Population: {profile2['population']}
-- Households: {profile2['households']}
-- Ethnolinguistic: {profile2['ethnolinguistic_group']}
-- Livelihoods: {profile2['primary_livelihoods']}
-- Poverty: {profile2['poverty_incidence']}
-- Water Access: {profile2['access_water']}
-- Electricity: {profile2['access_electricity']}
-- Healthcare: {profile2['access_healthcare']}
-- Education: {profile2['access_education']}
-
-Calculate similarity (0.0 to 1.0) based on:
-1. Population size similarity (±50% is close)
-2. Same ethnolinguistic group: +0.2
-3. Similar livelihoods: +0.15
-4. Similar infrastructure access levels: +0.15 per category
-5. Same province: +0.1
-6. Similar poverty levels: +0.1
+Target community: {target['name']} ({target['province']})
+- Population: {target['population']}
+- Ethnolinguistic: {target['ethnolinguistic_group']}
+- Livelihoods: {target['primary_livelihoods']}
+
+These communities were ranked as most similar to it:
+{chr(10).join(lines)}
+
+For each numbered community, write one sentence explaining the similarity.
 
 Respond in JSON format:
 {{
-    "score": 0.75,
-    "matching_features": ["population_size", "ethnolinguistic_group", "livelihoods"],
-    "differences": ["access_to_electricity", "poverty_level"],
-    "rationale": "Brief explanation of similarity"
+    "rationales": ["Explanation for community 1", "Explanation for community 2"]
 }}
 """
 
             response = self.model.generate_content(prompt)
-            result = json.loads(response.text.strip())
-
-            return {
-                'score': result.get('score', 0.5),
-                'matching_features': result.get('matching_features', []),
-                'differences': result.get('differences', []),
-                'rationale': result.get('rationale', 'Similar communities')
-            }
+            rationales = json.loads(response.text.strip()).get('rationales', [])
+            for match, rationale in zip(matches, rationales):
+                if rationale:
+                    match['rationale'] = rationale
 
         except Exception as e:
-            logger.error(f"Similarity calculation error: {str(e)}")
-            # Fallback: simple population-based similarity
-            pop1 = profile1.get('population', 0)
-            pop2 = profile2.get('population', 0)
-
-            if pop1 > 0 and pop2 > 0:
-                pop_ratio = min(pop1, pop2) / max(pop1, pop2)
-                return {
-                    'score': pop_ratio * 0.5,  # Conservative estimate
-                    'matching_features': ['population_size'],
-                    'differences': [],
-                    'rationale': 'Similar population size'
-                }
-            else:
-                return {
-                    'score': 0.3,
-                    'matching_features': [],
-                    'differences': [],
-                    'rationale': 'Limited data for comparison'
-                }
+            logger.warning(f"Similarity rationale error: {str(e)}")
 
     def _format_similar_communities(self, similar: List[dict]) -> str:
         """Format similar communities list for AI prompt."""
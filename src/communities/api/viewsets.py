@@ -4,6 +4,8 @@ from rest_framework import filters, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
+from common.mixins.api_mixins import DeltaSyncMixin
+
 from ..models import (
     CommunityInfrastructure,
     CommunityLivelihood,
@@ -76,7 +78,7 @@ class MunicipalityCoverageViewSet(viewsets.ModelViewSet):
         serializer.save(updated_by=user)
 
 
-class OBCCommunityViewSet(viewsets.ModelViewSet):
+class OBCCommunityViewSet(DeltaSyncMixin, viewsets.ModelViewSet):
     """
     ViewSet for OBC Community model.
     Provides CRUD operations for OBC communities.
@@ -531,7 +533,7 @@ class StakeholderViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
-class StakeholderEngagementViewSet(viewsets.ModelViewSet):
+class StakeholderEngagementViewSet(DeltaSyncMixin, viewsets.ModelViewSet):
     """
     ViewSet for Stakeholder Engagement model.
     """
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:12
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0047_calendar_window_indexes'),
+        ('communities', '0031_remove_municipalitycoverage_communities_munici_org_idx_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='communityevent',
+            index=models.Index(fields=['start_date', 'end_date'], name='communities_start_d_f3f23c_idx'),
+        ),
+    ]
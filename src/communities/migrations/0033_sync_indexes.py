@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:38
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0047_calendar_window_indexes'),
+        ('communities', '0032_calendar_window_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='obccommunity',
+            index=models.Index(fields=['updated_at', 'id'], name='obc_community_sync_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='stakeholderengagement',
+            index=models.Index(fields=['updated_at', 'id'], name='comm_engagement_sync_idx'),
+        ),
+    ]
@@ -804,6 +804,9 @@ class OBCCommunity(CommunityProfileBase):
                 name="unique_obccommunity_per_barangay",
             )
         ]
+        indexes = [
+            models.Index(fields=["updated_at", "id"], name="obc_community_sync_idx"),
+        ]
 
     def __str__(self):
         location = (
@@ -830,6 +833,15 @@ class OBCCommunity(CommunityProfileBase):
 
     def save(self, *args, **kwargs):
         """Keep derived legacy fields in sync with expanded profile data."""
+        self.sync_legacy_fields()
+        super().save(*args, **kwargs)
+
+    def sync_legacy_fields(self):
+        """Derive ``community_names`` and ``languages_spoken`` from legacy fields.
+
+        Called by ``save()``; bulk writers call it directly because
+        ``bulk_create``/``bulk_update`` bypass ``save()``.
+        """
         # Ensure community_names always includes the legacy name as the first entry
         if self.name:
             existing_names = [
@@ -866,8 +878,6 @@ class OBCCommunity(CommunityProfileBase):
                     normalised.append(lang)
             self.languages_spoken = ", ".join(normalised)
 
-        super().save(*args, **kwargs)
-
     @property
     def full_location(self):
         """Return the full administrative location path."""
@@ -1431,6 +1441,9 @@ class StakeholderEngagement(models.Model):
         ordering = ["-date", "stakeholder__full_name"]
         verbose_name = "Stakeholder Engagement"
         verbose_name_plural = "Stakeholder Engagements"
+        indexes = [
+            models.Index(fields=["updated_at", "id"], name="comm_engagement_sync_idx"),
+        ]
 
     def __str__(self):
         return f"{self.title} - {self.stakeholder.display_name} ({self.date})"
@@ -1567,18 +1580,23 @@ class MunicipalityCoverage(CommunityProfileBase):
             "auto_sync_enabled": self.auto_sync,
         }
 
-    def refresh_from_communities(self):
-        """Aggregate community data for this municipality when auto-sync is enabled."""
+    def refresh_from_communities(self, sync_province=True):
+        """Aggregate community data for this municipality when auto-sync is enabled.
+
+        Pass ``sync_province=False`` when the caller refreshes the province
+        itself, once for several municipalities.
+        """
         if self.auto_sync:
             communities = OBCCommunity.objects.filter(
                 barangay__municipality=self.municipality
             )
 
             aggregates = communities.aggregate(
+                community_count=models.Count("pk"),
                 **{
                     f"{field}__sum": models.Sum(field)
                     for field in AGGREGATED_NUMERIC_FIELDS
-                }
+                },
             )
             key_barangays = (
                 communities.values_list("barangay__name", flat=True)
@@ -1587,7 +1605,7 @@ class MunicipalityCoverage(CommunityProfileBase):
             )
 
             update_kwargs = {
-                "total_obc_communities": communities.count(),
+                "total_obc_communities": aggregates["community_count"],
                 "key_barangays": ", ".join(key_barangays),
             }
 
@@ -1605,19 +1623,19 @@ class MunicipalityCoverage(CommunityProfileBase):
                 setattr(self, field, value)
 
         province = self.province
-        if province:
+        if province and sync_province:
             ProvinceCoverage.sync_for_province(province)
 
     @classmethod
-    def sync_for_municipality(cls, municipality):
+    def sync_for_municipality(cls, municipality, sync_province=True):
         """Create or update coverage using barangay data."""
         existing = cls.all_objects.filter(municipality=municipality).first()
         if existing and existing.is_deleted:
             # Leave archived coverages untouched until explicitly restored.
             return existing
 
-        coverage, _ = cls.objects.get_or_create(municipality=municipality)
-        coverage.refresh_from_communities()
+        coverage = existing or cls.objects.get_or_create(municipality=municipality)[0]
+        coverage.refresh_from_communities(sync_province=sync_province)
         return coverage
 
     def soft_delete(self, *, user=None):
@@ -1803,17 +1821,12 @@ class ProvinceCoverage(CommunityProfileBase):
         )
 
         aggregates = municipal_coverages.aggregate(
+            municipality_count=models.Count("pk"),
+            community_total=models.Sum("total_obc_communities"),
             **{
                 f"{field}__sum": models.Sum(field)
                 for field in AGGREGATED_NUMERIC_FIELDS
-            }
-        )
-
-        total_barangay_communities = (
-            municipal_coverages.aggregate(total=models.Sum("total_obc_communities"))[
-                "total"
-            ]
-            or 0
+            },
         )
 
         key_municipalities = (
@@ -1823,8 +1836,8 @@ class ProvinceCoverage(CommunityProfileBase):
         )
 
         update_kwargs = {
-            "total_municipalities": municipal_coverages.count(),
-            "total_obc_communities": total_barangay_communities,
+            "total_municipalities": aggregates["municipality_count"],
+            "total_obc_communities": aggregates["community_total"] or 0,
             "key_municipalities": ", ".join(key_municipalities),
         }
 
@@ -1852,7 +1865,7 @@ class ProvinceCoverage(CommunityProfileBase):
         if existing and existing.is_deleted:
             return existing
 
-        coverage, _ = cls.objects.get_or_create(province=province)
+        coverage = existing or cls.objects.get_or_create(province=province)[0]
         coverage.refresh_from_municipalities()
         return coverage
 
@@ -2573,6 +2586,9 @@ class CommunityEvent(models.Model):
         ordering = ["-start_date"]
         verbose_name = "Community Event"
         verbose_name_plural = "Community Events"
+        indexes = [
+            models.Index(fields=["start_date", "end_date"]),
+        ]
 
     def __str__(self):
         return f"{self.title} - {self.community.name}"
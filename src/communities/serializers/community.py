@@ -2,6 +2,8 @@
 
 from rest_framework import serializers
 
+from common.serializers import SparseFieldsetMixin
+
 from ..models import CommunityInfrastructure, CommunityLivelihood, OBCCommunity
 from .base import COMMUNITY_PROFILE_SERIALIZER_FIELDS
 
@@ -70,7 +72,7 @@ class CommunityInfrastructureSerializer(serializers.ModelSerializer):
         ]
 
 
-class OBCCommunitySerializer(serializers.ModelSerializer):
+class OBCCommunitySerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Full serializer for OBC Community model."""
 
     region_name = serializers.CharField(
@@ -90,7 +92,6 @@ class OBCCommunitySerializer(serializers.ModelSerializer):
         model = OBCCommunity
         fields = [
             "id",
-            "community_reference",
             "community_names",
             "display_name",
             "region_name",
@@ -99,7 +100,6 @@ class OBCCommunitySerializer(serializers.ModelSerializer):
             "barangay",
             "barangay_name",
             "obc_id",
-            "community_type",
             "settlement_type",
             "unemployment_rate",
             "specific_location",
@@ -125,7 +125,7 @@ class OBCCommunitySerializer(serializers.ModelSerializer):
         ]
 
 
-class OBCCommunityListSerializer(serializers.ModelSerializer):
+class OBCCommunityListSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Lightweight serializer for community list views."""
 
     region_name = serializers.CharField(
@@ -145,7 +145,6 @@ class OBCCommunityListSerializer(serializers.ModelSerializer):
             "id",
             "display_name",
             "community_names",
-            "community_type",
             "settlement_type",
             "unemployment_rate",
             "population",
@@ -2,6 +2,8 @@
 
 from rest_framework import serializers
 
+from common.serializers import SparseFieldsetMixin
+
 from ..models import Stakeholder, StakeholderEngagement
 
 
@@ -122,7 +124,7 @@ class StakeholderListSerializer(serializers.ModelSerializer):
         ]
 
 
-class StakeholderEngagementSerializer(serializers.ModelSerializer):
+class StakeholderEngagementSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Serializer for stakeholder engagements."""
 
     stakeholder_name = serializers.CharField(
@@ -1,20 +1,24 @@
 """Signal handlers linking barangay communities and municipality coverage."""
 
 from django.apps import apps
+from django.db import DEFAULT_DB_ALIAS
 from django.db.models.signals import post_delete, post_save, pre_delete
 from django.dispatch import receiver
 
 from .models import MunicipalityCoverage, OBCCommunity, ProvinceCoverage
+from .utils.coverage_sync import schedule_coverage_sync
+from .utils.similarity import invalidate_community_features
 
 
 @receiver(post_save, sender=OBCCommunity)
 def sync_municipality_coverage_on_save(sender, instance, **kwargs):
-    """Create or update municipality coverage after a community is saved."""
+    """Schedule a municipality (and province) coverage sync after a save."""
 
-    municipality = instance.barangay.municipality
-    MunicipalityCoverage.sync_for_municipality(municipality)
-    if municipality and municipality.province:
-        ProvinceCoverage.sync_for_province(municipality.province)
+    schedule_coverage_sync(
+        instance.barangay.municipality_id,
+        changed_by=getattr(instance, "_history_user", None),
+        using=kwargs.get("using") or DEFAULT_DB_ALIAS,
+    )
 
 
 @receiver(pre_delete, sender=OBCCommunity)
@@ -30,12 +34,20 @@ def delete_community_history_on_delete(sender, instance, **kwargs):
 
 @receiver(post_delete, sender=OBCCommunity)
 def sync_municipality_coverage_on_delete(sender, instance, **kwargs):
-    """Keep municipality coverage in sync when a community is removed."""
+    """Schedule a coverage sync when a community is removed."""
 
-    municipality = instance.barangay.municipality
-    MunicipalityCoverage.sync_for_municipality(municipality)
-    if municipality and municipality.province:
-        ProvinceCoverage.sync_for_province(municipality.province)
+    schedule_coverage_sync(
+        instance.barangay.municipality_id,
+        changed_by=getattr(instance, "_history_user", None),
+        using=kwargs.get("using") or DEFAULT_DB_ALIAS,
+    )
+
+
+@receiver([post_save, post_delete], sender=OBCCommunity)
+def invalidate_similarity_features(sender, **kwargs):
+    """Mark the community similarity feature matrix as stale."""
+
+    invalidate_community_features()
 
 
 @receiver(post_delete, sender=MunicipalityCoverage)
@@ -0,0 +1,25 @@
+"""Celery tasks for the communities app."""
+
+import logging
+
+from celery import shared_task
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(bind=True, acks_late=True)
+def sync_community_coverage(self, targets):
+    """Recompute coverage for a batch of ``[municipality_id, user_id]`` targets."""
+
+    from communities.utils.coverage_sync import release_scheduled, sync_municipalities
+
+    changed_by = {municipality_id: user_id for municipality_id, user_id in targets}
+    # Release first so writes made while this runs schedule a fresh sync.
+    release_scheduled(changed_by)
+    stats = sync_municipalities(changed_by)
+    logger.info(
+        "Synced coverage for %s municipalities and %s provinces",
+        stats["municipalities_synced"],
+        stats["provinces_synced"],
+    )
+    return stats
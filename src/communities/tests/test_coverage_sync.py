@@ -0,0 +1,118 @@
+"""Tests for the coalesced coverage sync scheduler."""
+
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from common.tests.factories import create_barangay, create_municipality
+from communities.models import MunicipalityCoverage, OBCCommunity, ProvinceCoverage
+from communities.utils.coverage_sync import SCHEDULED_KEY_PREFIX, communities_synced
+from municipal_profiles.models import MunicipalOBCProfile
+from municipal_profiles.services import compute_aggregate_for_municipality
+
+
+pytestmark = pytest.mark.usefixtures("clear_cache")
+
+
+@pytest.fixture
+def commit_mode(settings):
+    settings.COMMUNITY_COVERAGE_SYNC_MODE = "commit"
+
+
+def _communities(municipality, count):
+    return [
+        OBCCommunity.objects.create(
+            barangay=create_barangay(municipality=municipality),
+            name=f"Sync Community {index}",
+            households=10,
+        )
+        for index in range(count)
+    ]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_writes_in_one_transaction_sync_each_municipality_once(commit_mode):
+    municipality = create_municipality()
+    communities = _communities(municipality, 5)
+    other = create_municipality(province=municipality.province)
+
+    sync_calls = []
+    communities_synced.connect(
+        lambda sender, municipalities, **kwargs: sync_calls.append(
+            sorted(m.pk for m in municipalities)
+        ),
+        weak=False,
+        dispatch_uid="test_coverage_sync_calls",
+    )
+    try:
+        with patch.object(
+            ProvinceCoverage, "sync_for_province", wraps=ProvinceCoverage.sync_for_province
+        ) as province_sync:
+            with transaction.atomic():
+                for community in communities * 10:
+                    community.households += 1
+                    community.save()
+                _communities(other, 1)
+                assert sync_calls == []
+    finally:
+        communities_synced.disconnect(dispatch_uid="test_coverage_sync_calls")
+
+    assert sync_calls == [sorted([municipality.pk, other.pk])]
+    assert province_sync.call_count == 1
+
+    coverage = MunicipalityCoverage.objects.get(municipality=municipality)
+    assert coverage.total_obc_communities == 5
+    assert coverage.households == 5 * 20
+    assert ProvinceCoverage.objects.get(province=municipality.province).total_obc_communities == 6
+    assert MunicipalOBCProfile.objects.filter(municipality__in=[municipality, other]).count() == 2
+
+
+@pytest.mark.django_db(transaction=True)
+def test_rolled_back_writes_schedule_nothing(commit_mode):
+    municipality = create_municipality()
+
+    with pytest.raises(RuntimeError):
+        with transaction.atomic():
+            _communities(municipality, 2)
+            raise RuntimeError("rollback")
+
+    assert not MunicipalityCoverage.objects.filter(municipality=municipality).exists()
+
+    _communities(municipality, 1)
+    assert MunicipalityCoverage.objects.get(municipality=municipality).total_obc_communities == 1
+
+
+@pytest.mark.django_db(transaction=True)
+def test_celery_mode_runs_the_delayed_task(settings):
+    settings.COMMUNITY_COVERAGE_SYNC_MODE = "celery"
+    municipality = create_municipality()
+
+    with patch("communities.tasks.sync_community_coverage.apply_async") as apply_async:
+        with transaction.atomic():
+            _communities(municipality, 3)
+        _communities(municipality, 1)
+
+    # The second commit found the municipality already scheduled.
+    apply_async.assert_called_once_with(args=[[[municipality.pk, None]]], countdown=5)
+    assert cache.get(f"{SCHEDULED_KEY_PREFIX}:{municipality.pk}") == 1
+
+    from communities.tasks import sync_community_coverage
+
+    sync_community_coverage.apply(args=[[[municipality.pk, None]]])
+    assert cache.get(f"{SCHEDULED_KEY_PREFIX}:{municipality.pk}") is None
+    assert MunicipalityCoverage.objects.get(municipality=municipality).total_obc_communities == 4
+
+
+@pytest.mark.django_db
+def test_profile_aggregate_is_two_queries():
+    municipality = create_municipality()
+    _communities(municipality, 3)
+
+    with CaptureQueriesContext(connection) as queries:
+        result = compute_aggregate_for_municipality(municipality)
+
+    assert len(queries) == 2
+    assert result.aggregated_metrics["metadata"]["community_count"] == 3
@@ -0,0 +1,131 @@
+"""Tests for the vectorized community similarity engine."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from common.tests.factories import create_barangay, create_municipality
+from communities.models import OBCCommunity
+from communities.utils.similarity import clear_feature_matrix, get_feature_matrix
+
+
+@pytest.fixture(autouse=True)
+def reset_feature_matrix(clear_cache):
+    clear_feature_matrix()
+    yield
+    clear_feature_matrix()
+
+
+def _community(municipality, name, **fields):
+    defaults = {
+        "estimated_obc_population": 1000,
+        "households": 200,
+        "primary_ethnolinguistic_group": "iranun",
+        "primary_livelihoods": "Fishing, farming",
+        "estimated_poverty_incidence": "high",
+        "access_electricity": "poor",
+    }
+    defaults.update(fields)
+    return OBCCommunity.objects.create(
+        barangay=create_barangay(municipality=municipality), name=name, **defaults
+    )
+
+
+@pytest.mark.django_db
+def test_rank_orders_matches_by_weighted_similarity():
+    municipality = create_municipality()
+    target = _community(municipality, "Target")
+    twin = _community(municipality, "Twin", estimated_obc_population=1100)
+    cousin = _community(
+        municipality,
+        "Cousin",
+        estimated_obc_population=3000,
+        access_electricity="excellent",
+    )
+    _community(
+        municipality,
+        "Stranger",
+        estimated_obc_population=50,
+        households=5,
+        primary_ethnolinguistic_group="badjao",
+        primary_livelihoods="Trading",
+        estimated_poverty_incidence="very_low",
+        access_electricity="none",
+    )
+
+    matches = get_feature_matrix().rank(target, limit=2)
+
+    assert [m["community_id"] for m in matches] == [twin.pk, cousin.pk]
+    assert matches[0]["similarity_score"] > matches[1]["similarity_score"]
+    assert {"ethnolinguistic_group", "livelihoods"} <= set(
+        matches[0]["matching_features"]
+    )
+    assert "access_to_electricity" in matches[1]["differences"]
+    assert "access_to_water" not in matches[0]["matching_features"]  # unreported
+
+
+@pytest.mark.django_db
+def test_rank_can_stay_within_the_province():
+    municipality = create_municipality()
+    target = _community(municipality, "Target")
+    neighbour = _community(municipality, "Neighbour", households=150)
+    _community(create_municipality(), "Elsewhere")
+
+    matrix = get_feature_matrix()
+
+    assert len(matrix.rank(target, limit=5)) == 2
+    assert [m["community_id"] for m in matrix.rank(
+        target, limit=5, same_province_only=True
+    )] == [neighbour.pk]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_matrix_rebuilds_after_community_writes():
+    municipality = create_municipality()
+    target = _community(municipality, "Target")
+    first = get_feature_matrix()
+    assert get_feature_matrix() is first
+    assert len(first) == 1
+
+    peer = _community(municipality, "Peer")
+    (match,) = get_feature_matrix().rank(target, limit=5)
+    assert match["community_id"] == peer.pk
+
+    peer.primary_ethnolinguistic_group = "badjao"
+    peer.save()
+    (rescored,) = get_feature_matrix().rank(target, limit=5)
+    assert rescored["similarity_score"] < match["similarity_score"]
+    assert "ethnolinguistic_group" in rescored["differences"]
+
+
+@pytest.mark.django_db
+def test_matcher_explains_all_matches_in_one_prompt(settings):
+    settings.GOOGLE_API_KEY = "test-key"
+    settings.GEMINI_MODEL = "gemini-test"
+    municipality = create_municipality()
+    target = _community(municipality, "Target")
+    peers = [_community(municipality, f"Peer {index}") for index in range(3)]
+
+    with patch(
+        "communities.ai_services.community_matcher.genai.GenerativeModel"
+    ) as model_class:
+        model = MagicMock()
+        model.generate_content.return_value.text = (
+            '{"rationales": ["Same group", "Same livelihoods", "Same size"]}'
+        )
+        model_class.return_value = model
+
+        from communities.ai_services.community_matcher import CommunityMatcher
+
+        matcher = CommunityMatcher()
+        local = matcher.find_similar_communities(target, limit=3)
+        explained = matcher.find_similar_communities(target, limit=3, explain=True)
+
+    assert model.generate_content.call_count == 1
+    assert {r["community"].pk for r in local} == {p.pk for p in peers}
+    assert all(r["rationale"].startswith("Similar ") for r in local)
+    assert [r["rationale"] for r in explained] == [
+        "Same group",
+        "Same livelihoods",
+        "Same size",
+    ]
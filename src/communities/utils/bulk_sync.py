@@ -65,9 +65,9 @@ def bulk_sync_communities(
         if sync_provincial and municipality.province:
             provinces_to_sync.add(municipality.province)
 
-    # Sync all municipalities
+    # Sync all municipalities (provinces follow below, once each)
     for municipality in municipalities_to_sync:
-        MunicipalityCoverage.sync_for_municipality(municipality)
+        MunicipalityCoverage.sync_for_municipality(municipality, sync_province=False)
 
     # Sync all provinces (only once per province, not once per municipality!)
     if sync_provincial:
@@ -154,7 +154,7 @@ def bulk_refresh_municipalities(
 
     # Sync all municipalities
     for municipality in municipalities_list:
-        MunicipalityCoverage.sync_for_municipality(municipality)
+        MunicipalityCoverage.sync_for_municipality(municipality, sync_province=False)
 
         if sync_provincial and municipality.province:
             provinces_to_sync.add(municipality.province)
@@ -239,7 +239,7 @@ def sync_entire_hierarchy(region=None) -> dict:
 
     # Sync municipalities
     for municipality in municipalities:
-        MunicipalityCoverage.sync_for_municipality(municipality)
+        MunicipalityCoverage.sync_for_municipality(municipality, sync_province=False)
 
     # Sync provinces
     for province in provinces:
@@ -0,0 +1,148 @@
+"""Coalesced coverage sync for OBC community writes.
+
+Saving or deleting an ``OBCCommunity`` no longer recomputes coverage inline.
+The write marks its municipality dirty instead, and the roll-ups run once per
+municipality and then once per affected province:
+
+- ``"commit"`` (default): when the surrounding transaction commits, so
+  editing 50 communities of one municipality in a transaction costs one sync;
+- ``"celery"``: in a ``sync_community_coverage`` task started
+  ``COMMUNITY_COVERAGE_SYNC_DELAY`` seconds after commit; municipalities
+  already waiting for a task are not scheduled twice;
+- ``"immediate"``: on every write (the test settings use this because test
+  transactions never commit).
+
+The mode comes from the ``COMMUNITY_COVERAGE_SYNC_MODE`` setting. Writes made
+outside a transaction are synced right away in every mode except
+``"celery"``. ``communities_synced`` is sent after each sync so other roll-ups
+(municipal profiles) can follow the same schedule.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Dict, Iterable, Optional
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from django.dispatch import Signal
+
+from common.services.on_commit_batch import OnCommitBatch
+from communities.models import MunicipalityCoverage, ProvinceCoverage
+
+logger = logging.getLogger(__name__)
+
+SYNC_MODES = ("commit", "celery", "immediate")
+SCHEDULED_KEY_PREFIX = "coverage-sync:scheduled"
+
+# Sent after coverage is recomputed, with ``municipalities`` (a list of
+# Municipality instances) and ``changed_by`` (municipality id -> user id).
+communities_synced = Signal()
+
+
+def get_sync_mode() -> str:
+    mode = getattr(settings, "COMMUNITY_COVERAGE_SYNC_MODE", "commit")
+    if mode not in SYNC_MODES:
+        raise ValueError(f"Unknown COMMUNITY_COVERAGE_SYNC_MODE: {mode}")
+    return mode
+
+
+def get_sync_delay() -> int:
+    return getattr(settings, "COMMUNITY_COVERAGE_SYNC_DELAY", 5)
+
+
+# Municipality id -> id of the last user who changed one of its communities.
+_pending_municipalities: OnCommitBatch[Dict[int, Optional[int]]] = OnCommitBatch(
+    "coverage_sync", dict, lambda changed_by: _dispatch(changed_by)
+)
+
+
+def schedule_coverage_sync(
+    municipality_id: Optional[int], *, changed_by=None, using: str = DEFAULT_DB_ALIAS
+) -> None:
+    """Mark a municipality's coverage (and its province's) as needing a sync."""
+
+    if municipality_id is None:
+        return
+
+    user_id = getattr(changed_by, "pk", changed_by)
+    pending = None
+    if get_sync_mode() != "immediate":
+        pending = _pending_municipalities.collect(using)
+    if pending is None:
+        _dispatch({municipality_id: user_id})
+        return
+    if user_id is not None or municipality_id not in pending:
+        pending[municipality_id] = user_id
+
+
+def _dispatch(changed_by: Dict[int, Optional[int]]) -> None:
+    if not changed_by:
+        return
+    if get_sync_mode() != "celery":
+        sync_municipalities(changed_by)
+        return
+
+    from communities.tasks import sync_community_coverage
+
+    delay = get_sync_delay()
+    # Municipalities already waiting for a task ride along with it.
+    targets = [
+        [municipality_id, user_id]
+        for municipality_id, user_id in changed_by.items()
+        if cache.add(f"{SCHEDULED_KEY_PREFIX}:{municipality_id}", 1, delay + 60)
+    ]
+    if not targets:
+        return
+    try:
+        sync_community_coverage.apply_async(args=[targets], countdown=delay)
+    except Exception as e:
+        # Without a broker, sync inline rather than leave coverage stale.
+        logger.error(f"Could not queue coverage sync, running it inline: {e}")
+        release_scheduled(municipality_id for municipality_id, _ in targets)
+        sync_municipalities(changed_by)
+
+
+def release_scheduled(municipality_ids: Iterable[int]) -> None:
+    """Allow the given municipalities to be scheduled again."""
+
+    cache.delete_many([f"{SCHEDULED_KEY_PREFIX}:{pk}" for pk in municipality_ids])
+
+
+def sync_municipalities(changed_by: Dict[int, Optional[int]]) -> dict:
+    """Recompute each municipality's coverage once, then each province once."""
+
+    from common.models import Municipality
+
+    municipalities = list(
+        Municipality.objects.filter(pk__in=list(changed_by)).select_related("province")
+    )
+    provinces = {}
+    for municipality in municipalities:
+        MunicipalityCoverage.sync_for_municipality(municipality, sync_province=False)
+        if municipality.province_id:
+            provinces[municipality.province_id] = municipality.province
+
+    for province in provinces.values():
+        ProvinceCoverage.sync_for_province(province)
+
+    communities_synced.send(
+        sender=MunicipalityCoverage,
+        municipalities=municipalities,
+        changed_by=changed_by,
+    )
+    return {
+        "municipalities_synced": len(municipalities),
+        "provinces_synced": len(provinces),
+    }
+
+
+def get_users(user_ids: Iterable[Optional[int]]) -> Dict[int, object]:
+    """Load the users named in a ``changed_by`` mapping with one query."""
+
+    ids = {user_id for user_id in user_ids if user_id is not None}
+    if not ids:
+        return {}
+    return get_user_model().objects.in_bulk(ids)
@@ -0,0 +1,337 @@
+"""Local, vectorized similarity scoring for OBC communities.
+
+Every active ``OBCCommunity`` is encoded once into NumPy arrays (one query):
+
+- log-scaled population and household counts;
+- ordinal poverty, access and BARMM-proximity ratings scaled to ``[0, 1]``;
+- ethnolinguistic group and province codes;
+- a multi-hot matrix of livelihood keywords.
+
+A lookup scores the target against all communities at once: each feature
+yields a similarity in ``[0, 1]`` and the weighted mean over the features both
+sides actually report is the community's score. The matrix is cached per
+process and rebuilt lazily when the ``communities:features`` cache tag moves,
+which every community save, delete or bulk import bumps.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from common.services.cache_tags import get_tag_versions, invalidate_tags
+
+COMMUNITY_FEATURES_CACHE_TAG = "communities:features"
+
+POVERTY_SCALE = ("very_low", "low", "moderate", "high", "very_high", "extremely_high")
+ACCESS_SCALE = ("none", "poor", "fair", "good", "excellent")
+PROXIMITY_SCALE = ("adjacent", "near", "distant")
+
+# Count features compared on a log scale; a 4x ratio scores zero.
+COUNT_FEATURES = {
+    "population_size": "estimated_obc_population",
+    "households": "households",
+}
+COUNT_LOG_RANGE = np.log(4.0)
+
+ORDINAL_FEATURES = {
+    "poverty_level": ("estimated_poverty_incidence", POVERTY_SCALE),
+    "access_to_water": ("access_clean_water", ACCESS_SCALE),
+    "access_to_electricity": ("access_electricity", ACCESS_SCALE),
+    "access_to_healthcare": ("access_healthcare", ACCESS_SCALE),
+    "access_to_education": ("access_formal_education", ACCESS_SCALE),
+    "access_to_madrasah": ("access_madrasah", ACCESS_SCALE),
+    "access_to_roads": ("access_roads_transport", ACCESS_SCALE),
+    "proximity_to_barmm": ("proximity_to_barmm", PROXIMITY_SCALE),
+}
+
+FEATURE_WEIGHTS = {
+    "population_size": 0.15,
+    "households": 0.05,
+    "ethnolinguistic_group": 0.20,
+    "livelihoods": 0.15,
+    "poverty_level": 0.10,
+    "access_to_water": 0.05,
+    "access_to_electricity": 0.05,
+    "access_to_healthcare": 0.05,
+    "access_to_education": 0.05,
+    "access_to_madrasah": 0.03,
+    "access_to_roads": 0.05,
+    "proximity_to_barmm": 0.02,
+    "province": 0.10,
+}
+FEATURE_NAMES = tuple(FEATURE_WEIGHTS)
+
+# Per-feature similarities at or above / at or below these mark a match or
+# a difference in the explanation of a score.
+MATCH_THRESHOLD = 0.8
+DIFFERENCE_THRESHOLD = 0.4
+
+_LIVELIHOOD_SPLIT = re.compile(r"[,;/\n]+|\band\b")
+
+_matrix: Optional[Tuple[int, "CommunityFeatureMatrix"]] = None
+_build_lock = threading.Lock()
+
+
+def invalidate_community_features() -> None:
+    """Mark the cached feature matrix as stale (collapses on commit)."""
+
+    invalidate_tags([COMMUNITY_FEATURES_CACHE_TAG])
+
+
+def livelihood_keywords(*texts: Optional[str]) -> List[str]:
+    """Split free-text livelihood descriptions into normalised keywords."""
+
+    keywords = []
+    for text in texts:
+        for part in _LIVELIHOOD_SPLIT.split((text or "").lower()):
+            keyword = " ".join(part.split())
+            if keyword and keyword not in keywords:
+                keywords.append(keyword)
+    return keywords
+
+
+class _Encoder:
+    """Assigns stable integer codes to categorical values."""
+
+    def __init__(self):
+        self.codes: Dict[object, int] = {}
+
+    def encode(self, value) -> int:
+        if value in (None, ""):
+            return -1
+        return self.codes.setdefault(value, len(self.codes))
+
+    def lookup(self, value) -> int:
+        if value in (None, ""):
+            return -1
+        return self.codes.get(value, -2)
+
+
+def _ordinal(value: Optional[str], scale: Sequence[str]) -> float:
+    if value in scale:
+        return scale.index(value) / (len(scale) - 1)
+    return np.nan
+
+
+def _log_count(value: Optional[int]) -> float:
+    return np.log1p(value) if value else np.nan
+
+
+class CommunityFeatureMatrix:
+    """Encoded features of every community, scored with array operations."""
+
+    VALUE_FIELDS = (
+        ("pk", "barangay__municipality__province_id", "primary_ethnolinguistic_group")
+        + tuple(COUNT_FEATURES.values())
+        + tuple(field for field, _ in ORDINAL_FEATURES.values())
+        + ("primary_livelihoods", "secondary_livelihoods")
+    )
+
+    def __init__(self, rows: Iterable[Dict[str, object]]):
+        self.groups = _Encoder()
+        self.provinces = _Encoder()
+        self.keywords = _Encoder()
+
+        ids, numeric, groups, provinces, keyword_rows = [], [], [], [], []
+        for row in rows:
+            ids.append(row["pk"])
+            numeric.append(self._numeric(row))
+            groups.append(self.groups.encode(row["primary_ethnolinguistic_group"]))
+            provinces.append(
+                self.provinces.encode(row["barangay__municipality__province_id"])
+            )
+            keyword_rows.append(
+                [
+                    self.keywords.encode(keyword)
+                    for keyword in livelihood_keywords(
+                        row["primary_livelihoods"], row["secondary_livelihoods"]
+                    )
+                ]
+            )
+
+        self.ids = np.asarray(ids, dtype=np.int64)
+        self.numeric = np.asarray(numeric, dtype=float).reshape(
+            len(ids), len(COUNT_FEATURES) + len(ORDINAL_FEATURES)
+        )
+        self.groups_array = np.asarray(groups, dtype=np.int64)
+        self.provinces_array = np.asarray(provinces, dtype=np.int64)
+        self.livelihoods = np.zeros((len(ids), len(self.keywords.codes)), dtype=bool)
+        for index, codes in enumerate(keyword_rows):
+            self.livelihoods[index, codes] = True
+        self.weights = np.asarray(
+            [FEATURE_WEIGHTS[name] for name in FEATURE_NAMES], dtype=float
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @staticmethod
+    def _numeric(row: Dict[str, object]) -> List[float]:
+        return [_log_count(row[field]) for field in COUNT_FEATURES.values()] + [
+            _ordinal(row[field], scale) for field, scale in ORDINAL_FEATURES.values()
+        ]
+
+    def encode_community(self, community) -> Dict[str, object]:
+        """Encode a community instance (indexed or not) as a query vector."""
+
+        row = {
+            field: getattr(community, field, None)
+            for field in self.VALUE_FIELDS
+            if "__" not in field
+        }
+        keywords = livelihood_keywords(
+            row["primary_livelihoods"], row["secondary_livelihoods"]
+        )
+        livelihoods = np.zeros(len(self.keywords.codes), dtype=bool)
+        known = [self.keywords.codes[k] for k in keywords if k in self.keywords.codes]
+        livelihoods[known] = True
+        province = getattr(community, "province", None)
+        return {
+            "numeric": np.asarray(self._numeric(row), dtype=float),
+            "group": self.groups.lookup(row["primary_ethnolinguistic_group"]),
+            "province": self.provinces.lookup(getattr(province, "pk", None)),
+            "livelihoods": livelihoods,
+            "keyword_count": len(keywords),
+        }
+
+    def feature_similarities(self, query: Dict[str, object]) -> np.ndarray:
+        """Return an ``(n, features)`` array of per-feature similarities.
+
+        Features missing on either side are NaN.
+        """
+
+        n = len(self.ids)
+        count_columns = len(COUNT_FEATURES)
+        delta = np.abs(self.numeric - query["numeric"])
+        counts = 1.0 - np.minimum(delta[:, :count_columns] / COUNT_LOG_RANGE, 1.0)
+        ordinals = 1.0 - delta[:, count_columns:]
+
+        def categorical(column: np.ndarray, value: int) -> np.ndarray:
+            if value == -1:
+                return np.full(n, np.nan)
+            return np.where(column >= 0, (column == value).astype(float), np.nan)
+
+        # Jaccard overlap of livelihood keywords; unknown when either side
+        # lists none.
+        listed = self.livelihoods.sum(axis=1)
+        shared = self.livelihoods @ query["livelihoods"].astype(np.int64)
+        union = listed + query["keyword_count"] - shared
+        livelihoods = np.divide(
+            shared,
+            union,
+            out=np.full(n, np.nan),
+            where=(listed > 0) & (query["keyword_count"] > 0),
+        )
+
+        columns = {
+            "population_size": counts[:, 0],
+            "households": counts[:, 1],
+            "ethnolinguistic_group": categorical(self.groups_array, query["group"]),
+            "livelihoods": livelihoods,
+            "province": categorical(self.provinces_array, query["province"]),
+        }
+        for offset, name in enumerate(ORDINAL_FEATURES):
+            columns[name] = ordinals[:, offset]
+        return np.column_stack([columns[name] for name in FEATURE_NAMES])
+
+    def score(self, similarities: np.ndarray) -> np.ndarray:
+        """Weighted mean of the available per-feature similarities."""
+
+        available = ~np.isnan(similarities)
+        weights = np.where(available, self.weights, 0.0)
+        total = weights.sum(axis=1)
+        weighted = np.where(available, similarities, 0.0) @ self.weights
+        return np.divide(weighted, total, out=np.zeros(len(total)), where=total > 0)
+
+    def rank(
+        self,
+        community,
+        *,
+        limit: int,
+        min_score: float = 0.0,
+        same_province_only: bool = False,
+    ) -> List[Dict[str, object]]:
+        """Return the ``limit`` best matches for ``community``, best first."""
+
+        if not len(self.ids):
+            return []
+
+        query = self.encode_community(community)
+        similarities = self.feature_similarities(query)
+        scores = self.score(similarities)
+
+        eligible = (self.ids != community.pk) & (scores > min_score)
+        if same_province_only:
+            eligible &= self.provinces_array == query["province"]
+        candidates = np.flatnonzero(eligible)
+        if not len(candidates):
+            return []
+        if len(candidates) > limit:
+            top = np.argpartition(-scores[candidates], limit - 1)[:limit]
+            candidates = candidates[top]
+        candidates = candidates[np.argsort(-scores[candidates], kind="stable")]
+
+        matches = []
+        for index in candidates:
+            row = similarities[index]
+            matches.append(
+                {
+                    "community_id": int(self.ids[index]),
+                    "similarity_score": round(float(scores[index]), 4),
+                    "matching_features": [
+                        name
+                        for name, value in zip(FEATURE_NAMES, row)
+                        if value >= MATCH_THRESHOLD
+                    ],
+                    "differences": [
+                        name
+                        for name, value in zip(FEATURE_NAMES, row)
+                        if value <= DIFFERENCE_THRESHOLD
+                    ],
+                }
+            )
+        return matches
+
+
+def _load_rows() -> Iterable[Dict[str, object]]:
+    from communities.models import OBCCommunity
+
+    return (
+        OBCCommunity.objects.order_by("pk")
+        .values(*CommunityFeatureMatrix.VALUE_FIELDS)
+        .iterator(chunk_size=2000)
+    )
+
+
+def get_feature_matrix() -> CommunityFeatureMatrix:
+    """Return the process-cached matrix, rebuilding it when stale."""
+
+    global _matrix
+
+    version = get_tag_versions([COMMUNITY_FEATURES_CACHE_TAG])[
+        COMMUNITY_FEATURES_CACHE_TAG
+    ]
+    cached = _matrix
+    if cached and cached[0] == version:
+        return cached[1]
+
+    with _build_lock:
+        cached = _matrix
+        if cached and cached[0] == version:
+            return cached[1]
+        matrix = CommunityFeatureMatrix(_load_rows())
+        _matrix = (version, matrix)
+        return matrix
+
+
+def clear_feature_matrix() -> None:
+    """Drop the cached matrix in this process."""
+
+    global _matrix
+
+    with _build_lock:
+        _matrix = None
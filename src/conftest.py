@@ -0,0 +1,12 @@
+"""Fixtures shared by the test suites of every app."""
+
+import pytest
+from django.core.cache import cache
+
+
+@pytest.fixture
+def clear_cache():
+    """Run the test against an empty cache and leave it empty afterwards."""
+    cache.clear()
+    yield
+    cache.clear()
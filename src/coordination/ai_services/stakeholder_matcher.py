@@ -7,13 +7,22 @@ using semantic similarity and multi-criteria analysis.
 
 import json
 from typing import List, Dict, Optional, Tuple
-from decimal import Decimal
 
-from django.db.models import Q, Count, Avg, Sum
 from django.core.cache import cache
 
 from ai_assistant.services import EmbeddingService, SimilaritySearchService, GeminiService
 from coordination.models import Organization
+from coordination.utils.stakeholder_matching import (
+    MATCH_CACHE_TIMEOUT,
+    StakeholderMatrix,
+    capacity_score,
+    describe_match,
+    geographic_score,
+    hydrate_matches,
+    match_cache_key,
+    sector_score,
+    track_record_score,
+)
 from communities.models import OBCCommunity
 
 
@@ -54,10 +63,10 @@ class StakeholderMatcher:
             ]
         """
         # Check cache first
-        cache_key = f"stakeholder_matches_{community_id}_{need_category}"
+        cache_key = match_cache_key(community_id, need_category)
         cached_result = cache.get(cache_key)
         if cached_result:
-            return cached_result
+            return hydrate_matches(cached_result)
 
         # Get community details
         try:
@@ -67,36 +76,23 @@ class StakeholderMatcher:
         except OBCCommunity.DoesNotExist:
             return []
 
-        # Create need profile for semantic matching
-        need_profile = self._create_need_profile(community, need_category)
+        # Score every active organization at once
+        matrix = StakeholderMatrix()
+        entries = matrix.match(
+            [community], [need_category], top_k=top_k, min_score=min_score
+        )[(community.pk, need_category)]
 
-        # Get active organizations
-        organizations = Organization.objects.filter(
-            is_active=True,
-            partnership_status='active'
-        ).select_related('created_by')
+        # Cache compact results for 24 hours
+        cache.set(cache_key, entries, timeout=MATCH_CACHE_TIMEOUT)
 
-        # Calculate matches
-        matches = []
-        for org in organizations:
-            score, criteria = self._calculate_match_score(community, org, need_category)
-
-            if score >= min_score:
-                rationale = self._generate_rationale(community, org, need_category, criteria)
-                matches.append({
-                    'stakeholder': org,
-                    'match_score': round(score, 2),
-                    'matching_criteria': criteria,
-                    'rationale': rationale
-                })
-
-        # Sort by score and limit results
-        matches = sorted(matches, key=lambda x: x['match_score'], reverse=True)[:top_k]
-
-        # Cache results for 24 hours
-        cache.set(cache_key, matches, timeout=86400)
-
-        return matches
+        organizations = {str(org.pk): org for org in matrix.organizations}
+        return [
+            {
+                'stakeholder': organizations[entry['stakeholder_id']],
+                **{k: v for k, v in entry.items() if k != 'stakeholder_id'},
+            }
+            for entry in entries
+        ]
 
     def _create_need_profile(self, community: OBCCommunity, need_category: str) -> str:
         """Create a textual profile of the community need"""
@@ -157,79 +153,21 @@ class StakeholderMatcher:
 
     def _calculate_geographic_score(self, community: OBCCommunity, org: Organization) -> float:
         """Calculate geographic proximity score"""
-        score = 0.0
-
-        if not org.geographic_coverage:
-            return 0.0
-
-        coverage_lower = org.geographic_coverage.lower()
-
-        # Exact province match (highest priority)
-        if community.municipality.province.name.lower() in coverage_lower:
-            score = 0.3
-        # Region match
-        elif community.municipality.province.region.name.lower() in coverage_lower:
-            score = 0.25
-        # Municipality match
-        elif community.municipality.name.lower() in coverage_lower:
-            score = 0.2
-        # National coverage
-        elif 'national' in coverage_lower or 'nationwide' in coverage_lower:
-            score = 0.15
-
-        return score
+        municipality = community.municipality
+        return geographic_score(
+            org.geographic_coverage,
+            municipality.province.name,
+            municipality.province.region.name,
+            municipality.name,
+        )
 
     def _calculate_sector_score(self, org: Organization, need_category: str) -> float:
         """Calculate sector alignment score"""
-        if not org.areas_of_expertise:
-            return 0.0
-
-        expertise_lower = org.areas_of_expertise.lower()
-        need_lower = need_category.lower()
-
-        # Direct match
-        if need_lower in expertise_lower:
-            return 0.4
-
-        # Related sector matching
-        sector_mappings = {
-            'health': ['medical', 'healthcare', 'clinic', 'hospital', 'wellness'],
-            'education': ['school', 'training', 'learning', 'scholarship', 'literacy'],
-            'livelihood': ['employment', 'income', 'enterprise', 'skills', 'economic'],
-            'infrastructure': ['construction', 'building', 'roads', 'water', 'sanitation'],
-            'agriculture': ['farming', 'crops', 'livestock', 'fishery', 'agri'],
-        }
-
-        if need_lower in sector_mappings:
-            for related_term in sector_mappings[need_lower]:
-                if related_term in expertise_lower:
-                    return 0.3
-
-        return 0.0
+        return sector_score(org.areas_of_expertise, need_category)
 
     def _calculate_capacity_score(self, org: Organization) -> float:
         """Calculate organization capacity score based on budget and staff"""
-        score = 0.0
-
-        # Budget capacity (0-0.1)
-        if org.annual_budget:
-            if org.annual_budget >= Decimal('10000000'):  # 10M+
-                score += 0.1
-            elif org.annual_budget >= Decimal('5000000'):  # 5M+
-                score += 0.07
-            elif org.annual_budget >= Decimal('1000000'):  # 1M+
-                score += 0.05
-
-        # Staff count (0-0.05)
-        if org.staff_count:
-            if org.staff_count >= 50:
-                score += 0.05
-            elif org.staff_count >= 20:
-                score += 0.03
-            elif org.staff_count >= 10:
-                score += 0.02
-
-        return min(score, 0.15)
+        return capacity_score(org.annual_budget, org.staff_count)
 
     def _calculate_track_record_score(self, org: Organization) -> float:
         """Calculate track record score based on past partnerships"""
@@ -241,17 +179,7 @@ class StakeholderMatcher:
             status__in=['active', 'completed']
         ).count()
 
-        # Calculate score
-        if active_partnerships >= 10:
-            return 0.15
-        elif active_partnerships >= 5:
-            return 0.12
-        elif active_partnerships >= 3:
-            return 0.1
-        elif active_partnerships >= 1:
-            return 0.07
-
-        return 0.0
+        return track_record_score(active_partnerships)
 
     def _generate_rationale(
         self,
@@ -261,41 +189,7 @@ class StakeholderMatcher:
         criteria: List[str]
     ) -> str:
         """Generate human-readable rationale for the match"""
-        rationale_parts = []
-
-        # Organization type and name
-        org_type = org.get_organization_type_display()
-        rationale_parts.append(f"{org_type}")
-
-        # Geographic relevance
-        if 'geography' in criteria:
-            if org.geographic_coverage:
-                coverage = org.geographic_coverage
-                if community.municipality.province.name in coverage:
-                    rationale_parts.append(f"operates in {community.municipality.province.name}")
-                elif community.municipality.province.region.name in coverage:
-                    rationale_parts.append(f"covers {community.municipality.province.region.name}")
-
-        # Sector expertise
-        if 'sector' in criteria:
-            rationale_parts.append(f"experienced in {need_category.lower()} sector")
-
-        # Capacity
-        if 'capacity' in criteria:
-            if org.annual_budget and org.annual_budget >= Decimal('5000000'):
-                rationale_parts.append("strong financial capacity")
-            if org.staff_count and org.staff_count >= 20:
-                rationale_parts.append("adequate staffing")
-
-        # Track record
-        if 'track_record' in criteria:
-            rationale_parts.append("proven track record in partnerships")
-
-        # Combine rationale
-        if rationale_parts:
-            return f"{rationale_parts[0].capitalize()}, " + ", ".join(rationale_parts[1:]) + "."
-
-        return "General stakeholder alignment with community needs."
+        return describe_match(community, org, need_category, criteria)
 
     def recommend_partnerships(
         self,
@@ -3,6 +3,8 @@ from rest_framework import filters, permissions, viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
+from common.mixins.api_mixins import DeltaSyncMixin
+
 from .models import (
     # ActionItem,  # DEPRECATED - replaced by WorkItem
     Communication,
@@ -63,7 +65,7 @@ class StakeholderEngagementTypeViewSet(viewsets.ModelViewSet):
     ordering = ["name"]
 
 
-class StakeholderEngagementViewSet(viewsets.ModelViewSet):
+class StakeholderEngagementViewSet(DeltaSyncMixin, viewsets.ModelViewSet):
     """ViewSet for StakeholderEngagement model."""
 
     queryset = StakeholderEngagement.objects.all().select_related(
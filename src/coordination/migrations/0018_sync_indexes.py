@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('coordination', '0017_rename_coordination_intermoapartnership_lead_status_idx_coordinatio_lead_mo_b3b346_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='stakeholderengagement',
+            index=models.Index(fields=['updated_at', 'id'], name='coord_engagement_sync_idx'),
+        ),
+    ]
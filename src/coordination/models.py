@@ -329,6 +329,7 @@ class StakeholderEngagement(models.Model):
             models.Index(fields=["engagement_type", "planned_date"]),
             models.Index(fields=["status", "priority"]),
             models.Index(fields=["is_participatory_budgeting", "planned_date"]),
+            models.Index(fields=["updated_at", "id"], name="coord_engagement_sync_idx"),
         ]
 
     def __str__(self):
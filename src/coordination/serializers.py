@@ -1,5 +1,7 @@
 from rest_framework import serializers
 
+from common.serializers import SparseFieldsetMixin
+
 from .models import (
     Communication,
     CommunicationSchedule,
@@ -42,7 +44,7 @@ class EngagementFacilitatorSerializer(serializers.ModelSerializer):
         fields = "__all__"
 
 
-class StakeholderEngagementSerializer(serializers.ModelSerializer):
+class StakeholderEngagementSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Serializer for StakeholderEngagement model."""
 
     engagement_type_name = serializers.CharField(
@@ -6,6 +6,7 @@ and meeting intelligence.
 """
 
 from celery import shared_task
+from django.conf import settings
 from django.core.cache import cache
 from django.utils import timezone
 import logging
@@ -59,56 +60,56 @@ def match_stakeholders_for_communities():
 
     This task runs nightly to pre-compute and cache stakeholder matches,
     ensuring instant results when users access the matching feature.
+
+    Communities are scored in chunks of ``STAKEHOLDER_MATCH_CHUNK_SIZE``
+    against a matrix of the active organizations. With
+    ``STAKEHOLDER_MATCH_PARALLEL`` set, each chunk is queued as its own
+    ``match_stakeholders_chunk`` task so workers process them in parallel.
     """
     from communities.models import OBCCommunity
-    from coordination.ai_services.stakeholder_matcher import StakeholderMatcher
-
-    matcher = StakeholderMatcher()
-
-    # Get active communities
-    communities = OBCCommunity.objects.filter(
-        is_active=True
-    ).select_related('barangay__municipality__province__region')
-
-    # Need categories to match
-    need_categories = [
-        'Health',
-        'Education',
-        'Livelihood',
-        'Infrastructure',
-        'Agriculture',
-        'Water and Sanitation',
-        'Social Services'
+
+    community_ids = list(
+        OBCCommunity.objects.filter(is_active=True)
+        .order_by('pk')
+        .values_list('pk', flat=True)
+    )
+    chunk_size = max(1, settings.STAKEHOLDER_MATCH_CHUNK_SIZE)
+    chunks = [
+        community_ids[start:start + chunk_size]
+        for start in range(0, len(community_ids), chunk_size)
     ]
 
+    if settings.STAKEHOLDER_MATCH_PARALLEL:
+        for chunk in chunks:
+            match_stakeholders_chunk.delay(chunk)
+        logger.info(
+            f"Queued stakeholder matching for {len(community_ids)} communities "
+            f"in {len(chunks)} chunks"
+        )
+        return {
+            'communities_queued': len(community_ids),
+            'chunks_queued': len(chunks),
+        }
+
+    from coordination.utils.stakeholder_matching import StakeholderMatrix
+
+    matrix = StakeholderMatrix()
     results = {
         'communities_processed': 0,
         'matches_generated': 0,
         'errors': []
     }
 
-    for community in communities:
+    for chunk in chunks:
         try:
-            for need in need_categories:
-                matches = matcher.find_matching_stakeholders(
-                    community.id,
-                    need,
-                    top_k=10,
-                    min_score=0.6
-                )
-
-                # Cache results for 24 hours
-                cache_key = f"stakeholder_matches_{community.id}_{need}"
-                cache.set(cache_key, matches, timeout=86400)
-
-                results['matches_generated'] += len(matches)
-
-            results['communities_processed'] += 1
+            stats = matrix.match_and_cache(chunk)
+            results['communities_processed'] += stats['communities_processed']
+            results['matches_generated'] += stats['matches_generated']
 
         except Exception as e:
-            logger.error(f"Error matching stakeholders for community {community.id}: {str(e)}")
+            logger.error(f"Error matching stakeholders for communities {chunk[0]}-{chunk[-1]}: {str(e)}")
             results['errors'].append({
-                'community_id': community.id,
+                'community_ids': chunk,
                 'error': str(e)
             })
 
@@ -118,6 +119,29 @@ def match_stakeholders_for_communities():
     return results
 
 
+@shared_task(
+    name='coordination.match_stakeholders_chunk', bind=True, acks_late=True
+)
+def match_stakeholders_chunk(self, community_ids):
+    """
+    Background task: Score and cache stakeholder matches for a community chunk
+
+    Args:
+        community_ids: OBCCommunity primary keys
+
+    Returns:
+        dict with communities processed and matches generated
+    """
+    from coordination.utils.stakeholder_matching import StakeholderMatrix
+
+    stats = StakeholderMatrix().match_and_cache(community_ids)
+    logger.info(
+        f"Stakeholder matching chunk complete: {stats['communities_processed']} "
+        f"communities, {stats['matches_generated']} matches"
+    )
+    return stats
+
+
 @shared_task(name='coordination.analyze_partnership_portfolio')
 def analyze_partnership_portfolio(organization_id: str):
     """
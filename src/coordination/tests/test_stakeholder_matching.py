@@ -0,0 +1,177 @@
+"""Tests for batch stakeholder matching."""
+
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from common.models import User
+from common.tests.factories import (
+    create_barangay,
+    create_municipality,
+    create_partnership,
+    create_province,
+    create_region,
+)
+from communities.models import OBCCommunity
+from coordination.models import Organization, Partnership
+from coordination.tasks import match_stakeholders_for_communities
+from coordination.utils.stakeholder_matching import (
+    NEED_CATEGORIES,
+    StakeholderMatrix,
+    capacity_score,
+    geographic_score,
+    hydrate_matches,
+    match_cache_key,
+    sector_score,
+    track_record_score,
+)
+
+
+pytestmark = pytest.mark.usefixtures("clear_cache")
+
+
+@pytest.fixture
+def communities():
+    region = create_region(name="Zamboanga Peninsula")
+    municipality = create_municipality(
+        province=create_province(region=region, name="Zamboanga del Sur"),
+        name="Pagadian City",
+    )
+    other = create_municipality(name="Iligan City")
+    return [
+        OBCCommunity.objects.create(
+            barangay=create_barangay(municipality=target), name=f"Community {index}"
+        )
+        for index, target in enumerate([municipality, municipality, other])
+    ]
+
+
+@pytest.fixture
+def organizations():
+    user = User.objects.create_user(username="matcher", password="secret")
+    specs = [
+        ("Health NGO", "Health, clinic operations", "Zamboanga del Sur", 12_000_000, 60),
+        ("Clinic Network", "Medical missions", "Zamboanga Peninsula", 6_000_000, 25),
+        ("Schools Trust", "Education and training", "Nationwide", 2_000_000, 12),
+        ("Farm Partners", "Farming, livestock", "Pagadian City", None, None),
+        ("Health Twin", "Health, clinic operations", "Zamboanga del Sur", 12_000_000, 60),
+    ]
+    orgs = [
+        Organization.objects.create(
+            name=name,
+            organization_type="ngo",
+            areas_of_expertise=expertise,
+            geographic_coverage=coverage,
+            annual_budget=Decimal(budget) if budget else None,
+            staff_count=staff,
+            is_active=True,
+            partnership_status="active",
+        )
+        for name, expertise, coverage, budget, staff in specs
+    ]
+    for status in ["active", "completed", "concept"]:
+        create_partnership(created_by=user, lead_organization=orgs[1], status=status)
+    Organization.objects.create(
+        name="Dormant NGO",
+        organization_type="ngo",
+        areas_of_expertise="Health",
+        geographic_coverage="Nationwide",
+        is_active=False,
+        partnership_status="active",
+    )
+    return orgs
+
+
+def _pairwise_matches(community, need, top_k, min_score):
+    """Score organization by organization, as StakeholderMatcher used to."""
+
+    municipality = community.municipality
+    scored = []
+    for org in Organization.objects.filter(is_active=True, partnership_status="active"):
+        partnerships = Partnership.objects.filter(
+            organizations=org, status__in=["active", "completed"]
+        ).count()
+        parts = [
+            ("geography", 0.2, geographic_score(
+                org.geographic_coverage,
+                municipality.province.name,
+                municipality.province.region.name,
+                municipality.name,
+            )),
+            ("sector", 0.2, sector_score(org.areas_of_expertise, need)),
+            ("capacity", 0.1, capacity_score(org.annual_budget, org.staff_count)),
+            ("track_record", 0.1, track_record_score(partnerships)),
+        ]
+        score = min(sum(value for _, _, value in parts), 1.0)
+        if score >= min_score:
+            criteria = [name for name, threshold, value in parts if value >= threshold]
+            scored.append((str(org.pk), round(score, 2), criteria))
+    return sorted(scored, key=lambda item: item[1], reverse=True)[:top_k]
+
+
+@pytest.mark.django_db
+def test_matrix_matches_per_organization_scoring(communities, organizations):
+    with CaptureQueriesContext(connection) as queries:
+        matrix = StakeholderMatrix()
+    assert len(queries) == 1
+    # Migrations seed organizations too; the matrix holds every active one.
+    active = Organization.objects.filter(is_active=True, partnership_status="active")
+    assert len(matrix) == active.count()
+    assert {org.pk for org in organizations} <= {org.pk for org in matrix.organizations}
+
+    for top_k, min_score in [(10, 0.0), (2, 0.3), (1, 0.6)]:
+        results = matrix.match(communities, top_k=top_k, min_score=min_score)
+        for community in communities:
+            for need in NEED_CATEGORIES:
+                expected = _pairwise_matches(community, need, top_k, min_score)
+                actual = [
+                    (m["stakeholder_id"], m["match_score"], m["matching_criteria"])
+                    for m in results[(community.pk, need)]
+                ]
+                assert actual == expected, (community.name, need, top_k)
+
+
+@pytest.mark.django_db
+def test_nightly_task_caches_every_community_need(settings, communities, organizations):
+    settings.STAKEHOLDER_MATCH_CHUNK_SIZE = 2
+    settings.STAKEHOLDER_MATCH_PARALLEL = False
+
+    result = match_stakeholders_for_communities()
+
+    assert result["communities_processed"] == 3
+    assert result["errors"] == []
+    cached = cache.get(match_cache_key(communities[0].pk, "Health"))
+    assert result["matches_generated"] >= len(cached) > 0
+    assert cached[0]["stakeholder_id"] == str(organizations[0].pk)
+    assert "operates in Zamboanga del Sur" in cached[0]["rationale"]
+
+    with CaptureQueriesContext(connection) as queries:
+        matches = hydrate_matches(cached)
+    assert len(queries) == 1
+    assert matches[0]["stakeholder"] == organizations[0]
+    assert matches[0]["match_score"] == cached[0]["match_score"]
+
+
+@pytest.mark.django_db
+def test_parallel_mode_queues_one_task_per_chunk(settings, communities):
+    settings.STAKEHOLDER_MATCH_CHUNK_SIZE = 2
+    settings.STAKEHOLDER_MATCH_PARALLEL = True
+
+    with patch("coordination.tasks.match_stakeholders_chunk.delay") as delay:
+        result = match_stakeholders_for_communities()
+
+    ids = sorted(community.pk for community in communities)
+    assert [c.args[0] for c in delay.call_args_list] == [ids[:2], ids[2:]]
+    assert result == {"communities_queued": 3, "chunks_queued": 2}
+
+
+def test_cache_keys_are_versioned_and_memcached_safe():
+    key = match_cache_key(42, "Water and Sanitation")
+
+    assert key.startswith("stakeholder_matches_v2_42_")
+    assert " " not in key
+    assert key != match_cache_key(42, "Health")
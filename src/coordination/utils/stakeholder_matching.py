@@ -0,0 +1,382 @@
+"""
+Batch scoring of stakeholder organizations against community needs.
+
+``StakeholderMatrix`` loads the active organizations once (one query, with
+partnership counts annotated) and scores a whole chunk of communities per
+need category with NumPy: geography is scored once per organization and
+distinct municipality, sector once per organization and need, and capacity
+and track record once per organization. The per-community top matches are
+then taken with ``argpartition`` and written to the cache in one
+``set_many`` call.
+
+The scalar scoring helpers are shared with ``StakeholderMatcher`` so both
+paths rank organizations identically.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from django.core.cache import cache
+from django.db.models import Count, Q
+
+NEED_CATEGORIES = (
+    "Health",
+    "Education",
+    "Livelihood",
+    "Infrastructure",
+    "Agriculture",
+    "Water and Sanitation",
+    "Social Services",
+)
+
+SECTOR_MAPPINGS = {
+    "health": ["medical", "healthcare", "clinic", "hospital", "wellness"],
+    "education": ["school", "training", "learning", "scholarship", "literacy"],
+    "livelihood": ["employment", "income", "enterprise", "skills", "economic"],
+    "infrastructure": ["construction", "building", "roads", "water", "sanitation"],
+    "agriculture": ["farming", "crops", "livestock", "fishery", "agri"],
+}
+
+TRACK_RECORD_STATUSES = ("active", "completed")
+
+MATCH_CACHE_TIMEOUT = 86400  # 24 hours
+
+
+def match_cache_key(community_id, need_category: str) -> str:
+    """Cache key holding the compact matches for a community need.
+
+    ``v2`` entries hold ``stakeholder_id`` values rather than Organization
+    objects. The need name is hashed so free-text categories stay valid
+    memcached keys.
+    """
+
+    need = hashlib.md5(need_category.encode("utf-8")).hexdigest()[:12]
+    return f"stakeholder_matches_v2_{community_id}_{need}"
+
+
+def geographic_score(
+    coverage: Optional[str], province: str, region: str, municipality: str
+) -> float:
+    """Score how well an organization's coverage text reaches a community."""
+
+    if not coverage:
+        return 0.0
+
+    coverage_lower = coverage.lower()
+
+    # Exact province match (highest priority)
+    if province.lower() in coverage_lower:
+        return 0.3
+    # Region match
+    if region.lower() in coverage_lower:
+        return 0.25
+    # Municipality match
+    if municipality.lower() in coverage_lower:
+        return 0.2
+    # National coverage
+    if "national" in coverage_lower or "nationwide" in coverage_lower:
+        return 0.15
+    return 0.0
+
+
+def sector_score(expertise: Optional[str], need_category: str) -> float:
+    """Score an organization's expertise text against a need category."""
+
+    if not expertise:
+        return 0.0
+
+    expertise_lower = expertise.lower()
+    need_lower = need_category.lower()
+
+    # Direct match
+    if need_lower in expertise_lower:
+        return 0.4
+
+    # Related sector matching
+    for related_term in SECTOR_MAPPINGS.get(need_lower, ()):
+        if related_term in expertise_lower:
+            return 0.3
+
+    return 0.0
+
+
+def capacity_score(annual_budget, staff_count) -> float:
+    """Score an organization's capacity from its budget and staff count."""
+
+    score = 0.0
+
+    # Budget capacity (0-0.1)
+    if annual_budget:
+        if annual_budget >= Decimal("10000000"):  # 10M+
+            score += 0.1
+        elif annual_budget >= Decimal("5000000"):  # 5M+
+            score += 0.07
+        elif annual_budget >= Decimal("1000000"):  # 1M+
+            score += 0.05
+
+    # Staff count (0-0.05)
+    if staff_count:
+        if staff_count >= 50:
+            score += 0.05
+        elif staff_count >= 20:
+            score += 0.03
+        elif staff_count >= 10:
+            score += 0.02
+
+    return min(score, 0.15)
+
+
+def track_record_score(partnership_count: int) -> float:
+    """Score an organization's active and completed partnership count."""
+
+    if partnership_count >= 10:
+        return 0.15
+    if partnership_count >= 5:
+        return 0.12
+    if partnership_count >= 3:
+        return 0.1
+    if partnership_count >= 1:
+        return 0.07
+    return 0.0
+
+
+def describe_match(community, org, need_category: str, criteria: List[str]) -> str:
+    """Human-readable rationale for a stakeholder match."""
+
+    rationale_parts = [org.get_organization_type_display()]
+
+    # Geographic relevance
+    if "geography" in criteria and org.geographic_coverage:
+        coverage = org.geographic_coverage
+        province = community.municipality.province
+        if province.name in coverage:
+            rationale_parts.append(f"operates in {province.name}")
+        elif province.region.name in coverage:
+            rationale_parts.append(f"covers {province.region.name}")
+
+    # Sector expertise
+    if "sector" in criteria:
+        rationale_parts.append(f"experienced in {need_category.lower()} sector")
+
+    # Capacity
+    if "capacity" in criteria:
+        if org.annual_budget and org.annual_budget >= Decimal("5000000"):
+            rationale_parts.append("strong financial capacity")
+        if org.staff_count and org.staff_count >= 20:
+            rationale_parts.append("adequate staffing")
+
+    # Track record
+    if "track_record" in criteria:
+        rationale_parts.append("proven track record in partnerships")
+
+    return f"{rationale_parts[0].capitalize()}, " + ", ".join(rationale_parts[1:]) + "."
+
+
+def hydrate_matches(entries: Sequence[Dict]) -> List[Dict]:
+    """Replace cached ``stakeholder_id`` values with Organization objects."""
+
+    from coordination.models import Organization
+
+    organizations = {
+        str(org.pk): org
+        for org in Organization.objects.in_bulk(
+            [entry["stakeholder_id"] for entry in entries]
+        ).values()
+    }
+    matches = []
+    for entry in entries:
+        org = organizations.get(entry["stakeholder_id"])
+        if org is None:
+            continue
+        match = {key: value for key, value in entry.items() if key != "stakeholder_id"}
+        matches.append({"stakeholder": org, **match})
+    return matches
+
+
+class StakeholderMatrix:
+    """Active organizations encoded as score vectors for batch matching."""
+
+    CRITERIA = (
+        ("geography", 0.2),
+        ("sector", 0.2),
+        ("capacity", 0.1),
+        ("track_record", 0.1),
+    )
+
+    def __init__(self, organizations: Optional[Iterable] = None):
+        if organizations is None:
+            organizations = self._load_organizations()
+        self.organizations = list(organizations)
+        self.capacity = np.asarray(
+            [capacity_score(o.annual_budget, o.staff_count) for o in self.organizations],
+            dtype=float,
+        )
+        self.track_record = np.asarray(
+            [track_record_score(o.track_record_count) for o in self.organizations],
+            dtype=float,
+        )
+        self._sector: Dict[str, np.ndarray] = {}
+        self._geography: Dict[Tuple[str, str, str], np.ndarray] = {}
+
+    @staticmethod
+    def _load_organizations():
+        from coordination.models import Organization
+
+        # Aggregating drops Meta.ordering; restore it so ties rank as before.
+        return (
+            Organization.objects.filter(is_active=True, partnership_status="active")
+            .annotate(
+                track_record_count=Count(
+                    "partnerships",
+                    filter=Q(partnerships__status__in=TRACK_RECORD_STATUSES),
+                    distinct=True,
+                )
+            )
+            .order_by(*Organization._meta.ordering)
+        )
+
+    def __len__(self) -> int:
+        return len(self.organizations)
+
+    def sector_scores(self, need_category: str) -> np.ndarray:
+        """Per-organization sector score for ``need_category``."""
+
+        if need_category not in self._sector:
+            self._sector[need_category] = np.asarray(
+                [
+                    sector_score(o.areas_of_expertise, need_category)
+                    for o in self.organizations
+                ],
+                dtype=float,
+            )
+        return self._sector[need_category]
+
+    def geography_scores(self, communities: Sequence) -> np.ndarray:
+        """``(communities, organizations)`` geographic scores.
+
+        Organizations are scored once per distinct municipality.
+        """
+
+        rows = []
+        for community in communities:
+            municipality = community.municipality
+            place = (
+                municipality.province.name,
+                municipality.province.region.name,
+                municipality.name,
+            )
+            if place not in self._geography:
+                self._geography[place] = np.asarray(
+                    [
+                        geographic_score(o.geographic_coverage, *place)
+                        for o in self.organizations
+                    ],
+                    dtype=float,
+                )
+            rows.append(self._geography[place])
+        return np.vstack(rows) if rows else np.zeros((0, len(self)))
+
+    def match(
+        self,
+        communities: Sequence,
+        need_categories: Sequence[str] = NEED_CATEGORIES,
+        *,
+        top_k: int = 10,
+        min_score: float = 0.6,
+    ) -> Dict[Tuple[object, str], List[Dict]]:
+        """Return compact matches keyed by ``(community_id, need_category)``.
+
+        Matches are ordered by rounded score, ties keeping organization
+        order, exactly as ``StakeholderMatcher`` sorts them.
+        """
+
+        results: Dict[Tuple[object, str], List[Dict]] = {}
+        if not communities:
+            return results
+
+        count = len(self)
+        geography = self.geography_scores(communities)
+        base = geography + self.capacity + self.track_record
+        # Stable tie-break: earlier organizations rank higher at equal score.
+        order = np.arange(count - 1, -1, -1)
+
+        for need in need_categories:
+            sector = self.sector_scores(need)
+            raw = np.minimum(base + sector, 1.0)
+            eligible = raw >= min_score
+            scores = np.round(raw, 2)
+            # Integer keys (score in hundredths, then organization order)
+            # make argpartition select exactly the top_k the sort would keep.
+            keys = np.where(
+                eligible, np.rint(scores * 100).astype(np.int64) * count + order, -1
+            )
+            limit = min(top_k, count)
+
+            for row, community in enumerate(communities):
+                entries: List[Dict] = []
+                if limit:
+                    row_keys = keys[row]
+                    top = np.argpartition(-row_keys, limit - 1)[:limit]
+                    top = top[row_keys[top] >= 0]
+                    top = top[np.argsort(-row_keys[top])]
+                    for index in top:
+                        org = self.organizations[index]
+                        values = (
+                            geography[row, index],
+                            sector[index],
+                            self.capacity[index],
+                            self.track_record[index],
+                        )
+                        criteria = [
+                            name
+                            for (name, threshold), value in zip(self.CRITERIA, values)
+                            if value >= threshold
+                        ]
+                        entries.append(
+                            {
+                                "stakeholder_id": str(org.pk),
+                                "match_score": float(scores[row, index]),
+                                "matching_criteria": criteria,
+                                "rationale": describe_match(
+                                    community, org, need, criteria
+                                ),
+                            }
+                        )
+                results[(community.pk, need)] = entries
+        return results
+
+    def match_and_cache(
+        self,
+        community_ids: Sequence[int],
+        need_categories: Sequence[str] = NEED_CATEGORIES,
+        *,
+        top_k: int = 10,
+        min_score: float = 0.6,
+    ) -> Dict[str, int]:
+        """Match a chunk of communities and cache every result in one write."""
+
+        from communities.models import OBCCommunity
+
+        communities = list(
+            OBCCommunity.objects.filter(pk__in=community_ids)
+            .select_related("barangay__municipality__province__region")
+            .order_by("pk")
+        )
+        results = self.match(
+            communities, need_categories, top_k=top_k, min_score=min_score
+        )
+        cache.set_many(
+            {
+                match_cache_key(community_id, need): entries
+                for (community_id, need), entries in results.items()
+            },
+            timeout=MATCH_CACHE_TIMEOUT,
+        )
+        return {
+            "communities_processed": len(communities),
+            "matches_generated": sum(len(entries) for entries in results.values()),
+        }
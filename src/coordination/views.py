@@ -20,7 +20,7 @@ from django.utils.dateparse import parse_date
 from django.http import Http404, HttpResponseForbidden
 
 from common.utils.moa_permissions import moa_can_edit_organization
-from common.services.locations import build_location_data, get_object_centroid
+from common.services.locations import get_location_data, get_object_centroid
 from common.models import Municipality, RecurringEventPattern
 from common.work_item_model import WorkItem
 from common.forms.work_items import WorkItemForm
@@ -262,7 +262,7 @@ def coordination_note_create(request):
         "page_title": "Coordination Notes",
         "page_heading": "Coordination Notes",
         "return_url": reverse("common:coordination_events"),
-        "location_data": build_location_data(),
+        "location_data": get_location_data(include_barangays=False),
         "community_locations": _build_community_locations(),
     }
     return render(request, "coordination/coordination_note_form.html", context)
@@ -674,7 +674,7 @@ def partnership_create(request):
         "page_heading": "New Partnership Agreement",
         "submit_label": "Create partnership",
         "is_edit": False,
-        "location_data": build_location_data(include_barangays=True),
+        "location_data": get_location_data(include_barangays=False),
         "community_locations": _build_community_locations(),
     }
     return render(request, "coordination/partnership_form.html", context)
@@ -789,7 +789,7 @@ def partnership_update(request, partnership_id):
         "page_heading": f"Edit {partnership.title}",
         "submit_label": "Save changes",
         "is_edit": True,
-        "location_data": build_location_data(include_barangays=True),
+        "location_data": get_location_data(include_barangays=False),
         "community_locations": _build_community_locations(),
     }
     return render(request, "coordination/partnership_form.html", context)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import time
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional
@@ -10,9 +11,9 @@ from typing import Dict, Iterable, List, Optional
 from django.conf import settings
 from django.core.management.base import BaseCommand, CommandError
 from django.db import transaction
-from django.utils.text import slugify
 
 from common.models import Barangay, Municipality, Province, Region
+from data_imports.services import HierarchyResolver, build_code
 
 logger = logging.getLogger(__name__)
 
@@ -154,18 +155,6 @@ def parse_population_file(file_path: Path) -> List[ProvinceRecord]:
     return provinces
 
 
-def build_code(*parts: str) -> str:
-    """Generate a unique hierarchical code limited to 64 characters."""
-
-    slug_parts: List[str] = []
-    for part in parts:
-        slug = slugify(part)
-        if slug:
-            slug_parts.append(slug.upper())
-    code = "-".join(slug_parts)
-    return code[:64]
-
-
 def infer_municipality_type(name: str) -> str:
     """Infer municipality type based on naming conventions."""
 
@@ -188,6 +177,11 @@ class Command(BaseCommand):
             "--dataset-dir",
             help="Override the default dataset directory (useful for testing or alternative data sources).",
         )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report what would change without writing to the database.",
+        )
 
     def handle(self, *args, **options) -> None:
         region_codes = options.get("regions") or REGION_DATASETS.keys()
@@ -202,16 +196,9 @@ class Command(BaseCommand):
         if not dataset_dir.exists():
             raise CommandError(f"Dataset directory does not exist: {dataset_dir}")
 
-        stats = {
-            "regions_created": 0,
-            "regions_updated": 0,
-            "provinces_created": 0,
-            "provinces_updated": 0,
-            "municipalities_created": 0,
-            "municipalities_updated": 0,
-            "barangays_created": 0,
-            "barangays_updated": 0,
-        }
+        started = time.perf_counter()
+        resolver = HierarchyResolver(dry_run=options["dry_run"])
+        node_count = 0
 
         with transaction.atomic():
             for code in region_codes:
@@ -224,9 +211,16 @@ class Command(BaseCommand):
                 dataset_file = dataset_dir / config["filename"]
                 province_records = parse_population_file(dataset_file)
                 self.stdout.write(f"Importing {code} from {dataset_file.name}...")
-                self._import_region_data(code, config["name"], province_records, stats)
+                node_count += self._import_region_data(
+                    resolver, code, config["name"], province_records
+                )
+                resolver.flush()
+            resolver.finalize()
 
-        self.stdout.write(self.style.SUCCESS("Population hierarchy import completed."))
+        elapsed = time.perf_counter() - started
+        stats = resolver.stats
+        prefix = "[DRY RUN] " if options["dry_run"] else ""
+        self.stdout.write(self.style.SUCCESS(f"{prefix}Population hierarchy import completed."))
         self.stdout.write(
             "Created: regions={regions_created}, provinces={provinces_created}, municipalities={municipalities_created}, barangays={barangays_created}".format(
                 **stats
@@ -237,129 +231,69 @@ class Command(BaseCommand):
                 **stats
             )
         )
+        rate = node_count / elapsed if elapsed else 0
+        self.stdout.write(
+            f"Processed {node_count} rows in {elapsed:.2f}s ({rate:.0f} rows/sec)"
+        )
 
     def _import_region_data(
         self,
+        resolver: HierarchyResolver,
         region_code: str,
         region_name: str,
         provinces: Iterable[ProvinceRecord],
-        stats: Dict[str, int],
-    ) -> None:
-        region, created = Region.objects.get_or_create(
-            code=region_code,
-            defaults={"name": region_name, "is_active": True},
-        )
+    ) -> int:
+        """Stage one region's records on ``resolver``; return the rows processed."""
 
-        region_updated = False
-        if region.name != region_name:
-            region.name = region_name
-            region_updated = True
-        if not region.is_active:
-            region.is_active = True
-            region_updated = True
-        if region_updated:
-            region.save()
-
-        if created:
-            stats["regions_created"] += 1
-        elif region_updated:
-            stats["regions_updated"] += 1
+        region, created = resolver.get_or_build(
+            Region, region_name, code=region_code, is_active=True
+        )
+        if not created:
+            resolver.update(region, name=region_name, is_active=True)
 
+        node_count = 1
         for province_record in provinces:
-            province_code = build_code(region.code, province_record.name)
-            province, province_created = Province.objects.get_or_create(
-                region=region,
-                name=province_record.name,
-                defaults={
-                    "code": province_code,
-                    "population_total": province_record.population,
-                    "is_active": True,
-                },
+            province = self._stage(
+                resolver,
+                Province,
+                province_record.name,
+                region,
+                population_total=province_record.population,
             )
-
-            province_changed = False
-            if province.population_total != province_record.population:
-                province.population_total = province_record.population
-                province_changed = True
-            if not province.is_active:
-                province.is_active = True
-                province_changed = True
-            if not province.code:
-                province.code = province_code
-                province_changed = True
-            if province_changed:
-                province.save()
-
-            if province_created:
-                stats["provinces_created"] += 1
-            elif province_changed:
-                stats["provinces_updated"] += 1
+            node_count += 1
 
             for municipality_record in province_record.municipalities:
-                municipality_code = build_code(
-                    province.code or province_code, municipality_record.name
+                municipality = self._stage(
+                    resolver,
+                    Municipality,
+                    municipality_record.name,
+                    province,
+                    population_total=municipality_record.population,
+                    municipality_type=infer_municipality_type(municipality_record.name),
                 )
-                municipality_type = infer_municipality_type(municipality_record.name)
-                municipality, municipality_created = Municipality.objects.get_or_create(
-                    province=province,
-                    name=municipality_record.name,
-                    defaults={
-                        "code": municipality_code,
-                        "municipality_type": municipality_type,
-                        "population_total": municipality_record.population,
-                        "is_active": True,
-                    },
-                )
-
-                municipality_changed = False
-                if municipality.population_total != municipality_record.population:
-                    municipality.population_total = municipality_record.population
-                    municipality_changed = True
-                if municipality.municipality_type != municipality_type:
-                    municipality.municipality_type = municipality_type
-                    municipality_changed = True
-                if not municipality.is_active:
-                    municipality.is_active = True
-                    municipality_changed = True
-                if not municipality.code:
-                    municipality.code = municipality_code
-                    municipality_changed = True
-                if municipality_changed:
-                    municipality.save()
-
-                if municipality_created:
-                    stats["municipalities_created"] += 1
-                elif municipality_changed:
-                    stats["municipalities_updated"] += 1
+                node_count += 1
 
                 for barangay_record in municipality_record.barangays:
-                    barangay_code = build_code(
-                        municipality.code or municipality_code, barangay_record.name
-                    )
-                    barangay, barangay_created = Barangay.objects.get_or_create(
-                        municipality=municipality,
-                        name=barangay_record.name,
-                        defaults={
-                            "code": barangay_code,
-                            "population_total": barangay_record.population,
-                            "is_active": True,
-                        },
+                    self._stage(
+                        resolver,
+                        Barangay,
+                        barangay_record.name,
+                        municipality,
+                        population_total=barangay_record.population,
                     )
+                    node_count += 1
+
+        return node_count
 
-                    barangay_changed = False
-                    if barangay.population_total != barangay_record.population:
-                        barangay.population_total = barangay_record.population
-                        barangay_changed = True
-                    if not barangay.is_active:
-                        barangay.is_active = True
-                        barangay_changed = True
-                    if not barangay.code:
-                        barangay.code = barangay_code
-                        barangay_changed = True
-                    if barangay_changed:
-                        barangay.save()
-
-                    if barangay_created:
-                        stats["barangays_created"] += 1
-                    elif barangay_changed:
-                        stats["barangays_updated"] += 1
+    def _stage(self, resolver: HierarchyResolver, model, name: str, parent, **values):
+        """Create or update one node, filling in a missing code."""
+
+        code = build_code(parent.code, name)
+        node, created = resolver.get_or_build(
+            model, name, parent, code=code, is_active=True, **values
+        )
+        if not created:
+            if not node.code:
+                values["code"] = code
+            resolver.update(node, is_active=True, **values)
+        return node
@@ -0,0 +1,610 @@
+"""Bulk import pipeline for OBC communities and the administrative hierarchy.
+
+Source rows are streamed and processed in chunks:
+
+- the region/province/municipality/barangay hierarchy is preloaded into
+  dictionaries keyed by normalised name, and missing nodes are created with
+  one ``bulk_create`` per level and chunk;
+- communities are written with ``bulk_create``/``bulk_update``;
+- ``ImportLog`` entries are buffered and inserted in batches.
+
+Each chunk commits in its own transaction, so progress is visible while the
+import runs. A chunk that fails is retried one row at a time, so only the
+rows that are actually bad get reported as errors.
+
+Bulk writes send no model signals, so the per-save side effects (coverage
+sync, municipal profile aggregation, community history, cache invalidation
+and geocoding) run once per import instead of once per row.
+"""
+
+from __future__ import annotations
+
+import csv
+import logging
+import time
+from contextlib import contextmanager
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from django.db import transaction
+from django.utils import timezone
+from django.utils.text import slugify
+
+from common.ai_services.chat.query_executor import invalidate_query_cache
+from common.models import Barangay, Municipality, Province, Region
+from common.services.geocoding_queue import queue_location_geocoding
+from common.services.locations import (
+    invalidate_location_caches,
+    invalidate_location_geodata_caches,
+)
+from communities.models import OBCCommunity
+from communities.utils.coverage_sync import sync_municipalities
+from communities.utils.similarity import invalidate_community_features
+from municipal_profiles.models import OBCCommunityHistory
+from municipal_profiles.services import record_community_history_bulk
+
+from .models import ImportLog
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 1000
+
+HIERARCHY = (Region, Province, Municipality, Barangay)
+
+PARENT_FIELDS = {
+    Province: "region",
+    Municipality: "province",
+    Barangay: "municipality",
+}
+
+# Columns loaded for every preloaded node; keep the heavy GeoJSON fields out.
+LOAD_FIELDS = {
+    Region: ("id", "code", "name", "is_active"),
+    Province: ("id", "code", "name", "region", "is_active", "population_total"),
+    Municipality: (
+        "id",
+        "code",
+        "name",
+        "province",
+        "municipality_type",
+        "is_active",
+        "population_total",
+    ),
+    Barangay: ("id", "code", "name", "municipality", "is_active", "population_total"),
+}
+
+STAT_PREFIXES = {
+    Region: "regions",
+    Province: "provinces",
+    Municipality: "municipalities",
+    Barangay: "barangays",
+}
+
+DEFAULT_COMMUNITY_MAPPING = {
+    "name": "community_name",
+    "region": "region_name",
+    "province": "province_name",
+    "municipality": "municipality_name",
+    "barangay": "barangay_name",
+    "population": "population",
+    "households": "households",
+    "cultural_background": "cultural_background",
+    "primary_language": "primary_language",
+    "established_year": "established_year",
+    "settlement_type": "settlement_type",
+    "unemployment_rate": "unemployment_rate",
+}
+
+LOCATION_KEYS = ("region", "province", "municipality", "barangay")
+
+
+def normalise_key(value) -> str:
+    """Return the case- and whitespace-insensitive lookup key for a name."""
+
+    return " ".join(str(value or "").split()).casefold()
+
+
+def build_code(*parts: str) -> str:
+    """Generate a unique hierarchical code limited to 64 characters."""
+
+    slug_parts: List[str] = []
+    for part in parts:
+        slug = slugify(part)
+        if slug:
+            slug_parts.append(slug.upper())
+    code = "-".join(slug_parts)
+    return code[:64]
+
+
+def safe_int(value) -> Optional[int]:
+    """Safely convert string to integer."""
+
+    if not value or not str(value).strip():
+        return None
+    try:
+        return int(str(value).strip().replace(",", ""))
+    except (ValueError, TypeError):
+        return None
+
+
+def iter_csv_rows(path: str, encoding: str = "utf-8") -> Iterator[Tuple[int, Dict[str, str]]]:
+    """Yield ``(row_number, row)`` pairs without reading the whole file."""
+
+    with open(path, "r", encoding=encoding, newline="") as handle:
+        # Row numbers start at 2 to account for the header line.
+        for row_number, row in enumerate(csv.DictReader(handle), start=2):
+            yield row_number, row
+
+
+def count_csv_rows(path: str, encoding: str = "utf-8") -> int:
+    """Count data rows in a CSV file with a streaming pass."""
+
+    with open(path, "r", encoding=encoding, newline="") as handle:
+        return sum(1 for _ in csv.DictReader(handle))
+
+
+def chunked(iterable: Iterable, size: int) -> Iterator[List]:
+    """Yield lists of at most ``size`` items from ``iterable``."""
+
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class HierarchyResolver:
+    """Resolve administrative names against a preloaded copy of the hierarchy.
+
+    Lookups never query the database. Missing nodes are built in memory by
+    ``get_or_build`` and changed ones are recorded by ``update``; ``flush``
+    writes both with one ``bulk_create``/``bulk_update`` per level, parents
+    first. In dry-run mode nothing is written but the statistics still count
+    what would have changed.
+    """
+
+    def __init__(self, *, dry_run: bool = False):
+        self.dry_run = dry_run
+        self.stats: Dict[str, int] = {
+            f"{prefix}_{action}": 0
+            for prefix in STAT_PREFIXES.values()
+            for action in ("created", "updated")
+        }
+        self.created: Dict[type, list] = {model: [] for model in HIERARCHY}
+        self.reload()
+
+    def reload(self) -> None:
+        """Load the hierarchy from the database, discarding unsaved changes."""
+
+        self._nodes: Dict[tuple, object] = {}
+        self._regions_by_code: Dict[str, Region] = {}
+        self._codes: Dict[type, set] = {model: set() for model in HIERARCHY}
+        self._to_create: Dict[type, list] = {model: [] for model in HIERARCHY}
+        self._to_update: Dict[type, dict] = {model: {} for model in HIERARCHY}
+        self._update_fields: Dict[type, set] = {model: set() for model in HIERARCHY}
+
+        parents: Dict[int, object] = {}
+        for model in HIERARCHY:
+            loaded = {}
+            parent_field = PARENT_FIELDS.get(model)
+            for node in model.objects.only(*LOAD_FIELDS[model]).iterator(chunk_size=2000):
+                parent = None
+                if parent_field:
+                    parent = parents.get(getattr(node, f"{parent_field}_id"))
+                    setattr(node, parent_field, parent)
+                self._register(model, parent, node)
+                loaded[node.pk] = node
+            parents = loaded
+
+    def _register(self, model, parent, node) -> None:
+        key = (model, id(parent) if parent is not None else None, normalise_key(node.name))
+        self._nodes.setdefault(key, node)
+        self._codes[model].add(node.code)
+        if model is Region:
+            self._regions_by_code.setdefault(node.code.upper(), node)
+
+    def _unique_code(self, model, base: str) -> str:
+        max_length = model._meta.get_field("code").max_length
+        base = (base or "IMPORTED")[:max_length]
+        code, suffix = base, 1
+        while code in self._codes[model]:
+            suffix += 1
+            tail = f"-{suffix}"
+            code = f"{base[: max_length - len(tail)]}{tail}"
+        return code
+
+    def find(self, model, name: str, parent=None):
+        """Return the preloaded node called ``name`` under ``parent``, if any."""
+
+        node = self._nodes.get(
+            (model, id(parent) if parent is not None else None, normalise_key(name))
+        )
+        if node is None and model is Region:
+            node = self._regions_by_code.get(str(name).strip().upper())
+        return node
+
+    def get_or_build(self, model, name: str, parent=None, *, code: str = "", **defaults):
+        """Return ``(node, created)``; new nodes are saved by the next ``flush``.
+
+        Regions given an explicit ``code`` are matched on it before the name.
+        """
+
+        node = None
+        if model is Region and code:
+            node = self._regions_by_code.get(code.upper())
+        if node is None:
+            node = self.find(model, name, parent)
+        if node is not None:
+            return node, False
+
+        if not code:
+            code = build_code(parent.code, name) if parent is not None else build_code(name)
+        node = model(name=name, code=self._unique_code(model, code), **defaults)
+        if parent is not None:
+            setattr(node, PARENT_FIELDS[model], parent)
+        self._register(model, parent, node)
+        self._to_create[model].append(node)
+        return node, True
+
+    def update(self, node, **values) -> bool:
+        """Apply ``values`` to ``node``; return whether anything changed."""
+
+        changed = [field for field, value in values.items() if getattr(node, field) != value]
+        for field in changed:
+            setattr(node, field, values[field])
+        # Nodes still waiting to be created carry the new values with them.
+        if changed and node.pk is not None:
+            model = type(node)
+            self._to_update[model][id(node)] = node
+            self._update_fields[model].update(changed)
+        return bool(changed)
+
+    def flush(self) -> None:
+        """Write pending nodes with one bulk statement per level, parents first."""
+
+        now = timezone.now()
+        for model in HIERARCHY:
+            to_create, self._to_create[model] = self._to_create[model], []
+            to_update = list(self._to_update[model].values())
+            fields = sorted(self._update_fields[model] | {"updated_at"})
+            self._to_update[model], self._update_fields[model] = {}, set()
+
+            prefix = STAT_PREFIXES[model]
+            self.stats[f"{prefix}_created"] += len(to_create)
+            self.stats[f"{prefix}_updated"] += len(to_update)
+            if self.dry_run:
+                continue
+
+            if to_create:
+                model.objects.bulk_create(to_create, batch_size=CHUNK_SIZE)
+                self.created[model].extend(to_create)
+            if to_update:
+                for node in to_update:
+                    node.updated_at = now
+                model.objects.bulk_update(to_update, fields, batch_size=CHUNK_SIZE)
+
+    @contextmanager
+    def savepoint(self):
+        """Run a block atomically, rolling back the preloaded state with it."""
+
+        created = {model: len(nodes) for model, nodes in self.created.items()}
+        stats = dict(self.stats)
+        try:
+            with transaction.atomic():
+                yield
+        except Exception:
+            for model, count in created.items():
+                del self.created[model][count:]
+            self.stats = stats
+            self.reload()
+            raise
+
+    def finalize(self) -> None:
+        """Run the location side effects that the bulk writes skipped."""
+
+        if self.dry_run or not any(self.stats.values()):
+            return
+
+        invalidate_location_caches()
+        invalidate_query_cache(
+            [
+                model.__name__
+                for model, prefix in STAT_PREFIXES.items()
+                if self.stats[f"{prefix}_created"] or self.stats[f"{prefix}_updated"]
+            ]
+        )
+        # New locations have no coordinates yet; one task geocodes them all.
+        for model in (Municipality, Barangay):
+            for node in self.created[model]:
+                queue_location_geocoding(node)
+
+
+class ImportLogBuffer:
+    """Collect ``ImportLog`` entries and insert them in batches."""
+
+    def __init__(
+        self,
+        import_session=None,
+        *,
+        batch_size: int = CHUNK_SIZE,
+        echo: Optional[Callable[[str, str], None]] = None,
+    ):
+        self.import_session = import_session
+        self.batch_size = batch_size
+        self.echo = echo
+        self._entries: List[ImportLog] = []
+
+    def add(self, level: str, message: str, row_number=None, record_data=None) -> None:
+        if self.echo:
+            self.echo(level, message)
+        if self.import_session is None:
+            return
+        self._entries.append(
+            ImportLog(
+                import_session=self.import_session,
+                level=level,
+                message=message,
+                row_number=row_number,
+                record_data=record_data or {},
+            )
+        )
+        if len(self._entries) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        entries, self._entries = self._entries, []
+        if entries:
+            ImportLog.objects.bulk_create(entries, batch_size=self.batch_size)
+
+
+class CommunityImporter:
+    """Import OBC communities from mapped CSV rows in chunks.
+
+    A barangay holds at most one community, so rows are matched to existing
+    communities by barangay. Use ``run`` with the rows from ``iter_csv_rows``;
+    it returns the import statistics, including ``rows_per_second``.
+    """
+
+    def __init__(
+        self,
+        *,
+        mapping: Optional[Dict[str, str]] = None,
+        import_session=None,
+        dry_run: bool = False,
+        update_existing: bool = False,
+        chunk_size: int = CHUNK_SIZE,
+        changed_by=None,
+        echo: Optional[Callable[[str, str], None]] = None,
+    ):
+        self.mapping = {**DEFAULT_COMMUNITY_MAPPING, **(mapping or {})}
+        self.import_session = import_session
+        self.dry_run = dry_run
+        self.update_existing = update_existing
+        self.chunk_size = chunk_size
+        self.changed_by = changed_by
+        self.logs = ImportLogBuffer(import_session, echo=echo)
+        self.stats: Dict[str, float] = {
+            "total": 0,
+            "imported": 0,
+            "updated": 0,
+            "skipped": 0,
+            "errors": 0,
+        }
+        self._touched_municipalities: set = set()
+
+    def _column(self, row: Dict[str, str], field: str, default=""):
+        return row.get(self.mapping.get(field, ""), default)
+
+    @staticmethod
+    def _barangay_key(barangay):
+        """Identify a barangay across chunks, saved or (in a dry run) not."""
+
+        if barangay.pk is not None:
+            return barangay.pk
+        names, node = [], barangay
+        while node is not None:
+            names.append(normalise_key(node.name))
+            parent_field = PARENT_FIELDS.get(type(node))
+            node = getattr(node, parent_field) if parent_field else None
+        return tuple(names)
+
+    def _community_values(self, row: Dict[str, str]) -> Dict[str, object]:
+        values = {
+            "population": safe_int(self._column(row, "population")),
+            "households": safe_int(self._column(row, "households")),
+            "cultural_background": self._column(row, "cultural_background"),
+            "primary_language": self._column(row, "primary_language"),
+            "established_year": safe_int(self._column(row, "established_year")),
+            "settlement_type": self._column(row, "settlement_type", "village"),
+            "unemployment_rate": self._column(row, "unemployment_rate", "developing"),
+        }
+        return {key: value for key, value in values.items() if value is not None}
+
+    def run(self, rows: Iterable[Tuple[int, Dict[str, str]]]) -> Dict[str, float]:
+        started = time.perf_counter()
+        resolver = HierarchyResolver(dry_run=self.dry_run)
+        self._existing_barangays = set(
+            OBCCommunity.all_objects.values_list("barangay_id", flat=True)
+        )
+
+        for chunk in chunked(rows, self.chunk_size):
+            self.stats["total"] += len(chunk)
+            try:
+                with resolver.savepoint():
+                    result = self._import_chunk(resolver, chunk)
+            except Exception:
+                logger.warning(
+                    "Rows %s-%s failed as a chunk; retrying one by one",
+                    chunk[0][0],
+                    chunk[-1][0],
+                    exc_info=True,
+                )
+                self._import_rows_singly(resolver, chunk)
+            else:
+                self._merge(result)
+            self._save_progress()
+
+        if not self.dry_run:
+            try:
+                # One transaction so the on-commit batches (geocoding, cache
+                # bumps) coalesce across everything imported.
+                with transaction.atomic():
+                    self._finalize(resolver)
+            except Exception as e:
+                # Imported rows are already committed; report the failed
+                # roll-ups instead of losing the whole import.
+                logger.exception("Post-import updates failed")
+                self.logs.add("error", f"Post-import updates failed: {str(e)}")
+                self.stats["finalize_failed"] = True
+        self.logs.flush()
+
+        elapsed = time.perf_counter() - started
+        self.stats["elapsed"] = round(elapsed, 3)
+        self.stats["rows_per_second"] = round(self.stats["total"] / elapsed, 1) if elapsed else 0.0
+        self.stats.update(resolver.stats)
+        return self.stats
+
+    def _import_rows_singly(self, resolver: HierarchyResolver, chunk) -> None:
+        for row_number, row in chunk:
+            try:
+                with resolver.savepoint():
+                    result = self._import_chunk(resolver, [(row_number, row)])
+            except Exception as e:
+                logger.exception("Failed to import row %s", row_number)
+                self.logs.add(
+                    "error", f"Error importing row {row_number}: {str(e)}", row_number, row
+                )
+                self.stats["errors"] += 1
+            else:
+                self._merge(result)
+
+    def _import_chunk(self, resolver: HierarchyResolver, chunk) -> Dict[str, object]:
+        counts = {"imported": 0, "updated": 0, "skipped": 0}
+        logs = []
+
+        resolved = []
+        for row_number, row in chunk:
+            name = (self._column(row, "name") or "").strip()
+            location = [(self._column(row, key) or "").strip() for key in LOCATION_KEYS]
+            if not name or not all(location):
+                logs.append(("warning", f"Missing required fields in row {row_number}", row_number, row))
+                counts["skipped"] += 1
+                continue
+
+            parent = None
+            for model, location_name in zip(HIERARCHY, location):
+                parent, _ = resolver.get_or_build(model, location_name, parent)
+            resolved.append((row_number, row, name, parent))
+        resolver.flush()
+
+        existing = {}
+        if self.update_existing:
+            barangay_ids = [
+                barangay.pk for *_, barangay in resolved if barangay.pk in self._existing_barangays
+            ]
+            existing = {
+                community.barangay_id: community
+                for community in OBCCommunity.all_objects.filter(barangay_id__in=barangay_ids)
+            }
+
+        new: Dict[int, OBCCommunity] = {}
+        changed: Dict[int, OBCCommunity] = {}
+        changed_fields = set()
+        for row_number, row, name, barangay in resolved:
+            key = id(barangay)
+            values = self._community_values(row)
+            known = (
+                key in new
+                or key in changed
+                or self._barangay_key(barangay) in self._existing_barangays
+            )
+
+            if not known:
+                new[key] = OBCCommunity(name=name, barangay=barangay, **values)
+                verb = "Would import" if self.dry_run else "Created"
+                logs.append(("info", f"{verb} community: {name}", row_number, None))
+                counts["imported"] += 1
+                continue
+
+            if not self.update_existing:
+                logs.append(("warning", f"Community already exists: {name}", row_number, None))
+                counts["skipped"] += 1
+                continue
+
+            # A dry run has not written communities planned by earlier chunks.
+            community = new.get(key) or changed.get(key) or existing.get(barangay.pk)
+            if community is not None:
+                community.barangay = barangay
+                community.name = name
+                for field, value in values.items():
+                    setattr(community, field, value)
+                if key not in new:
+                    changed[key] = community
+                    changed_fields.update(values, {"name"})
+            verb = "Would update" if self.dry_run else "Updated"
+            logs.append(("info", f"{verb} community: {name}", row_number, None))
+            counts["updated"] += 1
+
+        written = list(new.values()) + list(changed.values())
+        if not self.dry_run and written:
+            for community in written:
+                community.sync_legacy_fields()
+            OBCCommunity.objects.bulk_create(list(new.values()), batch_size=self.chunk_size)
+            if changed:
+                now = timezone.now()
+                for community in changed.values():
+                    community.updated_at = now
+                OBCCommunity.all_objects.bulk_update(
+                    list(changed.values()),
+                    sorted(changed_fields | {"community_names", "languages_spoken", "updated_at"}),
+                    batch_size=self.chunk_size,
+                )
+            record_community_history_bulk(
+                instances=written,
+                source=OBCCommunityHistory.SOURCE_IMPORT,
+                changed_by=self.changed_by,
+                note="Imported",
+                batch_size=self.chunk_size,
+            )
+
+        return {"counts": counts, "logs": logs, "written": written}
+
+    def _merge(self, result: Dict[str, object]) -> None:
+        for field, count in result["counts"].items():
+            self.stats[field] += count
+        for entry in result["logs"]:
+            self.logs.add(*entry)
+        for community in result["written"]:
+            self._existing_barangays.add(self._barangay_key(community.barangay))
+            if not self.dry_run:
+                self._touched_municipalities.add(community.barangay.municipality.pk)
+
+    def _save_progress(self) -> None:
+        if self.import_session is None or self.dry_run:
+            return
+        self.logs.flush()
+        self.import_session.records_processed = self.stats["total"]
+        self.import_session.records_imported = self.stats["imported"]
+        self.import_session.records_updated = self.stats["updated"]
+        self.import_session.records_skipped = self.stats["skipped"]
+        self.import_session.records_failed = self.stats["errors"]
+        self.import_session.save()
+
+    def _finalize(self, resolver: HierarchyResolver) -> None:
+        """Apply the per-save side effects once for everything imported."""
+
+        resolver.finalize()
+        if not self._touched_municipalities:
+            return
+
+        user_id = getattr(self.changed_by, "pk", None)
+        sync_stats = sync_municipalities(
+            {municipality_id: user_id for municipality_id in self._touched_municipalities}
+        )
+        invalidate_location_geodata_caches()
+        invalidate_community_features()
+        invalidate_query_cache(["OBCCommunity"])
+
+        self.stats["municipalities_synced"] = sync_stats["municipalities_synced"]
+        self.stats["provinces_synced"] = sync_stats["provinces_synced"]
@@ -0,0 +1,185 @@
+"""Tests for the chunked community import pipeline."""
+
+import csv
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from common.models import Barangay, Municipality, Province, Region
+from communities.models import MunicipalityCoverage, OBCCommunity, ProvinceCoverage
+from data_imports.models import DataImport, ImportLog
+from data_imports.services import CommunityImporter, HierarchyResolver, iter_csv_rows
+from municipal_profiles.models import MunicipalOBCProfile, OBCCommunityHistory
+
+pytestmark = [pytest.mark.component, pytest.mark.usefixtures("clear_cache")]
+
+HEADER = [
+    "community_name",
+    "region_name",
+    "province_name",
+    "municipality_name",
+    "barangay_name",
+    "population",
+    "households",
+]
+
+
+def _rows(count, municipalities=5, population=100):
+    return [
+        [
+            f"Community {index}",
+            "Bulk Test Region",
+            "Bulk Province",
+            f"Town {index % municipalities}",
+            f"Barangay {index}",
+            str(population),
+            "20",
+        ]
+        for index in range(count)
+    ]
+
+
+def _write_csv(path, rows):
+    with open(path, "w", newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(HEADER)
+        writer.writerows(rows)
+    return str(path)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_import_creates_hierarchy_and_runs_side_effects_once(tmp_path):
+    csv_file = _write_csv(tmp_path / "communities.csv", _rows(250))
+
+    with CaptureQueriesContext(connection) as queries:
+        stats = CommunityImporter(chunk_size=100).run(iter_csv_rows(csv_file))
+
+    assert stats["imported"] == 250
+    assert stats["errors"] == 0
+    assert stats["rows_per_second"] > 0
+    assert stats["barangays_created"] == 250
+    # Query count scales with chunks and municipalities, not rows.
+    assert len(queries) < 250
+
+    region = Region.objects.get(name="Bulk Test Region")
+    assert Province.objects.filter(region=region).count() == 1
+    assert Municipality.objects.filter(province__region=region).count() == 5
+    assert OBCCommunity.objects.filter(barangay__municipality__province__region=region).count() == 250
+    assert OBCCommunityHistory.objects.filter(source=OBCCommunityHistory.SOURCE_IMPORT).count() == 250
+
+    community = OBCCommunity.objects.get(name="Community 7")
+    assert community.community_names == "Community 7"
+    assert community.population == 100
+
+    coverage = MunicipalityCoverage.objects.get(municipality=community.barangay.municipality)
+    assert coverage.total_obc_communities == 50
+    assert ProvinceCoverage.objects.filter(province__region=region).exists()
+    assert MunicipalOBCProfile.objects.filter(municipality__province__region=region).count() == 5
+
+
+@pytest.mark.django_db(transaction=True)
+def test_existing_communities_are_skipped_or_updated(tmp_path):
+    CommunityImporter().run(iter_csv_rows(_write_csv(tmp_path / "first.csv", _rows(10))))
+
+    second = _write_csv(tmp_path / "second.csv", _rows(12, population=300))
+    stats = CommunityImporter().run(iter_csv_rows(second))
+    assert (stats["imported"], stats["skipped"]) == (2, 10)
+    assert OBCCommunity.objects.get(name="Community 0").population == 100
+
+    stats = CommunityImporter(update_existing=True).run(iter_csv_rows(second))
+    assert (stats["imported"], stats["updated"]) == (0, 12)
+    assert OBCCommunity.objects.get(name="Community 0").population == 300
+    assert Barangay.objects.filter(name__startswith="Barangay ").count() == 12
+
+
+@pytest.mark.django_db(transaction=True)
+def test_dry_run_command_writes_nothing(tmp_path):
+    csv_file = _write_csv(tmp_path / "communities.csv", _rows(20) + [["", "", "", "", "", "", ""]])
+    session = DataImport.objects.create(import_type="communities", title="Dry run")
+    regions = Region.objects.count()
+
+    out = StringIO()
+    call_command(
+        "import_communities", csv_file, "--dry-run", "--import-session", str(session.id), stdout=out
+    )
+
+    assert Region.objects.count() == regions
+    assert not OBCCommunity.objects.filter(name__startswith="Community ").exists()
+    assert "Imported: 20, Updated: 0, Skipped: 1" in out.getvalue()
+    session.refresh_from_db()
+    assert session.records_total is None
+    assert (session.records_imported, session.records_skipped) == (0, 0)
+    assert ImportLog.objects.filter(import_session=session, level="warning").count() == 1
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.parametrize("update_existing", [False, True])
+def test_dry_run_counts_duplicates_across_chunks_like_a_real_run(tmp_path, update_existing):
+    rows = _rows(3)
+    csv_file = _write_csv(tmp_path / "communities.csv", rows + [rows[0]])
+
+    def run(dry_run):
+        stats = CommunityImporter(
+            chunk_size=2, dry_run=dry_run, update_existing=update_existing
+        ).run(iter_csv_rows(csv_file))
+        return stats["imported"], stats["updated"], stats["skipped"]
+
+    expected = (3, 1, 0) if update_existing else (3, 0, 1)
+    assert run(dry_run=True) == expected
+    assert run(dry_run=False) == expected
+
+
+@pytest.mark.django_db(transaction=True)
+def test_failed_chunk_is_retried_row_by_row(tmp_path):
+    rows = _rows(4)
+    rows[3][5] = "-5"  # violates the positive population constraint
+    csv_file = _write_csv(tmp_path / "communities.csv", rows)
+    session = DataImport.objects.create(import_type="communities", title="Bad row")
+
+    stats = CommunityImporter(chunk_size=2, import_session=session).run(
+        iter_csv_rows(csv_file)
+    )
+
+    assert (stats["imported"], stats["errors"]) == (3, 1)
+    assert set(OBCCommunity.objects.values_list("name", flat=True)) >= {
+        "Community 0",
+        "Community 1",
+        "Community 2",
+    }
+    assert Barangay.objects.filter(name="Barangay 2").exists()
+    assert not Barangay.objects.filter(name="Barangay 3").exists()
+    errors = ImportLog.objects.filter(import_session=session, level="error")
+    assert list(errors.values_list("row_number", flat=True)) == [5]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_chunks_commit_before_post_import_updates(tmp_path, monkeypatch):
+    def fail(*args, **kwargs):
+        raise RuntimeError("coverage sync unavailable")
+
+    monkeypatch.setattr("data_imports.services.sync_municipalities", fail)
+    csv_file = _write_csv(tmp_path / "communities.csv", _rows(4))
+
+    stats = CommunityImporter(chunk_size=2).run(iter_csv_rows(csv_file))
+
+    assert stats["imported"] == 4
+    assert stats["finalize_failed"] is True
+    assert OBCCommunity.objects.filter(name__startswith="Community ").count() == 4
+
+
+@pytest.mark.django_db
+def test_resolver_matches_names_loosely_and_keeps_codes_unique():
+    region = Region.objects.create(code="RTEST", name="Resolver Region")
+    Province.objects.create(region=region, code="RTEST-DUP", name="Dup")
+
+    resolver = HierarchyResolver()
+    assert resolver.find(Region, "  resolver   REGION ") == region
+    assert resolver.find(Region, "rtest") == region
+
+    province, created = resolver.get_or_build(Province, "Other", region, code="RTEST-DUP")
+    assert created and province.code == "RTEST-DUP-2"
+    resolver.flush()
+    assert Province.objects.get(code="RTEST-DUP-2").region == region
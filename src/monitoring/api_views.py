@@ -9,6 +9,8 @@ from rest_framework.filters import OrderingFilter, SearchFilter
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
 
+from common.mixins.api_mixins import DeltaSyncMixin
+
 from .models import MonitoringEntry, MonitoringUpdate
 from .serializers import (
     MonitoringEntrySerializer,
@@ -22,7 +24,7 @@ from .serializers import (
 from .services.budget_distribution import BudgetDistributionService
 
 
-class MonitoringEntryViewSet(viewsets.ModelViewSet):
+class MonitoringEntryViewSet(DeltaSyncMixin, viewsets.ModelViewSet):
     """CRUD operations for monitoring entries."""
 
     serializer_class = MonitoringEntrySerializer
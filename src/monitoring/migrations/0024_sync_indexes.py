@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('monitoring', '0023_monitoringentry_monitoring_entry_budget_allocation_within_ceiling_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='monitoringentry',
+            index=models.Index(fields=['updated_at', 'id'], name='monitoring_entry_sync_idx'),
+        ),
+    ]
@@ -823,6 +823,9 @@ class MonitoringEntry(models.Model):
         ordering = ["-updated_at", "-created_at"]
         verbose_name = "Monitoring Entry"
         verbose_name_plural = "Monitoring Entries"
+        indexes = [
+            models.Index(fields=["updated_at", "id"], name="monitoring_entry_sync_idx"),
+        ]
         constraints = [
             models.CheckConstraint(
                 condition=Q(progress__gte=0) & Q(progress__lte=100),
@@ -921,7 +924,28 @@ class MonitoringEntry(models.Model):
             raise ValidationError(errors)
 
     def funding_total(self, tranche_type: str) -> float:
-        """Return total amount recorded for a funding tranche type."""
+        """
+        Return total amount recorded for a funding tranche type.
+
+        Uses the ``with_funding_totals()`` annotation or prefetched
+        ``funding_flows`` when present so report loops stay query-free; falls
+        back to an aggregate query otherwise.
+        """
+
+        annotation = f"total_{tranche_type}s_sum"
+        if annotation in self.__dict__:
+            return self.__dict__[annotation] or 0
+
+        prefetched = getattr(self, "_prefetched_objects_cache", {})
+        if "funding_flows" in prefetched:
+            return sum(
+                (
+                    flow.amount
+                    for flow in prefetched["funding_flows"]
+                    if flow.tranche_type == tranche_type
+                ),
+                0,
+            )
 
         return (
             self.funding_flows.filter(tranche_type=tranche_type)
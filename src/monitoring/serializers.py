@@ -3,7 +3,7 @@
 from rest_framework import serializers
 
 from common.models import WorkItem
-from common.serializers import WorkItemSerializer
+from common.serializers import SparseFieldsetMixin, WorkItemSerializer
 
 from .models import (
     MonitoringEntry,
@@ -217,7 +217,7 @@ class MonitoringUpdateSerializer(serializers.ModelSerializer):
         ]
 
 
-class MonitoringEntrySerializer(serializers.ModelSerializer):
+class MonitoringEntrySerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Serialize monitoring entries with related resource links."""
 
     category_display = serializers.CharField(
@@ -0,0 +1,634 @@
+"""
+Streaming export engine for monitoring spreadsheets.
+
+Exports are described by an :class:`ExportSpec` (headers, a queryset and a
+row builder) and written without holding the dataset in memory:
+
+- CSV rows are yielded one at a time into a ``StreamingHttpResponse``.
+- Excel files use openpyxl's write-only mode, which flushes rows to disk as
+  they are appended, and are streamed back from a temporary file.
+- Rows are read with ``.iterator()`` so Django does not cache the queryset.
+
+Exports larger than ``MONITORING_EXPORT_ASYNC_THRESHOLD`` rows are handed to
+the ``monitoring.generate_export`` Celery task. It writes the file to a
+private storage root that is never served as media and emails the requester a
+signed, expiring link. The link only works for that user, through
+``monitoring:export_download``. ``monitoring.cleanup_exports`` deletes files
+once their links have expired.
+"""
+
+import csv
+import logging
+import posixpath
+import secrets
+import tempfile
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from django.conf import settings
+from django.contrib import messages
+from django.core import signing
+from django.core.files import File
+from django.core.files.storage import FileSystemStorage
+from django.db.models import QuerySet
+from django.http import (
+    FileResponse,
+    Http404,
+    HttpResponseRedirect,
+    StreamingHttpResponse,
+)
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.http import url_has_allowed_host_and_scheme
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Font, PatternFill
+from openpyxl.utils import get_column_letter
+
+from monitoring.models import MonitoringEntry, MonitoringEntryFunding
+
+logger = logging.getLogger(__name__)
+
+FORMAT_XLSX = "xlsx"
+FORMAT_CSV = "csv"
+
+CONTENT_TYPES = {
+    FORMAT_XLSX: "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    FORMAT_CSV: "text/csv",
+}
+
+EXPORT_CHUNK_SIZE = 2000
+DEFAULT_ASYNC_THRESHOLD = 5000
+EXPORT_STORAGE_DIR = "exports/monitoring"
+EXPORT_LINK_SALT = "monitoring.export_download"
+DEFAULT_EXPORT_RETENTION_HOURS = 48
+
+CURRENCY_FORMAT = "#,##0.00"
+MAX_COLUMN_WIDTH = 50
+MIN_COLUMN_WIDTH = 12
+
+HEADER_FILL = PatternFill(start_color="1F4E78", end_color="1F4E78", fill_type="solid")
+HEADER_FONT = Font(bold=True, color="FFFFFF", size=11)
+HEADER_ALIGNMENT = Alignment(horizontal="center", vertical="center", wrap_text=True)
+
+
+def _yes_no(value) -> str:
+    return "Yes" if value else "No"
+
+
+def _date(value) -> str:
+    return value.strftime("%Y-%m-%d") if value else ""
+
+
+@dataclass
+class ExportSpec:
+    """
+    Description of one tabular export.
+
+    Args:
+        name: Registry key (see ``EXPORT_BUILDERS``)
+        title: Worksheet title
+        filename_prefix: Download filename prefix; a timestamp is appended
+        headers: Column headers
+        queryset: Rows to export, read with ``.iterator()``
+        row: Callable turning one object into a list of cell values
+        currency_columns: 1-based columns formatted as currency in Excel
+        total_columns: 1-based columns summed in an Excel TOTAL row
+        column_widths: Explicit Excel widths by 1-based column
+    """
+
+    name: str
+    title: str
+    filename_prefix: str
+    headers: Sequence[str]
+    queryset: QuerySet
+    row: Callable[[Any], List[Any]]
+    currency_columns: Tuple[int, ...] = ()
+    total_columns: Tuple[int, ...] = ()
+    column_widths: Optional[Dict[int, int]] = None
+
+    def iter_rows(self) -> Iterator[List[Any]]:
+        for obj in self.queryset.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+            yield self.row(obj)
+
+    def filename(self, export_format: str) -> str:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        return f"{self.filename_prefix}_{timestamp}.{export_format}"
+
+    def column_width(self, column: int) -> int:
+        if self.column_widths and column in self.column_widths:
+            return self.column_widths[column]
+        header = self.headers[column - 1]
+        return min(max(len(header) + 2, MIN_COLUMN_WIDTH), MAX_COLUMN_WIDTH)
+
+
+# ----------------------------------------------------------------------
+# Writers
+# ----------------------------------------------------------------------
+
+
+def write_xlsx(spec: ExportSpec, fileobj) -> int:
+    """Write ``spec`` to ``fileobj`` as a write-only workbook; return row count."""
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(spec.title)
+
+    # Write-only sheets need widths before any row is appended.
+    for column in range(1, len(spec.headers) + 1):
+        ws.column_dimensions[get_column_letter(column)].width = spec.column_width(column)
+
+    header_cells = []
+    for header in spec.headers:
+        cell = WriteOnlyCell(ws, value=header)
+        cell.fill = HEADER_FILL
+        cell.font = HEADER_FONT
+        cell.alignment = HEADER_ALIGNMENT
+        header_cells.append(cell)
+    ws.append(header_cells)
+
+    currency_columns = set(spec.currency_columns)
+    count = 0
+    for values in spec.iter_rows():
+        if currency_columns:
+            values = [
+                _currency_cell(ws, value) if column in currency_columns else value
+                for column, value in enumerate(values, 1)
+            ]
+        ws.append(values)
+        count += 1
+
+    if spec.total_columns:
+        last_row = count + 1
+        ws.append([])
+        totals = [None] * len(spec.headers)
+        totals[0] = WriteOnlyCell(ws, value="TOTAL")
+        totals[0].font = Font(bold=True)
+        for column in spec.total_columns:
+            letter = get_column_letter(column)
+            cell = _currency_cell(ws, f"=SUM({letter}2:{letter}{last_row})")
+            cell.font = Font(bold=True)
+            totals[column - 1] = cell
+        ws.append(totals)
+
+    wb.save(fileobj)
+    return count
+
+
+def _currency_cell(ws, value) -> WriteOnlyCell:
+    cell = WriteOnlyCell(ws, value=value)
+    cell.number_format = CURRENCY_FORMAT
+    return cell
+
+
+class _Echo:
+    """File-like object whose ``write`` returns the value, for csv streaming."""
+
+    def write(self, value):
+        return value
+
+
+def iter_csv(spec: ExportSpec) -> Iterator[str]:
+    """Yield ``spec`` as CSV lines."""
+    writer = csv.writer(_Echo())
+    yield writer.writerow(spec.headers)
+    for values in spec.iter_rows():
+        yield writer.writerow(values)
+
+
+def write_export(spec: ExportSpec, export_format: str, fileobj) -> None:
+    """Write ``spec`` to a binary file object in ``export_format``."""
+    if export_format == FORMAT_XLSX:
+        write_xlsx(spec, fileobj)
+    elif export_format == FORMAT_CSV:
+        for line in iter_csv(spec):
+            fileobj.write(line.encode("utf-8"))
+    else:
+        raise ValueError(f"Unsupported export format: {export_format}")
+
+
+# ----------------------------------------------------------------------
+# Responses
+# ----------------------------------------------------------------------
+
+
+def stream_export(spec: ExportSpec, export_format: str):
+    """Return a streaming download response for ``spec``."""
+    filename = spec.filename(export_format)
+
+    if export_format == FORMAT_CSV:
+        response = StreamingHttpResponse(
+            iter_csv(spec), content_type=CONTENT_TYPES[FORMAT_CSV]
+        )
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
+
+    # The zip container needs a seekable file; a temporary file keeps it
+    # off the heap and FileResponse closes (and so deletes) it when done.
+    tmp = tempfile.TemporaryFile()
+    try:
+        write_export(spec, export_format, tmp)
+    except Exception:
+        tmp.close()
+        raise
+    tmp.seek(0)
+    return FileResponse(
+        tmp,
+        as_attachment=True,
+        filename=filename,
+        content_type=CONTENT_TYPES[export_format],
+    )
+
+
+def async_threshold() -> int:
+    return getattr(settings, "MONITORING_EXPORT_ASYNC_THRESHOLD", DEFAULT_ASYNC_THRESHOLD)
+
+
+def export_response(request, name: str, export_format: str):
+    """
+    Stream export ``name`` or, when it is too large, queue it for email.
+
+    Large exports only go to the background when the user has an email
+    address to receive the link; otherwise they are streamed as usual.
+    """
+    params = request.GET.dict()
+    spec = build_export(name, params)
+
+    if request.user.email and spec.queryset.count() > async_threshold():
+        from monitoring.tasks import generate_export
+
+        generate_export.delay(name, params, export_format, request.user.pk)
+        messages.info(
+            request,
+            "This export is large and is being prepared in the background. "
+            f"A download link will be emailed to {request.user.email}.",
+        )
+        referer = request.META.get("HTTP_REFERER")
+        if not url_has_allowed_host_and_scheme(
+            referer, allowed_hosts={request.get_host()}, require_https=request.is_secure()
+        ):
+            referer = reverse("monitoring:home")
+        return HttpResponseRedirect(referer)
+
+    return stream_export(spec, export_format)
+
+
+# ----------------------------------------------------------------------
+# Background exports
+# ----------------------------------------------------------------------
+
+
+def export_storage() -> FileSystemStorage:
+    """Storage for background exports; it has no public URL."""
+    return FileSystemStorage(location=settings.MONITORING_EXPORT_ROOT, base_url=None)
+
+
+def export_retention() -> timedelta:
+    return timedelta(
+        hours=getattr(
+            settings, "MONITORING_EXPORT_RETENTION_HOURS", DEFAULT_EXPORT_RETENTION_HOURS
+        )
+    )
+
+
+def save_export(
+    name: str, params: Dict[str, str], export_format: str, user_id: int
+) -> str:
+    """Write an export to private storage and return its storage path."""
+    spec = build_export(name, params)
+    with tempfile.TemporaryFile() as tmp:
+        write_export(spec, export_format, tmp)
+        tmp.seek(0)
+        path = export_storage().save(
+            posixpath.join(
+                EXPORT_STORAGE_DIR,
+                str(user_id),
+                secrets.token_urlsafe(16),
+                spec.filename(export_format),
+            ),
+            File(tmp),
+        )
+    logger.info("Saved %s export to %s", name, path)
+    return path
+
+
+def export_download_url(path: str, user_id: int) -> str:
+    """Absolute, signed download link for ``path``, valid for its owner only."""
+    token = signing.dumps({"path": path, "user": user_id}, salt=EXPORT_LINK_SALT)
+    url = reverse("monitoring:export_download", args=[token])
+    return f"{settings.SITE_URL.rstrip('/')}{url}"
+
+
+def export_download_response(request, token: str):
+    """Serve a background export to the user it was built for."""
+    try:
+        data = signing.loads(
+            token,
+            salt=EXPORT_LINK_SALT,
+            max_age=export_retention().total_seconds(),
+        )
+    except signing.BadSignature:
+        raise Http404("This export link is invalid or has expired.")
+
+    storage = export_storage()
+    path = data["path"]
+    if data["user"] != request.user.pk or not storage.exists(path):
+        raise Http404("This export link is invalid or has expired.")
+
+    return FileResponse(
+        storage.open(path, "rb"),
+        as_attachment=True,
+        filename=posixpath.basename(path),
+    )
+
+
+def delete_expired_exports() -> int:
+    """Delete background exports older than the link lifetime."""
+    storage = export_storage()
+    cutoff = timezone.now() - export_retention()
+    deleted = 0
+
+    def sweep(directory):
+        nonlocal deleted
+        try:
+            subdirs, files = storage.listdir(directory)
+        except FileNotFoundError:
+            return
+        for name in files:
+            path = posixpath.join(directory, name)
+            if storage.get_modified_time(path) < cutoff:
+                storage.delete(path)
+                deleted += 1
+        for name in subdirs:
+            sweep(posixpath.join(directory, name))
+
+    sweep(EXPORT_STORAGE_DIR)
+    return deleted
+
+
+# ----------------------------------------------------------------------
+# Export definitions
+# ----------------------------------------------------------------------
+
+
+def aip_summary_export(params: Dict[str, str]) -> ExportSpec:
+    """Annual Investment Plan summary with funding tranche totals."""
+    entries = MonitoringEntry.objects.select_related(
+        "lead_organization",
+        "implementing_moa",
+        "submitted_by_community",
+        "coverage_region",
+        "coverage_province",
+    ).with_funding_totals()
+
+    if params.get("plan_year"):
+        entries = entries.filter(plan_year=params["plan_year"])
+    if params.get("sector"):
+        entries = entries.filter(sector=params["sector"])
+    if params.get("funding_source"):
+        entries = entries.filter(funding_source=params["funding_source"])
+
+    def row(entry):
+        return [
+            entry.get_category_display(),
+            entry.title,
+            entry.lead_organization.name if entry.lead_organization else "",
+            entry.implementing_moa.name if entry.implementing_moa else "",
+            entry.plan_year or "",
+            entry.fiscal_year or "",
+            entry.get_sector_display() if entry.sector else "",
+            (
+                entry.get_appropriation_class_display()
+                if entry.appropriation_class
+                else ""
+            ),
+            entry.get_funding_source_display() if entry.funding_source else "",
+            entry.program_code or "",
+            float(entry.budget_allocation or 0),
+            float(entry.budget_obc_allocation or 0),
+            float(entry.budget_ceiling or 0),
+            float(entry.funding_total(MonitoringEntryFunding.TRANCHE_ALLOCATION)),
+            float(entry.funding_total(MonitoringEntryFunding.TRANCHE_OBLIGATION)),
+            float(entry.funding_total(MonitoringEntryFunding.TRANCHE_DISBURSEMENT)),
+            entry.get_status_display(),
+            entry.progress,
+            entry.coverage_region.name if entry.coverage_region else "",
+            entry.coverage_province.name if entry.coverage_province else "",
+            _yes_no(entry.compliance_gad),
+            _yes_no(entry.compliance_ccet),
+            _yes_no(entry.benefits_indigenous_peoples),
+            _yes_no(entry.supports_peace_agenda),
+            _yes_no(entry.supports_sdg),
+            _date(entry.start_date),
+            _date(entry.target_end_date),
+        ]
+
+    budget_columns = tuple(range(11, 17))
+    return ExportSpec(
+        name="aip_summary",
+        title="AIP Summary",
+        filename_prefix="AIP_Summary",
+        headers=[
+            "Category",
+            "Title",
+            "Lead Organization",
+            "Implementing MOA",
+            "Plan Year",
+            "Fiscal Year",
+            "Sector",
+            "Appropriation Class",
+            "Funding Source",
+            "Program Code",
+            "Budget Allocation (PHP)",
+            "OBC Allocation (PHP)",
+            "Budget Ceiling (PHP)",
+            "Allocations (PHP)",
+            "Obligations (PHP)",
+            "Disbursements (PHP)",
+            "Status",
+            "Progress (%)",
+            "Region",
+            "Province",
+            "GAD",
+            "CCET",
+            "IP",
+            "Peace",
+            "SDG",
+            "Start Date",
+            "Target End Date",
+        ],
+        queryset=entries,
+        row=row,
+        currency_columns=budget_columns,
+        total_columns=budget_columns,
+        column_widths={2: MAX_COLUMN_WIDTH, 3: 30, 4: 30},
+    )
+
+
+def compliance_export(params: Dict[str, str]) -> ExportSpec:
+    """Compliance tracking report (GAD, CCET, IP, Peace, SDG)."""
+    entries = MonitoringEntry.objects.select_related(
+        "lead_organization",
+        "implementing_moa",
+    )
+
+    def row(entry):
+        return [
+            entry.title,
+            entry.get_category_display(),
+            entry.lead_organization.name if entry.lead_organization else "",
+            entry.get_sector_display() if entry.sector else "",
+            float(entry.budget_allocation or 0),
+            _yes_no(entry.compliance_gad),
+            _yes_no(entry.compliance_ccet),
+            _yes_no(entry.benefits_indigenous_peoples),
+            _yes_no(entry.supports_peace_agenda),
+            _yes_no(entry.supports_sdg),
+            ", ".join(entry.goal_alignment) if entry.goal_alignment else "",
+            entry.moral_governance_pillar or "",
+        ]
+
+    return ExportSpec(
+        name="compliance",
+        title="Compliance Report",
+        filename_prefix="Compliance_Report",
+        headers=[
+            "Title",
+            "Category",
+            "Lead Organization",
+            "Sector",
+            "Budget Allocation (PHP)",
+            "GAD",
+            "CCET",
+            "Indigenous Peoples",
+            "Peace Agenda",
+            "SDG",
+            "Goal Alignment",
+            "Moral Governance Pillar",
+        ],
+        queryset=entries,
+        row=row,
+        currency_columns=(5,),
+        column_widths={1: MAX_COLUMN_WIDTH, 3: 30, 11: 30},
+    )
+
+
+def budget_export(params: Dict[str, str]) -> ExportSpec:
+    """Budget summary (served as CSV)."""
+    entries = MonitoringEntry.objects.select_related(
+        "lead_organization",
+        "implementing_moa",
+    )
+
+    def row(entry):
+        return [
+            entry.title,
+            entry.get_category_display(),
+            entry.lead_organization.name if entry.lead_organization else "",
+            entry.plan_year or "",
+            entry.fiscal_year or "",
+            entry.get_sector_display() if entry.sector else "",
+            (
+                entry.get_appropriation_class_display()
+                if entry.appropriation_class
+                else ""
+            ),
+            entry.get_funding_source_display() if entry.funding_source else "",
+            float(entry.budget_allocation or 0),
+            float(entry.budget_obc_allocation or 0),
+            float(entry.budget_ceiling or 0),
+            entry.get_status_display(),
+            entry.progress,
+            _yes_no(entry.compliance_gad),
+            _yes_no(entry.compliance_ccet),
+            _yes_no(entry.benefits_indigenous_peoples),
+            _yes_no(entry.supports_peace_agenda),
+            _yes_no(entry.supports_sdg),
+        ]
+
+    return ExportSpec(
+        name="budget",
+        title="Budget Export",
+        filename_prefix="Budget_Export",
+        headers=[
+            "Title",
+            "Category",
+            "Lead Organization",
+            "Plan Year",
+            "Fiscal Year",
+            "Sector",
+            "Appropriation Class",
+            "Funding Source",
+            "Budget Allocation",
+            "OBC Allocation",
+            "Budget Ceiling",
+            "Status",
+            "Progress",
+            "GAD",
+            "CCET",
+            "IP",
+            "Peace",
+            "SDG",
+        ],
+        queryset=entries,
+        row=row,
+        currency_columns=(9, 10, 11),
+    )
+
+
+def funding_timeline_export(params: Dict[str, str]) -> ExportSpec:
+    """Funding timeline (allocations, obligations, disbursements)."""
+    tranches = MonitoringEntryFunding.objects.select_related(
+        "entry__lead_organization",
+        "entry__implementing_moa",
+    ).order_by("scheduled_date")
+
+    def row(tranche):
+        return [
+            tranche.entry.title,
+            (
+                tranche.entry.lead_organization.name
+                if tranche.entry.lead_organization
+                else ""
+            ),
+            tranche.get_tranche_type_display(),
+            float(tranche.amount),
+            tranche.get_funding_source_display() if tranche.funding_source else "",
+            _date(tranche.scheduled_date),
+            tranche.remarks or "",
+        ]
+
+    return ExportSpec(
+        name="funding_timeline",
+        title="Funding Timeline",
+        filename_prefix="Funding_Timeline",
+        headers=[
+            "PPA Title",
+            "Lead Organization",
+            "Tranche Type",
+            "Amount (PHP)",
+            "Funding Source",
+            "Scheduled Date",
+            "Remarks",
+        ],
+        queryset=tranches,
+        row=row,
+        currency_columns=(4,),
+        column_widths={1: MAX_COLUMN_WIDTH, 2: 30, 7: 40},
+    )
+
+
+EXPORT_BUILDERS: Dict[str, Callable[[Dict[str, str]], ExportSpec]] = {
+    "aip_summary": aip_summary_export,
+    "compliance": compliance_export,
+    "budget": budget_export,
+    "funding_timeline": funding_timeline_export,
+}
+
+
+def build_export(name: str, params: Optional[Dict[str, str]] = None) -> ExportSpec:
+    """Build the registered export ``name`` for request ``params``."""
+    try:
+        builder = EXPORT_BUILDERS[name]
+    except KeyError:
+        raise ValueError(f"Unknown export: {name}") from None
+    return builder(params or {})
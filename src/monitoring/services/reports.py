@@ -57,9 +57,7 @@ class MFBMBudgetExecutionReportGenerator:
         ).select_related(
             'implementing_moa',
             'execution_project'
-        ).prefetch_related(
-            'funding_flows'
-        )
+        ).with_funding_totals()
 
         if self.moa_filter:
             queryset = queryset.filter(implementing_moa__id=self.moa_filter)
@@ -544,9 +542,8 @@ class COAVarianceReportGenerator:
             'implementing_moa',
             'execution_project'
         ).prefetch_related(
-            'funding_flows',
             'execution_project__children'
-        )
+        ).with_funding_totals()
 
         if self.moa_filter:
             queryset = queryset.filter(implementing_moa__id=self.moa_filter)
@@ -694,7 +691,8 @@ class COAVarianceReportGenerator:
                 row += 1
             else:
                 # Has WorkItem tracking, show activity breakdown
-                activities = entry.execution_project.get_children()
+                # Prefetched children; get_children() would query per entry.
+                activities = entry.execution_project.children.all()
 
                 for activity in activities:
                     allocated = activity.allocated_budget or Decimal('0.00')
@@ -752,23 +750,22 @@ class COAVarianceReportGenerator:
         # Get ContentType for MonitoringEntry
         content_type = ContentType.objects.get_for_model(MonitoringEntry)
 
+        # PPA codes keyed by object_pk, auditlog's text column for UUID keys
+        ppa_codes = {
+            str(entry_id): program_code or f"PPA-{entry_id.hex[:8]}"
+            for entry_id, program_code in queryset.values_list('id', 'program_code')
+        }
+
         # Query audit logs for these entries
-        entry_ids = list(queryset.values_list('id', flat=True))
         audit_logs = LogEntry.objects.filter(
             content_type=content_type,
-            object_id__in=[str(eid) for eid in entry_ids]
+            object_pk__in=list(ppa_codes)
         ).select_related('actor').order_by('-timestamp')[:1000]  # Limit to 1000 recent entries
 
         # Data rows
         row += 1
         for log in audit_logs:
-            # Get PPA code from changes
-            ppa_code = "N/A"
-            try:
-                entry = MonitoringEntry.objects.get(id=log.object_id)
-                ppa_code = entry.program_code or f"PPA-{entry.id.hex[:8]}"
-            except MonitoringEntry.DoesNotExist:
-                pass
+            ppa_code = ppa_codes.get(log.object_pk, "N/A")
 
             # Parse changes
             changes = log.changes_dict if hasattr(log, 'changes_dict') else {}
@@ -190,6 +190,12 @@ def sync_workitem_to_ppa(sender, instance, created, **kwargs):
     if created:
         return
 
+    # Bulk WorkItem operations send one aggregated notification instead
+    from common.work_item_model import work_item_side_effects_deferred
+
+    if work_item_side_effects_deferred():
+        return
+
     # Only sync root-level projects that are execution_projects
     if instance.parent is not None:
         return
@@ -814,3 +814,72 @@ def send_approval_deadline_reminders(self):
             "alerts_created": 0,
             "errors": [str(e)]
         }
+
+
+@shared_task(
+    name="monitoring.generate_export",
+    bind=True,
+    max_retries=2,
+    default_retry_delay=60,
+    acks_late=True,
+)
+def generate_export(self, name, params, export_format, user_id):
+    """
+    Build a large monitoring export in the background and email a link.
+
+    The file is written with the streaming export engine to private export
+    storage. The emailed link is signed for ``user_id`` and expires after
+    ``MONITORING_EXPORT_RETENTION_HOURS``.
+
+    Returns:
+        dict: ``{"status", "path", "url", "emailed"}``
+    """
+    import logging
+    from django.contrib.auth import get_user_model
+    from .services.export_engine import export_download_url, save_export
+
+    logger = logging.getLogger(__name__)
+
+    try:
+        path = save_export(name, params, export_format, user_id)
+    except ValueError:
+        # Unknown export or format: retrying will not help.
+        raise
+    except Exception as e:
+        logger.error(f"[EXPORT] Failed to build {name} export: {e}", exc_info=True)
+        raise self.retry(exc=e)
+
+    url = export_download_url(path, user_id)
+
+    user = get_user_model().objects.filter(pk=user_id).first()
+    emailed = False
+    if user and user.email:
+        try:
+            send_mail(
+                subject="Your monitoring export is ready",
+                message=f"""
+Your {name.replace('_', ' ')} export is ready for download:
+
+{url}
+
+---
+Office for Other Bangsamoro Communities
+Planning & Budgeting System
+""",
+                from_email=settings.DEFAULT_FROM_EMAIL,
+                recipient_list=[user.email],
+                fail_silently=False,
+            )
+            emailed = True
+        except Exception as e:
+            logger.error(f"[EXPORT] Failed to email export link to {user.email}: {e}")
+
+    return {"status": "completed", "path": path, "url": url, "emailed": emailed}
+
+
+@shared_task(name="monitoring.cleanup_exports")
+def cleanup_exports():
+    """Delete background exports whose download links have expired."""
+    from .services.export_engine import delete_expired_exports
+
+    return {"deleted": delete_expired_exports()}
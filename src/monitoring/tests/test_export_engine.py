@@ -0,0 +1,176 @@
+"""Tests for the streaming monitoring export engine."""
+
+import os
+import time
+from decimal import Decimal
+from io import BytesIO
+from urllib.parse import urlparse
+
+import pytest
+from django.core import mail
+from django.http import FileResponse, StreamingHttpResponse
+from django.urls import reverse
+from openpyxl import load_workbook
+
+from monitoring.models import MonitoringEntryFunding
+from monitoring.services import export_engine
+from monitoring.tasks import cleanup_exports, generate_export
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def logged_in_client(client, staff_user):
+    staff_user.email = "analyst@example.com"
+    staff_user.save(update_fields=["email"])
+    client.force_login(staff_user)
+    return client
+
+
+@pytest.fixture
+def funded_entries(monitoring_entry_factory):
+    entries = []
+    for index in range(3):
+        entry = monitoring_entry_factory(title=f"Export PPA {index}", plan_year=2025)
+        MonitoringEntryFunding.objects.create(
+            entry=entry,
+            tranche_type=MonitoringEntryFunding.TRANCHE_DISBURSEMENT,
+            amount=Decimal("250.00"),
+        )
+        entries.append(entry)
+    return entries
+
+
+def _content(response):
+    return b"".join(response.streaming_content)
+
+
+def test_aip_summary_streams_write_only_workbook(logged_in_client, funded_entries):
+    response = logged_in_client.get(
+        reverse("monitoring:export_aip_summary"), {"plan_year": 2025}
+    )
+
+    assert response.status_code == 200
+    assert isinstance(response, FileResponse)
+    assert response["Content-Disposition"].startswith('attachment; filename="AIP_Summary_')
+
+    ws = load_workbook(BytesIO(_content(response))).active
+    rows = list(ws.iter_rows(values_only=True))
+    assert ws.title == "AIP Summary"
+    assert rows[0][1] == "Title"
+    assert sorted(row[1] for row in rows[1:4]) == [e.title for e in funded_entries]
+    assert [row[15] for row in rows[1:4]] == [250.0] * 3
+    # Blank spacer row, then SUM formulas over the data rows.
+    assert rows[5][0] == "TOTAL"
+    assert rows[5][15] == "=SUM(P2:P4)"
+    assert ws.cell(row=2, column=11).number_format == export_engine.CURRENCY_FORMAT
+
+
+def test_budget_csv_is_streamed(logged_in_client, funded_entries):
+    response = logged_in_client.get(reverse("monitoring:export_budget_csv"))
+
+    assert isinstance(response, StreamingHttpResponse)
+    lines = _content(response).decode("utf-8").splitlines()
+    assert lines[0].startswith("Title,Category,Lead Organization")
+    assert len(lines) == 4
+
+
+def test_rows_are_read_with_iterator(funded_entries, monkeypatch):
+    spec = export_engine.build_export("compliance")
+    calls = []
+    original = type(spec.queryset).iterator
+
+    def tracking_iterator(queryset, *args, **kwargs):
+        calls.append(kwargs.get("chunk_size"))
+        return original(queryset, *args, **kwargs)
+
+    monkeypatch.setattr(type(spec.queryset), "iterator", tracking_iterator)
+
+    assert len(list(spec.iter_rows())) == 3
+    assert calls == [export_engine.EXPORT_CHUNK_SIZE]
+
+
+def test_large_export_is_queued_for_email(
+    logged_in_client, funded_entries, settings, monkeypatch
+):
+    settings.MONITORING_EXPORT_ASYNC_THRESHOLD = 2
+    queued = []
+    monkeypatch.setattr(generate_export, "delay", lambda *args: queued.append(args))
+
+    response = logged_in_client.get(
+        reverse("monitoring:export_funding_timeline"),
+        HTTP_REFERER="http://evil.example.com/",
+    )
+
+    assert response.status_code == 302
+    assert response["Location"] == reverse("monitoring:home")
+    user_id = response.wsgi_request.user.pk
+    assert queued == [("funding_timeline", {}, "xlsx", user_id)]
+
+
+def test_generate_export_saves_file_and_emails_link(
+    funded_entries, staff_user, settings, tmp_path
+):
+    settings.MONITORING_EXPORT_ROOT = str(tmp_path)
+    settings.EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
+    staff_user.email = "analyst@example.com"
+    staff_user.save(update_fields=["email"])
+
+    result = generate_export.run("budget", {}, "csv", staff_user.pk)
+
+    assert result["status"] == "completed"
+    assert result["emailed"] is True
+    assert result["path"].startswith(f"exports/monitoring/{staff_user.pk}/")
+    assert "/Budget_Export_" in result["path"]
+    saved = (tmp_path / result["path"]).read_text(encoding="utf-8").splitlines()
+    assert len(saved) == 4
+    assert mail.outbox[0].to == ["analyst@example.com"]
+    assert result["url"] in mail.outbox[0].body
+    assert "/monitoring/exports/download/" in result["url"]
+
+
+def test_export_link_only_serves_its_owner(
+    client, funded_entries, staff_user, django_user_model, settings, tmp_path
+):
+    settings.MONITORING_EXPORT_ROOT = str(tmp_path)
+    path = export_engine.save_export("budget", {}, "csv", staff_user.pk)
+    url = urlparse(export_engine.export_download_url(path, staff_user.pk)).path
+
+    assert client.get(url).status_code == 302  # login required
+
+    other = django_user_model.objects.create_superuser(
+        username="other_analyst", password="testpass123"
+    )
+    client.force_login(other)
+    assert client.get(url).status_code == 404
+
+    client.force_login(staff_user)
+    response = client.get(url)
+    assert response.status_code == 200
+    assert len(b"".join(response.streaming_content).splitlines()) == 4
+
+    tampered = url.rstrip("/")[:-2] + "xx/"
+    assert client.get(tampered).status_code == 404
+
+
+def test_expired_exports_are_deleted_and_links_stop_working(
+    client, funded_entries, staff_user, settings, tmp_path
+):
+    settings.MONITORING_EXPORT_ROOT = str(tmp_path)
+    path = export_engine.save_export("budget", {}, "csv", staff_user.pk)
+    url = urlparse(export_engine.export_download_url(path, staff_user.pk)).path
+    fresh = export_engine.save_export("budget", {}, "csv", staff_user.pk)
+    stale = time.time() - 49 * 3600
+    os.utime(tmp_path / path, (stale, stale))
+
+    assert cleanup_exports() == {"deleted": 1}
+
+    assert not (tmp_path / path).exists()
+    assert (tmp_path / fresh).exists()
+    client.force_login(staff_user)
+    assert client.get(url).status_code == 404
+
+
+def test_unknown_export_is_rejected():
+    with pytest.raises(ValueError):
+        export_engine.build_export("nope")
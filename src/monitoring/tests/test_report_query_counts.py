@@ -0,0 +1,156 @@
+"""Query-count regression tests for funding-based reports and exports."""
+
+from decimal import Decimal
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from monitoring.models import MonitoringEntry, MonitoringEntryFunding
+from monitoring.services.reports import (
+    generate_coa_variance_report,
+    generate_mfbm_budget_execution_report,
+)
+from project_central.services import AnalyticsService, ReportGenerator
+
+FISCAL_YEAR = 2025
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def funded_entries(monitoring_entry_factory):
+    """Return a helper that creates ``count`` approved entries with tranches."""
+
+    def create(count):
+        entries = []
+        for index in range(count):
+            entry = monitoring_entry_factory(
+                title=f"Funded PPA {index}",
+                fiscal_year=FISCAL_YEAR,
+                plan_year=FISCAL_YEAR,
+                sector="economic",
+                approval_status=MonitoringEntry.APPROVAL_STATUS_APPROVED,
+            )
+            for tranche, amount in (
+                (MonitoringEntryFunding.TRANCHE_ALLOCATION, "900000.00"),
+                (MonitoringEntryFunding.TRANCHE_OBLIGATION, "600000.00"),
+                (MonitoringEntryFunding.TRANCHE_DISBURSEMENT, "300000.00"),
+                (MonitoringEntryFunding.TRANCHE_DISBURSEMENT, "100000.00"),
+            ):
+                MonitoringEntryFunding.objects.create(
+                    entry=entry, tranche_type=tranche, amount=Decimal(amount)
+                )
+            entries.append(entry)
+        return entries
+
+    return create
+
+
+def _count_queries(func):
+    with CaptureQueriesContext(connection) as queries:
+        func()
+    return len(queries)
+
+
+def _assert_constant_queries(funded_entries, func):
+    """Query count must not grow with the number of entries in the report."""
+    funded_entries(2)
+    baseline = _count_queries(func)
+    funded_entries(5)
+    assert _count_queries(func) == baseline
+
+
+def test_funding_accessors_read_annotations_without_queries(funded_entries):
+    funded_entries(1)
+    entry = MonitoringEntry.objects.with_funding_totals().get()
+
+    with CaptureQueriesContext(connection) as queries:
+        totals = (
+            entry.total_allocations,
+            entry.total_obligations,
+            entry.total_disbursements,
+            entry.obligation_rate,
+            entry.disbursement_rate,
+            entry.budget_utilization_rate,
+        )
+
+    assert len(queries) == 0
+    assert totals[:3] == (Decimal("900000.00"), Decimal("600000.00"), Decimal("400000.00"))
+    assert totals[5] == pytest.approx(40.0)
+
+
+def test_funding_accessors_read_prefetched_flows(funded_entries):
+    funded_entries(1)
+    entry = MonitoringEntry.objects.prefetch_related("funding_flows").get()
+
+    with CaptureQueriesContext(connection) as queries:
+        disbursed = entry.total_disbursements
+
+    assert len(queries) == 0
+    assert disbursed == Decimal("400000.00")
+
+
+def test_funding_accessors_fall_back_to_aggregate(funded_entries):
+    (entry,) = funded_entries(1)
+    entry = MonitoringEntry.objects.get(pk=entry.pk)
+
+    assert entry.total_obligations == Decimal("600000.00")
+
+
+def test_mfbm_budget_execution_report_query_count(funded_entries):
+    _assert_constant_queries(
+        funded_entries, lambda: generate_mfbm_budget_execution_report(FISCAL_YEAR)
+    )
+
+
+def test_coa_variance_report_query_count(funded_entries):
+    _assert_constant_queries(
+        funded_entries, lambda: generate_coa_variance_report(FISCAL_YEAR)
+    )
+
+
+def test_aip_summary_export_query_count(funded_entries, staff_user, client):
+    client.force_login(staff_user)
+    url = reverse("monitoring:export_aip_summary")
+
+    def export():
+        response = client.get(url, {"plan_year": FISCAL_YEAR})
+        assert response.status_code == 200
+
+    _assert_constant_queries(funded_entries, export)
+
+
+@pytest.mark.parametrize(
+    "method",
+    [
+        "get_budget_allocation_by_sector",
+        "get_budget_allocation_by_source",
+        "get_utilization_rates",
+    ],
+)
+def test_analytics_query_count(funded_entries, method):
+    _assert_constant_queries(
+        funded_entries, lambda: getattr(AnalyticsService, method)(FISCAL_YEAR)
+    )
+
+
+def test_utilization_status_breakdown_counts_entries(funded_entries):
+    funded_entries(3)
+
+    data = AnalyticsService.get_utilization_rates(FISCAL_YEAR)
+
+    assert data["status_breakdown"] == {"planning": 3}
+    assert data["ppa_utilization"]["total_disbursed"] == pytest.approx(1200000.0)
+
+
+def test_budget_utilization_report_query_count(funded_entries):
+    _assert_constant_queries(
+        funded_entries,
+        lambda: ReportGenerator.generate_budget_utilization_report(FISCAL_YEAR),
+    )
+
+    report = ReportGenerator.generate_budget_utilization_report(FISCAL_YEAR)
+    assert report["ppa_details"][0]["total_disbursed"] == pytest.approx(400000.0)
+    assert report["ppa_details"][0]["obligation_rate"] == pytest.approx(60.0)
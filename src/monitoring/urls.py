@@ -119,6 +119,11 @@ urlpatterns = [
         exports.export_funding_timeline_excel,
         name="export_funding_timeline",
     ),
+    path(
+        "exports/download/<str:token>/",
+        exports.download_export,
+        name="export_download",
+    ),
     # Prioritization and scenario planning
     path(
         "prioritization/",
@@ -25,7 +25,7 @@ from django.views.decorators.http import require_POST
 from common.decorators.rbac import require_feature_access
 from common.utils.moa_permissions import moa_can_edit_ppa
 
-from common.services.locations import build_location_data, get_object_centroid
+from common.services.locations import get_location_data, get_object_centroid
 from communities.models import OBCCommunity
 from common.models import Municipality
 from common.work_item_model import WorkItem
@@ -203,7 +203,7 @@ def _build_geographic_context(include_barangays: bool = True) -> dict[str, objec
     """Return serialized geographic data for coverage widgets."""
 
     return {
-        "location_data": build_location_data(include_barangays=include_barangays),
+        "location_data": get_location_data(include_barangays=include_barangays),
         "community_locations": _build_community_location_payload(),
     }
 
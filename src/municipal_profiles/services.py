@@ -124,6 +124,29 @@ def record_community_history(
     )
 
 
+def record_community_history_bulk(
+    *,
+    instances: Iterable[OBCCommunity],
+    source: str,
+    changed_by=None,
+    note: str = "",
+    batch_size: int = 1000,
+) -> List[OBCCommunityHistory]:
+    """Persist history snapshots for many communities with batched inserts."""
+
+    entries = [
+        OBCCommunityHistory(
+            community=instance,
+            snapshot=_serialise_community(instance),
+            source=source,
+            changed_by=changed_by,
+            note=note,
+        )
+        for instance in instances
+    ]
+    return OBCCommunityHistory.objects.bulk_create(entries, batch_size=batch_size)
+
+
 def compute_aggregate_for_municipality(
     municipality: Municipality,
 ) -> AggregationResult:
@@ -150,6 +173,11 @@ def compute_aggregate_for_municipality(
             aggregate_kwargs[agg_name] = Avg(rule.source)
             metric_lookup[(section_key, metric_key)] = agg_name
         elif rule.aggregation == "weighted_mean" and rule.weight_source:
+            # Numerator and denominator ride along in the same aggregate.
+            aggregate_kwargs[f"{metric_key}__weighted"] = Sum(
+                F(rule.source) * F(rule.weight_source), output_field=FloatField()
+            )
+            aggregate_kwargs[f"{metric_key}__weight"] = Sum(rule.weight_source)
             weighted_rules.append((section_key, metric_key, rule))
         else:
             raise ValueError(
@@ -168,21 +196,15 @@ def compute_aggregate_for_municipality(
                 section_payload[section_key][metric_key] = int(value)
 
     for section_key, metric_key, rule in weighted_rules:
-        numerator = (
-            queryset.aggregate(
-                total=Sum(
-                    F(rule.source) * F(rule.weight_source), output_field=FloatField()
-                )
-            )["total"]
-            or 0.0
-        )
-        denominator = queryset.aggregate(total=Sum(rule.weight_source))["total"] or 0
+        numerator = aggregates.get(f"{metric_key}__weighted") or 0.0
+        denominator = aggregates.get(f"{metric_key}__weight") or 0
         section_payload[section_key][metric_key] = (
             round(numerator / denominator, 2) if denominator else 0
         )
 
-    community_ids: List[int] = list(queryset.values_list("id", flat=True))
-    barangay_ids: List[int] = list(queryset.values_list("barangay_id", flat=True))
+    rows = list(queryset.values_list("id", "barangay_id"))
+    community_ids: List[int] = [community_id for community_id, _ in rows]
+    barangay_ids: List[int] = [barangay_id for _, barangay_id in rows]
 
     aggregated_flat = flatten_metrics(section_payload)
     metadata = {
@@ -4,6 +4,7 @@ from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
 from communities.models import OBCCommunity
+from communities.utils.coverage_sync import communities_synced, get_users
 
 from .models import OBCCommunityHistory
 from .services import aggregate_and_store, record_community_history
@@ -11,26 +12,23 @@ from .services import aggregate_and_store, record_community_history
 
 @receiver(post_save, sender=OBCCommunity)
 def handle_community_saved(sender, instance: OBCCommunity, created: bool, **kwargs):
-    """Capture history and refresh aggregates whenever a community changes."""
+    """Capture history whenever a community changes.
+
+    Aggregates are refreshed by ``refresh_profiles_after_sync`` once the
+    coalesced coverage sync for the municipality runs.
+    """
 
-    changed_by = getattr(instance, "_history_user", None)
     record_community_history(
         instance=instance,
         source=OBCCommunityHistory.SOURCE_MANUAL,
         note="Created" if created else "Updated",
-        changed_by=changed_by,
-    )
-    municipality = instance.barangay.municipality
-    aggregate_and_store(
-        municipality=municipality,
-        note="Triggered by barangay save",
-        changed_by=changed_by,
+        changed_by=getattr(instance, "_history_user", None),
     )
 
 
 @receiver(post_delete, sender=OBCCommunity)
 def handle_community_deleted(sender, instance: OBCCommunity, **kwargs):
-    """Recompute aggregates whenever a community is removed."""
+    """Capture history whenever a community is removed."""
 
     record_community_history(
         instance=instance,
@@ -38,9 +36,16 @@ def handle_community_deleted(sender, instance: OBCCommunity, **kwargs):
         note="Deleted",
         changed_by=getattr(instance, "_history_user", None),
     )
-    municipality = instance.barangay.municipality
-    aggregate_and_store(
-        municipality=municipality,
-        note="Triggered by barangay delete",
-        changed_by=getattr(instance, "_history_user", None),
-    )
+
+
+@receiver(communities_synced)
+def refresh_profiles_after_sync(sender, municipalities, changed_by, **kwargs):
+    """Recompute each synced municipality's profile aggregates once."""
+
+    users = get_users(changed_by.values())
+    for municipality in municipalities:
+        aggregate_and_store(
+            municipality=municipality,
+            note="Triggered by barangay changes",
+            changed_by=users.get(changed_by.get(municipality.pk)),
+        )
@@ -48,12 +48,24 @@ app.conf.beat_schedule = {
         "schedule": crontab(hour=7, minute=30),  # 7:30 AM daily
         "options": {"expires": 3600},
     },
+    # Monitoring: Delete background exports with expired links hourly
+    "cleanup-monitoring-exports": {
+        "task": "monitoring.cleanup_exports",
+        "schedule": crontab(minute=0),  # Every hour
+        "options": {"expires": 3600},
+    },
     # Calendar: Process event reminders every 15 minutes
     "process-event-reminders": {
         "task": "common.tasks.process_scheduled_reminders",
         "schedule": crontab(minute="*/15"),  # Every 15 minutes
         "options": {"expires": 900},  # 15 minutes
     },
+    # Search: Merge logged searches into the popular-query summary every minute
+    "flush-search-analytics": {
+        "task": "common.tasks.flush_search_analytics",
+        "schedule": crontab(),  # Every minute
+        "options": {"expires": 60},
+    },
     # Calendar: Send daily digest at 7:00 AM
     "send-daily-calendar-digest": {
         "task": "common.tasks.send_daily_digest",
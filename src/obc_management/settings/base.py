@@ -379,6 +379,33 @@ BASE_URL = env("BASE_URL", default="http://localhost:8000")
 # Site URL for absolute links in emails and API responses
 SITE_URL = env("SITE_URL", default="http://localhost:8000")
 
+# Monitoring exports with more rows than this are built by Celery and emailed
+MONITORING_EXPORT_ASYNC_THRESHOLD = env.int(
+    "MONITORING_EXPORT_ASYNC_THRESHOLD", default=5000
+)
+# Background exports hold PPA and budget data: keep them outside MEDIA_ROOT,
+# serve them only through the signed download view, and delete them (and
+# expire their links) after this many hours.
+MONITORING_EXPORT_ROOT = env(
+    "MONITORING_EXPORT_ROOT", default=str(BASE_DIR / "private" / "exports")
+)
+MONITORING_EXPORT_RETENTION_HOURS = env.int(
+    "MONITORING_EXPORT_RETENTION_HOURS", default=48
+)
+
+# OBC community writes mark their municipality dirty; coverage and profile
+# roll-ups then run once per municipality on commit ("commit"), in a Celery
+# task started after a short delay ("celery"), or on every write ("immediate").
+COMMUNITY_COVERAGE_SYNC_MODE = env(
+    "COMMUNITY_COVERAGE_SYNC_MODE", default="commit"
+)
+COMMUNITY_COVERAGE_SYNC_DELAY = env.int("COMMUNITY_COVERAGE_SYNC_DELAY", default=5)
+
+# Nightly stakeholder matching scores communities in chunks of this size;
+# with STAKEHOLDER_MATCH_PARALLEL each chunk runs as its own Celery task.
+STAKEHOLDER_MATCH_CHUNK_SIZE = env.int("STAKEHOLDER_MATCH_CHUNK_SIZE", default=500)
+STAKEHOLDER_MATCH_PARALLEL = env.bool("STAKEHOLDER_MATCH_PARALLEL", default=False)
+
 # Application version (used by health checks and deployment tracking)
 VERSION = env("APP_VERSION", default="1.0.0")
 
@@ -24,3 +24,9 @@ CELERY_TASK_ALWAYS_EAGER = True
 
 # Disable async for tests
 ASYNC_TASK_ENABLED = False
+
+# Never call external geocoding providers from tests
+GEOCODING_OFFLINE = True
+
+# Test transactions never commit, so roll coverage up on every write
+COMMUNITY_COVERAGE_SYNC_MODE = "immediate"
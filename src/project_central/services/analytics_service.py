@@ -45,8 +45,15 @@ class AnalyticsService:
     # --------------------------------------------------------------------- #
 
     @classmethod
-    def _monitoring_queryset(cls, fiscal_year: Optional[int] = None):
-        qs = MonitoringEntry.objects.all()
+    def _monitoring_queryset(
+        cls, fiscal_year: Optional[int] = None, with_funding: bool = True
+    ):
+        # Funding totals are annotated so the total_* properties read them
+        # instead of running three aggregates per entry.
+        if with_funding:
+            qs = MonitoringEntry.objects.with_funding_totals()
+        else:
+            qs = MonitoringEntry.objects.all()
         if fiscal_year:
             qs = qs.filter(fiscal_year=fiscal_year)
         return qs.select_related("coverage_region")
@@ -198,7 +205,7 @@ class AnalyticsService:
         """
         Aggregate budget allocation by geographic coverage region.
         """
-        entries = cls._monitoring_queryset(fiscal_year)
+        entries = cls._monitoring_queryset(fiscal_year, with_funding=False)
         regions: Dict[str, Dict] = defaultdict(
             lambda: {
                 "region": "Unspecified",
@@ -240,8 +247,10 @@ class AnalyticsService:
         entries = cls._monitoring_queryset(fiscal_year)
         totals = cls._aggregate_entries(entries)
 
+        # Grouped separately: the funding join would inflate these counts.
         by_status = dict(
-            entries.values("status").annotate(count=Count("id")).values_list("status", "count")
+            cls._monitoring_queryset(fiscal_year, with_funding=False)
+            .values("status").annotate(count=Count("id")).values_list("status", "count")
         )
 
         return {
@@ -277,7 +286,7 @@ class AnalyticsService:
         """
         Summarize cost-per-beneficiary and rating distribution.
         """
-        entries = cls._monitoring_queryset(fiscal_year)
+        entries = cls._monitoring_queryset(fiscal_year, with_funding=False)
         if sector:
             entries = entries.filter(sector=sector)
 
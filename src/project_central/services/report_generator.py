@@ -106,7 +106,7 @@ class ReportGenerator:
         from project_central.models import BudgetCeiling
 
         # Get all approved PPAs
-        queryset = MonitoringEntry.objects.filter(
+        queryset = MonitoringEntry.objects.with_funding_totals().filter(
             approval_status__in=[
                 MonitoringEntry.APPROVAL_STATUS_APPROVED,
                 MonitoringEntry.APPROVAL_STATUS_ENACTED,
@@ -122,16 +122,14 @@ class ReportGenerator:
         # Build detailed PPA list
         ppa_details = []
         for ppa in queryset:
+            total_obligated = ppa.total_obligations
+            total_disbursed = ppa.total_disbursements
             obligation_rate = 0
             disbursement_rate = 0
 
             if ppa.budget_allocation and ppa.budget_allocation > 0:
-                obligation_rate = (
-                    (ppa.total_obligated or 0) / ppa.budget_allocation * 100
-                )
-                disbursement_rate = (
-                    (ppa.total_disbursed or 0) / ppa.budget_allocation * 100
-                )
+                obligation_rate = total_obligated / ppa.budget_allocation * 100
+                disbursement_rate = total_disbursed / ppa.budget_allocation * 100
 
             ppa_details.append(
                 {
@@ -139,8 +137,8 @@ class ReportGenerator:
                     "sector": ppa.sector,
                     "funding_source": ppa.funding_source,
                     "budget_allocation": float(ppa.budget_allocation or 0),
-                    "total_obligated": float(ppa.total_obligated or 0),
-                    "total_disbursed": float(ppa.total_disbursed or 0),
+                    "total_obligated": float(total_obligated),
+                    "total_disbursed": float(total_disbursed),
                     "obligation_rate": float(obligation_rate),
                     "disbursement_rate": float(disbursement_rate),
                     "status": ppa.status,
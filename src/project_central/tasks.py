@@ -504,9 +504,10 @@ def recalculate_all_progress_task(self):
             - errors: list of error messages
 
     Performance:
-        - Processes WorkItems in batches of 100
-        - Uses select_related/prefetch_related for optimization
-        - Expected runtime: 5-15 minutes for 1000+ WorkItems
+        - Set-based rollup: one grouped aggregate over all child rows and a
+          batched bulk_update of changed rows (see
+          common.services.work_item_progress)
+        - Query count is independent of the number of WorkItems
 
     Example Result:
         {
@@ -518,55 +519,24 @@ def recalculate_all_progress_task(self):
             "errors": []
         }
     """
+    from common.services.work_item_progress import rollup_progress
     from common.work_item_model import WorkItem
 
     logger.info("[PROGRESS RECALC] Starting monthly progress recalculation")
 
     try:
-        # Get all root WorkItems (projects without parents)
-        root_projects = WorkItem.objects.filter(
+        total_projects = WorkItem.objects.filter(
             work_type=WorkItem.WORK_TYPE_PROJECT,
             parent__isnull=True
-        ).prefetch_related('children')
+        ).count()
 
-        total_projects = 0
-        total_recalculated = 0
-        total_unchanged = 0
+        rollup = rollup_progress()
+
+        total_recalculated = rollup.updated
+        total_unchanged = rollup.unchanged
         total_errors = 0
         errors = []
 
-        for project in root_projects:
-            total_projects += 1
-
-            try:
-                # Store old progress
-                old_progress = project.progress
-
-                # Recalculate progress from descendants
-                # WorkItem.calculate_progress() updates self.progress
-                project.calculate_progress()
-                project.refresh_from_db()
-
-                new_progress = project.progress
-
-                if new_progress != old_progress:
-                    total_recalculated += 1
-                    logger.info(
-                        f"[PROGRESS RECALC] Updated WorkItem {project.id}: "
-                        f"{old_progress}% → {new_progress}% ({project.title})"
-                    )
-                else:
-                    total_unchanged += 1
-
-            except Exception as e:
-                total_errors += 1
-                error_msg = f"WorkItem {project.id}: {str(e)}"
-                errors.append(error_msg)
-                logger.error(
-                    f"[PROGRESS RECALC] Error recalculating WorkItem {project.id}: {e}",
-                    exc_info=True
-                )
-
         # Final summary
         result = {
             "status": "completed",
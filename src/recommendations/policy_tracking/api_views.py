@@ -3,6 +3,8 @@ from rest_framework import filters, permissions, viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
+from common.mixins.api_mixins import DeltaSyncMixin
+
 from .models import PolicyDocument, PolicyEvidence, PolicyImpact, PolicyRecommendation
 from .serializers import (
     PolicyDocumentListSerializer,
@@ -16,7 +18,7 @@ from .serializers import (
 )
 
 
-class PolicyRecommendationViewSet(viewsets.ModelViewSet):
+class PolicyRecommendationViewSet(DeltaSyncMixin, viewsets.ModelViewSet):
     """ViewSet for PolicyRecommendation model."""
 
     queryset = PolicyRecommendation.objects.all().select_related(
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('policy_tracking', '0007_policyrecommendation_target_barangay_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='policyrecommendation',
+            index=models.Index(fields=['updated_at', 'id'], name='policy_rec_sync_idx'),
+        ),
+    ]
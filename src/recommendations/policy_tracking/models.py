@@ -513,6 +513,7 @@ class PolicyRecommendation(models.Model):
             models.Index(fields=["category", "status"]),
             models.Index(fields=["proposed_by", "status"]),
             models.Index(fields=["submission_date", "priority"]),
+            models.Index(fields=["updated_at", "id"], name="policy_rec_sync_idx"),
         ]
 
     def __str__(self):
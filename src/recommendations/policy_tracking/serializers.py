@@ -1,5 +1,7 @@
 from rest_framework import serializers
 
+from common.serializers import SparseFieldsetMixin
+
 from .models import PolicyDocument, PolicyEvidence, PolicyImpact, PolicyRecommendation
 
 
@@ -45,7 +47,7 @@ class PolicyDocumentSerializer(serializers.ModelSerializer):
         fields = "__all__"
 
 
-class PolicyRecommendationSerializer(serializers.ModelSerializer):
+class PolicyRecommendationSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Serializer for PolicyRecommendation model."""
 
     related_need_title = serializers.CharField(
@@ -77,7 +79,7 @@ class PolicyRecommendationSerializer(serializers.ModelSerializer):
         return obj.evidence.count()
 
 
-class PolicyRecommendationListSerializer(serializers.ModelSerializer):
+class PolicyRecommendationListSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Simplified serializer for PolicyRecommendation list view."""
 
     related_need_title = serializers.CharField(
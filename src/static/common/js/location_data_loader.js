@@ -121,5 +121,61 @@
         return requestLocationData(apiUrl, includeBarangays);
     }
 
+    function extractBarangaysUrl(container) {
+        if (container && container.dataset && container.dataset.barangaysApi) {
+            return container.dataset.barangaysApi;
+        }
+        var body = document.body || null;
+        if (body && body.dataset && body.dataset.barangaysApi) {
+            return body.dataset.barangaysApi;
+        }
+        return null;
+    }
+
+    function fetchBarangays(municipalityId, options) {
+        options = options || {};
+        if (municipalityId === undefined || municipalityId === null || municipalityId === "") {
+            return Promise.resolve([]);
+        }
+
+        var template = extractBarangaysUrl(options.container || null);
+        if (!template) {
+            console.warn("No barangay API endpoint configured.");
+            return Promise.resolve([]);
+        }
+
+        var url = template.replace("{municipality_id}", encodeURIComponent(String(municipalityId)));
+        var cacheKey = "barangays::" + url;
+        if (cache.has(cacheKey)) {
+            return cache.get(cacheKey);
+        }
+
+        var promise = fetch(url, {
+            method: "GET",
+            credentials: "same-origin",
+            headers: {
+                "Accept": "application/json",
+            },
+        })
+            .then(function (response) {
+                if (!response.ok) {
+                    throw new Error("Barangay API returned status " + response.status);
+                }
+                return response.json();
+            })
+            .then(function (payload) {
+                return (payload && payload.barangays) || [];
+            })
+            .catch(function (error) {
+                console.error("Failed to fetch barangays", error);
+                cache.delete(cacheKey);
+                return [];
+            });
+
+        cache.set(cacheKey, promise);
+        return promise;
+    }
+
     window.OBC.fetchLocationData = fetchLocationData;
+    window.OBC.fetchBarangays = fetchBarangays;
 })();
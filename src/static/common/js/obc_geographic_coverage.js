@@ -37,6 +37,8 @@ document.addEventListener('DOMContentLoaded', () => {
     const provincesByRegion = mapByKey(locationData.provinces, province => province.region_id);
     const municipalitiesByProvince = mapByKey(locationData.municipalities, municipality => municipality.province_id);
     const barangaysByMunicipality = mapByKey(locationData.barangays, barangay => barangay.municipality_id);
+    // Pages that omit barangays from the payload load them per municipality.
+    const barangaysEmbedded = Array.isArray(locationData.barangays);
 
     const toStringId = value => (value === null || value === undefined ? '' : String(value));
 
@@ -244,9 +246,28 @@ document.addEventListener('DOMContentLoaded', () => {
             setOptions(municipalitySelect, options, municipalityPlaceholder, selectedValue);
         };
 
+        let barangayRequest = 0;
         const updateBarangayOptions = (municipalityId, selectedValue) => {
-            const options = municipalityId ? barangaysByMunicipality.get(toStringId(municipalityId)) || [] : [];
-            setOptions(barangaySelect, options, barangayPlaceholder, selectedValue);
+            const municipalityKey = toStringId(municipalityId);
+            barangayRequest += 1;
+            if (barangaysEmbedded || !municipalityKey || !window.OBC || !window.OBC.fetchBarangays) {
+                const options = municipalityKey ? barangaysByMunicipality.get(municipalityKey) || [] : [];
+                setOptions(barangaySelect, options, barangayPlaceholder, selectedValue);
+                return;
+            }
+
+            const requestId = barangayRequest;
+            setOptions(barangaySelect, [], barangayPlaceholder, '');
+            window.OBC.fetchBarangays(municipalityKey).then(options => {
+                if (requestId !== barangayRequest) {
+                    return;
+                }
+                setOptions(barangaySelect, options, barangayPlaceholder, selectedValue);
+                // A restored selection arrives after listeners read the initial value.
+                if (barangaySelect && selectedValue && barangaySelect.value) {
+                    barangaySelect.dispatchEvent(new Event('change'));
+                }
+            });
         };
 
         const autoSelectMunicipalityForProvince = (shouldDispatch = true) => {